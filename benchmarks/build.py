@@ -0,0 +1,51 @@
+"""
+Per-node cost of building node trees.
+
+Times build_from_obj on the parse_dict output of a wide analytic query and
+reports the cost per node built.
+
+Usage::
+
+    python benchmarks/build.py [--columns N]
+"""
+from __future__ import print_function
+
+import argparse
+import timeit
+
+import psqlparse
+from psqlparse.nodes.utils import build_from_obj
+
+
+def analytic_query(columns):
+    return ("SELECT " +
+            ", ".join("sum(CASE WHEN t.kind = %d THEN t.amount ELSE 0 END) "
+                      "AS kind_%d" % (i, i) for i in range(columns)) +
+            " FROM transactions t WHERE t.region IN (" +
+            ", ".join("'region_%d'" % i for i in range(columns)) + ")")
+
+
+def count_nodes(obj):
+    if isinstance(obj, list):
+        return sum(count_nodes(item) for item in obj)
+    if isinstance(obj, dict):
+        return (len(obj) == 1) + sum(count_nodes(value)
+                                     for value in obj.values())
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--columns', type=int, default=500)
+    args = parser.parse_args()
+
+    statement_dicts = psqlparse.parse_dict(analytic_query(args.columns))
+    n_nodes = count_nodes(statement_dicts)
+    elapsed = min(timeit.repeat(lambda: build_from_obj(statement_dicts),
+                                number=5, repeat=5)) / 5
+    print('%d nodes in %.2f ms, %.0f ns per node' %
+          (n_nodes, elapsed * 1e3, elapsed / n_nodes * 1e9))
+
+
+if __name__ == '__main__':
+    main()
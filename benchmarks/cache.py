@@ -0,0 +1,55 @@
+"""
+Parse cache hit-path latency.
+
+Compares the latency of ``parse`` and ``parse_dict`` on a cold parse
+against a hit in a ``psqlparse.ParseCache``, for a short query and a large
+statement.
+
+Usage::
+
+    python benchmarks/cache.py [--number N]
+"""
+from __future__ import print_function
+
+import argparse
+import timeit
+
+import psqlparse
+
+
+QUERY = ("SELECT u.id, u.name, u.email FROM users u "
+         "JOIN memberships m ON m.user_id = u.id "
+         "WHERE m.group_id = 42 AND u.active ORDER BY u.name LIMIT 50")
+
+LARGE_QUERY = " UNION ALL ".join(
+    "SELECT u.id, u.name, count(*) FROM users u "
+    "JOIN orders o ON o.user_id = u.id "
+    "WHERE o.total > %d AND u.name LIKE 'a%%' GROUP BY u.id, u.name" % i
+    for i in range(200))
+
+
+def latency(func, query, number):
+    return min(timeit.repeat(lambda: func(query), number=number,
+                             repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--number', type=int, default=5000)
+    args = parser.parse_args()
+
+    for query, number in ((QUERY, args.number),
+                          (LARGE_QUERY, max(args.number // 500, 1))):
+        print('%d bytes:' % len(query))
+        for func in (psqlparse.parse_dict, psqlparse.parse):
+            psqlparse.set_cache(None)
+            cold = latency(func, query, number)
+            psqlparse.set_cache(psqlparse.ParseCache())
+            hit = latency(func, query, number)
+            print('  %-10s cold: %9.1f us  hit: %9.1f us  (x%.1f)' %
+                  (func.__name__, cold, hit, cold / hit))
+    psqlparse.set_cache(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,372 @@
+-- A wide analytic SELECT.
+WITH facts AS (
+    SELECT * FROM sales_facts WHERE sold_at >= date '2016-01-01'
+)
+SELECT d.region, d.country, date_trunc('month', f.sold_at) AS month,
+    sum(CASE WHEN f.kind = 0 THEN f.amount * f.rate ELSE 0 END) AS kind_0,
+    avg(f.amount) FILTER (WHERE f.channel = 'c0') AS avg_c0,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_0,
+    sum(CASE WHEN f.kind = 1 THEN f.amount * f.rate ELSE 0 END) AS kind_1,
+    sum(CASE WHEN f.kind = 2 THEN f.amount * f.rate ELSE 0 END) AS kind_2,
+    sum(CASE WHEN f.kind = 3 THEN f.amount * f.rate ELSE 0 END) AS kind_3,
+    sum(CASE WHEN f.kind = 4 THEN f.amount * f.rate ELSE 0 END) AS kind_4,
+    sum(CASE WHEN f.kind = 5 THEN f.amount * f.rate ELSE 0 END) AS kind_5,
+    sum(CASE WHEN f.kind = 6 THEN f.amount * f.rate ELSE 0 END) AS kind_6,
+    sum(CASE WHEN f.kind = 7 THEN f.amount * f.rate ELSE 0 END) AS kind_7,
+    sum(CASE WHEN f.kind = 8 THEN f.amount * f.rate ELSE 0 END) AS kind_8,
+    sum(CASE WHEN f.kind = 9 THEN f.amount * f.rate ELSE 0 END) AS kind_9,
+    sum(CASE WHEN f.kind = 10 THEN f.amount * f.rate ELSE 0 END) AS kind_10,
+    avg(f.amount) FILTER (WHERE f.channel = 'c10') AS avg_c10,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_10,
+    sum(CASE WHEN f.kind = 11 THEN f.amount * f.rate ELSE 0 END) AS kind_11,
+    sum(CASE WHEN f.kind = 12 THEN f.amount * f.rate ELSE 0 END) AS kind_12,
+    sum(CASE WHEN f.kind = 13 THEN f.amount * f.rate ELSE 0 END) AS kind_13,
+    sum(CASE WHEN f.kind = 14 THEN f.amount * f.rate ELSE 0 END) AS kind_14,
+    sum(CASE WHEN f.kind = 15 THEN f.amount * f.rate ELSE 0 END) AS kind_15,
+    sum(CASE WHEN f.kind = 16 THEN f.amount * f.rate ELSE 0 END) AS kind_16,
+    sum(CASE WHEN f.kind = 17 THEN f.amount * f.rate ELSE 0 END) AS kind_17,
+    sum(CASE WHEN f.kind = 18 THEN f.amount * f.rate ELSE 0 END) AS kind_18,
+    sum(CASE WHEN f.kind = 19 THEN f.amount * f.rate ELSE 0 END) AS kind_19,
+    sum(CASE WHEN f.kind = 20 THEN f.amount * f.rate ELSE 0 END) AS kind_20,
+    avg(f.amount) FILTER (WHERE f.channel = 'c20') AS avg_c20,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_20,
+    sum(CASE WHEN f.kind = 21 THEN f.amount * f.rate ELSE 0 END) AS kind_21,
+    sum(CASE WHEN f.kind = 22 THEN f.amount * f.rate ELSE 0 END) AS kind_22,
+    sum(CASE WHEN f.kind = 23 THEN f.amount * f.rate ELSE 0 END) AS kind_23,
+    sum(CASE WHEN f.kind = 24 THEN f.amount * f.rate ELSE 0 END) AS kind_24,
+    sum(CASE WHEN f.kind = 25 THEN f.amount * f.rate ELSE 0 END) AS kind_25,
+    sum(CASE WHEN f.kind = 26 THEN f.amount * f.rate ELSE 0 END) AS kind_26,
+    sum(CASE WHEN f.kind = 27 THEN f.amount * f.rate ELSE 0 END) AS kind_27,
+    sum(CASE WHEN f.kind = 28 THEN f.amount * f.rate ELSE 0 END) AS kind_28,
+    sum(CASE WHEN f.kind = 29 THEN f.amount * f.rate ELSE 0 END) AS kind_29,
+    sum(CASE WHEN f.kind = 30 THEN f.amount * f.rate ELSE 0 END) AS kind_30,
+    avg(f.amount) FILTER (WHERE f.channel = 'c30') AS avg_c30,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_30,
+    sum(CASE WHEN f.kind = 31 THEN f.amount * f.rate ELSE 0 END) AS kind_31,
+    sum(CASE WHEN f.kind = 32 THEN f.amount * f.rate ELSE 0 END) AS kind_32,
+    sum(CASE WHEN f.kind = 33 THEN f.amount * f.rate ELSE 0 END) AS kind_33,
+    sum(CASE WHEN f.kind = 34 THEN f.amount * f.rate ELSE 0 END) AS kind_34,
+    sum(CASE WHEN f.kind = 35 THEN f.amount * f.rate ELSE 0 END) AS kind_35,
+    sum(CASE WHEN f.kind = 36 THEN f.amount * f.rate ELSE 0 END) AS kind_36,
+    sum(CASE WHEN f.kind = 37 THEN f.amount * f.rate ELSE 0 END) AS kind_37,
+    sum(CASE WHEN f.kind = 38 THEN f.amount * f.rate ELSE 0 END) AS kind_38,
+    sum(CASE WHEN f.kind = 39 THEN f.amount * f.rate ELSE 0 END) AS kind_39,
+    sum(CASE WHEN f.kind = 40 THEN f.amount * f.rate ELSE 0 END) AS kind_40,
+    avg(f.amount) FILTER (WHERE f.channel = 'c40') AS avg_c40,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_40,
+    sum(CASE WHEN f.kind = 41 THEN f.amount * f.rate ELSE 0 END) AS kind_41,
+    sum(CASE WHEN f.kind = 42 THEN f.amount * f.rate ELSE 0 END) AS kind_42,
+    sum(CASE WHEN f.kind = 43 THEN f.amount * f.rate ELSE 0 END) AS kind_43,
+    sum(CASE WHEN f.kind = 44 THEN f.amount * f.rate ELSE 0 END) AS kind_44,
+    sum(CASE WHEN f.kind = 45 THEN f.amount * f.rate ELSE 0 END) AS kind_45,
+    sum(CASE WHEN f.kind = 46 THEN f.amount * f.rate ELSE 0 END) AS kind_46,
+    sum(CASE WHEN f.kind = 47 THEN f.amount * f.rate ELSE 0 END) AS kind_47,
+    sum(CASE WHEN f.kind = 48 THEN f.amount * f.rate ELSE 0 END) AS kind_48,
+    sum(CASE WHEN f.kind = 49 THEN f.amount * f.rate ELSE 0 END) AS kind_49,
+    sum(CASE WHEN f.kind = 50 THEN f.amount * f.rate ELSE 0 END) AS kind_50,
+    avg(f.amount) FILTER (WHERE f.channel = 'c50') AS avg_c50,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_50,
+    sum(CASE WHEN f.kind = 51 THEN f.amount * f.rate ELSE 0 END) AS kind_51,
+    sum(CASE WHEN f.kind = 52 THEN f.amount * f.rate ELSE 0 END) AS kind_52,
+    sum(CASE WHEN f.kind = 53 THEN f.amount * f.rate ELSE 0 END) AS kind_53,
+    sum(CASE WHEN f.kind = 54 THEN f.amount * f.rate ELSE 0 END) AS kind_54,
+    sum(CASE WHEN f.kind = 55 THEN f.amount * f.rate ELSE 0 END) AS kind_55,
+    sum(CASE WHEN f.kind = 56 THEN f.amount * f.rate ELSE 0 END) AS kind_56,
+    sum(CASE WHEN f.kind = 57 THEN f.amount * f.rate ELSE 0 END) AS kind_57,
+    sum(CASE WHEN f.kind = 58 THEN f.amount * f.rate ELSE 0 END) AS kind_58,
+    sum(CASE WHEN f.kind = 59 THEN f.amount * f.rate ELSE 0 END) AS kind_59,
+    sum(CASE WHEN f.kind = 60 THEN f.amount * f.rate ELSE 0 END) AS kind_60,
+    avg(f.amount) FILTER (WHERE f.channel = 'c60') AS avg_c60,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_60,
+    sum(CASE WHEN f.kind = 61 THEN f.amount * f.rate ELSE 0 END) AS kind_61,
+    sum(CASE WHEN f.kind = 62 THEN f.amount * f.rate ELSE 0 END) AS kind_62,
+    sum(CASE WHEN f.kind = 63 THEN f.amount * f.rate ELSE 0 END) AS kind_63,
+    sum(CASE WHEN f.kind = 64 THEN f.amount * f.rate ELSE 0 END) AS kind_64,
+    sum(CASE WHEN f.kind = 65 THEN f.amount * f.rate ELSE 0 END) AS kind_65,
+    sum(CASE WHEN f.kind = 66 THEN f.amount * f.rate ELSE 0 END) AS kind_66,
+    sum(CASE WHEN f.kind = 67 THEN f.amount * f.rate ELSE 0 END) AS kind_67,
+    sum(CASE WHEN f.kind = 68 THEN f.amount * f.rate ELSE 0 END) AS kind_68,
+    sum(CASE WHEN f.kind = 69 THEN f.amount * f.rate ELSE 0 END) AS kind_69,
+    sum(CASE WHEN f.kind = 70 THEN f.amount * f.rate ELSE 0 END) AS kind_70,
+    avg(f.amount) FILTER (WHERE f.channel = 'c70') AS avg_c70,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_70,
+    sum(CASE WHEN f.kind = 71 THEN f.amount * f.rate ELSE 0 END) AS kind_71,
+    sum(CASE WHEN f.kind = 72 THEN f.amount * f.rate ELSE 0 END) AS kind_72,
+    sum(CASE WHEN f.kind = 73 THEN f.amount * f.rate ELSE 0 END) AS kind_73,
+    sum(CASE WHEN f.kind = 74 THEN f.amount * f.rate ELSE 0 END) AS kind_74,
+    sum(CASE WHEN f.kind = 75 THEN f.amount * f.rate ELSE 0 END) AS kind_75,
+    sum(CASE WHEN f.kind = 76 THEN f.amount * f.rate ELSE 0 END) AS kind_76,
+    sum(CASE WHEN f.kind = 77 THEN f.amount * f.rate ELSE 0 END) AS kind_77,
+    sum(CASE WHEN f.kind = 78 THEN f.amount * f.rate ELSE 0 END) AS kind_78,
+    sum(CASE WHEN f.kind = 79 THEN f.amount * f.rate ELSE 0 END) AS kind_79,
+    sum(CASE WHEN f.kind = 80 THEN f.amount * f.rate ELSE 0 END) AS kind_80,
+    avg(f.amount) FILTER (WHERE f.channel = 'c80') AS avg_c80,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_80,
+    sum(CASE WHEN f.kind = 81 THEN f.amount * f.rate ELSE 0 END) AS kind_81,
+    sum(CASE WHEN f.kind = 82 THEN f.amount * f.rate ELSE 0 END) AS kind_82,
+    sum(CASE WHEN f.kind = 83 THEN f.amount * f.rate ELSE 0 END) AS kind_83,
+    sum(CASE WHEN f.kind = 84 THEN f.amount * f.rate ELSE 0 END) AS kind_84,
+    sum(CASE WHEN f.kind = 85 THEN f.amount * f.rate ELSE 0 END) AS kind_85,
+    sum(CASE WHEN f.kind = 86 THEN f.amount * f.rate ELSE 0 END) AS kind_86,
+    sum(CASE WHEN f.kind = 87 THEN f.amount * f.rate ELSE 0 END) AS kind_87,
+    sum(CASE WHEN f.kind = 88 THEN f.amount * f.rate ELSE 0 END) AS kind_88,
+    sum(CASE WHEN f.kind = 89 THEN f.amount * f.rate ELSE 0 END) AS kind_89,
+    sum(CASE WHEN f.kind = 90 THEN f.amount * f.rate ELSE 0 END) AS kind_90,
+    avg(f.amount) FILTER (WHERE f.channel = 'c90') AS avg_c90,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_90,
+    sum(CASE WHEN f.kind = 91 THEN f.amount * f.rate ELSE 0 END) AS kind_91,
+    sum(CASE WHEN f.kind = 92 THEN f.amount * f.rate ELSE 0 END) AS kind_92,
+    sum(CASE WHEN f.kind = 93 THEN f.amount * f.rate ELSE 0 END) AS kind_93,
+    sum(CASE WHEN f.kind = 94 THEN f.amount * f.rate ELSE 0 END) AS kind_94,
+    sum(CASE WHEN f.kind = 95 THEN f.amount * f.rate ELSE 0 END) AS kind_95,
+    sum(CASE WHEN f.kind = 96 THEN f.amount * f.rate ELSE 0 END) AS kind_96,
+    sum(CASE WHEN f.kind = 97 THEN f.amount * f.rate ELSE 0 END) AS kind_97,
+    sum(CASE WHEN f.kind = 98 THEN f.amount * f.rate ELSE 0 END) AS kind_98,
+    sum(CASE WHEN f.kind = 99 THEN f.amount * f.rate ELSE 0 END) AS kind_99,
+    sum(CASE WHEN f.kind = 100 THEN f.amount * f.rate ELSE 0 END) AS kind_100,
+    avg(f.amount) FILTER (WHERE f.channel = 'c100') AS avg_c100,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_100,
+    sum(CASE WHEN f.kind = 101 THEN f.amount * f.rate ELSE 0 END) AS kind_101,
+    sum(CASE WHEN f.kind = 102 THEN f.amount * f.rate ELSE 0 END) AS kind_102,
+    sum(CASE WHEN f.kind = 103 THEN f.amount * f.rate ELSE 0 END) AS kind_103,
+    sum(CASE WHEN f.kind = 104 THEN f.amount * f.rate ELSE 0 END) AS kind_104,
+    sum(CASE WHEN f.kind = 105 THEN f.amount * f.rate ELSE 0 END) AS kind_105,
+    sum(CASE WHEN f.kind = 106 THEN f.amount * f.rate ELSE 0 END) AS kind_106,
+    sum(CASE WHEN f.kind = 107 THEN f.amount * f.rate ELSE 0 END) AS kind_107,
+    sum(CASE WHEN f.kind = 108 THEN f.amount * f.rate ELSE 0 END) AS kind_108,
+    sum(CASE WHEN f.kind = 109 THEN f.amount * f.rate ELSE 0 END) AS kind_109,
+    sum(CASE WHEN f.kind = 110 THEN f.amount * f.rate ELSE 0 END) AS kind_110,
+    avg(f.amount) FILTER (WHERE f.channel = 'c110') AS avg_c110,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_110,
+    sum(CASE WHEN f.kind = 111 THEN f.amount * f.rate ELSE 0 END) AS kind_111,
+    sum(CASE WHEN f.kind = 112 THEN f.amount * f.rate ELSE 0 END) AS kind_112,
+    sum(CASE WHEN f.kind = 113 THEN f.amount * f.rate ELSE 0 END) AS kind_113,
+    sum(CASE WHEN f.kind = 114 THEN f.amount * f.rate ELSE 0 END) AS kind_114,
+    sum(CASE WHEN f.kind = 115 THEN f.amount * f.rate ELSE 0 END) AS kind_115,
+    sum(CASE WHEN f.kind = 116 THEN f.amount * f.rate ELSE 0 END) AS kind_116,
+    sum(CASE WHEN f.kind = 117 THEN f.amount * f.rate ELSE 0 END) AS kind_117,
+    sum(CASE WHEN f.kind = 118 THEN f.amount * f.rate ELSE 0 END) AS kind_118,
+    sum(CASE WHEN f.kind = 119 THEN f.amount * f.rate ELSE 0 END) AS kind_119,
+    sum(CASE WHEN f.kind = 120 THEN f.amount * f.rate ELSE 0 END) AS kind_120,
+    avg(f.amount) FILTER (WHERE f.channel = 'c120') AS avg_c120,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_120,
+    sum(CASE WHEN f.kind = 121 THEN f.amount * f.rate ELSE 0 END) AS kind_121,
+    sum(CASE WHEN f.kind = 122 THEN f.amount * f.rate ELSE 0 END) AS kind_122,
+    sum(CASE WHEN f.kind = 123 THEN f.amount * f.rate ELSE 0 END) AS kind_123,
+    sum(CASE WHEN f.kind = 124 THEN f.amount * f.rate ELSE 0 END) AS kind_124,
+    sum(CASE WHEN f.kind = 125 THEN f.amount * f.rate ELSE 0 END) AS kind_125,
+    sum(CASE WHEN f.kind = 126 THEN f.amount * f.rate ELSE 0 END) AS kind_126,
+    sum(CASE WHEN f.kind = 127 THEN f.amount * f.rate ELSE 0 END) AS kind_127,
+    sum(CASE WHEN f.kind = 128 THEN f.amount * f.rate ELSE 0 END) AS kind_128,
+    sum(CASE WHEN f.kind = 129 THEN f.amount * f.rate ELSE 0 END) AS kind_129,
+    sum(CASE WHEN f.kind = 130 THEN f.amount * f.rate ELSE 0 END) AS kind_130,
+    avg(f.amount) FILTER (WHERE f.channel = 'c130') AS avg_c130,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_130,
+    sum(CASE WHEN f.kind = 131 THEN f.amount * f.rate ELSE 0 END) AS kind_131,
+    sum(CASE WHEN f.kind = 132 THEN f.amount * f.rate ELSE 0 END) AS kind_132,
+    sum(CASE WHEN f.kind = 133 THEN f.amount * f.rate ELSE 0 END) AS kind_133,
+    sum(CASE WHEN f.kind = 134 THEN f.amount * f.rate ELSE 0 END) AS kind_134,
+    sum(CASE WHEN f.kind = 135 THEN f.amount * f.rate ELSE 0 END) AS kind_135,
+    sum(CASE WHEN f.kind = 136 THEN f.amount * f.rate ELSE 0 END) AS kind_136,
+    sum(CASE WHEN f.kind = 137 THEN f.amount * f.rate ELSE 0 END) AS kind_137,
+    sum(CASE WHEN f.kind = 138 THEN f.amount * f.rate ELSE 0 END) AS kind_138,
+    sum(CASE WHEN f.kind = 139 THEN f.amount * f.rate ELSE 0 END) AS kind_139,
+    sum(CASE WHEN f.kind = 140 THEN f.amount * f.rate ELSE 0 END) AS kind_140,
+    avg(f.amount) FILTER (WHERE f.channel = 'c140') AS avg_c140,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_140,
+    sum(CASE WHEN f.kind = 141 THEN f.amount * f.rate ELSE 0 END) AS kind_141,
+    sum(CASE WHEN f.kind = 142 THEN f.amount * f.rate ELSE 0 END) AS kind_142,
+    sum(CASE WHEN f.kind = 143 THEN f.amount * f.rate ELSE 0 END) AS kind_143,
+    sum(CASE WHEN f.kind = 144 THEN f.amount * f.rate ELSE 0 END) AS kind_144,
+    sum(CASE WHEN f.kind = 145 THEN f.amount * f.rate ELSE 0 END) AS kind_145,
+    sum(CASE WHEN f.kind = 146 THEN f.amount * f.rate ELSE 0 END) AS kind_146,
+    sum(CASE WHEN f.kind = 147 THEN f.amount * f.rate ELSE 0 END) AS kind_147,
+    sum(CASE WHEN f.kind = 148 THEN f.amount * f.rate ELSE 0 END) AS kind_148,
+    sum(CASE WHEN f.kind = 149 THEN f.amount * f.rate ELSE 0 END) AS kind_149,
+    sum(CASE WHEN f.kind = 150 THEN f.amount * f.rate ELSE 0 END) AS kind_150,
+    avg(f.amount) FILTER (WHERE f.channel = 'c150') AS avg_c150,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_150,
+    sum(CASE WHEN f.kind = 151 THEN f.amount * f.rate ELSE 0 END) AS kind_151,
+    sum(CASE WHEN f.kind = 152 THEN f.amount * f.rate ELSE 0 END) AS kind_152,
+    sum(CASE WHEN f.kind = 153 THEN f.amount * f.rate ELSE 0 END) AS kind_153,
+    sum(CASE WHEN f.kind = 154 THEN f.amount * f.rate ELSE 0 END) AS kind_154,
+    sum(CASE WHEN f.kind = 155 THEN f.amount * f.rate ELSE 0 END) AS kind_155,
+    sum(CASE WHEN f.kind = 156 THEN f.amount * f.rate ELSE 0 END) AS kind_156,
+    sum(CASE WHEN f.kind = 157 THEN f.amount * f.rate ELSE 0 END) AS kind_157,
+    sum(CASE WHEN f.kind = 158 THEN f.amount * f.rate ELSE 0 END) AS kind_158,
+    sum(CASE WHEN f.kind = 159 THEN f.amount * f.rate ELSE 0 END) AS kind_159,
+    sum(CASE WHEN f.kind = 160 THEN f.amount * f.rate ELSE 0 END) AS kind_160,
+    avg(f.amount) FILTER (WHERE f.channel = 'c160') AS avg_c160,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_160,
+    sum(CASE WHEN f.kind = 161 THEN f.amount * f.rate ELSE 0 END) AS kind_161,
+    sum(CASE WHEN f.kind = 162 THEN f.amount * f.rate ELSE 0 END) AS kind_162,
+    sum(CASE WHEN f.kind = 163 THEN f.amount * f.rate ELSE 0 END) AS kind_163,
+    sum(CASE WHEN f.kind = 164 THEN f.amount * f.rate ELSE 0 END) AS kind_164,
+    sum(CASE WHEN f.kind = 165 THEN f.amount * f.rate ELSE 0 END) AS kind_165,
+    sum(CASE WHEN f.kind = 166 THEN f.amount * f.rate ELSE 0 END) AS kind_166,
+    sum(CASE WHEN f.kind = 167 THEN f.amount * f.rate ELSE 0 END) AS kind_167,
+    sum(CASE WHEN f.kind = 168 THEN f.amount * f.rate ELSE 0 END) AS kind_168,
+    sum(CASE WHEN f.kind = 169 THEN f.amount * f.rate ELSE 0 END) AS kind_169,
+    sum(CASE WHEN f.kind = 170 THEN f.amount * f.rate ELSE 0 END) AS kind_170,
+    avg(f.amount) FILTER (WHERE f.channel = 'c170') AS avg_c170,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_170,
+    sum(CASE WHEN f.kind = 171 THEN f.amount * f.rate ELSE 0 END) AS kind_171,
+    sum(CASE WHEN f.kind = 172 THEN f.amount * f.rate ELSE 0 END) AS kind_172,
+    sum(CASE WHEN f.kind = 173 THEN f.amount * f.rate ELSE 0 END) AS kind_173,
+    sum(CASE WHEN f.kind = 174 THEN f.amount * f.rate ELSE 0 END) AS kind_174,
+    sum(CASE WHEN f.kind = 175 THEN f.amount * f.rate ELSE 0 END) AS kind_175,
+    sum(CASE WHEN f.kind = 176 THEN f.amount * f.rate ELSE 0 END) AS kind_176,
+    sum(CASE WHEN f.kind = 177 THEN f.amount * f.rate ELSE 0 END) AS kind_177,
+    sum(CASE WHEN f.kind = 178 THEN f.amount * f.rate ELSE 0 END) AS kind_178,
+    sum(CASE WHEN f.kind = 179 THEN f.amount * f.rate ELSE 0 END) AS kind_179,
+    sum(CASE WHEN f.kind = 180 THEN f.amount * f.rate ELSE 0 END) AS kind_180,
+    avg(f.amount) FILTER (WHERE f.channel = 'c180') AS avg_c180,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_180,
+    sum(CASE WHEN f.kind = 181 THEN f.amount * f.rate ELSE 0 END) AS kind_181,
+    sum(CASE WHEN f.kind = 182 THEN f.amount * f.rate ELSE 0 END) AS kind_182,
+    sum(CASE WHEN f.kind = 183 THEN f.amount * f.rate ELSE 0 END) AS kind_183,
+    sum(CASE WHEN f.kind = 184 THEN f.amount * f.rate ELSE 0 END) AS kind_184,
+    sum(CASE WHEN f.kind = 185 THEN f.amount * f.rate ELSE 0 END) AS kind_185,
+    sum(CASE WHEN f.kind = 186 THEN f.amount * f.rate ELSE 0 END) AS kind_186,
+    sum(CASE WHEN f.kind = 187 THEN f.amount * f.rate ELSE 0 END) AS kind_187,
+    sum(CASE WHEN f.kind = 188 THEN f.amount * f.rate ELSE 0 END) AS kind_188,
+    sum(CASE WHEN f.kind = 189 THEN f.amount * f.rate ELSE 0 END) AS kind_189,
+    sum(CASE WHEN f.kind = 190 THEN f.amount * f.rate ELSE 0 END) AS kind_190,
+    avg(f.amount) FILTER (WHERE f.channel = 'c190') AS avg_c190,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_190,
+    sum(CASE WHEN f.kind = 191 THEN f.amount * f.rate ELSE 0 END) AS kind_191,
+    sum(CASE WHEN f.kind = 192 THEN f.amount * f.rate ELSE 0 END) AS kind_192,
+    sum(CASE WHEN f.kind = 193 THEN f.amount * f.rate ELSE 0 END) AS kind_193,
+    sum(CASE WHEN f.kind = 194 THEN f.amount * f.rate ELSE 0 END) AS kind_194,
+    sum(CASE WHEN f.kind = 195 THEN f.amount * f.rate ELSE 0 END) AS kind_195,
+    sum(CASE WHEN f.kind = 196 THEN f.amount * f.rate ELSE 0 END) AS kind_196,
+    sum(CASE WHEN f.kind = 197 THEN f.amount * f.rate ELSE 0 END) AS kind_197,
+    sum(CASE WHEN f.kind = 198 THEN f.amount * f.rate ELSE 0 END) AS kind_198,
+    sum(CASE WHEN f.kind = 199 THEN f.amount * f.rate ELSE 0 END) AS kind_199,
+    sum(CASE WHEN f.kind = 200 THEN f.amount * f.rate ELSE 0 END) AS kind_200,
+    avg(f.amount) FILTER (WHERE f.channel = 'c200') AS avg_c200,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_200,
+    sum(CASE WHEN f.kind = 201 THEN f.amount * f.rate ELSE 0 END) AS kind_201,
+    sum(CASE WHEN f.kind = 202 THEN f.amount * f.rate ELSE 0 END) AS kind_202,
+    sum(CASE WHEN f.kind = 203 THEN f.amount * f.rate ELSE 0 END) AS kind_203,
+    sum(CASE WHEN f.kind = 204 THEN f.amount * f.rate ELSE 0 END) AS kind_204,
+    sum(CASE WHEN f.kind = 205 THEN f.amount * f.rate ELSE 0 END) AS kind_205,
+    sum(CASE WHEN f.kind = 206 THEN f.amount * f.rate ELSE 0 END) AS kind_206,
+    sum(CASE WHEN f.kind = 207 THEN f.amount * f.rate ELSE 0 END) AS kind_207,
+    sum(CASE WHEN f.kind = 208 THEN f.amount * f.rate ELSE 0 END) AS kind_208,
+    sum(CASE WHEN f.kind = 209 THEN f.amount * f.rate ELSE 0 END) AS kind_209,
+    sum(CASE WHEN f.kind = 210 THEN f.amount * f.rate ELSE 0 END) AS kind_210,
+    avg(f.amount) FILTER (WHERE f.channel = 'c210') AS avg_c210,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_210,
+    sum(CASE WHEN f.kind = 211 THEN f.amount * f.rate ELSE 0 END) AS kind_211,
+    sum(CASE WHEN f.kind = 212 THEN f.amount * f.rate ELSE 0 END) AS kind_212,
+    sum(CASE WHEN f.kind = 213 THEN f.amount * f.rate ELSE 0 END) AS kind_213,
+    sum(CASE WHEN f.kind = 214 THEN f.amount * f.rate ELSE 0 END) AS kind_214,
+    sum(CASE WHEN f.kind = 215 THEN f.amount * f.rate ELSE 0 END) AS kind_215,
+    sum(CASE WHEN f.kind = 216 THEN f.amount * f.rate ELSE 0 END) AS kind_216,
+    sum(CASE WHEN f.kind = 217 THEN f.amount * f.rate ELSE 0 END) AS kind_217,
+    sum(CASE WHEN f.kind = 218 THEN f.amount * f.rate ELSE 0 END) AS kind_218,
+    sum(CASE WHEN f.kind = 219 THEN f.amount * f.rate ELSE 0 END) AS kind_219,
+    sum(CASE WHEN f.kind = 220 THEN f.amount * f.rate ELSE 0 END) AS kind_220,
+    avg(f.amount) FILTER (WHERE f.channel = 'c220') AS avg_c220,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_220,
+    sum(CASE WHEN f.kind = 221 THEN f.amount * f.rate ELSE 0 END) AS kind_221,
+    sum(CASE WHEN f.kind = 222 THEN f.amount * f.rate ELSE 0 END) AS kind_222,
+    sum(CASE WHEN f.kind = 223 THEN f.amount * f.rate ELSE 0 END) AS kind_223,
+    sum(CASE WHEN f.kind = 224 THEN f.amount * f.rate ELSE 0 END) AS kind_224,
+    sum(CASE WHEN f.kind = 225 THEN f.amount * f.rate ELSE 0 END) AS kind_225,
+    sum(CASE WHEN f.kind = 226 THEN f.amount * f.rate ELSE 0 END) AS kind_226,
+    sum(CASE WHEN f.kind = 227 THEN f.amount * f.rate ELSE 0 END) AS kind_227,
+    sum(CASE WHEN f.kind = 228 THEN f.amount * f.rate ELSE 0 END) AS kind_228,
+    sum(CASE WHEN f.kind = 229 THEN f.amount * f.rate ELSE 0 END) AS kind_229,
+    sum(CASE WHEN f.kind = 230 THEN f.amount * f.rate ELSE 0 END) AS kind_230,
+    avg(f.amount) FILTER (WHERE f.channel = 'c230') AS avg_c230,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_230,
+    sum(CASE WHEN f.kind = 231 THEN f.amount * f.rate ELSE 0 END) AS kind_231,
+    sum(CASE WHEN f.kind = 232 THEN f.amount * f.rate ELSE 0 END) AS kind_232,
+    sum(CASE WHEN f.kind = 233 THEN f.amount * f.rate ELSE 0 END) AS kind_233,
+    sum(CASE WHEN f.kind = 234 THEN f.amount * f.rate ELSE 0 END) AS kind_234,
+    sum(CASE WHEN f.kind = 235 THEN f.amount * f.rate ELSE 0 END) AS kind_235,
+    sum(CASE WHEN f.kind = 236 THEN f.amount * f.rate ELSE 0 END) AS kind_236,
+    sum(CASE WHEN f.kind = 237 THEN f.amount * f.rate ELSE 0 END) AS kind_237,
+    sum(CASE WHEN f.kind = 238 THEN f.amount * f.rate ELSE 0 END) AS kind_238,
+    sum(CASE WHEN f.kind = 239 THEN f.amount * f.rate ELSE 0 END) AS kind_239,
+    sum(CASE WHEN f.kind = 240 THEN f.amount * f.rate ELSE 0 END) AS kind_240,
+    avg(f.amount) FILTER (WHERE f.channel = 'c240') AS avg_c240,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_240,
+    sum(CASE WHEN f.kind = 241 THEN f.amount * f.rate ELSE 0 END) AS kind_241,
+    sum(CASE WHEN f.kind = 242 THEN f.amount * f.rate ELSE 0 END) AS kind_242,
+    sum(CASE WHEN f.kind = 243 THEN f.amount * f.rate ELSE 0 END) AS kind_243,
+    sum(CASE WHEN f.kind = 244 THEN f.amount * f.rate ELSE 0 END) AS kind_244,
+    sum(CASE WHEN f.kind = 245 THEN f.amount * f.rate ELSE 0 END) AS kind_245,
+    sum(CASE WHEN f.kind = 246 THEN f.amount * f.rate ELSE 0 END) AS kind_246,
+    sum(CASE WHEN f.kind = 247 THEN f.amount * f.rate ELSE 0 END) AS kind_247,
+    sum(CASE WHEN f.kind = 248 THEN f.amount * f.rate ELSE 0 END) AS kind_248,
+    sum(CASE WHEN f.kind = 249 THEN f.amount * f.rate ELSE 0 END) AS kind_249,
+    sum(CASE WHEN f.kind = 250 THEN f.amount * f.rate ELSE 0 END) AS kind_250,
+    avg(f.amount) FILTER (WHERE f.channel = 'c250') AS avg_c250,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_250,
+    sum(CASE WHEN f.kind = 251 THEN f.amount * f.rate ELSE 0 END) AS kind_251,
+    sum(CASE WHEN f.kind = 252 THEN f.amount * f.rate ELSE 0 END) AS kind_252,
+    sum(CASE WHEN f.kind = 253 THEN f.amount * f.rate ELSE 0 END) AS kind_253,
+    sum(CASE WHEN f.kind = 254 THEN f.amount * f.rate ELSE 0 END) AS kind_254,
+    sum(CASE WHEN f.kind = 255 THEN f.amount * f.rate ELSE 0 END) AS kind_255,
+    sum(CASE WHEN f.kind = 256 THEN f.amount * f.rate ELSE 0 END) AS kind_256,
+    sum(CASE WHEN f.kind = 257 THEN f.amount * f.rate ELSE 0 END) AS kind_257,
+    sum(CASE WHEN f.kind = 258 THEN f.amount * f.rate ELSE 0 END) AS kind_258,
+    sum(CASE WHEN f.kind = 259 THEN f.amount * f.rate ELSE 0 END) AS kind_259,
+    sum(CASE WHEN f.kind = 260 THEN f.amount * f.rate ELSE 0 END) AS kind_260,
+    avg(f.amount) FILTER (WHERE f.channel = 'c260') AS avg_c260,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_260,
+    sum(CASE WHEN f.kind = 261 THEN f.amount * f.rate ELSE 0 END) AS kind_261,
+    sum(CASE WHEN f.kind = 262 THEN f.amount * f.rate ELSE 0 END) AS kind_262,
+    sum(CASE WHEN f.kind = 263 THEN f.amount * f.rate ELSE 0 END) AS kind_263,
+    sum(CASE WHEN f.kind = 264 THEN f.amount * f.rate ELSE 0 END) AS kind_264,
+    sum(CASE WHEN f.kind = 265 THEN f.amount * f.rate ELSE 0 END) AS kind_265,
+    sum(CASE WHEN f.kind = 266 THEN f.amount * f.rate ELSE 0 END) AS kind_266,
+    sum(CASE WHEN f.kind = 267 THEN f.amount * f.rate ELSE 0 END) AS kind_267,
+    sum(CASE WHEN f.kind = 268 THEN f.amount * f.rate ELSE 0 END) AS kind_268,
+    sum(CASE WHEN f.kind = 269 THEN f.amount * f.rate ELSE 0 END) AS kind_269,
+    sum(CASE WHEN f.kind = 270 THEN f.amount * f.rate ELSE 0 END) AS kind_270,
+    avg(f.amount) FILTER (WHERE f.channel = 'c270') AS avg_c270,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_270,
+    sum(CASE WHEN f.kind = 271 THEN f.amount * f.rate ELSE 0 END) AS kind_271,
+    sum(CASE WHEN f.kind = 272 THEN f.amount * f.rate ELSE 0 END) AS kind_272,
+    sum(CASE WHEN f.kind = 273 THEN f.amount * f.rate ELSE 0 END) AS kind_273,
+    sum(CASE WHEN f.kind = 274 THEN f.amount * f.rate ELSE 0 END) AS kind_274,
+    sum(CASE WHEN f.kind = 275 THEN f.amount * f.rate ELSE 0 END) AS kind_275,
+    sum(CASE WHEN f.kind = 276 THEN f.amount * f.rate ELSE 0 END) AS kind_276,
+    sum(CASE WHEN f.kind = 277 THEN f.amount * f.rate ELSE 0 END) AS kind_277,
+    sum(CASE WHEN f.kind = 278 THEN f.amount * f.rate ELSE 0 END) AS kind_278,
+    sum(CASE WHEN f.kind = 279 THEN f.amount * f.rate ELSE 0 END) AS kind_279,
+    sum(CASE WHEN f.kind = 280 THEN f.amount * f.rate ELSE 0 END) AS kind_280,
+    avg(f.amount) FILTER (WHERE f.channel = 'c280') AS avg_c280,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_280,
+    sum(CASE WHEN f.kind = 281 THEN f.amount * f.rate ELSE 0 END) AS kind_281,
+    sum(CASE WHEN f.kind = 282 THEN f.amount * f.rate ELSE 0 END) AS kind_282,
+    sum(CASE WHEN f.kind = 283 THEN f.amount * f.rate ELSE 0 END) AS kind_283,
+    sum(CASE WHEN f.kind = 284 THEN f.amount * f.rate ELSE 0 END) AS kind_284,
+    sum(CASE WHEN f.kind = 285 THEN f.amount * f.rate ELSE 0 END) AS kind_285,
+    sum(CASE WHEN f.kind = 286 THEN f.amount * f.rate ELSE 0 END) AS kind_286,
+    sum(CASE WHEN f.kind = 287 THEN f.amount * f.rate ELSE 0 END) AS kind_287,
+    sum(CASE WHEN f.kind = 288 THEN f.amount * f.rate ELSE 0 END) AS kind_288,
+    sum(CASE WHEN f.kind = 289 THEN f.amount * f.rate ELSE 0 END) AS kind_289,
+    sum(CASE WHEN f.kind = 290 THEN f.amount * f.rate ELSE 0 END) AS kind_290,
+    avg(f.amount) FILTER (WHERE f.channel = 'c290') AS avg_c290,
+    rank() OVER (PARTITION BY d.region ORDER BY sum(f.amount) DESC) AS rank_290,
+    sum(CASE WHEN f.kind = 291 THEN f.amount * f.rate ELSE 0 END) AS kind_291,
+    sum(CASE WHEN f.kind = 292 THEN f.amount * f.rate ELSE 0 END) AS kind_292,
+    sum(CASE WHEN f.kind = 293 THEN f.amount * f.rate ELSE 0 END) AS kind_293,
+    sum(CASE WHEN f.kind = 294 THEN f.amount * f.rate ELSE 0 END) AS kind_294,
+    sum(CASE WHEN f.kind = 295 THEN f.amount * f.rate ELSE 0 END) AS kind_295,
+    sum(CASE WHEN f.kind = 296 THEN f.amount * f.rate ELSE 0 END) AS kind_296,
+    sum(CASE WHEN f.kind = 297 THEN f.amount * f.rate ELSE 0 END) AS kind_297,
+    sum(CASE WHEN f.kind = 298 THEN f.amount * f.rate ELSE 0 END) AS kind_298,
+    sum(CASE WHEN f.kind = 299 THEN f.amount * f.rate ELSE 0 END) AS kind_299
+FROM facts f
+JOIN dim_store d ON d.id = f.store_id
+LEFT JOIN dim_product p ON p.id = f.product_id
+WHERE p.category IN ('a', 'b', 'c') AND f.amount > 0
+GROUP BY d.region, d.country, date_trunc('month', f.sold_at)
+HAVING sum(f.amount) > 1000
+ORDER BY 1, 2, 3;
@@ -0,0 +1,3 @@
+-- Deeply nested subqueries.
+SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT * FROM (SELECT id FROM t0) s0 WHERE s0.id IN (SELECT id FROM u0 WHERE u0.flag)) s1 WHERE s1.id IN (SELECT id FROM u1 WHERE u1.flag)) s2 WHERE s2.id IN (SELECT id FROM u2 WHERE u2.flag)) s3 WHERE s3.id IN (SELECT id FROM u3 WHERE u3.flag)) s4 WHERE s4.id IN (SELECT id FROM u4 WHERE u4.flag)) s5 WHERE s5.id IN (SELECT id FROM u5 WHERE u5.flag)) s6 WHERE s6.id IN (SELECT id FROM u6 WHERE u6.flag)) s7 WHERE s7.id IN (SELECT id FROM u7 WHERE u7.flag)) s8 WHERE s8.id IN (SELECT id FROM u8 WHERE u8.flag)) s9 WHERE s9.id IN (SELECT id FROM u9 WHERE u9.flag)) s10 WHERE s10.id IN (SELECT id FROM u10 WHERE u10.flag)) s11 WHERE s11.id IN (SELECT id FROM u11 WHERE u11.flag)) s12 WHERE s12.id IN (SELECT id FROM u12 WHERE u12.flag)) s13 WHERE s13.id IN (SELECT id FROM u13 WHERE u13.flag)) s14 WHERE s14.id IN (SELECT id FROM u14 WHERE u14.flag)) s15 WHERE s15.id IN (SELECT id FROM u15 WHERE u15.flag)) s16 WHERE s16.id IN (SELECT id FROM u16 WHERE u16.flag)) s17 WHERE s17.id IN (SELECT id FROM u17 WHERE u17.flag)) s18 WHERE s18.id IN (SELECT id FROM u18 WHERE u18.flag)) s19 WHERE s19.id IN (SELECT id FROM u19 WHERE u19.flag)) s20 WHERE s20.id IN (SELECT id FROM u20 WHERE u20.flag)) s21 WHERE s21.id IN (SELECT id FROM u21 WHERE u21.flag)) s22 WHERE s22.id IN (SELECT id FROM u22 WHERE u22.flag)) s23 WHERE s23.id IN (SELECT id FROM u23 WHERE u23.flag)) s24 WHERE s24.id IN (SELECT id FROM u24 WHERE u24.flag)) s25 WHERE s25.id IN (SELECT id FROM u25 WHERE u25.flag)) s26 WHERE s26.id IN (SELECT id FROM u26 WHERE u26.flag)) s27 WHERE s27.id IN (SELECT id FROM u27 WHERE u27.flag)) s28 WHERE s28.id IN (SELECT id FROM u28 WHERE u28.flag)) s29 WHERE s29.id IN (SELECT id FROM u29 WHERE u29.flag)) s30 WHERE s30.id IN (SELECT id FROM u30 WHERE u30.flag)) s31 WHERE s31.id IN (SELECT id FROM u31 WHERE u31.flag)) s32 WHERE s32.id IN (SELECT id FROM u32 WHERE u32.flag)) s33 WHERE s33.id IN (SELECT id FROM u33 WHERE u33.flag)) s34 WHERE s34.id IN (SELECT id FROM u34 WHERE u34.flag)) s35 WHERE s35.id IN (SELECT id FROM u35 WHERE u35.flag)) s36 WHERE s36.id IN (SELECT id FROM u36 WHERE u36.flag)) s37 WHERE s37.id IN (SELECT id FROM u37 WHERE u37.flag)) s38 WHERE s38.id IN (SELECT id FROM u38 WHERE u38.flag)) s39 WHERE s39.id IN (SELECT id FROM u39 WHERE u39.flag)) s40 WHERE s40.id IN (SELECT id FROM u40 WHERE u40.flag)) s41 WHERE s41.id IN (SELECT id FROM u41 WHERE u41.flag)) s42 WHERE s42.id IN (SELECT id FROM u42 WHERE u42.flag)) s43 WHERE s43.id IN (SELECT id FROM u43 WHERE u43.flag)) s44 WHERE s44.id IN (SELECT id FROM u44 WHERE u44.flag)) s45 WHERE s45.id IN (SELECT id FROM u45 WHERE u45.flag)) s46 WHERE s46.id IN (SELECT id FROM u46 WHERE u46.flag)) s47 WHERE s47.id IN (SELECT id FROM u47 WHERE u47.flag)) s48 WHERE s48.id IN (SELECT id FROM u48 WHERE u48.flag)) s49 WHERE s49.id IN (SELECT id FROM u49 WHERE u49.flag)) s50 WHERE s50.id IN (SELECT id FROM u50 WHERE u50.flag)) s51 WHERE s51.id IN (SELECT id FROM u51 WHERE u51.flag)) s52 WHERE s52.id IN (SELECT id FROM u52 WHERE u52.flag)) s53 WHERE s53.id IN (SELECT id FROM u53 WHERE u53.flag)) s54 WHERE s54.id IN (SELECT id FROM u54 WHERE u54.flag)) s55 WHERE s55.id IN (SELECT id FROM u55 WHERE u55.flag)) s56 WHERE s56.id IN (SELECT id FROM u56 WHERE u56.flag)) s57 WHERE s57.id IN (SELECT id FROM u57 WHERE u57.flag)) s58 WHERE s58.id IN (SELECT id FROM u58 WHERE u58.flag)) s59 WHERE s59.id IN (SELECT id FROM u59 WHERE u59.flag)) s60 WHERE s60.id IN (SELECT id FROM u60 WHERE u60.flag)) s61 WHERE s61.id IN (SELECT id FROM u61 WHERE u61.flag)) s62 WHERE s62.id IN (SELECT id FROM u62 WHERE u62.flag)) s63 WHERE s63.id IN (SELECT id FROM u63 WHERE u63.flag)) s64 WHERE s64.id IN (SELECT id FROM u64 WHERE u64.flag)) s65 WHERE s65.id IN (SELECT id FROM u65 WHERE u65.flag)) s66 WHERE s66.id IN (SELECT id FROM u66 WHERE u66.flag)) s67 WHERE s67.id IN (SELECT id FROM u67 WHERE u67.flag)) s68 WHERE s68.id IN (SELECT id FROM u68 WHERE u68.flag)) s69 WHERE s69.id IN (SELECT id FROM u69 WHERE u69.flag)) s70 WHERE s70.id IN (SELECT id FROM u70 WHERE u70.flag)) s71 WHERE s71.id IN (SELECT id FROM u71 WHERE u71.flag)) s72 WHERE s72.id IN (SELECT id FROM u72 WHERE u72.flag)) s73 WHERE s73.id IN (SELECT id FROM u73 WHERE u73.flag)) s74 WHERE s74.id IN (SELECT id FROM u74 WHERE u74.flag)) s75 WHERE s75.id IN (SELECT id FROM u75 WHERE u75.flag)) s76 WHERE s76.id IN (SELECT id FROM u76 WHERE u76.flag)) s77 WHERE s77.id IN (SELECT id FROM u77 WHERE u77.flag)) s78 WHERE s78.id IN (SELECT id FROM u78 WHERE u78.flag)) s79 WHERE s79.id IN (SELECT id FROM u79 WHERE u79.flag)) s80 WHERE s80.id IN (SELECT id FROM u80 WHERE u80.flag)) s81 WHERE s81.id IN (SELECT id FROM u81 WHERE u81.flag)) s82 WHERE s82.id IN (SELECT id FROM u82 WHERE u82.flag)) s83 WHERE s83.id IN (SELECT id FROM u83 WHERE u83.flag)) s84 WHERE s84.id IN (SELECT id FROM u84 WHERE u84.flag)) s85 WHERE s85.id IN (SELECT id FROM u85 WHERE u85.flag)) s86 WHERE s86.id IN (SELECT id FROM u86 WHERE u86.flag)) s87 WHERE s87.id IN (SELECT id FROM u87 WHERE u87.flag)) s88 WHERE s88.id IN (SELECT id FROM u88 WHERE u88.flag)) s89 WHERE s89.id IN (SELECT id FROM u89 WHERE u89.flag)) s90 WHERE s90.id IN (SELECT id FROM u90 WHERE u90.flag)) s91 WHERE s91.id IN (SELECT id FROM u91 WHERE u91.flag)) s92 WHERE s92.id IN (SELECT id FROM u92 WHERE u92.flag)) s93 WHERE s93.id IN (SELECT id FROM u93 WHERE u93.flag)) s94 WHERE s94.id IN (SELECT id FROM u94 WHERE u94.flag)) s95 WHERE s95.id IN (SELECT id FROM u95 WHERE u95.flag)) s96 WHERE s96.id IN (SELECT id FROM u96 WHERE u96.flag)) s97 WHERE s97.id IN (SELECT id FROM u97 WHERE u97.flag)) s98 WHERE s98.id IN (SELECT id FROM u98 WHERE u98.flag)) s99 WHERE s99.id IN (SELECT id FROM u99 WHERE u99.flag)) s100 WHERE s100.id IN (SELECT id FROM u100 WHERE u100.flag)) s101 WHERE s101.id IN (SELECT id FROM u101 WHERE u101.flag)) s102 WHERE s102.id IN (SELECT id FROM u102 WHERE u102.flag)) s103 WHERE s103.id IN (SELECT id FROM u103 WHERE u103.flag)) s104 WHERE s104.id IN (SELECT id FROM u104 WHERE u104.flag)) s105 WHERE s105.id IN (SELECT id FROM u105 WHERE u105.flag)) s106 WHERE s106.id IN (SELECT id FROM u106 WHERE u106.flag)) s107 WHERE s107.id IN (SELECT id FROM u107 WHERE u107.flag)) s108 WHERE s108.id IN (SELECT id FROM u108 WHERE u108.flag)) s109 WHERE s109.id IN (SELECT id FROM u109 WHERE u109.flag)) s110 WHERE s110.id IN (SELECT id FROM u110 WHERE u110.flag)) s111 WHERE s111.id IN (SELECT id FROM u111 WHERE u111.flag)) s112 WHERE s112.id IN (SELECT id FROM u112 WHERE u112.flag)) s113 WHERE s113.id IN (SELECT id FROM u113 WHERE u113.flag)) s114 WHERE s114.id IN (SELECT id FROM u114 WHERE u114.flag)) s115 WHERE s115.id IN (SELECT id FROM u115 WHERE u115.flag)) s116 WHERE s116.id IN (SELECT id FROM u116 WHERE u116.flag)) s117 WHERE s117.id IN (SELECT id FROM u117 WHERE u117.flag)) s118 WHERE s118.id IN (SELECT id FROM u118 WHERE u118.flag)) s119 WHERE s119.id IN (SELECT id FROM u119 WHERE u119.flag)) s120 WHERE s120.id IN (SELECT id FROM u120 WHERE u120.flag)) s121 WHERE s121.id IN (SELECT id FROM u121 WHERE u121.flag)) s122 WHERE s122.id IN (SELECT id FROM u122 WHERE u122.flag)) s123 WHERE s123.id IN (SELECT id FROM u123 WHERE u123.flag)) s124 WHERE s124.id IN (SELECT id FROM u124 WHERE u124.flag)) s125 WHERE s125.id IN (SELECT id FROM u125 WHERE u125.flag)) s126 WHERE s126.id IN (SELECT id FROM u126 WHERE u126.flag)) s127 WHERE s127.id IN (SELECT id FROM u127 WHERE u127.flag)) s128 WHERE s128.id IN (SELECT id FROM u128 WHERE u128.flag)) s129 WHERE s129.id IN (SELECT id FROM u129 WHERE u129.flag)) s130 WHERE s130.id IN (SELECT id FROM u130 WHERE u130.flag)) s131 WHERE s131.id IN (SELECT id FROM u131 WHERE u131.flag)) s132 WHERE s132.id IN (SELECT id FROM u132 WHERE u132.flag)) s133 WHERE s133.id IN (SELECT id FROM u133 WHERE u133.flag)) s134 WHERE s134.id IN (SELECT id FROM u134 WHERE u134.flag)) s135 WHERE s135.id IN (SELECT id FROM u135 WHERE u135.flag)) s136 WHERE s136.id IN (SELECT id FROM u136 WHERE u136.flag)) s137 WHERE s137.id IN (SELECT id FROM u137 WHERE u137.flag)) s138 WHERE s138.id IN (SELECT id FROM u138 WHERE u138.flag)) s139 WHERE s139.id IN (SELECT id FROM u139 WHERE u139.flag)) s140 WHERE s140.id IN (SELECT id FROM u140 WHERE u140.flag)) s141 WHERE s141.id IN (SELECT id FROM u141 WHERE u141.flag)) s142 WHERE s142.id IN (SELECT id FROM u142 WHERE u142.flag)) s143 WHERE s143.id IN (SELECT id FROM u143 WHERE u143.flag)) s144 WHERE s144.id IN (SELECT id FROM u144 WHERE u144.flag)) s145 WHERE s145.id IN (SELECT id FROM u145 WHERE u145.flag)) s146 WHERE s146.id IN (SELECT id FROM u146 WHERE u146.flag)) s147 WHERE s147.id IN (SELECT id FROM u147 WHERE u147.flag)) s148 WHERE s148.id IN (SELECT id FROM u148 WHERE u148.flag)) s149 WHERE s149.id IN (SELECT id FROM u149 WHERE u149.flag);
+SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT EXISTS (SELECT 1) AS e0 FROM v0) AS e1 FROM v1) AS e2 FROM v2) AS e3 FROM v3) AS e4 FROM v4) AS e5 FROM v5) AS e6 FROM v6) AS e7 FROM v7) AS e8 FROM v8) AS e9 FROM v9) AS e10 FROM v10) AS e11 FROM v11) AS e12 FROM v12) AS e13 FROM v13) AS e14 FROM v14) AS e15 FROM v15) AS e16 FROM v16) AS e17 FROM v17) AS e18 FROM v18) AS e19 FROM v19) AS e20 FROM v20) AS e21 FROM v21) AS e22 FROM v22) AS e23 FROM v23) AS e24 FROM v24) AS e25 FROM v25) AS e26 FROM v26) AS e27 FROM v27) AS e28 FROM v28) AS e29 FROM v29) AS e30 FROM v30) AS e31 FROM v31) AS e32 FROM v32) AS e33 FROM v33) AS e34 FROM v34) AS e35 FROM v35) AS e36 FROM v36) AS e37 FROM v37) AS e38 FROM v38) AS e39 FROM v39) AS e40 FROM v40) AS e41 FROM v41) AS e42 FROM v42) AS e43 FROM v43) AS e44 FROM v44) AS e45 FROM v45) AS e46 FROM v46) AS e47 FROM v47) AS e48 FROM v48) AS e49 FROM v49) AS e50 FROM v50) AS e51 FROM v51) AS e52 FROM v52) AS e53 FROM v53) AS e54 FROM v54) AS e55 FROM v55) AS e56 FROM v56) AS e57 FROM v57) AS e58 FROM v58) AS e59 FROM v59) AS e60 FROM v60) AS e61 FROM v61) AS e62 FROM v62) AS e63 FROM v63) AS e64 FROM v64) AS e65 FROM v65) AS e66 FROM v66) AS e67 FROM v67) AS e68 FROM v68) AS e69 FROM v69) AS e70 FROM v70) AS e71 FROM v71) AS e72 FROM v72) AS e73 FROM v73) AS e74 FROM v74) AS e75 FROM v75) AS e76 FROM v76) AS e77 FROM v77) AS e78 FROM v78) AS e79 FROM v79) AS e80 FROM v80) AS e81 FROM v81) AS e82 FROM v82) AS e83 FROM v83) AS e84 FROM v84) AS e85 FROM v85) AS e86 FROM v86) AS e87 FROM v87) AS e88 FROM v88) AS e89 FROM v89) AS e90 FROM v90) AS e91 FROM v91) AS e92 FROM v92) AS e93 FROM v93) AS e94 FROM v94) AS e95 FROM v95) AS e96 FROM v96) AS e97 FROM v97) AS e98 FROM v98) AS e99 FROM v99) AS e100 FROM v100) AS e101 FROM v101) AS e102 FROM v102) AS e103 FROM v103) AS e104 FROM v104) AS e105 FROM v105) AS e106 FROM v106) AS e107 FROM v107) AS e108 FROM v108) AS e109 FROM v109) AS e110 FROM v110) AS e111 FROM v111) AS e112 FROM v112) AS e113 FROM v113) AS e114 FROM v114) AS e115 FROM v115) AS e116 FROM v116) AS e117 FROM v117) AS e118 FROM v118) AS e119 FROM v119) AS e120 FROM v120) AS e121 FROM v121) AS e122 FROM v122) AS e123 FROM v123) AS e124 FROM v124) AS e125 FROM v125) AS e126 FROM v126) AS e127 FROM v127) AS e128 FROM v128) AS e129 FROM v129) AS e130 FROM v130) AS e131 FROM v131) AS e132 FROM v132) AS e133 FROM v133) AS e134 FROM v134) AS e135 FROM v135) AS e136 FROM v136) AS e137 FROM v137) AS e138 FROM v138) AS e139 FROM v139) AS e140 FROM v140) AS e141 FROM v141) AS e142 FROM v142) AS e143 FROM v143) AS e144 FROM v144) AS e145 FROM v145) AS e146 FROM v146) AS e147 FROM v147) AS e148 FROM v148) AS e149 FROM v149;
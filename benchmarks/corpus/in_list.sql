@@ -0,0 +1,3 @@
+-- Huge IN-lists.
+SELECT id, name FROM users WHERE id IN (177113153, 448817264, 740631598, 448856380, 681825997, 301997413, 514430211, 905463494, 231943637, 851083590, 509648606, 867426949, 550245699, 197118916, 542329978, 566450661, 253463589, 846541832, 3415179, 15162683, 398408349, 628528194, 459766715, 74372478, 155608920, 852283666, 806723927, 249379454, 989447735, 249854300, 745089342, 45457308, 469070465, 793159932, 827534393, 939566533, 436764974, 661306950, 474422370, 36582440, 353185197, 579980954, 534242733, 745085997, 124349833, 696661072, 395616569, 24936746, 166229248, 795666072, 877794084, 94987389, 134085764, 868241484, 996372141, 20991134, 486542051, 172978305, 592708573, 782175901, 368209072, 430939029, 520446573, 162239803, 200691758, 714154389, 39878294, 504596393, 929737564, 880623329, 252185580, 80126199, 837797098, 211932367, 223941972, 723481178, 862121895, 959888496, 706517416, 810452220, 819042367, 963568090, 623592424, 783571018, 76157101, 131509611, 601427477, 511450489, 600160034, 888003907, 416621895, 215907387, 366394138, 991243500, 156928557, 953009984, 575335616, 439806469, 313518975, 392152570, 484602908, 538416129, 414225633, 341398195, 520176873, 415101374, 285298189, 28814572, 895630222, 100139886, 170664529, 771046016, 768796959, 532587508, 3040827, 527786639, 75287164, 591020673, 643577287, 803347885, 560678823, 238406143, 613663237, 653802891, 342138332, 597523366, 668536063, 121021048, 194000833, 719059392, 182634729, 672696110, 373884708, 895134100, 995437705, 356888368, 372173325, 818032486, 641277882, 998261688, 329224228, 263888605, 110888790, 181132098, 70484641, 991203040, 873699261, 186850525, 834317354, 460329572, 402519562, 171675291, 733743404, 39403497, 725744009, 557983672, 964969236, 706500900, 259365554, 437028656, 985462852, 175112479, 796566943, 634064732, 15314528, 948296196, 372169070, 527112595, 543457147, 403254636, 716117257, 265437339, 940753107, 264003058, 174260313, 603246138, 74448054, 471623213, 864664725, 437510964, 830986646, 796086071, 518802978, 61666014, 898720630, 309217016, 56021001, 916231612, 277000272, 706979800, 311250545, 37324839, 450489823, 266926347, 183212216, 423618294, 74572727, 934569461, 363013195, 693031060, 965449814, 156889416, 162348493, 800847897, 782190250, 514293552, 53045111, 270813581, 149882221, 698200976, 564388552, 978656809, 782337421, 514393859, 30386276, 227731504, 965765172, 900078902, 392693990, 853859158, 165186159, 946452737, 395951347, 645700854, 829748303, 457502598, 520183378, 623993794, 969147303, 911974084, 512012856, 330688083, 149030098, 573737616, 631803080, 296333210, 149583812, 824908364, 773918222, 10988195, 410562259, 735833916, 135165486, 768463742, 25233644, 283919919, 637466064, 350222006, 691338231, 268183568, 914486657, 627430500, 452152341, 276162927, 733522351, 435516460, 807063730, 872039549, 972387941, 148727947, 143385098, 152435913, 101832737, 426233515, 100866052, 200446525, 27183925, 689059855, 479807397, 844116907, 151210726, 77190890, 931295115, 127853066, 703648003, 302086344, 135858450, 326445418, 578380283, 348189652, 425503794, 530285399, 953435699, 235802209, 667009534, 178327525, 194965011, 197507389, 920727221, 405671175, 216488814, 762330058, 799076865, 590596678, 812882846, 49586922, 648430532, 763297336, 542110471, 938309672, 800541233, 831343356, 60851126, 849035027, 997710721, 8399712, 416233908, 498087043, 928209989, 68173398, 427281526, 820252952, 608749864, 188223879, 917447244, 763953992, 250522611, 271555694, 748111456, 649814367, 336743989, 800806374, 45001758, 262756487, 417547073, 167689993, 332228159, 779690225, 967177630, 316782842, 877893684, 540222308, 862293629, 589841102, 526197105, 615237603, 105831651, 585638348, 645511615, 64479341, 545689073, 638623136, 788741342, 347809789, 554962142, 333028763, 313123068, 751025227, 670795317, 564559126, 813695087, 602022156, 203530457, 68423064, 661918019, 874764925, 349762805, 216168268, 381420861, 70131358, 341555446, 706478730, 451264851, 115541254, 931975578, 81720413, 699771442, 78739492, 672749810, 874379359, 867232968, 815950909, 481099563, 542286095, 667213653, 21237758, 730030770, 692184175, 757686257, 475277583, 505603664, 555582372, 550837021, 418116826, 940237315, 431122219, 75542239, 242113676, 26788369, 52420031, 710280517, 465913638, 45140102, 265275350, 295904297, 756106687, 632871535, 877565115, 434417507, 777131048, 458535751, 489617835, 856434956, 253872277, 428357682, 413827611, 351649239, 522681035, 244581005, 678415328, 982117508, 702586382, 91704271, 40191604, 515081736, 185593786, 528157400, 400535439, 770059263, 649174604, 956152156, 231827739, 836998314, 482904916, 673029576, 679246555, 814460786, 665202960, 717290340, 784945327, 922243204, 650248682, 750573416, 880749800, 733339167, 281526903, 263395572, 516684789, 984276491, 535452974, 414413446, 328513367, 660039557, 410007760, 885659553, 562888917, 763836818, 976130394, 6856376, 173807955, 335669154, 216934731, 334720363, 940236082, 420072484, 769247101, 156145180, 97386316, 594040901, 188246867, 85380470, 560896902, 324916830, 665684503, 403105929, 797098141, 797763533, 496443419, 116198486, 178715815, 755860977, 465223936, 220996027, 728716480, 360018913, 399405270, 688888374, 624568784, 731895849, 202735315, 280106357, 88041984, 30699121, 345864963, 552626733, 272986935, 907710674, 164719876, 966067927, 731393443, 544439795, 214620632, 255963813, 642064412, 738911213, 297867845, 769001806, 406943106, 168753180, 421624696, 501400568, 431304317, 469097399, 494692736, 662597881, 714848544, 301321408, 718967742, 187203319, 716903296, 412998027, 667557046, 292489182, 106255846, 202353861, 231057816, 36911375, 376452714, 870195979, 675878981, 936522824, 756557417, 394802810, 20388058, 80399866, 538161588, 622790576, 42164244, 427512246, 652686893, 473773580, 752057146, 482794288, 257942113, 8162518, 584549967, 158786660, 101488875, 331746091, 204335997, 487590922, 397899915, 960412634, 3215528, 397331920, 178459103, 144903904, 612873993, 850096574, 979241360, 882987902, 464032791, 568455601, 902797737, 52784216, 331403945, 201405894, 447898063, 432686495, 947619268, 592596600, 262340059, 241720634, 617282017, 861542283, 884532645, 905695638, 627723058, 993384673, 502230269, 948711147, 850077735, 18903873, 707288177, 624992761, 78395971, 86373245, 467923124, 966020525, 894122567, 802007037, 815265981, 706610181, 202178594, 163321672, 64043825, 534031775, 875317624, 565391831, 651245942, 575046689, 666023013, 527629973, 505848923, 729311846, 859114899, 725980102, 362919931, 163967401, 289619035, 164788341, 379166458, 309208236, 319962263, 687165230, 673350005, 9924223, 955787332, 866481377, 76251812, 717453538, 72618350, 200088920, 549493467, 105390784, 728006790, 889391719, 203777550, 386752086, 289758670, 378355617, 63093404, 174053512, 39887029, 628439237, 531565066, 295546108, 730957405, 847488814, 701339418, 428928152, 169852132, 34831676, 111786155, 249835413, 999508793, 385032520, 578272473, 268904257, 438535258, 213643218, 741807279, 207806260, 781485784, 563263510, 454703855, 84086410, 348532693, 888280619, 235219553, 229474922, 539848058, 43462709, 781398544, 378250187, 651414903, 571821523, 679682879, 674553332, 689968319, 186932191, 22597541, 761959583, 395667891, 530227057, 513774782, 173957375, 927922333, 913706361, 474043585, 866229694, 20214008, 973204600, 300185814, 729584510, 59765149, 233338521, 731136142, 835024839, 695630647, 969331025, 661408198, 572578273, 648101888, 975464263, 119981766, 333322639, 418915955, 225646226, 498274833, 748151607, 852415008, 394032544, 12074564, 980547543, 377869501, 186134329, 658842467, 284719165, 651963494, 26850858, 811401204, 403891519, 694560523, 803699686, 173381434, 195775650, 999437306, 575769011, 537413093, 946707945, 442970385, 222082404, 243009928, 552613872, 595775714, 307046154, 832770926, 483167581, 794527996, 823678666, 947885550, 389080074, 977261445, 88924167, 257559423, 435481910, 643568161, 191411565, 377839102, 579654770, 721412797, 875072369, 930478239, 388930152, 615152057, 140717895, 28989763, 978915976, 454139499, 623232575, 810860090, 28233955, 714510329, 794635737, 226418812, 796442428, 114935197, 228359259, 996108723, 571771354, 561600288, 397684366, 961079515, 551834188, 317935382, 131906374, 172964429, 257748395, 711032906, 455545065, 658859957, 688127312, 498813267, 827723585, 531181250, 806788229, 204818830, 698768443, 227847151, 271604801, 197989329, 461848056, 888075941, 405917352, 238652229, 525680312, 512390305, 285064637, 43491488, 577478334, 922069312, 492613294, 220988558, 38173571, 847369796, 883578137, 360885449, 629686530, 472775611, 861948745, 324176816, 790857624, 149639072, 784727680, 235093701, 170202779, 404664237, 152788488, 422637447, 35163092, 4021627, 834904252, 713335520, 930533513, 624363686, 318478556, 618944665, 893805990, 491628230, 211450847, 521847578, 244028525, 934015951, 788280159, 594139774, 872283237, 821545759, 518439273, 722460363, 59007373, 29085409, 397739139, 983973032, 887303534, 141977698, 536692996, 358392491, 495525296, 380437579, 418170779, 604098631, 674820188, 480971289, 642623991, 771598056, 744140171, 75942980, 929079928, 275385022, 806696429, 112279337, 402562079, 704275763, 268857305, 788402254, 839549267, 492621558, 851390643, 134133131, 996598120, 960320026, 213448833, 639292277, 910203306, 357764289, 956272087, 911292966, 82915487, 800998997, 330687359, 267051490, 680400237, 139462195, 156938228, 807142206, 892450892, 284370893, 111906631, 732669299, 662566717, 317618002, 693612120, 234297763, 551860502, 222224952, 143785636, 534257729, 828051594, 765631301, 531741461, 233929674, 34533070, 737024950, 966849313, 359814708, 989351342, 697138704, 561126477, 395337579, 9847331, 207507622, 904921089, 151431468, 304649546, 62007004, 281801693, 747696509, 885727163, 444172213, 64893327, 132331848, 811914118, 945491586, 646243925, 703083011, 548651159, 22716050, 778188892, 249621190, 638498351, 756352928, 476475467, 523902495, 537545715, 577165230, 589256470, 401470627, 464410718, 683129412, 22867792, 682604714, 392698591, 153146791, 371919743, 431456544, 810648567, 476421369, 682642470, 695708362, 490611402, 772003455, 551666534, 629442282, 239983770, 471496868, 847619799, 249614711, 21342267, 915069598, 690616273, 963850742, 488496550, 905767501, 237709284, 831815744, 630070890, 968733645, 626025921, 804386186, 93178989, 370280432, 526252091, 165779859, 177245787, 14466470, 858024389, 291105171, 351047570, 743422021, 352562578, 321336851, 231277096, 51676898, 490462258, 200432179, 216749628, 162864029, 11104975, 670204711, 169722347, 909831663, 164400425, 237314238, 591442014, 119997290, 178997383, 573875099, 690819516, 124131452, 674873164, 435115293, 131303401, 816977587, 133083465, 218137991, 752086584, 751233545, 223588982, 578428145, 19308472, 91254308, 837431563, 260424552, 235768036, 643593866, 609912566, 103352986, 262797647, 218692716, 463686887, 619260083, 846752917, 878422559, 996997754, 558797211, 749977374, 712440020, 872435361, 9738962, 429155551, 324918416, 341600767, 865945868, 980780214, 737696475, 383880758, 949713523, 842679021, 448537973, 36849221, 619601780, 535178308, 49831473, 957186326, 433860540, 828186735, 865996880, 622412058, 517712527, 195571513, 40745307, 994528102, 687802020, 85673784, 836445578, 275854327, 833465033, 506545519, 772778961, 281108901, 569761320, 885813326, 176069867, 310427859, 365994518, 398449017, 712911775, 527185744, 704355616, 283569821, 418021795, 984022993, 860290230, 314631016, 57353512, 123952776, 308441669, 628002367, 97110376, 522637077, 348770208, 881123256, 851406439, 148169877, 809012160, 774355510, 160386402, 334780617, 331132900, 419262091, 120389189, 289559617, 710719139, 727120519, 475219393, 973426185, 248658988, 52690586, 401765504, 800735876, 929007731, 888418811, 456488945, 550463315, 741795235, 114146980, 673996018, 508538457, 234034141, 597438792, 948324369, 390655650, 779162279, 212994187, 50168744, 530882099, 672323878, 326957068, 653087079, 354425872, 466954303, 200300359, 827234610, 980710467, 20103840, 456893246, 539833546, 215015772, 174724806, 34067153, 233710611, 230031652, 177569113, 932516046, 361716661, 14107425, 716245979, 830549502, 247506228, 912913425, 698589587, 483441355, 267030217, 790693845, 380799378, 567414712, 908292121, 403061885, 203799612, 300758339, 752852243, 638084473, 965287166, 893216564, 194993983, 742586256, 395865443, 515523954, 153887909, 352734709, 395026649, 957162111, 969224985, 908627646, 699961599, 156553228, 308989361, 729329311, 805340531, 829015985, 747863399, 725617474, 789237750, 84335675, 943821395, 62738447, 264209101, 772079343, 326542164, 351803069, 601159096, 407822132, 881664091, 840470219, 179601086, 774739992, 424596577, 29834891, 672070986, 620502421, 293017602, 983823949, 286710210, 227485897, 852773608, 657686674, 823242152, 798704415, 247548730, 848165881, 130168343, 936439023, 26203015, 959482327, 225732510, 884096417, 404776197, 203740115, 536131323, 698922690, 753321790, 714939677, 551757289, 227243537, 179092706, 703338288, 968760656, 462328677, 408847958, 713005856, 997068049, 316628895, 826759416, 139029355, 557561630, 414786316, 51970505, 146977528, 765701372, 4309412, 809992399, 99357539, 178184728, 487855507, 119159038, 819630356, 508282943, 52098609, 79982744, 683645425, 351933642, 119532322, 189632796, 547989989, 625893799, 317598655, 700887988, 478837681, 936549538, 764427415, 312823216, 443899656, 823450290, 420636173, 782255476, 594979496, 124401335, 299854803, 374665740, 5935766, 753577635, 439476831, 896493678, 850248759, 942389121, 276114471, 497437610, 671302088, 974452544, 335675155, 946401962, 753594090, 284723991, 908590307, 374944630, 145043909, 568992342, 370444886, 699452030, 676677991, 378383533, 219938765, 678776716, 172882577, 878864345, 98402108, 299244162, 852978481, 841212279, 173545375, 3899561, 365553016, 46403373, 179203219, 847307253, 371359718, 744432161, 228848980, 541836458, 27205679, 45303699, 862356755, 31222901, 186290795, 348824807, 615464549, 733333150, 595043096, 248992684, 912131200, 137635020, 909408460, 346277774, 667486366, 770103838, 181373336, 652114434, 816946179, 213216276, 104693486, 186628291, 997046993, 785918863, 331113453, 442734476, 271406031, 350385965, 232577575, 780714997, 425331079, 412349407, 849903668, 853478293, 917932902, 318201408, 801076769, 996229835, 783097315, 44101319, 262088126, 321176755, 344881142, 244467209, 326657323, 881871343, 465296073, 826553360, 938963826, 203324979, 89931370, 663472506, 966184759, 986084901, 498325218, 494907496, 764162405, 743891203, 842347955, 196892829, 200643081, 772374559, 661255358, 470573868, 53890740, 945290772, 408835299, 978818700, 522829596, 90984635, 967983528, 767358726, 596433247, 522398108, 971194152, 976263135, 179194730, 877417904, 589257952, 976474885, 129491800, 661749509, 863691518, 9549455, 775852494, 822952418, 33445284, 332422057, 559440902, 152015994, 774985053, 682318930, 2046519, 676434761, 953193729, 67281254, 935775518, 473182035, 96649753, 616503983, 437515619, 390256341, 650870711, 927135077, 427791923, 846025649, 473224586, 524545182, 805047072, 284810705, 200205493, 607430350, 320279143, 686519459, 819979820, 241546885, 324089038, 73878954, 995545658, 978770645, 152719647, 171272265, 986133463, 441366736, 701961712, 336602717, 599450616, 280982705, 825793522, 378441860, 421349660, 576967223, 799618615, 124614976, 395318516, 572565749, 548315494, 54838544, 978628356, 84724565, 688761623, 217068065, 954004742, 258006252, 494021098, 366716917, 507507681, 312736999, 553639034, 898568186, 259462903, 706525203, 591967943, 508071385, 300158538, 828260425, 209241040, 736453358, 614393002, 338636325, 340101498, 661304217, 633148191, 800416819, 519034525, 573734358, 451222433, 808013012, 246618386, 679456772, 964070957, 996318726, 934165701, 283596507, 218613223, 721093582, 192912286, 580674837, 567040166, 971990429, 177595968, 101685543, 776888895, 199220838, 284935310, 893970485, 805615443, 516521573, 454706888, 640750851, 574482315, 290327513, 266851222, 539036543, 275995030, 93419694, 929314250, 649593884, 690761902, 869403811, 675104472, 978125026, 124269845, 910195378, 314715035, 604687446, 67177689, 218223016, 577477087, 182824843, 747939552, 12009161, 548130357, 826294975, 595128503, 543572679, 856912855, 839025547, 684087773, 254506419, 687702726, 461937661, 750056046, 450646298, 734174047, 909894327, 724751158, 425956715, 280235740, 663255834, 743466744, 193446555, 463046420, 206356020, 16394203, 763786036, 313371781, 404666129, 448655502, 211449043, 957567001, 720170919, 705314647, 279958598, 774215005, 676059021, 713930772, 920436659, 426567305, 527912004, 304079926, 629873296, 786559823, 959636529, 248012568, 64073947, 720675876, 389033891, 270447183, 401681268, 366183946, 568668250, 459375911, 551477002, 61381772, 283137737, 729132602, 172363782, 961774599, 251448339, 927380355, 199437491, 110912171, 359343400, 703511058, 855207413, 973668059, 243208988, 183744484, 827765695, 624102097, 185441866, 338504856, 638929712, 565283932, 774351398, 986812604, 723553032, 649301096, 90672694, 36280326, 55102436, 910503658, 722927250, 516456359, 887156801, 922779649, 610245250, 645300396, 195648810, 181006802, 426184313, 404720039, 881281785, 324947404, 497946019, 843560340, 44985545, 178006142, 156797437, 199932722, 629208933, 408068359, 691271470, 672030824, 480887856, 176186290, 433523297, 861537802, 411495465, 368158634, 126890170, 721590398, 719128340, 219654120, 691984941, 551978586, 890177420, 192854958, 106600287, 121675369, 361565562, 42502862, 123496686, 409295336, 859626082, 701043117, 361933064, 589606968, 430891662, 854304203, 784181534, 512482745, 293234594, 90289708, 871748012, 780995957, 982816796, 431662634, 57785469, 806905081, 822544212, 981347029, 562876341, 618337607, 268892084, 157818764, 384212671, 554488750, 535305971, 95311142, 342686824, 905023909, 108897212, 489947306, 427804904, 442219133, 704528206, 484881615, 876185204, 514341710, 817805584, 303695350, 949242907, 663539953, 860386645, 61235214, 441730354, 261203338, 691847504, 976022487, 58124779, 828378157, 852589164, 795442535, 760196923, 616800000, 284846872, 259145613, 507097393, 283079947, 291780923, 616520002, 853748128, 600674990, 458159991, 249653169, 838520519, 992012864, 791444752, 835000603, 466779380, 408155909, 959012986, 367677394, 956093736, 942455956, 971212699, 866554714, 203675861, 336136282, 388934997, 903090181, 846261602, 305166134, 812215118, 884996343, 304010326, 734826539, 479189255, 28070259, 677113861, 96861155, 294275414, 74853599, 713267755, 126086405, 974395211, 534703297, 701953031, 504017759, 342938035, 848565296, 905828348, 454624052, 353763995, 418618819, 244252861, 564767004, 278704151, 81215403, 840144742, 911990113, 149842567, 190081036, 586992383, 805223968, 998350827, 82858083, 215865477, 399213517, 675115752, 434294159, 568937714, 589172693, 551329622, 429300130, 527067044, 114103778, 970162657, 554265033, 807799813, 966720577, 155886279, 93318618, 863068018, 663417586, 428597322, 768311552, 529589869, 205088116, 446762846, 855257254, 243740359, 245248267, 296615658, 878069524, 221304623, 20020497, 180591466, 696276686, 784021736, 217592774, 55136685, 358535157, 642927683, 426605337, 641931654, 747623667, 789817123, 212278649, 609271433, 118877065, 995657902, 431358002, 301996721, 901075172, 99978391, 887059619, 625505454, 983414605, 289195661, 941932858, 818635833, 989769991, 38932121, 738290655, 811966032, 895127362, 913457933, 262430141, 985524092, 520735039, 856053958, 411064253, 454184612, 370633066, 66169250, 401387290, 512978000, 797675502, 702216414, 292501168, 27035840, 20980464, 579087066, 960522256, 137343941, 35331000, 520447457, 592441901, 632631500, 415938067, 338265619, 757785323, 498127974, 762381104, 811594993, 977209475, 86756325, 623486612, 914860195, 289693981, 875050035, 674912583, 737082273, 54044610, 281297748, 798912788, 340869100, 329266946, 197691584, 772431351, 44932378, 141661722, 641572469, 961889025, 181523312, 611105775, 39240736, 889033400, 283221444, 549340906, 910983700, 173540102, 417305375, 661990343, 561377402, 241745028, 848609619, 27036938, 88986662, 278239855, 464428729, 745245120, 685259793, 839468956, 93616074, 852396558, 562906300, 372368032, 408809648, 509353381, 510255503, 841742684, 977937393, 269327246, 75774089, 521543219, 680232697, 793318122, 914020931, 365263164, 261764840, 572336450, 714409500, 361725036, 233145887, 635034, 168453028, 856619635, 512214019, 759842523, 695570615, 681616630, 687352498, 424131148, 622915700, 176433556, 1356920, 569437475, 16166543, 515421487, 277951468, 985341983, 77047551, 154452461, 193674634, 279784616, 890844278, 43357523, 149199588, 691109487, 979429155, 706186952, 617990618, 240139261, 513357538, 989796816, 685663034, 681649868, 891840614, 216455431, 217153879, 393120112, 916264925, 518601069, 336968287, 54605393, 928714802, 154935834, 139891478, 695579685, 373527246, 303565122, 449712612, 720836954, 300562856, 320776986, 386235728, 414216815, 397911065, 222558695, 932234694, 879844484, 644351441, 197047600, 937599735, 910214561, 934506663, 366011547, 936659969, 590449044, 35309448, 941227602, 842462544, 286331721, 263839697, 567619363, 277775851, 682854226, 582066992, 620304100, 900619171, 437408233, 236692618, 693576836, 642469736, 337791124, 363995641, 166480961, 591669650, 9601171, 797753131, 650443806, 51926543, 616530592, 39699910, 858569158, 494466750, 168346845, 529800585, 722470069, 454967955, 486748337, 909189537, 563736811, 165928053, 892781889, 557320141, 468544734, 467769258, 735142399, 693232783, 244581191, 158737663, 569411015, 937133830, 555573506, 584023892, 45514979, 366641830, 516965594, 127864007, 599737175, 540941579, 457748791, 342587965, 285014399, 458200550, 133762447, 305356301, 964391645, 19256571, 281179301, 265279977, 327677787, 505374624, 883389333, 723211979, 199923781, 71845322, 352905597, 358982615, 496044690, 781332524, 679807125, 369789537, 475885350, 188584285, 763585327, 923593808, 468748468, 384000886, 746282490, 880983912, 519967813, 238718933, 872368933, 699655473, 549833262, 201163931, 647727755, 873070192, 261969547, 774869486, 658477058, 526472346, 923450324, 654536006, 85280589, 404432919, 184162915, 81965951, 379508754, 949886563, 161402980, 866957406, 478426126, 823519204, 608141474, 922531218, 313588041, 591514124, 972713145, 932460039, 508119281, 412857241, 338688588, 86667000, 212778377, 406311944, 333257954, 613224191, 658597194, 878746376, 240758035, 559169287, 61247713, 848510230, 347820222, 401330094, 321360722, 726971334, 576288760, 855339159, 346752113, 644481064, 683572484, 22361884, 186257591, 705408077, 813232696, 138433, 416939425, 325198507, 479650463, 123153279, 852763063, 819751643, 895044242, 180738883, 735986068, 772235713, 777150671, 77625281, 33387583, 222221791, 255153903, 746325450, 724138889, 992719346, 462028031, 76814912, 659665789, 731421991, 426712852, 170415822, 667772473, 218613099, 82965167, 475948793, 18017803, 610579149, 84519294, 840851254, 956784568, 728798937, 526690426, 436589635, 657659202, 37673787, 143237000, 518369975, 736401100, 462249046, 967528991, 633956277, 212504584, 147946320, 838157263, 698375527, 911047808, 2112379, 62650335, 607517302, 788224652, 692555223, 787459138, 370298606, 138320252, 838455088, 211554121, 333379389, 834416661, 669565229, 984733549, 672886816, 815786599, 927139812, 845277256, 552144250, 102986942, 319310075, 190097936, 441519257, 383535305, 773291879, 425522825, 72323287, 769663762, 635135769, 278831064, 823138030, 600186534, 579069928, 485437765, 452869988, 327744262, 689777358, 43933874, 466059441, 238683426, 55027834, 138791975, 327227016, 965119520, 518551823, 684143604, 740539461, 492846397, 909114573, 83621729, 311687622, 694607492, 771529752, 862533823, 575447091, 375617442, 412417648, 765047085, 677232325, 570890818, 977060672, 96908642, 644357974, 922740790, 39346327, 334867513, 242387651, 515717728, 282885005, 817633035, 455807525, 940609961, 102916089, 916860055, 955446922, 394639929, 9580694, 909653624, 164068391, 363996372, 592364140, 464297419, 17738844, 929902256, 960749675, 775524740, 744823576, 707644584, 152988635, 870611783, 335458643, 373287695, 133476819, 476794662, 421421204, 110455183, 154734426, 376582643, 64460210, 214175431, 153393237, 785284890, 198167052, 138956500, 492433400, 982421043, 686856629, 644469297, 862258608, 479079847, 546545447, 128066971, 278490768, 479501382, 606336625, 605369659, 171690680, 154714939, 38998699, 855139640, 387486239, 80398044, 466592411, 86040910, 306164451, 848070078, 400601156, 692635761, 296862086, 963675837, 917070473, 853340600, 76941586, 230442938, 391633361, 247444684, 641638167, 537419359, 514857872, 348302942, 193258415, 519807161, 304989062, 67157224, 907103372, 329950166, 193520895, 467258783, 946958322, 823217746, 162519774, 461934862, 652103612, 445901211, 24964901, 702304566, 933121430, 297060790, 851205897, 590772842, 288362695, 209119567, 418512834, 662659011, 412905588, 578828240, 470221129, 702257131, 170489830, 939266469, 675405758, 853748905, 923438098, 909719171, 250481702, 92411582, 857315238, 477598875, 483719993, 393607936, 774681842, 488547192, 133425722, 989185861, 606923541, 909153954, 864365487, 985739225, 323481809, 666421964, 127568874, 288658543, 218707949, 207745933, 721776206, 690818156, 753991046, 106790446, 70492965, 248895034, 3888854, 688081923, 664183506, 362772768, 44798121, 977208145, 499757241, 813422568, 104985873, 591703747, 875073806, 354846152, 568442537, 549019314, 657399807, 545274982, 995491768, 134002060, 900330839, 231016969, 322355884, 844882973, 652023489, 856253350, 470769023, 4070868, 382399838, 778063748, 665122431, 673698232, 920862148, 489455230, 985065805, 978639184, 141406879, 469036110, 30245603, 890338625, 991897378, 265374853, 553592438, 560361744, 934958142, 502858389, 865345046, 210611866, 475268156, 858543907, 144622989, 295416124, 219223448, 980733336, 970356783, 150057058, 876029418, 265161907, 150061022, 160468163, 320761253, 399216040, 860746236, 780958182, 197867883, 606282350, 417840609, 921312874, 544091494, 525555317, 974724163, 31792867, 806227341, 598749635, 131384794, 914082353, 263082187, 441064482, 610998545, 887326800, 89525786, 479533190, 115597474, 385520374, 174642654, 385583842, 489653986, 245377407, 994601161, 537569865, 626820819, 835381719, 634322023, 716393058, 824290071, 527346211, 192536605, 128867157, 396820359, 42438323, 623004937, 47254737, 412069465, 678790244, 9368197, 568647714, 932105819, 987118018, 138597735, 9626518, 707500712, 852397403, 198638488, 310834781, 752432027, 289591972, 310875832, 355741031, 645737408, 582033185, 793653420, 995605163, 155328264, 752626906, 263056566, 864231785, 962327184, 579730600, 297276628, 341559589, 716259364, 419388711, 774847293, 561169861, 492675, 400036253, 29408368, 647079758, 815028072, 738497345, 986185182, 948782232, 745927532, 444670824, 501584101, 398900663, 108462413, 645437154, 565816266, 317541263, 117924655, 348250570, 347567627, 37792327, 980509871, 552972153, 486649679, 501821064, 756327448, 305454676, 431686156, 237656717, 85537551, 71055570, 254908147, 29893580, 10961973, 136204595, 870019758, 77883523, 35608087, 520266783, 769237400, 765999078, 489603360, 703252633, 630932994, 327258940, 984168809, 428504579, 867272661, 447041064, 434488668, 886939033, 463282561, 718106501, 985659870, 881670265, 167860139, 159870995, 938487378, 664798939, 114892475, 608818934, 214523256, 572289838, 634451681, 904613118, 97477390, 664434691, 267533432, 534648741, 379673233, 262046663, 237679865, 766903601, 91958881, 35724523, 765271767, 77106002, 452387494, 239590421, 795795501, 403343932, 420866367, 20883947, 920011195, 262235846, 348722455, 550162160, 730540697, 454092033, 856855583, 849437998, 850156839, 140503815, 166740999, 586145083, 74655515, 487131893, 466339883, 670453420, 249903137, 11453202, 582779608, 161926004, 993940009, 110447449, 123137747, 528095813, 481161358, 96622278, 87033895, 644685329, 533303538, 51105718, 480779880, 1119708, 293356552, 808320918, 183360904, 837364064, 124115041, 242115917, 647401929, 804802609, 159277818, 982182141, 107010127, 789120358, 559771904, 912147260, 319988088, 325193764, 707703983, 800014815, 565641045, 505018253, 246336619, 256037283, 987779955, 72572010, 6542688, 623788364, 861079835, 468799285, 302819078, 526703750, 965479376, 760640683, 651970928, 509114613, 492566908, 601117795, 231962349, 726128908, 919652642, 699015499, 921057003, 652820369, 613565903, 633095689, 386133945, 992937815, 866620071, 960767673, 876689645, 715670308, 890464237, 363726201, 288945882, 648137631, 508136696, 368466162, 679080748, 873582719, 606103896, 593705659, 529617762, 930719039, 44302096, 957687827, 973239258, 810173201, 157150255, 218080843, 637399197, 359848299, 576999495, 91728075, 888146407, 359849774, 329455553, 169083671, 434444574, 321917126, 558815121, 852510784, 584786037, 128375411, 95724102, 985404890, 600639445, 989706656, 417642499, 828183345, 958017122, 255742651, 682680751, 311956318, 530991703, 491193570, 401455034, 664446751, 867307850, 994123908, 631542205, 21842762, 194555116, 92474651, 199986077, 882802054, 407067009, 24148121, 793891333, 959578687, 419008134, 200024349, 89644610, 671319153, 505666795, 369187527, 650668235, 459490885, 885867437, 615870676, 883985047, 925520898, 445295071, 189549010, 494197105, 62676801, 846732628, 133392732, 275190421, 569457355, 327086586, 96655748, 935189154, 947049974, 426807156, 888636480, 237480432, 369256326, 368114554, 834856406, 111975091, 259980074, 893962700, 865217725, 52080364, 888861364, 196776666, 57827328, 25867708, 205589628, 491052557, 661975034, 381292252, 75677986, 125456351, 270656762, 953642866, 288038163, 750061836, 753029715, 922282949, 382794159, 81337824, 186784094, 501284552, 742731506, 966717639, 177242624, 597119971, 67780317, 305965164, 437455211, 193465003, 402372156, 63834817, 798073201, 148261780, 505513573, 693147006, 64291501, 817539826, 702100270, 485247939, 985706444, 48363806, 147384511, 591475544, 107020002, 306357844, 79299778, 798959752, 60988043, 534633778, 242852474, 110301064, 751349576, 510174190, 881636938, 168343749, 215559318, 897441198, 418717268, 666186481, 852245138, 712392505, 606201835, 811532622, 208536434, 351686150, 576277337, 866749802, 406867561, 879043027, 951829811, 287189357, 25317720, 927839643, 62580384, 68250395, 539776843, 943456676, 13607033, 55890180, 469429369, 313674918, 496926142, 590158852, 942028410, 181082939, 456819169, 823501226, 821918039, 658867917, 165985343, 13236369, 477812568, 195356200, 780017671, 565181094, 502621404, 820668613, 198983935, 809243809, 922347146, 971544104, 384129979, 541579753, 979933410, 499726816, 337778673, 972031359, 888464179, 680242810, 133222922, 156238912, 724676774, 670330800, 501814738, 673887328, 627705169, 444627388, 729260198, 118357076, 56040119, 882903327, 123211437, 238911993, 294036914, 95822766, 778495287, 658175835, 374659191, 143885078, 794685394, 64923833, 689311215, 596260004, 924742912, 755464028, 290804893, 827261106, 881571001, 408919886, 91872142, 822855727, 87340777, 135074632, 144088562, 920802599, 370078263, 842830914, 184150478, 194308155, 764789382, 345473081, 104088484, 623068309, 111612657, 980796848, 171779089, 683756847, 620906854, 874343312, 398726513, 55075781, 904667789, 651879920, 164106900, 18385467, 963162100, 736707013, 845421519, 126810181, 402174688, 640929866, 649279258, 368351815, 726678006, 674236488, 130999198, 455231609, 472840732, 931764509, 552857667, 800089279, 915094994, 270643000, 22466352, 210700536, 286906056, 613717992, 33139478, 793969158, 790845109, 811688309, 234704611, 988964662, 770735926, 891190880, 770608492, 118253055, 177906196, 193519646, 352412995, 444512326, 846307205, 203100985, 477101197, 992639287, 188789212, 387219973, 724543608, 261403135, 853004220, 423883453, 480301184, 282430160, 409942646, 401026816, 141944818, 604042137, 435863293, 665573908, 902158369, 145283633, 380654865, 641835548, 102028564, 384119001, 384600275, 511159078, 836396968, 872082324, 979075614, 906979332, 622876407, 453312437, 640279165, 484731185, 366694585, 139189855, 237449646, 578009481, 773168392, 879274962, 641106820, 204678227, 75893132, 338706002, 254089006, 70557507, 845082365, 487328601, 954992484, 516319010, 698808464, 238419489, 719516510, 842073053, 985617520, 955514271, 215110701, 248027260, 470097142, 798316639, 753921229, 796705586, 79565718, 636063128, 613168968, 672907267, 671675881, 75738245, 28980403, 218202013, 931245830, 841908082, 483144826, 173803338, 164866373, 684760137, 224306130, 452526936, 903821178, 418263865, 268257226, 940264080, 369043991, 425789659, 39045248, 944310459, 881218965, 243595442, 595394934, 673020397, 109121698, 797000910, 358283869, 709170659, 440688297, 283388812, 294903578, 633858796, 656555077, 215660436, 311022279, 786345367, 933038087, 738536434, 812581601, 955558827, 160330943, 637399393, 478049844, 118520433, 976493097, 854699494, 120375425, 618694348, 883132513, 557858376, 985210763, 348214013, 188170849, 475813660, 816950437, 602786237, 439311291, 750029628, 77287531, 678993949, 962565656, 925378397, 32583594, 575438520, 608304326, 219983167, 594022914, 922293693, 269356330, 763781999, 781181263, 169766696, 516769406, 494796662, 913774323, 619492348, 288162572, 131063863, 982349066, 929657348, 565234583, 784931761, 356330520, 211756201, 462272092, 745349241, 566130774, 927328003, 805045162, 618059179, 755903475, 577586257, 706848812, 13036909, 256131636, 708027217, 811322078, 891421970, 805557599, 983891517, 661349940, 810935855, 316341459, 279200890, 862446615, 3483248, 508705901, 533999051, 64847581, 615309817, 179888547, 986644037, 52856207, 91401430, 993718342, 778479225, 866969588, 747014320, 973155244, 942571134, 834196209, 828595426, 486886911, 837251838, 605402748, 581958116, 27381130, 466886987, 172012806, 368293471, 429733914, 284840152, 57615422, 762505126, 342580343, 722420044, 557164458, 589308226, 173317837, 143051927, 190795053, 91903137, 780862398, 490915954, 793807812, 898801416, 560566761, 480340903, 808720645, 756274021, 849686510, 768954905, 962634923, 863073495, 428144422, 854651824, 629610907, 537475896, 359586847, 49541213, 118544025, 181117874, 11331165, 298702456, 261330180, 361932773, 207676196, 643022521, 391126395, 534664063, 969543084, 309504557, 362495344, 179975309, 847547827, 792871617, 404234490, 739699410, 753468856, 633457039, 151067303, 996179049, 746372053, 334857550, 858447585, 93808194, 577522510, 680669816, 553832687, 925650269, 654593594, 514088883, 559585238, 758870277, 922953007, 181597535, 161351428, 897888261, 341189077, 613112897, 878415331, 205135612, 334766887, 670639172, 105013111, 885694530, 478447947, 347577888, 335241252, 732181396, 763163560, 65566032, 357464406, 332578764, 436493755, 521720324, 629703664, 404632646, 290640048, 152696514, 292091824, 586261954, 769375853, 308733950, 814577776, 513219969, 124924988, 890000375, 196217444, 596568186, 578478534, 152999241, 217833886, 327996243, 198817553, 18335900, 69136214, 502201371, 757967503, 837965101, 307164986, 664656645, 235155246, 940650369, 683799436, 77114171, 820940723, 808716158, 489145879, 565464602, 209440410, 566047143, 285270585, 235916202, 821216262, 544013185, 233851410, 106027076, 74784892, 544232952, 401489081, 193627458, 793256927, 328279295, 679659793, 434020867, 440669787, 936520446, 134977811, 263773308, 184791140, 764613006, 644857943, 128401939, 530676111, 239679076, 582551610, 222835502, 797368404, 457643568, 615456833, 456057786, 932076732, 193588111, 987585779, 394857593, 557353237, 125650444, 386948744, 90189356, 541264595, 620908120, 268091447, 769582225, 188310829, 817515836, 773410055, 913546957, 473951122, 288484831, 24018413, 309468094, 421788320, 710194634, 345049146, 65167289, 746806788, 24145607, 345628948, 658976461, 151424247, 864577502, 953189865, 900657932, 492138540, 641144456, 444179673, 242308958, 134729025, 685019242, 484228937, 289109631, 393000654, 247691289, 362388434, 353013084, 160712098, 145008971, 506657542, 119562502, 419059985, 891283700, 90538623, 424243464, 680349920, 742768917, 786284693, 796858360, 928296071, 119425213, 432438370, 730443469, 822610707, 214881609, 823204045, 545414678, 918464769, 486994648, 683560798, 968326259, 107739676, 799973541, 7842255, 295713188, 627163172, 632280084, 563823012, 80910174, 696244193, 320328226, 92745854, 398024632, 379237960, 765859202, 819044971, 635576275, 351786019, 339543591, 753866512, 8847769, 954117266, 47368518, 111596046, 957884656, 292780956, 294133132, 79308778, 76334065, 514135225, 313196018, 219248960, 226676378, 540392441, 583549643, 879660168, 52672829, 923764471, 579869408, 694395598, 49684522, 575677287, 889375904, 640871981, 638192739, 259371432, 245125451, 420155824, 911273717, 803333440, 861532825, 306339902, 292566521, 886937006, 39990828, 203734719, 513062695, 340765854, 963309868, 239849052, 712477462, 137982076, 296191762, 979813975, 392809531, 957417888, 302736070, 129541595, 806765031, 567376629, 391911632, 389469008, 899142782, 294163015, 746880511, 800641728, 892024106, 178801542, 569558218, 113853933, 302782832, 926719636, 738172268, 984909509, 467928016, 442325850, 54785939, 483217023, 783658882, 200211739, 962648261, 78745502, 363850154, 285241455, 841424497, 505301511, 718431476, 840999230, 465762850, 991157484, 625496919, 97484953, 415594843, 441278284, 604954900, 346106979, 279769422, 759775252, 917980935, 852471062, 477130464, 868850539, 597007019, 461227541, 400032143, 148951367, 827657295, 896788425, 38592294, 993933736, 572904700, 115056339, 612998189, 974561630, 731063237, 234512131, 119204213, 443987176, 518416941, 694535410, 47610758, 123755313, 250198342, 691264847, 747480044, 947036979, 836575981, 252717751, 888670534, 292592287, 170140815, 92197153, 361592303, 410487816, 265156617, 968765050, 397391166, 294641893, 949509152, 643964902, 66052433, 283922164, 782102666, 603171330, 500264259, 652990601, 170571806, 619199650, 482827276, 428793146, 126530568, 628910069, 106501047, 575897618, 156165975, 280951711, 511157359, 924704543, 98979201, 28949603, 743620996, 462799266, 207770275, 45473556, 446044438, 773221086, 22532630, 496954940, 602862990, 811371817, 677411092, 619759517, 623740402, 409821729, 75809123, 693529920, 916295994, 168829766, 729588433, 907806742, 280744576, 80736652, 88212806, 269465139, 676271035, 437784249, 998683805, 114384760, 797775160, 990487365, 475853579, 644531469, 135721008, 271050341, 197880957, 108260871, 500504991, 28344856, 119644058, 783898869, 519726108, 907938670, 876087533, 863972422, 279995294, 959961399, 877929916, 244131714, 273334672, 39213670, 876289802, 243868211, 81823802, 127835588, 982877175, 49507511, 525345585, 622524251, 584594345, 24167767, 16931087, 745291292, 665155687, 448592000, 306694953, 971490472, 762054763, 413474427, 254123173, 895480557, 396139955, 807572092, 928163487, 402003213, 88255690, 836592318, 848817787, 643991336, 592947426, 636814349, 291104244, 458080905, 650114644, 165383981, 894444609, 561240890, 422788280, 556960629, 532238523, 464057874, 811782551, 12862311, 183874805, 629387079, 978164931, 563616483, 599667062, 160129472, 105853678, 275398469, 604184785, 291691016, 201730159, 532299959, 797427656, 514981496, 903718286, 829367177, 565731860, 976654305, 182520539, 77023100, 594363644, 941447664, 617935423, 198662368, 162475057, 413481788, 87233241, 577902903, 498231233, 704186508, 34202367, 239870915, 133979897, 862259919, 548375455, 589398184, 224577865, 311443221, 644716994, 548123071, 223314404, 971766400, 715331252, 609341001, 670167917, 522483502, 81237751, 906851650, 735085071, 264550422, 990640316, 782914591, 931016105, 45146140, 738927113, 811906624, 342717318, 783433234, 447692723, 550108659, 493713864, 575085942, 52469506, 593446313, 675774748, 403531671, 139766043, 496330350, 918791009, 391962111, 109143610, 580196328, 668618060, 594344426, 387019182, 34588499, 872415956, 122390960, 933792081, 532546838, 248508445, 419044676, 373812638, 166450669, 267418174, 108726470, 310892512, 248648985, 690265612, 873878700, 490443440, 147000539, 485389392, 812683085, 837921741, 122551765, 821165578, 877037283, 392609423, 827818366, 86145271, 946798980, 289041047, 419047845, 765100683, 498640660, 444793376, 201512112, 677422697, 763961325, 889639554, 252941430, 162600125, 886911008, 48819518, 828837003, 745419495, 527972572, 243763674, 330060318, 235393485, 992353059, 529993337, 188777108, 184765630, 418602128, 290428938, 689973623, 217612194, 213939670, 98021044, 263632868, 875737589, 996319748, 906203287, 434564013, 785964111, 928970957, 472027635, 865784898, 990303137, 658720891, 583092975, 858077135, 595288342, 792853373, 22956291, 767595244, 381694958, 12363767, 232774577, 255112928, 706405221, 981212207, 673943501, 657162463, 342932328, 760674488, 893763676, 907632663, 85836251, 724814863, 864915016, 46227785, 496694979, 810388249, 558309473, 253743503, 517848716, 363605874, 706160889, 141718951, 428879012, 599114599, 806146313, 692303396, 577473294, 897633558, 490116388, 15082077, 862588672, 76407492, 498541602, 298927191, 412147397, 276600152, 19547432, 332867749, 362157081, 394952259, 435114384, 587544439, 585150651, 311052113, 161177773, 489613157, 35442959, 295217701, 951830544, 474516492, 384372056, 857029561, 236257214, 819806136, 967597726, 998208341, 97988719, 287025457, 939758773, 836094752, 708110786, 743732352, 524971596, 671905706, 523850490, 972951977, 988364584, 358683146, 605084797, 350579745, 348046498, 113286567, 560835241, 384664403, 114014495, 142959300, 153240017, 773459583, 827883421, 492731522, 343881157, 569561120, 361988396, 899773352, 520058288, 979696139, 329415076, 529657599, 151670063, 668677859, 506113898, 21611739, 177019398, 235930671, 720063953, 563265977, 634986901, 711300718, 800846526, 636298763, 246505599, 786852642, 465652184, 353136958, 979435984, 633127536, 824393013, 541984632, 464542490, 612578007, 810381888, 864041145, 540458852, 301573071, 817643246, 303335810, 734857216, 535723419, 95121151, 543254610, 861857760, 55658974, 132414756, 540163960, 986475715, 701252990, 929046411, 632498442, 579634528, 111993698, 752043852, 871543567, 398881272, 229078760, 76975139, 363325990, 883280557, 503743858, 578973684, 655709922, 596614267, 658211503, 61749568, 984139298, 324303959, 716931214, 612508263, 529416635, 788684054, 193421453, 737532029, 868785382, 977560644, 341854617, 44103495, 462860659, 855275834, 935030356, 40415643, 70769579, 340937965, 570965449, 378600617, 219137549, 860071352, 108303331, 954494663, 828024646, 595284475, 999763375, 596785205, 204545318, 714060734, 859277792, 28305004, 565223050, 399010084, 709560081, 485253195, 764295892, 52147975, 954820627, 331588433, 763865935, 300466426, 164462633, 138131629, 763223824, 203020879, 588657031, 398062819, 121632753, 710133920, 914065284, 736205880, 342566244, 818693789, 844525852, 911983174, 765099146, 291662734, 110425473, 950587092, 214642550, 33444705, 942387046, 133625106, 151054966, 226743880, 672810108, 265872509, 627132776, 243627886, 865846007, 203315144, 833594116, 931379601, 877284548, 158200736, 146499613, 933294109, 776284564, 78920479, 962769835, 848257118, 714656804, 608922755, 504188956, 88604208, 141599994, 500148079, 265917706, 152699572, 324980775, 370556307, 86325324, 316642701, 964608937, 402282666, 872568807, 463175636, 745251095, 542765501, 299314989, 276113811, 537055919, 672518117, 998277574, 47033417, 374734027, 368222286, 267793785, 412316502, 984404637, 62675374, 761999565, 539842062, 850492196, 684580119, 983621610, 102004847, 153391669, 326609677, 809522646, 736243, 504012410, 792265784, 709311814, 57121989, 417028710, 235344500, 971386087, 862507989, 890954061, 612650779, 129466949, 658117508, 484807118, 449451767, 457274039, 196926728, 858120224, 315835870, 155233901, 781448878, 116739510, 530973710, 72711986, 560086852, 532251578, 702961664, 941357519, 951450540, 127418878, 400494069, 100184374, 471947282, 825949303, 986350826, 232906033, 981388389, 610779475, 788392664, 544652586, 771743387, 719497126, 30664321, 686150227, 456960099, 428693951, 996004868, 649195670, 183193143, 172945154, 902152675, 907733645, 490006287, 702789002, 785043242, 574801914, 311792908, 367505695, 992534037, 451636454, 3255813, 346173929, 609002166, 822709599, 377896225, 979482894, 124768185, 581282415, 896343699, 549905804, 378145089, 651954726, 568914464, 812793355, 152404317, 399934841, 212763287, 683502967, 922266097, 273207312, 897986500, 84834995, 91578249, 83320662, 534103404, 191865440, 355821001, 435815553, 968154420, 141675384, 327472773, 838692365, 226887998, 736639904, 855902592, 412319062, 509876060, 192493553, 888283472, 446228612, 409722376, 936649958, 897866833, 549467096, 740935825, 314481057, 413284802, 66842714, 896486890, 285477130, 545503408, 365494676, 641134053, 966648385, 865078263, 720168744, 145239671, 60652243, 833294334, 73858127, 961186122, 508847154, 764416271, 832789285, 927560790, 470116590, 593727854, 569650196, 146275951, 648984603, 649349215, 70671097, 439020950, 750357122, 387817520, 754293099, 227169704, 819033052, 635014099, 890335204, 564596263, 572043362, 697230610, 650824676, 613658101, 597758844, 61779800, 761904653, 150561162, 748341599, 23105912, 11099129, 731180537, 229557725, 528354273, 20308276, 53148783, 827448019, 776882336, 682046106, 816352749, 8014307, 393532058, 651020432, 644246797, 34077462, 42487266, 83698184, 792137993, 586318563, 723256757, 906370956, 865884651, 495942269, 508845497, 914886877, 987671056, 39881740, 444961462, 5361646, 188778099, 95647456, 599250884, 347519161, 312502024, 241168115, 251979703, 247671045, 96019089, 97952823, 741006612, 696764454, 602080556, 953745028, 997620420, 379704609, 168844990, 536063758, 689938680, 564420098, 680423549, 645638380, 323652830, 782404417, 564768177, 463879172, 845903657, 20956740, 889694319, 339522889, 596110009, 12583949, 383323333, 732643918, 757017259, 417295870, 614695296, 501694564, 742287210, 179643013, 611021277, 55052747, 828791338, 179504666, 747493301, 613342537, 585604264, 357255174, 734605856, 491927534, 233462361, 297964477, 839277161, 214889761, 357618185, 514341264, 287955945, 289611537, 919147580, 175402028, 19049174, 258157369, 200306055, 713531064, 996344535, 24078143, 715597668, 828073954, 216122213, 519569263, 142416246, 438064241, 722393716, 234062607, 893961172, 653378070, 501841767, 785891713, 806863230, 54003447, 90452479, 845667537, 516966355, 469722905, 22456488, 570927933, 681370224, 25374206, 217622958, 14678636, 965255615, 555972750, 637556899, 693111536, 290943921, 405587583, 73292572, 487960173, 939425012, 609747636, 852328566, 94888950, 80561560, 889642843, 834357663, 660121132, 466518305, 649981171, 469206539, 417167943, 587613761, 995069220, 444256396, 813633361, 507665718, 862694849, 492875886, 418637740, 188738101, 550455062, 587129903, 930273402, 923818853, 936444257, 680825029, 642716749, 723048102, 485230163, 886869460, 165663979, 914219195, 448092070, 555710729, 35818035, 710585691, 415241062, 865681106, 511775066, 275656208, 77981242, 675378494, 988805318, 306452830, 288953934, 820562093, 489993134, 327741104, 61605881, 980273931, 743549388, 44001606, 567045224, 610644079, 382047574, 626626222, 185070251, 287124120, 929988801, 26020349, 633090885, 485834906, 575899144, 315701659, 758997435, 505446130, 348943968, 226113457, 61280073, 221865511, 849009006, 604314183, 405939528, 212378790, 803697676, 636537854, 150335512, 719135331, 93944300, 179680971, 741954805, 468356768, 607648038, 859433492, 702475937, 22919308, 245184181, 532379449, 592795536, 641490449, 686757910, 237893638, 719359056, 768379555, 944827994, 210549395, 755923093, 116466830, 888799946, 167241096, 86820782, 49810040, 384603584, 433600622, 875972610, 841511660, 434454442, 186726000, 50015846, 304563334, 847687029, 360024417, 763316165, 237243482, 914371325, 933863086, 995152009, 895527000, 270131991, 128527214, 165377505, 708122048, 973292259, 593928143, 13148382, 35786706, 431679633, 828570167, 28592723, 533371495, 339872139, 226444650, 132158800, 672683650, 491560056, 509463044, 219530178, 269992558, 788356877, 881711560, 409706341, 841786617, 89358101, 18731746, 594018661, 706240507, 493253535, 950001595, 794511495, 581385218, 799378228, 628242458, 265773540, 192804088, 412515048, 296449296, 773724238, 484698217, 981373104, 592949482, 496315822, 655394330, 358408945, 239336694, 466963646, 193973217, 340281349, 937251111, 532406998, 820781987, 307047312, 345653386, 269902552, 30603785, 540642137, 93835190, 153398487, 930464769, 250343537, 372176058, 592119519, 270205875, 263548965, 674887127, 390675889, 183108826, 959451916, 174611427, 477711405, 546951322, 727616423, 713456254, 833000165, 415865090, 387956411, 216565550, 10543741, 431934434, 926700437, 424889684, 615807843, 442704211, 839466076, 671245684, 419517537, 935935457, 977613366, 635644294, 677755907, 119287140, 665374840, 619201406, 353716322, 519889917, 213375671, 108576857, 355224643, 19910938, 60482932, 371081892, 665807198, 399689939, 827918656, 940397797, 837434491, 953062421, 989092593, 823072200, 345508367, 433469036, 915948129, 791505607, 409061271, 383237249, 390888078, 830024173, 620524261, 87563404, 44710266, 665573298, 723585757, 36474282, 66152603, 580293437, 631804689, 847594893, 801853116, 232935774, 64947737, 38491882, 694522215, 318702432, 546418803, 367222298, 374393133, 542102061, 839950002, 931207846, 338687493, 514186557, 206258521, 262711105, 443114775, 733629521, 392561162, 268209003, 880657874, 23759005, 221756989, 48287670, 426663824, 297299919, 837409968, 776528880, 496831684, 363252560, 79230480, 157970386, 625967817, 377459077, 522591750, 569613835, 532845864, 836895850, 650551915, 51068939, 573290551, 11879497, 534972109, 493874887, 814696211, 168534076, 499796468, 847032499, 273231748, 470753369, 749071197, 221962591, 893083433, 420044338, 237755039, 165346069, 923246429, 265133197, 65177637, 769006160, 204199945, 95663547, 404725799, 971589055, 205054763, 516863346, 202274382, 370755990, 8288495, 261369465, 501907744, 748320511, 601156094, 216939178, 642112590, 801295325, 958804358, 553357442, 132767341, 473883343, 768907509, 9304236, 44142753, 652240245, 781811160, 762339420, 575577409, 864770792, 456905405, 951684237, 314801543, 342058307, 685464831, 486252951, 297992214, 903345578, 168813680, 171131985, 624756403, 481519677, 379953663, 716464923, 427372267, 644188121, 465112911, 454839678, 455762916, 355207527, 515894308, 277093900, 825351710, 292123187, 117269123, 244664396, 494402783, 399027877, 457934139, 903343192, 622914743, 917563339, 315750333, 134259960, 342099166, 967199420, 969445031, 13355460, 865575442, 749554229, 884169886, 17712521, 8613831, 313473468, 371974110, 693866132, 190692181, 725819138, 536368536, 683143307, 950935752, 240245819, 939908881, 431278004, 441595349, 917286469, 997728073, 297741819, 219479257, 576279643, 742078962, 599545432, 512402877, 921043476, 923156449, 863756983, 958772914, 848222869, 364208854, 362325868, 246328646, 790348748, 644158144, 959729769, 631534193, 80735882, 635743335, 779205592, 927956197, 497180563, 107240882, 413693825, 825773225, 689934752, 686948234, 868249470, 555400797, 971074695, 963694316, 855895810, 287396960, 679130952, 926162324, 738461969, 548178100, 742821443, 819924075, 981139324, 577035828, 632891146, 665174353, 75612380, 429315029, 458906642, 732558092, 179004597, 22577735, 89854056, 119361238, 232321124, 905163613, 208318789, 734982214, 508277908, 19434932, 996919019, 838164846, 643432087, 656138378, 408996729, 175175380, 693250441, 100289959, 195201032, 150171227, 30255612, 737271334, 809545757, 732299538, 376198285, 663174789, 99906248, 468710448, 612181158, 211110772, 503711294, 138532608, 869344014, 86830342, 311559298, 155223948, 447284063, 313684310, 548227877, 758100555, 3312362, 519275050, 345368559, 864945874, 212652378, 310560410, 111775459, 541632201, 998142580, 993102436, 187690152, 461352518, 315548065, 476309371, 289783807, 247652763, 843743446, 569726761, 931563046, 679729148, 683976117, 987975504, 678161505, 685325048, 644589312, 451305357, 31925834, 611024072, 713672471, 354815930, 821121081, 946110038, 477228407, 980127251, 136547839, 157133471, 766178224, 131813231, 520244947, 262066246, 446083268, 310663618, 941110172, 259890681, 212875033, 164235656, 37970884, 728813841, 83988807, 347036714, 385714261, 667770262, 932997484, 272420441, 650672081, 246221322, 36046317, 632046649, 520414948, 467071024, 482096843, 717250233, 169512870, 596578227, 745756729, 259964095, 590374434, 220600978, 95958147, 85104650, 532887663, 83433182, 168003842, 763794270, 491000317, 355236127, 813777595, 3475933, 441882984, 32883713, 868494531, 918772744, 169620305, 672959854, 273615572, 229323136, 515951437, 847509232, 420197175, 958872863, 837373895, 58697726, 787366858, 197050808, 16339711, 724907065, 818904010, 832211168, 939110317, 285488822, 236928895, 517055946, 492562008, 359431479, 411223860, 983561814, 897378250, 525733246, 619268072, 269263360, 679565416, 875656265, 974033886, 879685621, 983054668, 19702960, 719524130, 103106121, 37045761, 903747112, 396870691, 985514887, 976066147, 510418773, 94144848, 33418512, 738511080, 720280533, 907684659, 595286481, 844842083, 780443622, 39923479, 596884952, 603488826, 303286895, 559992042, 403080425, 355861023, 142000286, 910309896, 448790307, 2293179, 545912839, 53121687, 141575627, 780753550, 55010458, 405306566, 679056558, 684692456, 4930352, 830206152, 163923668, 500387388, 956925316, 93565743, 550441957, 559301623, 317805914, 898132310, 972879930, 725304314, 232875370, 633526734, 868817897, 547243176, 691248236, 879534224, 317543206, 336681785, 640600309, 147652406, 71662527, 225431600, 291797757, 84229925, 758638785, 165127600, 43286017, 170761904, 599501346, 624791066, 971138440, 15405596, 797549553, 827035467, 123690702, 887533369, 763445966, 339263909, 308578347, 385540238, 213899257, 280158615, 283503171, 68894256, 9882790, 90062554, 631132945, 59904932, 112722012, 234400159, 925477865, 356008896, 720706084, 405495308, 639418188, 517359559, 898938262, 896837216, 392782601, 655070523, 503061362, 488185657, 863010871, 385225527, 481787573, 739707560, 776452360, 921376501, 153966235, 962764095, 598399409, 298698199, 781601284, 902533635, 472122155, 994152504);
+SELECT * FROM events WHERE kind = 'click' AND session_id IN ('25599be3014de8443bf1fd257f6382f8', 'a9c7ac0f74e82396ba9ecaabab4f08d5', 'fb40c328326bb64634a315b026e9186a', 'fafabf94a092f4ac7716a2ce4cedaae6', 'b86567239cc48a608001950206497e2b', 'cf35c56e389c79712304f93bc103a852', '383d40310979583f7130f151a516c493', 'a8dcf7fbbcd706006d0da2d3a449453c', 'c301afaa9a783fd5e3442735454e6c89', 'c2c3b4ba95ed2c31eabeed975e47566b', '2c25a4c35d55f0f65fb73c51bc58f3e4', '6f80697ccc923d3fe86059dad44b224c', 'ac9d7ecd617bc4b1f4e970ccfb2484af', '96090c24a73493d6ca4ddac9c0a81f48', '7c905ce68a7489d4333de4da8d8877db', '1c40edc9b568817ba9ffafdcb5b252a5', 'cc425ac62da9552b5f4157cb96b6f332', '033e9e3d2178b6e63733ebf23c90ec6b', '6f4d9cf19877495838e744181c5333d9', '86002be587b133c44807fe930c27d97b', '6ed67923e340153f45200b3e4f4637aa', 'd4c0cc00bf4d8917eb09e7476499f0cf', '70d29f9e41bea5dbc23be6a09a440937', 'cceb5e8e1abc0f288db0dbd9b62a20dd', '5b4783323335565234f64d5c5da59e76', '749562231d21a8252312ee37d9e4a5f7', 'ac2e99453cf0aa9a4f3e631051b4923a', 'a6dd2549a92e143f5cf4c3d931132868', '96f17c89954e30e99384008fa675670c', '6b2ddbf52c0f91b86df762d3632d99e8', 'a58670d02e9539e82003d43da5331762', '48b808c707a503b05273046c2b570177', '6ae8ddc9f72a762ee5b4c52c6f87c06f', '9f61515aeba2efcc1ba1b39acc2174f1', '629c0e29cc2bd323665e8492de38438e', '80d34930cdb6e95d9ac2ee4e1054655c', '4c98805afe1e0782e5a76a24e32e9a81', 'd82fc9eedc24e176d031ae8a344f30ef', '03fe31a95aabade841dbf2c77909bb25', '87ff400e3c086d5f27b29f62c85ce163', '7762b4b116df4b33ddef60c9da678362', '96b90bc6404fc6fa3d2d708bb34bd7d6', 'ecdc6ade034676e6ca29f4324ded1cbe', '312e413fa5ccdda88e2993e8505b9a81', '8018522e0522b9238e27271cc164c7d1', '198fdb56ce2b73a835e7d4ca7b2fe8e3', '4844f5fac8a34126dfeed23dcaf92c58', '9124fb6ecf410295df1271b6c0ea45f6', 'e73fa2d5b4709f1300a18551a4adcc0a', '2ea5eeb539d81cf9fb2225ed8d94f920', '0adc8b0baadb4eedb1708bf233ab1113', '240b411b62012687e4e65b94003ba926', 'bf812c3ddd6759339df423e00ceaec83', 'e20f334fc239313a96b0f21c7b94db75', 'f9139119d8deb8aa2da6381ce30a784b', '1c75b125de555095a6b6b05b8e4ca0b8', '35fd4938e395321b09d569d810acaf6f', '622d2b975f79e9551e59fda631ae0ebd', '4b65bfef20cd02b31f858049bf657ace', 'b38d7c9bec8afcf1da77cf78264d34b8', '1e9ff1d70b15e7854861dcf5cae36b68', '4fb86a6c1b75897a1758d3bc7a4299d0', '23c760f5ba03d90f10b36a20bd57f5b0', '53a8aea2f3e770cafe30bbfe8a03e02d', '0e4d1d7f57f2a75ed4a5f3c755e637b3', '0d1382c65e9692d427b01f0660e296d3', 'dfc34aa1de7bfa4088acf7cbe53ba879', '5d82665387bce591d9f5d97014431c88', '63f562736624f1b3cc0472dd4934b29a', '4926dd26bc8cf46485a75b4a56ce3181', 'a413cf9debd254c454bc667a7c7bf3c0', '32c8901c1fd09ae36324618ac40ad66d', '0a191829b7ff13fc5638af1f9ff5c5b7', 'eb5168537cb144a0608cca15f681209c', '44bd06dd68cd1c2c8f2540ce3f4f7c7f', '88214200eda2049f78f54123bbf3ddc0', '8b2b508d23cb116d2514209567194ddd', '1befab0d70ab960a458aca20ba673027', '572be50081875e573a004c8aa3cfea69', '0c7bbf297e0724d5b7b718661b42ce2a', '94335777e21a80467bc6bf668c0d7c72', '243655e193d3ada8d8e0ad4f0e50ef8f', '5692132837e8f138c7c3e2e41657b943', 'ac1987cea246b0ef205b240116cd98ed', 'fe5480fb1f5abc25b684e25d4db6a961', 'b4265a0e8ec8f5a5419c1b208cfe12f2', '88025e6207b0f5b1f0b24ae19ac3229d', '1f9816ce105db6c0b1646a3feb3954c7', '6549b705385f3a754a5d36609d7f7c7e', '1e19c037e9c2e8792fe3e41b8c3fc5f4', 'a44c2888e04a9fe55e1b69b59a95db91', '84e3b2dab51bc409816883563fa60913', 'c0078c75e8e0b2de841d99c45cf65394', '54b3bd4a88d6d47abcb6109caafcc353', '232d3ed91010a5ca1aee72f43029b2c0', '6b67f64055f2802e5b4cdf91fb5083b1', '195ffad1730da8d0b2e09e0fc7fcdf6d', 'be1f00da2010843236bd675c02a0d5c1', '43a39eab7e8cebefd9c67d62ec6e0c14', '8d28b27c66cd14d28e18b866e164a53c', '7f05d6d057ded64341570336cdf3f151', 'f018998e4f3d04120e7343a3e56b8839', 'e801b509597945c03e8df4a4d1bd65b3', '690507128db9691be444d755e7a5f6d0', '49aece9a8c5b63d62ac54392ea4c74f3', '0e5eaf7cb91a5867ed8d0ddfd4c3ecf4', '43f4ba40e0d4262e43a1da6db7ac90cc', 'fb913f2e731e587e5b8b314cf060e90e', 'eafb0500df75855e7076657a79c7e621', '01dd25309566cb8fa6ebc18c6fb3ac73', '55621b5998fbcaf95b657f23ba80cc34', '3bf77f9693ced6ac301a451045f6e8ac', 'e2f2c5fb7339d4973817a6cda32f102f', '721ced035ee039c88fb3b80fd07594b8', 'a0b84afce32291dc4b575b29c17f61ba', '065c98ca150904dc596b1d82873d8b59', 'cee4cf44dbda927629d0af9c6f0d81c6', 'b1c3d3feeb058b23b001deacd610b5d1', '9e5a37d05815eb676e9ea53217cb2bc4', 'a1fe2b701b3cd4c005a64c1d6114912d', '9e3393358b5b443fd60e9d326b45b804', 'b15b564478c5e53a85ea86ff5ac3089a', '6934a8170f9f3e7cc85aacb3739d12b1', 'a2cc2d3d1c5a4fe51cc54a0d35254e81', 'f0b4feb84445597aa55680ec89f2d51d', '9399e56b26df54ad06a8b5c40c842547', '0b5770bc1b4a48a5e85bfb98c52b449c', 'a526423e1a514af8add6029ddf338f8c', '8a80dbb0a129f633d35c8cae62e09c67', 'c9c53e2f0ea296d8ae4bb8b25ad637b1', '033022e835fa0981374c240172d75685', '29dda76e854a5bf1b5e4b2c3c4a986bb', '1c0a4cb7cc7579441e446f97c0541e85', 'e2418836e3cc901ae49e8c4be792f53e', 'baf28f1799e6a62e799d0d1e5feab8a6', '1de54389f770007a4a1b3af4a1c1f544', '4652f881e6e7a8189d059ad0f149f388', 'b94c1e6083f5954a0d3216e409cfc1e9', 'a8a9de480a01578000d12f81f021fbfc', '4932280d2a80d5a42f8143fd3d12cba7', 'be1d9f88dbe8448e5c5b2e52614953b7', '1475d911919a4240a46e5dbff7082b62', '8a6107026810940b51073d540d15c39b', '6fc175b58cd4f8b7f54c92a43bac8436', 'd1d2c867f5d413aecfa7c099178db42c', '3f56e00ab246d718c1b66e9bdee58286', 'cacc6b7334a5386f24fef3527441fd1b', '7e2b0cd5a7c75a7038fe118e7fbcfef9', '9bf9fa998c5651fd6b9475c65b9926e2', '38b936dcac452369f20bac16bc231656', 'c5f03775fb95dd381276f23494ad1f77', '8f8026f316d826fe39fecf82df0fff6a', 'dceff7f3176122b044c354feeed377a8', 'd125ed08f6cdca7fa1d4c7b80c0b184f', '337399914e60bb4c5ad46135a4df000a', '2f7f102a274d27c8ab6323992c7dfae7', 'fd0ab8a5e11eb82210930dc7dc6bd41f', '18234b834994d082d90e16e842a970cf', '14c4dd43052173756a00307a809cc854', '98bf1a8a1e0b55d70fba1e34aaf4eeff', 'f5bc6ecf5469e054cb7a8f0a0e2c77ce', '6487c38e236c27bbe740173b679481f2', 'a9d328c4fb80eddd083b3416ef3a1ebc', '1fbe4ddd900e44117cb72da54b316081', '2a002ead0cec408d3cefe2ae388d8a36', '524e24bca4ed0149eec15d16f595639e', '91ffcd8da29daa85fa03be0e348f1dcb', 'c690598fd518f240b86ce1111b352e56', 'd8a694b53d4e790439a80b828f9664c1', '178d835ad48d3537edd58ae1dc4f7f76', '4383fbe89eab5206507fcac2ca0a782b', 'c8bbf637b88e2ddd9a3b2483c4ff279b', '7ab35187ad05263eded7a94bb58fa276', 'a507f77b57a59aedfde73dec6bbc4198', '71b916a84d92b2b2b9228c01d4679fac', '9663820d964109a49ecd5bc5445b7d4a', '8384fbc94d78049accf7ae0552ee9c3d', '470da4f3db6db2fa53ec9070b806fc7b', '45576c686aea49fd5b100f5cb30669d3', 'fc88dda50a71be558e358e5cff0a0534', '4359cff0983064fafe280abfc93e6703', '91bca1ab4a3afb5168e6fca4340bcb02', '122bea4ac16fb97156fe73f6e3caa133', 'de3f2cc769d906a935c59475df28a536', '0c99fae177ce621774023731625d3ac8', '3e1b6d5c896376579877ecb066dba1d1', 'bb115cecc3278946e566d1066ce54b47', '50a92ffc87d9c3af06a3657250c1899a', '4b70c3f072cdaed31774238c511cc59d', 'd49ec3fd49d2c200cd155a8e31f0e243', '77c8f24af9e17150e2ee9d4f5d9d5880', '92beb83ed30060e9931410c312a49b66', 'f44ec47ed28464ef44ec11dffcde1aea', 'efa586493249967c2c0f1914224659c3', 'c7ad17ecb5e9852b35d5e0aa49dc2f8e', '0c72948b227dc50c7b9f9ac0ba46beaa', '9157d332baaeed57c9d3be7b34928260', 'ffd5fff74fdcf9851bc852fba6efdf1f', 'a0f72a68e6b4405cdbfc46023ce16189', 'e116a95cd6febed6163d3064907bcdba', 'f4a27ff370d543640abfbdd8e5f21181', 'ca7de41a6dba64a7c611b7ce278a5a8b', 'a59d828a13bb154de9c639ffdd886af7', '6e55b51af63d621c611cc4e3d3abf13e', '83784cb890c56b2a668612e72f057fc5', 'a3cf1658329e674eaf4c84f5f79e3616', 'c2854320a457ed707cec91ae81e28abb', 'e7e4cacc437b969b05c65c6fc02b2bfc', '4e8a8c3fab65fb643fb18311cfbe2055', '7e3e24c6565b21b8bad7314ed300a39f', '1789058a0f13786b5b25a30b2a0554ff', '78973e3659fa8166b6c5a3acf3507a2f', '67d61b523ec087a64ff8851a50b2e1fb', 'f856913be61162ed92f05b5cd281cc5b', '5277dff2c5f6e7eda15f9ab95a4348a6', '48b4dbce9116480b1fb842faf7a8b2a2', '3132bee04644ca0c2eb1fb593599ee8a', '61a4744c7f021021bf9054b931311764', '29a2c70cf9f751d051bc8108c9157fe1', 'e5326ae4febaa573bc2aa3a77b477670', '4236cb2d693c3342b3273d0aa23b15b8', '1d6a29b362ce4996748cb524ccd0381d', '208f254e62b6372349887c36fb009fdf', 'ace24608bb6d46397f36e250454dd252', 'c1a2bc9c5296350085e34baacadc7d1a', 'c8226ccb07debd1cdb6b5ceea7b1b9d5', 'a371bd4b4e1862336cfa2032ce191bb1', 'b1e20e30262b501c9aabad04d7afa757', 'd65fac5525439c97c53c5839d0b6ba61', 'cab2b90da3fd1a1e7576dce43fecf59e', 'd8b4fd4fc0b2cc267396352e3dab08f5', 'da04015968b9a0ec723b2a2ae0077047', 'f2b5c3bdbda8d555214bed69ba713202', 'fd2d28fc5233b1960e180c1be9574f05', '18fece99d7cf9d6fbfeecc089fbc82e1', '450af84c640a42ad4bf15c58ba23ed15', '3aefdc73dfca85c16eeecb12a68c4430', '8560d9fa98e9ee6a2b7ed98797b0f5eb', '57c3171e15d377bfba1b5cf1112d9b15', '0ccf188092352c290fabdb7f659319af', 'fa1c8037147e186003ba1d088788a218', '3c2b1c3b17dc733ab2cf1d9cbe9f71f5', '0373c7e6d157a577e501f7682397e86e', '066b8ca953dd264bf2db9cdb0c1204a1', '11df3a10cde53f0d32a9b90b5e7f29b7', '381a86ea2268762ec58cca47f75fb4b7', '602dbd581c43608e65a5126f7fd6e5e7', 'd0f054aedd616991958fef2ce3ec58c0', '223cf5ed8a85a84396b4d93e7bcf331d', 'ae0095376363f94f100e1eaa9e86a194', '7fd8d0b4f57f1f76718772a121b1119c', '3f6119632d88df691d6b646bf201e57e', 'f6757564268194bdea18dc95d2353178', '6c0997e1afc73e78555e4879ea64ca66', 'caffbeb553fe231ce4abb87e6b7adad7', 'b52b0cb8420617cf535f469f27ea4cf7', '21bf80e32cb21afd4a949516cb46f64b', '5fee4c358d29861ce966bba6cc4b01ba', 'df74e1941a4777d0f66b8e1ca5343344', 'ea9fc0433d415ed48a60ab41dfd75259', '80701cb3fc8b36dc6ab0d55f68a3df94', '02333c2e059523b6285f8315f6e255e9', '2338584f8b3244796d358e2075108329', '7c76ecc3fca269855f64fda0d64f9418', 'c1aabddf44f9c51d591e9ccaa3a9e5ce', '7ada08ea7d3d63b1c986747ea7335caa', 'fc6849ccbf82e6a089fdf1f2d89434ea', '747cfe962ebacbb3801117448c68229a', '0916fbc9909ade1fb84069643f5c65ae', '3318d0c6c946fc7d44be92018b74f441', '058aaf9f16f17a3282b8bf04f0634f4f', 'c415520fd4f912f6c498d7b0dfc3a1bb', 'ea337943bcd185e976630396a84045f0', '611399f76987e3c37c01b1a5052ff4a1', '682a9e5348dfb2f819e57ae02cc7ff2f', 'b777541f4b8cbfc05a9fe484516f2fcf', '1b98bc4575a798ddd430d1ac77341c31', '87c66d3a954d477a84ab402ba5ccff7b', '732db9796d9478216470477dd722dbdd', '651cd9b6d7907bcef7652aee66f59c77', '8fdf66e957ad1cd1689a3b78c41bd407', '9d56ad4eab7f07ade627f22105d62810', '5cbd26718901fdf7fb2b4d93d88fdd50', 'd30d24998125fda5c92bfcc927348b7c', 'fecb3535f703f249ea99b04c9ca419b2', '461942fbedf2311188bea1505a2e2b24', 'a5f3b16b8523b2fb8872da0b70396897', 'b4848366cbf39e1b19e5cfe270a5c3f6', '437e5eac4d219943bb12d023714a1f75', 'b2055b7f8bc42c324d4ca558f5addbe6', 'e86b3c8e310bd6a9013dd0bea45d063f', '8456a4ac8f207516bb93246223bab6ed', '52affc75771330498c6e2d6d47e2109d', '3d3294f83b15e8d4cfeac39ba3504fe0', '0174e5b203441ac2aff9092e4231194e', 'ec0cc77af4c812bc093f8b4ffbd4cdcc', '14ab70c9a1271f740143f98754050036', '88cf7cc7f71d6c71c06a17f6ce243d3d', 'ddd9529a5267f1e523a718e3b4dbedd3', '739592670b0f96d21be84fd0bde0eb6b', 'cf70baab99fb24cdaa591b87e2b43d78', '801f79a279a30220af5c1a27dc95907f', '3d7dc0465fc116b51f7bb2496ecf71a8', '8221d9b10e728fe98e8768f65d7c5fc1', 'fb860f69a8f048144bea4d47da07a39f', 'ed40e0026f16465ec1a122b683b3e47c', 'f13b1ce35de88a8938bc4b167b3aa23a', '87ff5b0fe0d34476f38c8a27a972ac6b', 'f8abc7398b96e43aefa7f11fc2e380ee', '3d0bd32aa0cdfc2aedee2c80cbe9f24f', '0d4047a54a092587357facf54714172b', '2376dd1271e740c9e39969813217ac78', '048499803367371881af8b1e1e6b5caa', 'de634dc9f7c38630c72958a8fef3a09a', '43a1ad095bfa3d89ea2bdecb0818aa04', 'b3579752f317a8d7315034360f48ca39', '1f16abb20dfe6d02889b0dcc36dd7acd', '63bb3e8609770f2c9d3f61015b72d69a', 'b91eed05d666a463b5efde3f27ce1ffd', '31a39fe0c0ae9c7a5ee145847349e5b2', 'ec8a90f21cf01afd09b91898bd847692', '9d53370f7654a1f700c15caab0173c5b', 'f0f77b363e7444f1ad1b9e29dbc14461', 'fc32541e45627b5ba77fc29c36b9f926', 'a36f0a99bc256d87f7d8f3009f62bf25', '14542bd414d433a57fd160c767b7e353', '11a5d56c94f499f0572ddd78f31e45c7', '61bb2cef8aec9f438edcf50ff2a3d60d', 'e1d907ed0b86aebeeb24e67e5ebbd68e', '2393251455d9606d89b7db7bb1aa6327', 'ca7d65afc6b404fd870c28435bb70c65', '40549b0bb701ea5adef00c6992dcfb95', 'b5c35931bd10a65b0501d6810f4a736d', '0b93b2e5113a28754d217cac41116328', '7950d0baf07d764348f9287459151f88', 'bef3d1d08730f4fd2eaea6cbabfb237e', '88a62428e7cb5f10ad72acc49afb931a', '5db122a9468fb21668f0e76078e39c21', '50915e6053c1598b7e2abeed0bd8ca3a', '424f36cda0bf119cb78a69fa17e2fb23', '82ad2e8aca8d5a9372fe52e83abcf974', '18965b7c1ebd5d8c70735852f1315ab0', '46941620c281d2c9cd35716e47750604', 'ccf825c57ad06ec847e34727f2509727', '9f42ab614a9a483edb2a8e54454bffa1', '0d8fce94d56ae18dd9ea1c024275df16', 'e8dbde704978ab35152ee41c5fae8e1a', '47e73d1d8d25ba9cb714203387f6ea8f', 'c182986563454dd7f83b517754d426c1', '62903d2c59674857dafb3a8d63236f3c', '0dee6e646b2ae6f4ce48e0a2e65f6ad9', 'f6a90d78191f38ea6624a1932950161e', '1cf3c059014e7e59fd85d95843b2ab62', '4962a7f410ae440044bf4fab4da7e0fa', '7bf296828321ca56dceed37c0336d756', 'cfbefec2f371a0b5fa3d334e5ad9c489', '70669d71c6388aa125f493cd7a48f5c3', '2bf9136781c0964c310bb41c8031c2b8', '91080cfad94d3609469ecdfefb4e6f64', 'd1e7c7e5831c3959fc3600086dfee9ba', '65f1009346c6c73b5bc18c81ab90e0d9', '468090912183ae7d6a92c071e02779a7', '66d8553923322a1eb29caa4effd06f20', '44ce2710a9ec1e0c66e47628db8818d4', 'f889655268a2bf1f39eb02efcacc8a00', 'fb23998ba226bc7e05ed817a1d2a1e81', '9957ca4fbfc76badb120d90f09bb6abd', 'ba93a17240483567afcfc63347b58740', '0fe26d3c2de3036d3de012434e7c308a', '940518bcc34cb665f865d02c436a2916', 'e3715233e62c0ae4c4bcc5a7915fadc2', '0e1a97d2b73e79563c3dd69611ea87b1', 'b0d84b9148c00ca8e12284d46015c55d', '19db09e275c7ae547742f954e3545fd1', '04d7ab2b3246c002ca37c16a6407b975', 'f10cc371d0b063f3c9232ed581ee4960', '5369f5b4343a9b565f2bce5d3c928539', '187df647e29d9c43ce1e6f94bd8c4056', 'da47c5c0288ff58e3ef4c5988b8d891a', 'a2ecb2a58f101e57493f009b05885aca', 'b11185ac4174003597881673c8f78dde', '4fe4509c7613d52e38000a3b51fa6292', 'f2cb74a55f36634e5fe554f331272ffc', 'adcc42b922430df824067c87aaa34e4c', 'f9f16e67d8d96b9fc813c196e08252ea', '1e9a8ee4099de52523c7f0d7df941287', 'cdf0491ecf2cf64391edfaac3b0966b8', 'b50c8ce729d4e7e0a3b2f05d1e3f6914', 'e0e27366fbafdb3471b28b29e1b99de6', 'a4a64942fa388cd47fe500eb4cbd5329', 'a39985a5a9b002f709dd0a4bdf95a071', '2e54a555dfb9194e1e14fc8700bd617e', '3dd5265bff0c18cbf0219ce0b1de344a', 'e585f41e69cb9debe681af6a2cee6446', 'a0f17055bda9a2582501d6195bafba05', '15e51396f210b7d908e0e21100f79d19', '01b29957635f4dd1adc8b4f7c9a40102', 'e822ac71c6bb0f1eabc5bdae95409a50', 'f3d561be024c279e3d6100232e5e7584', '06ed3d1c4cc06ba5a7527fe365e9b22f', '464e63d0e8535f55442dfa4d60bfdc60', '7168aa589fdcd6303816938eb9407715', 'a41cac2b267ab74920a60ab1b1e4174b', '6575e811dec7c73ebdfa2931440a24b2', 'a0b5a0cada1ce91b163561a94e8fb195', '48c5953db352030356be20eb99099966', 'b510ef7532061e28bb48c988a292a3f7', 'bd6fecabebad0520161166366a791476', '9e4a2cea10a58cc7ea68aff9f1db06ec', '3fb2bc3b0d2acfd74e92726374f19c12', '7342888dffff4cd66426cf5a1e4fccbd', 'e9b6ae9f2d04ba0f8eeb9b03074e89f9', '93d57ef0c8fa1a551d8cc7a2aa332854', '95b1ea9c18e50e7fa0c11434c3156203', 'ea0cb0e20a6b4067ab635404a2e728a4', '02bda8fd22cce47975ccd4eba9a8e69f', '6df80462ddb4d36687a6c1085aafc7de', 'd294037dfd1a9078136857f9bd0c3133', '00a815b2972c8cfa68a7822e8eae9fc1', '85f075916c265be998d226f0a29f327b', 'a98471e16903f2b049f8e4d8a77fd701', 'e901332c60f6882a5353321c317ad34d', '6dbf137c977a8c763ac27bae4f95ee2b', '658a53fa63ee102c83a0f4b313203a2f', '9fcb4aa9d593a77494ab510365655f6a', '5b96e342b9cbfbffcef355bf3f561af9', '61466a21bad08c7ec8c0bf888b63ebb8', '087f1b6df923a5a26f68cb51502a6300', 'badda4d3d6fa51cd6b598e6155cf426d', '835d6d153495e69bd0c9befb3ebeb868', '9898abd19aed8a0ae9fe9db4e6866729', '78d6df99d71986f07bfaec3c0607f6fe', '54db21669d1d58ada569041697acb66f', 'cdb20e13cd70e497369c02ab1961da46', 'd4af2cb7e428a242254ecd15cfb3adc6', 'e3ba24cfa7dda69eab822f91b21300fa', '421017dc3f49a78abd170f8218b751d6', '8b53dd41d2db29daa205f2d087119f81', 'b7b94343c7ffbfb5ab53952c8c863fbf', '87008be01501d1fa76affedec23d414d', '48e1faac114ae91b47c76654c910ba37', '6cb48043196f57f70a2cb61d1c2e1daf', 'd49b323ae3038d00bdc84d2990865085', '5643135897c93973a916207eaa41544a', 'd17663d3a4e2462c0f360b9d417f7b14', 'a791b676a512712cf227cef78b64ce59', '07b2e9b9542ed32ad2f8a6187667f6b3', '99d53ed67ba1687ed9d2d54981ef8c84', 'b6f49e53c2c45f9e620c34ecc2ecd102', 'f08ca73f50d31dc0073d24c6d574d5c5', 'cc618a2a2df1387d06a87ab375492ef0', 'f73f92f943d90ae313212af47dab91fa', '7e8906937948ea8cf2899468799e5765', '6923893323edd6f3c32375dc6c4cee60', 'b2ca1468f7ef607435a2492ffcde20ed', 'ab9ed618da4d8c197ae802b690cf475d', 'ec997844a2b5f8387c463f544862b8e7', '3d76129c9a6d6403649f370bb2b7a313', 'b4a2c29c3067ec9ecc25332ce7f9ee37', '09ecb8c45b220338866b317ed92ae4b9', '374dbce498917ae53b30121eacb84fff', 'f10be01cbb6b9f14f6fe5d67150f08c1', '62defd3f6df1056634e830d4467bbf4f', '217a1e545cd6813545bdad67a9087233', '38a50ce03ad4550ce0bb714aed058008', '779d737724e2213dc2e7761b0eec14ac', 'd7c133e09fb87e4a7ea0fcbef8f5e7af', '2ded62c9e6bf439c6b353ef59134f624', 'e4a1bde3016105f3561d6969ac8b3b61', '32e4dfb747f517d92e165b4775d5e4cc', '1d193b6e3ffc93f63858bb62bde30455', '280df482196c1039b60ca1f7e68143cd', '417065c30dc1c0d95d2b24b7057b27b3', '40bdd191dda5a3415f06dc7b17e057be', '50300cd675eb1b83f8fda57c96b10b64', '6cbca483157e6c4af3cdf7aafa5dd7c7', 'b3b94f9f0623748dc97c2c1f4179a061', '3a31b9de7ef9f8d3024baed36361b1fa', 'e75ecb14b1bae64714d7e99458b846d8', 'd61e5a5e56efb9e882964985f5001876', 'd971a0b0dd6a292a430a4d9bd99c6d8e', '80d49cd055cb7f0916c5a8e97a9a6c9f', 'c33ed0f45afabf92b0bab68599ac7db8', '4fcfcc694933fa3c60274d769fa2ed0c', 'f3913d1c96f5e7c2bf1fd7c226326fd5', '04df1bb45aa276345352aeeaa9ead28f', '8d925afd7de0606b32cba9a4617df656', '66c00e190bd58f0d58b6e898e3a1d789', '423d63bd64b752e12be69880d36a7db8', '725fc066e13521149b5e63e0e4d2da8a', '0363af7b15c6b3b03c5968f306a28301', '95ffbad38b65dd736b0b521b6c2c04b4', 'b7729f6b58eefc1344d815ae9eaf0516', '226136f21ae9ca40a78b1d20e950313d', '57a962d98097bedb69ea0822c77e17b4', 'f93760a27ccc227895d9ae6c610281b4', '0a32d1c8c64c34e354c6acdaf9801ab7', 'e9272a087924ac318c5e4b8f08b81365', '04e06c85bad7f759159848f7c169d854', 'df3aa2adc51cf4af67e15c4f3d5306e9', '551fd909d86c7acbb02239c51e5c7463', '66a230d9c7f10800ea15ff73b54d2c3f', '596ac449eb9a939e0943ab0433c22eac', '0cb8cb2b9c6db57510248ecb710df59e', '6f4fe9d9f4a750c853cd5c2f93410c11', 'f415f0f3041b15656da4dac126305a73', 'bba303efe123255283268feb3eb2da74', 'e6a98b7d9fd6e767044a714c064bf74f', 'b691d9af53ef213f4eac363b0f5827ff', '8d03f93eb7a1070f1f402e9210752295', 'd4d7ee30883de8cb283204cb2ebd0d58', 'f65a8a59e4be0e2368fa648cc80175ae', '3ee8ac56939a15e4d322ba15d49b9d3b', 'c4720ef01b438d3e43ef4339d8bb0a8d', '3e0865206fc43e6c5018177ad87e425f', 'd8c5ac9ca0d45b4f0696886d58a568ce', '40d568fad37f5b57ae8975978e22175d', '36ca1d5a0aa64a0ffd7a40987d71aeed', '5e6f76981014ffdc429151cab7b81602', '042809e21b69d0832c5a32f739ac400d', 'e1ed0a5e9ab714563aed72a9dce7083b', '75587fa15b5b6237300a0000b17d857b', '0f2e184f74c0812dcf0379a256898d2a', 'cb1f9464f15f882c8d89153c655aa9e9', 'd71a9d2ac5208bd119460861390c9d6f', '5dfd6f4c6b1398d8a79242949c9f54da', 'a041c75115277af0ec2d88113ad7d17a', 'd52220c054b9762ce6d78bb0fbc7f640', '275788f3b28f7d7847a5f98e5a0ae1b8', '204e976f12bd46b30a9b71dd7a0b7e3d', 'c5179a895d31067d1650f335dfc45c78', 'a6a3a0b66a5fe41d34c675e7b25ce993', '25b8e38bdaeef56904c737088510965f', '2b36ff1a432c4adf18eb4d047cb50ba4', '7c5e0a3576be27157bb29a5ee5850e3b', 'f1b99e69e147821d35c348199162a1da', '22c0512ff88cfd0ed4c25c1e37763975', '5fa4b94ad58afb7ca0a1fa8d24c9afff', '34c308d886e1c9dfb5a07d9267f080e8', '2b01c5c11825771e4accb462f7c72950', '6ab836c6367b5ec9936d2a3f167d18e0', 'd8afb32a69a9dafa654b780c62071517', '190b8e8f237537efe5ab8e7b05fb41eb', '96f2ad50d092a126171d495e9a1336c3', '2665e178386e699d52d73e6270410d0e', 'c092a8193831a0829ecf21d2605a4166', 'c967a15104e17ba8551cc9da08b7ce04', 'dbcbdd5aeecc26392328015b37be8242', '91c0997a345e4fac9ae38a96fa944b41', '915cc0c9f8d717fdb7109529925f0ea3', '37aeac12c4844e765dcc84d94925bd67', '9b170b0daba51a2497a08bf826ba43a2', '4c0228575f186974d2253788e636bc15', '2fc6d43acb0843b37ca7a901f95139d0', 'b83db3a241100b298613e13a942763a5', '2d72044f8df5d9534588f18404fc4a75', '5360ef87b9ddb2f5d1bd3367091b369b', '97f9758b4f5c5151584ca6a9217cc6de', 'd7e4b434148527c6d30b4795d26d0168', 'ddaf022d7376b221a4bfac99cc6fa8a8', '4e7978847c36dff2166c9d3bc42700d9', '5c8f75b5859b84a3cae91d701d13043a', 'fd2380ad002655ee4db0061befeb0836', '4acf88ea5e98a7595b0811b49ad58187', '78de6640d302dfab0cdf3e524f0e51ec', 'faa1b4375d8def432f72885fc91c76f4', '7cf0555eed179e55e2dec384ca20916a', '3c332887054779e478deddd467c1c72b', '00e7e58e472cff0fee86f511692414db', '1b5d9f3ad9360e5903a3a449d84927cd', '3922d47b7d465dcd3f54ed4cf86632fc', '36c033e405a77e2bd77783ece56fefa2', 'a235da29d836e62eacf9dfc842ddf14f', '035b229be33cfaa5b9828ebe45750e39', '79489dd07b3db5a2eb064abf8fd2b1f1', 'c3436110ff31b8b01730332c0649719e', '592bf74872c8599aaa6634b812e76f8b', '71f43a3ec5f90ba4bb3971fe96f4facb', '74e5564bc351f2ea86e3bcc4be2989ce', 'd2ac0bcdfd4d259bc9d8bfc06d28da8c', 'e8b93fdd9eab962d5b326fbf66c368f3', 'b294e3e89708be3dd2cbf0e4b2ffb14e', '6f12bf0e105d8c55b32bcf33dd7ba3bb', 'c96ac1ad1cb038549564ef95b05622c3', '7094e13c946feca1bd0042bba9a98abd', '8aea4d41e20cba8d058ac8e665c32433', '54bd2d90edd26a7a51c58c75a6338c9b', '760c250c8bf580e75ad0939e3f6db09b', 'cddf6fe320d5da4a83bb19115479aa6e', '65111f11e1b6b1f7bd9902d80615a473', '46d4781972d600ace385aa183f2ae21e', 'b3cd5e4cce1900f4a2fd78b83878211d', 'b7c5f73bffbdca446ac560d13aa1ca62', 'b775a0df5ef6f4a8eb6a2e415de6a73f', '1d19837a36d4c8496d9702deed019f50', '9a314ad442f69d0cb5b2d69f87cd28ba', '0ad13b992ae9c1b888b58097ee09ba88', '1d72ccd10f16eed308659098b3b1888a', 'fe2221b9176f4654102fbb323ae36a0b', 'e3f93895bb9a154f6dbbaa5c30fe92f3', 'd766a7ce08a0c083697cfdd7e497b0dd', '309be84300f3439408e284c3b931e024', '8f8f247554eccc6cbd191fd1f1e25aca', '164363e885e736e04bc323e21458c555', '8e2a0222a4e8e2e5de72a108d77513bb', '8683fac5b4364dc08b1f4ccf0df288df', '266645ff8c0a5785d437e5054e4af2b3', '5630eec89c49c9b948e8106e66c4c54c', '31748fbc454ddc43844c5e317cbe55da', '1657ac352df8501d4fdc82418529c5c1', '02067b538ec201dfc10cae354020608a', '200a0bf712b22ff71bfb351f6b64d561', '259797e7276efff9d9b221482e3aca0a', '9507852d2371ad2360c701ff94e6696e', '722c5cc1642f53a4b0214a4443d0dc55', '1a0fbb185a55c7c779379f1b1e8fc586', 'fc52e885bf7cafc20e93c631e051874b', 'bfa0efbe129c415b8452488c79b782a1', 'a2610b2c976855882325268148718fe8', '8b65280f06c16099c37afb7058d3080e', 'fb2d12af4ab519d0f0cced50e8511599', '3fbf165c0f36e8f2267f02fffa4c8827', '24052ede39dad6a8717aa1ac2a5fbd1f', '43cba381eaff7dcd82861468df4052ff', '2cd0b53ad723c0e61c0060e9d0b37038', '46b429edc57329a50948b3cd08f20124', '9f2daf586144c2e1696d9942d13d421d', 'd8e4bfbf1ba9f6901027806d54e279d2', 'b9e3226a959ab174cac0312fcc4f419c', '1a1fbe87deb19d1e72c40e86e6bcc404', '52c2261d3335166d2cf283234319d830', 'ff80ba333405b855a392070ac551058f', 'dc3dc02c960c6cf2383e87f8eb8c1323', 'cc522cd06057763ee89df5f982660c91', 'acecd264ad14b1ee498665efabc08bd0', 'd043552b04cbfca5c64fc40d03ad344e', 'fc9d8e71b70de0d3ce7e3a6f16d3d2ee', '6ec02a21ecd879f7c81fdf342776f202', '1d29cfdd77785b0742d696dce2c36c3a', 'ce54ef6601acfaa55feda2c8c36ad115', 'eccbfadff709e7801fa7e46e5648021c', '20c0377eb6115d1ccc043abc0a463ff5', 'a4c103d7de02f5becf2d3fc5da95bd63', '7b0addb3b862807a3fb13157099e3d30', '5bddb5d8aa4ee705940553fd1197f433', '12c4e8536c6eb5b77d5135c7a9d15cd0', 'c2cc4a31cf62aa9c564a02612d131901', 'ed8a887f552f0f78b0b172296429ee96', '8e8c4fd4dc26c4646fd4559345ad6720', 'ea81a113b6b770d25610ef9b13670111', 'a217bd6f5e7a988cc16a21b0be84f35f', 'ad6825b812e6e37b477f6f0f53158c73', '799a324065994d9ce0433e507a1be140', '597e47be0b4556d510578a2be9a35dd7', '04e5ac142735b9de5561b8f159003300', '4ef5c98b85d0d87d237e84ed2d358e26', 'fca7ba2ea81a0883b11dd0cfca03d814', '89c23d7fc5a1cb87f7f8cbe24bacbf51', '96ec37eedeca9e1ee90fa41e7fec18aa', '9cd263571ef8456a3e24d320ed597e20', 'eb18689fd3837e546799358685955450', '05b84168dc6f8dc852aab8cd343f4606', 'a46df35df68111861af679349ef983ee', '7878f8b703778010942d15452b582238', 'bcbcd69ee887cee9d4073048ec1d9ad2', '491a6876d39d92f0b761b9323eae34a8', 'b9de41eba400d92ba7eda6fa7cb14d70', '09963c93e6759d2114147dec16085d64', 'a712ab985e6f3c9873b76fb7d272801a', '47d6a2cb198a2b5f3e8390bcc5adff2e', '956e9a000361bd6540293732e7ce7c83', '0d3bce419b4da28fe886c0facaf86016', '4e72ed12ad163b7972dfcf68ff7c3cd3', '1058fc2cec8fdcc678c493ff7b5a4069', 'b26b5a94bf573fc2c117895cda4ba63d', '0c6ac221f84f21d391f88b40d2a25e50', '48cca02c6082a2a4197ee2cb905a5531', '411a4ab6e96befcc0f377fc9119406ce', 'efa00cb6cc9346559bf673c5e0bb5bb6', '25e76cc0d84aca5c11813a4374f32e61', 'be498f38b8d5f0306ef6d08adaa30979', '6e4aa6adf4ffc6a12507386180c8fb2a', 'fc40a15a4d2179a11ac1389c513a38dc', '80137bf37c93283a754836e385b75a36', '3abfc1bf8631f450281a0651619651f2', '3064843654630bb48cd1132804d6129e', '07913fd9490f0ea52ca2900bdb6382b6', '943afbd119eb6091254f197fd8e96287', '47f6b239d6d0091c60b6b810bf6db769', '14e0e61da87bf2165f12a3f61694644d', 'c3a1b3893f22875446f64e4bbf075b8f', 'd0a632d8a4d6f5e08a1474087ce7b243', 'f929fe7fb1542461323b2c86c6fdb936', '25a9fb3f779a2668f7a0473e5e37fe6f', 'e2173b565f19dca3525c4eec233c2448', '8f9ce41e7d83503738b840f59c233300', '11b4f0a8019507ebb45c0bb260f7c635', 'e291758359b3a0087d4ed410f640ee71', 'e3dadf9acc590c3799e585f86ef27880', '7a643988dbb4b435d4abfd157b02658b', 'cc2cb3e5fe2210c91bb4faccd4358b1d', 'be2097783d23cd39ea0501d002facd32', 'b9d0e7ee3e48bfbdc9a7d0c4aa5fbe43', '46d570922d34395267e13bb00c67812b', '9605cbd05f00bad82763eb3fe32bb958', 'e2017616de6f0c23bf60ed18dec0e9a9', 'c5d51cc483d2b7fba0b23f385ea6cce3', '2c0d60305e2664875d8911567f03886b', '668204a4aebe4d26740ce91875e25721', '9b861e41d1a3276b4e8ed6e8d2b8e1fa', '302c5c6e8cf4200383d600076c048da9', 'be1d25c29f1d3ceae8bc7eab4973234f', '0ca78ebdf9bd397fa3f3ea7de9a075de', 'f9618092ff562fa898dd04719167ac0c', 'f915b80d34a6d6c91c82757cd227dbb7', '80615ccf5dface081c791185f212d8cb', 'e2d191be53b0a1822c363466099f6fd7', 'e2739b73362d1e5063c7d1e79e0039cc', '1460eb1830351ff0718dd583a4b02779', '2281fdd0642bef698c804ab9d93717ff', '4fe79cb5be4f1d8858149bbd9e462564', '5371d3e72d3ce73822e4dd2819e1d779', '5707bc307c38588fcab20233507f44e5', 'f4e44616da278a10f81c7f369ccd444a', 'aba496094aaf460f07e8e324a3d91b47', '373ddcb8c1b72787c0e4d779ecee9271', '377a6adbc8a9c0cd358c241001aa3f33', '1992d8301f01b2b1c9f7b5a8f42eed6b', 'a1c5fdcfafbfe3fb982937ceeab7078d', 'ae021d7ddc4669f904f068b5835443ac', '6ee1e7580eacdad0b42a66199f928f95', 'b307bf20ad6285b669e294d120204728', '75575e49de0f46b95ea4b7b4aece7694', 'cca9f3a3e16ea9a5fe97f985cb6be09f', '82f9870c5336b7047729f18a72e1f302', '6152e3689a2282ac01981d3a62d2b39e', '2b52a7bdefdf80772fd66eb80bd67caf', 'de63eafb1a28b0c671810713b5f9c4ab', '3d71c46c72841632e6b316931b0e9a5f', '0526bfb952bf7b971fe8fbe677e7a2fa', 'da324433457f50647bfd74f53121988d', 'c7ad4042c9349660f556a80e495c1bc2', 'b0f717f339c2c289fbc49c137218e198', '43f3c7f9df63c12b680e06218c356772', 'f3a5de69dee5b76587e493ed2ae20ee2', '2c86692385f4e19a51d5089000055b63', 'a6f6fffbb6364637fa19198bf4dc5c39', '96608f4e38adec9cbc6262bd56c9c387', '0178143daa9924fbf15852963f64fc64', 'e29b074cd2f172887582019e3afdf573', '655f147d2c00364b90f5004d881a4d84', '4847861c078e7555deecf64655c4bb7a', 'bf463a6a0878e578cf8dd9b59a2140c7', 'c95a8a676b96caa6c67ed0530df93992', '4189d8711a1668fa1e6284b21cef7fa4', 'f4dffe800b7e5d4655a1aa9403d4376d', 'ac00bf6d80226bd2dcbcdc621e15dc7e', '62efcaeebe5fb1420df3e5e9ec964df0', 'aa13eeb1728d975147ad1fb82ee4ad63', '4e03ce48c9fa8191e28892486e15f068', '46189d05c6e7fd03831f22f70c454f13', '954de39a28e7709a05a28d5647e19152', 'f6db95c2bbe95fdf1093041f07cb2b36', 'b57457856769cd8055a47df3a65cffe0', 'b82696d5e5209e829cb6f6abb5fd5c5a', '06571949fda44bf46997fcd432bfddef', '92276cb4ba6b5f53411b2bb29cf86587', '4670f4041a840a7ea7734b8f1614318e', '938badf6ba0ccb07bdc5928464ec1f2d', 'e79ddfa2008d4481b3df719146f4fb12', 'f656cfb05a2798e67625742a95dca517', '4cd2885db543e45c0a67b0194bfcf588', 'aadfb861304b8a041271b8a47dadae7a', '6fb06313a774f57c0e443c486a26a067', 'da17bb4d9f7e78ea055aeb6dc9c0a90b', 'c13cc77be532b2ee9c5dec3e5a640667', '2a757e326183b76b6c6615849f8e5e0b', 'a45643d0de41ad8c40333a4877a94de2', '90962f88731e1dd3d18954b3851803e7', '6601ddf3021e0c0f58047bf01d513def', 'eab399d8bcef0a93cc4f3c9d552c3fce', '172c0328f4635891a6b0ed3456963f3d', '83a6c40c1272c02b5d8c9498806e6297', '706fa1b545cc867c54090358b23edece', '0c2cdd7712ad58765728ee3271650aca', 'e99780e75effcb4859b127a1f216099a', 'c2c1c325b45ddeb515e6fec1bae1f3b7', 'a7dc02376b65f010318b5ab3d31811a2', '727f57bcdce6e2c01c6af10cb5ad6fb0', '9e3438114252f8235b712d7a03ad3299', 'a81656adc32f2c641839072c8e2a6aa4', '3ed8cef807147a2aae8433636acb69bd', 'edba6d1bfc71490b0b0dd126b28e9c4e', '537077cc4a89360a791c41ae713fe35b', '33fd640deb3fd36ec63765a48a524293', 'b9bafb2a440da88af7117bb0b439b468', '0089d355b045fe1e0ad64565fdea7365', '1c45bae7f819029e69cc124d164ff34e', 'd408a27712a6f9b373c0d442ef14fc50', '910b8d960d41f02f72199fce40edf40d', '662b8f82566c7ac9001c20f6dab679b8', 'a6821fe956126cbcdbde1d34b2220f15', '575a3f5f6b1db04d19e6db3c6c8b85b7', '1ac08e2941112f855877dc7ef54a941d', 'da6f37c20769a0f79888112a45db6260', 'eef0938f39e14e4bce05eea386371782', 'b7c7a3a8f5df65a108224735fecf5338', '4d0a332a0406e69394bb1b04db7b4c8f', '0705999103de5e2006b136ae48da95a2', '8579591296d695f73454943812412459', '1a9211074a84c00f4fe7ea3a46cc6eeb', 'ad5acc84248c21abcc4394e2993beffd', '0095e183d5ea80c741d25fefc42550b1', 'ae7c2aa2a4a5064a9c365d29d6e275b2', 'cc82bf88328ce29cc73e4785f2c3204b', 'ed45d22faabaf46a65d486eda33a95c0', 'a5d8a0b01a141368259c32d26ad9eb25', 'e626aa42d69598a52a1e0f94ebb9572d', 'e88be8580b0038aa267339e5b363df62', '215f5b8aad602d71c84c4759dec4be2d', 'c6783dfa39a39161af35e0baa9a0655f', '95f24812bfa27365bb04aa89ce5e10e4', 'd89f616d1d80983b0853f315b2ccb88b', '31fc43b7441b7bc041449ec6f4b4f7a4', '5c19c7729e5c9621b5f601aaaa7ca5e1', '20184958b41265461c5e994d78bcfc1d', '278088d4644b0173eb3aedf238cf8cc9', 'b8d45c8d022875e8353b81463927db0e', '10ff97b18bbf3208a54de541374ad634', '7e55b1a5ea85d8eaa3950441fddf6161', 'a43fbb0881cb37436d026a2ac771b6c9', '3c804e8d7fce9e66357c78c377c1edd4', '812450343b2f85308ee8d45a496f8e38', '14c755bcc75e5400a3fb08becff1572a', 'cefcfdf076c3395a301385a911c39de1', '7b313a96404e306b9fc04943101bd306', '777e1ed6b47d11b9e6c82e313107bca2', '67f501ac5bf6539f43c8785c374cd2cd', '7773963df766649f2a5e176373d34e7a', '1e9541a616c7c426c5f62bc50c0ed960', '6d7199932311c3ab554ec8fb8ddb06c7', '34d92ed779f2789e46b03e6e72d2af0b', '393fa117244001cca48b4226ae1a3f1a', 'f2672c6dbc9c735413c789afeb5f9530', 'e658e6f061b6134fb6a8247eb7f2d33a', '4aff8b6a922e777a0c613ae5bd0f8fcc', 'c5b7f27eeb4b49f78f54aa2cf87a828a', 'cebf84a4dde154e809d365f19b0a0de6', 'fb5f024b6ef6c2e08fb15119fc11b7c2', '045d3cc9d3d47ba37f47158131b2d762', 'c3cbdaf1199fb05e5c2eaf5127eb92a7', '87f0579e5a2741c76e392044ec8a89ef', '844d89f5b27992f88e29ad0d5e819e8f', '323c538586823d8418351630640c9efb', 'a05fa2e7b6866fa8dbb028edb6a9615d', '1c4eed649226c4345ff74ac24b7a13b3', '17df986d91d3211ed3caa06d23e9dde2', 'a890f6d3ea2dccfb2ec66cd2d108fd5b', '45c3973532b3efe152471c7eb194ffb0', '4a9ccae85f71e4064b4d51df4589984a', 'd002d91303ec4b0afa28c68e6780ee79', '6c01c56328088990ff7fba671b3060a4', '7086f3bf60346aa60ff169887ed98c1e', '91939a109b8771e1641d39d660e3d31f', 'dbb38ed2e75783769de9f3ec8e4e963d', '0ec49565567cb99f77487f0d6189e84c', 'daa9b5bbbcf993499a7e0f8b7043a9c4', '888ca1cb0b87a12026113ffcc2071f49', '28b64fb65d96537dbd5ec05777b58e56', '7891317800e8db3074d49df6246a136b', '20bc827a5ad6c4ac567c2f0cc3ea66f0', '895b4580ddcd1070358ed267b0f900b0', '15453fad2447746a260bd471121dfc6a', 'b2f6731489b7f6d5fb66f619b280b61e', 'd89bec8c252ced8034a274963ad29757', 'e6dd7958cff7473fd16a1888f092a998', '8378e7297b07dbbae89b81c251504bc2', '7e8da82d8eaca0923952daa671c42cc7', '9aa67f6d74682d85638e27ee03b89929', 'b3ebe6a2f131ea18578a85fcbdce47e3', '2fe180a3743c34b7987a1ac357f5df85', '1af78f638475b15b38e899b0ca2be8b4', '9d68d590112c17d71217ac7460c6ee12', '1a69d0044c693d4df3605708dad3a26b', '96e4b3a39a7bd3797bd75fd47f89bf41', 'f3a00a86545b80a642a1c272db078e57', 'dee40a75e6b084a514bdf71948467ffc', 'f8f25c02803c23b8af3687421f7139a2', 'e0737c1dda2946e06c156e8dae84fe3a', '745837d4e460a961274db75766130574', '5a4892163be7e12dda4552e235c21e59', '9026d8a494e2dbe9717363a4e44f3e59', 'dae427f062bdc748a1ac609ae8a2177d', '695cae074f3253fd7c486992b556cbaf', '08453a975c7ba6d74e4582335c4e85e2', '0e9f02e6237ee046db38415daf954d1f', '0952666ff8794c8292bc29657352b3e9', '4f364e34e09f4a7cb72548b95319f703', '4ad24c9eb5c637be3d8d13bdbc0a6931', 'db7d5adc3a672b0363ba22c228d9b2ea', '3535d3f3b8223af5ddf39e61b38728fc', 'd3af302a2dcbe595428ab77ad669ab7c', '13337e02e8ea0c05a0d3229824e3174a', '0432cbff734f6a62784091ae66d6ffde', '2ef3dad5545b90ec44b2c0d21cc2b29c', '1a5d8ad83ce8d4d33904ac4f6b875beb', '2eec326a4738e205678e38d018ae570a', '8a4cc7f075591c13ed2a4fe1b3da7c5b', '24d9f126c428d43cc0fd980be31f36ef', '71842216c7c13c0726cd3a7d1b978984', '9f7f14e407969e269a4e30489a7beaff', '11b961775372e77e048728a4877f9d20', '941fde35bde0633078d1afe4c68a687b', 'c02e9effa9056bb1847bfe5ef5318a90', '1b1aacec17abc30e693555440546d5db', '87f10e55cc482bb3cb1804f5b35149ce', '83203f84c04d7b941753e99a4d46dd45', '21f11f3fba2be5f48b65dcb986814772', 'e49afc7580c337695bf544bd887dde33', 'd11c2eb2818d13d8a26b71d56e4d612a', 'aaa927a4dc1fe01da6d8889ab318d01d', 'c25e38ecafb8fff7d5b0b0c1e4be12a1', '8f8679b996583a1c8466b0f426728bb9', '1fa3fbe28695b478944b5f83cf039f3d', '0f9ceccb9a71f1b7431f758d5efca27d', '893bb54676c64f0126271209ce6a2ba9', '4571492dce134c8a26002c7d5b23bf53', '1b8443ee00f86ad660c46fae58d7d5e6', 'f2d5a0af53e98fc7af921f25669014bc', '52896a28da75f89767e702924007865e', '5995ba79266fe0d61c18442dc9b27638', 'dcf7e675c538dd7ee46ff081e139196d', 'bb94d977d1091273d3c4f77624fe27e3', '6b68337c81e8c3af04000c75779ef768', '47761987fbfa10af56a6d31a11aa74b0', 'b3e485224b5540a1e2dd2e6c512d94b7', '2308f3f6221f4e65c3fe1c7f2cc9a822', 'd8bdec577d1f8fad89222c3d72b9b376', '92ee4eb11cbde5c3670e3357286a80ad', '9d92e97bf413add007b33837b75f1a8b', '94c02f95ffdf4e1e709f5c1738f26410', '9a83c43838f565e6a9d32c28e426b18e', 'c1cb162d10425bbd713d18ae494b041d', '09db89a5d1a7b90c061059a902c44daf', '2a1e5aa55f906dc22a44ead3d1613315', '6b42be7e5a56385a66df104696497100', 'e96ef13529f136ea2c83c9870f117551', '2b814c9cd0c254daa381764a537d4c4d', '94156793c0e10fa6e29758bf5fecd8b1', '3cbef816e3df897fe05e88ed888fc82f', '53aec660585bfff6aca802c235442ccc', 'ef308bb0e821392cb9e0d67ce9d815ee', '9077b0470821427bf93d1e1165f73906', 'c786f4ae9fb835e71e4bcf42311d0812', '699e7686f79083aeeea5a6b6e11cc0a7', '730de6d537c0f230540b8bb2efa1b692', '553345df69c8bd7535074bf274982b32', '8934a3e81b7b264d572aa4e2d2f6d881', '9622cbd4b2a83d6f831f3be51e456ae2', 'd479fa37d85d0cd585df0da1b8952c31', 'eb97e0c711913a7b09cacd159904f27b', 'cf1ac4497e6a63630cef0a18ad5d89f1', 'c80a3f02649fb34da67fbed4320f341a', '332a7aad8de1129d906015d39986458e', 'd1886f27bf7fc7dd6e41207ec0329fa6', '1fe7e334e67e6ca966346153d1736cf7', '8fa792d8c82d4f6d5c5d8f7e33e49316', '37d6b89fb91e1a150eeaa83dd8b38f8e', '12bca8ba002d29086e952ad012904e2c', '06be24cef13caaa34de0b04194c675ba', 'c2a72e6df0fdfc9f2f2c10e47334e828', '86fe2de5c8c731240b759a5b045eb09b', 'a577d42180d9efb53d63444fdb6e853b', 'a0fcdbb08efb25d739b206221d1f5809', '7a9f160cc840d0eec5762adf8bc878ee', '0bd232163017e0b141632c552514e469', 'a7e3b85a6f231e0fbbe6b286cd9ef253', '1363bc03068b639b3fea22aff772ced4', 'e3ad0a8396c1d6ee090eed377f3902a3', '6152ae96d2cdec46b3b6b784a28bfbc4', '79d6d62eed9a3256a4e689bf48576b2f', '5cd9f2f8a2cdb2b0e73d0f0c12de3a50', '42c6f700bedeb52521ee3bf2660f249d', '0226026047375ce0bd57326a84a01798', '9aa881393722e0809ac6ddeab61cb891', '958215f5d5d972744c5c9c866063938b', '00fc6030bff06cfcaa0c0351a0b65373', '25eb0be1a0e4edb34292292a788302c5', '95638c6fb0f72d4259feb63b911bee2c', 'def955b919d98dab3dcc9b206e268d67', '2917d11f3deaa5723979477ed41d60ad', '986e66567daa919df3c6cbd50438fc24', 'd418bc19facbf6ade58f098d4b469a42', '9cb9003136739b895ea3fe3244eef525', 'b08ff3658c8664e9ec7fd6d60a25aa4f', '218934ef767b211c1e94950b3cd4d1b4', '54c9be489cfcecce9bf82a5de401d346', '1a017400501b025a95ce5f6b22bd2ffe', '182f9e775d2da3361e7588617e9a3831', 'f069eaae73458ff4964268c403399700', 'd52fe381d5848881bd213a75607b31d9', '9f7cdd4ea5e6e0f17f3b10508e530268', '1188fb2c40e2e496817ade43887b3353', 'b02e817ad85e93753925e7176e44fefd', 'cf5905d2a70e01b8f481916da264d209', '9b52a17f0bd37e44435c5d6287b2d0de', '56807c1bac2edcba193395d1f33011d2', 'e4e3bbf7ae910fd70f9910216bcede7e', '5772df12d3d2bc322676cc0a9320cf06', '5ba97c4d06ac2fbdf47caf3789ad7222', '7d389e58a3a0c1962aecccbf7081fbb0', '27feff40dfc1c6a37616ded11c068c08', '28323cd461ab9d78be7edf2380bc2459', '6329c85cf4b3cb4d0dea434585ac2ca9', 'e23c0c21776c6e1c49146779b5e201e7', 'e6410408ea0f8938685486bd3a3f2062', '8384dfefc796ec85679d5a9d5f679344', '75211e3a44fd1ceccf5efdc8d0e15583', 'df0256431c96e2e546005cec4e08b29b', 'b4707da4bdf3350fdacc7759c1552336', '6f8f45de6e8b6913f688d9d688d9dc36', '0dc7f4305fff32d0ca638c9afa0ff48b', 'a75551de6c108f4813ea677e93840db5', '112538f649664fd5bc66d3df08591d43', '27aca7520571d23b8541330e7ef783ba', '8e7c8dd8f26c876924230d0ea3289c57', 'dbaca0809ed772be98fbfd9ee8b8809e', 'b4dcacc436e7d51625433ab13fc7ef15', 'd071e723b5f4541043bd04ce0b31fd3a', '6db450120db699857819c290a6c5e38f', 'fe8b97290e7b35c41a3d624349044b50', '824c52bdef1f5f92785b760952aaf888', '7a01ea6f0ea4d8394fe7b47942b58852', '7572263e9a63d83430d6f167b98be4e4', '47e7c995f493d81d4d4db9ac27b65a7e', '04472b4bf2eeffffb66c20efe12e9ab0', '07224d24764bcf7493e584d07d248f0e', '6b5d77e121eda4068a56274f59c29db3', 'b83c19f70325ace2e2f11b38442f3ab9', '2324e6e8dcb71e537722f0f851efb353', '47487d0fe7a7a1c4864c1ac4e334ed22', 'f3fbd8db2631aca8799b55f6c84dc1ec', '7941e7b1a354a2ef8cbb5ae89f775cd7', '4b9d200f8bc7ab280c830c3b5acbbdae', '39ac7679515a948d1ea0629720273e0a', '8157d76f12a25d3799fb537d7cd4947a', '26655a5f31cc0d368c3aff7011aa1ec0', 'd3f6aa3d12087d87220dc9a389f97deb', '0129c7244f0c2b6a5838fb8357b90fbb', '5dd2731b8905303f73490ddc478b3a4c', 'a714dbb7ac7764884359db2e98d96ffd', 'c75500c322c7f25ec0af07efef97a925', 'af94610128ec286bd562959428b0eee7', 'd0e3c9f922730413c4e0a26df17ede44', '567e0e2fffb26af9011b0abd907fe5e8', 'e6f8dc778544faa5aae268885fb4594e', '7a8b14dfe9bc2e04b0f1a8277c9336f7', 'c7ec83be63505c3e12b257ffd36fd343', '79f044c4500662774846ed469776535c', 'cdbce5d560d04b8a5a6e8064679a18ed', 'e37f224acaf70f389da73c76ca2e1be3', 'c6fa5515a39b3c4cc7682c15206af4d0', '83fbf9bf2e0ac481891777d0e5d8ddd3', '2154968536ce6e792c930d772456a81d', '3451592ab9b954a9f6f026d4b1c8e6af', 'f7a566996de7f34c595d45aa516139a8', '76f1399368ca85c80132e432cd286b86', 'eb621c3436778f0ef6d1c59bee93fd6b', '31a673b82f9899090d2bc43d2e6a6426', '95cf6274dab26a0ee292b40791f96b62', '798111bbdcd96f7c0d70fa06cc7ab4e5', '9e2b6b6dcbe6d9c3166a724dde53a038', 'e4d4ef08b3459aa6385a59ae230673ce', 'dbe4a054292c0e24deeb87ac621dbccd', 'a4103901811fe0157900ec7f972387be', '2410a583953c81bf603c28d24161551a', 'c575bb1ab9f86c88e1088d3c0a1e8fb2', '7b8fbcb9afe19871d0ecdd8fef59d434', '1a1531a6ed052065ce3eacac5a466c6c', '427725a9cce960fd93572f378679fb12', 'f68b54351547d231613ec6966b39042d', '4ae0e3614699349b6dbecd50e0e8c7a4', 'c598ebb6595dfd21112994f6c20e7b3b', 'd01e4326dcb03749701e91312a7b7a78', '1d50d304dcd07c4ad1bb9956a42a10cb', '1889fb36f55771afddb4a985f30b08df', 'ab575edcb4c6600943bddaa8b9ca6ef8', '7ffd04fac0dff55109469b5a675b281e', '483e2b3e4c55ab3bf7103380da77abc8', 'cc25202b9c597be304d22b4764f8c544', '2baa714e4d0f388cc8973aa89e51b55f', '71f1fe46fd5be71724b38d6688d0c22f', '706e2fb0966bea139096a9d9e7b6d790', '0a30c1d4c8dd5aae2883fd7a1eeb9de9', '979215b129f052cf1125b50b65662cc9', '030d9bfd201a7d31db26b2c16b592436', '7f735af9aa6fc8a86b77065edcf17614', '31314554ff12531c88a35b28f3bf44df', '394a165746cb53789eabe418d82de7ab', '0f625a22d0625cd025343c85dbb04a7c', '3d6fb7910942102943cb78f12246b262', 'f769089f43d41330799298184369ad5d', '50ed5311d813fd09b5ba1a73c96bafca', '8d7d4befeeb0d6548e452a21d9986dcd', 'f2da07ace40ef641e0986e254d9266c9', '0993a90ddd4d32a8167b85f3a8c3a340', 'ba9cc1e970dd11ddea3d7148552f68b1', '49b02c5193a993a63a6e899c949293de', 'c7bcb707291d30b5800c935c7874ac76', 'c7fa97950e298f405cbfc972395eabba', '315682d65a09103aa546bf3216cd3da9', '6ff54b54cb1004b66dc794cd3e88e601', '185754d84c955a658fd1ca43f595d0cc', '0694f90d891021ab56724037f0c4a8be', '4839e08520d50d17062d1cc3cb6871d1', 'b96449cf0979027b82c52e6f70c995c7', '51d9c5cd561af3e42047e1600dff5eba', 'd85c8798ad2b0bd8657406e4d59d1760', 'cbeabe687be2e99aaea127fe2ca7ad83', '3e9d91fa72301277764cc66b1cd8cfcf', '4d837d28b093ee1627839eabc15f073a', 'e1d803b1d1a4563811c4cce4c08d22a4', '18a3eab5255533b4813dfa0096d65775', '63f1db77636deb8837899cb1ed8ccb1e', '0c6691692a035f26583360de1c19cf9a', '697236726dfedb17f780083016e7ff12', 'a2c4968cea27c3ecf3c4a803d65fdd63', 'd47c8343a73034bacb2f8e4bb006edd1', '6acd4ad22b2fe59278d8520d918346b5', '21e6843db66c16e82da0066b92d7b3e3', '440559a809d6cd049c496f82a0352013', '501b7cdee10908b651930f6c7dbd875f', 'e48858da5331181ada4c41409cafb140', '7ed607a1cc0a71e85ba61c0a35fd0ea2', 'b1fae6b08c51007a3b6bc435d84b2055', '098428f0686446db9c7ccd01be5f8540', '60b5007d4fe5a369e335f6db8cf5591c', '42bfe177efa6d1192ecce45b47c04488', 'a0f581946c800028e5b7a0d06b76402f', '92105b69da2bf56e494d36f302caa618', '73d5a43de5065969cd04c0c9a60c7891', '2c18827d0f3cca95aef3568a1793ab54', 'e6bf3b5ed2bed87cf428c5397cc4e1b0', '49bb0b5ac2d9147b10fc4b429c079001', '4f222923f22c4b9ce079000788872f41', '5601dee62d0ba2b0ecb613ad32827c0d', 'dca046bf9bc759b71c0e0ef27d7cd9bc', 'ebbd9a7d291460875682b19d2652e6c2', 'b3ab6051fb8afd97ba46e256ba12de70', '4ba26d58e9f82ad3dde716bad50928f3', 'a91e70d75413bd3658a9f81e692e4bb5', '32bd03a525e2736225a03a53b0a128f4', '522467005f0705c210724893d3b8be77', 'f017123e46cc189f49e76e64ea0e1f0c', '9a7f9811ce167eea2b2e5424d41923b1', '8c6e9aa8557bcb014e50f18cba159e9d', '84da763b97aa72bc4eba5d96e62e3ed4', '7acd5ad2e8cffbf114a4c6dd08a98866', 'e6e75ad63549c379ba647e8b091f0b3c', 'ae33fc266e4476437b4b0aa7e4c07a4b', '30b74d99cc4f14e8bae9ebbff036d2db', 'c18b3f54e22cddcdc4d6b9663309315b', '88c6e98434320b31a6c61bd22b67063a', 'f9418ccd3bb3e44cdd5e410dd198a782', 'de3dc8c9045dbe84cd0424a7e4174c40', '1585e20d5984f9535c93ea14168d22a1', 'b97c33811d0ba422d11944fa346f640d', '3193fa7c84eb0c6fd585bfb021f0aab5', '4d318884d0cf9ebfdb2186b3ea7de07d', '24d28e3491196e0998fb79478ae9c6d2', '7d4b0726136c1aed7940a0d54ce5310c', 'e368a368edb0e662691e8a784982bc35', 'a6645d08b942a2882897e9f94b57e136', 'e13afbcc470d1d41dc02034bfc9041d3', '35555a8e9f25e6473c7ff82402f8b5f8', '918e139a86f6a973045a92c43baf5ac8', '1575027d1cdd1b340dc1b8939f3d930d', '11df821328c8ef9ae3b50188d9587e9c', '577a48bd87af53a0e8850356e690a1f3', '3e93c553f1c996390cd2a35ab3526c31', '9288b33091be69b1c9bc514f52fbcc0b', '7bad951863bc39350df4a2ebcae3c7e9', '5a3d3709f443b782845d2b3af2e859f3', '16d9461d29797d13208f14d1fb5abedd', 'c796bbaf5f2925c9e25eb55e5376df44', 'c653ee0aa150204ab46eb73607938614', 'aa0d8945fafeb3379802479758084d2e', 'b93fb289f5ed900cd143a902563c1999', 'c3a96242ec4ab07d425529a99ff88f36', '47d27f202bfb2e37bc1c20cee6d1644e', '7e10447ed49ed80571701523fe47fdcd', 'b1232a35641f5264e000fe859e5ab6c3', '49d67d7500be35c8c988be534fbe01a5', 'db299aebfb44dd9af2b3b20b08e2ba43', 'c1be2440140a466fa14e3c76338513cb', '9b09b35faf4ddd2ad983311e9d0f512f', '88e0025c658345a36c4b3da0c6a3a82a', '33f25f49028963381837fdb7106f365b', 'a90e444c21aa25a18ff8a3398d4d9306', '795bc7deefd64d39f8d3424b94b73e53', 'b501c10eb5acd99fd92f93621c76c276', 'eca56e51dbea6e45a51de216844cc34b', '4ab73ec43a5a1d93caf4eaadc8cbbc44', '4699469ac556eaebebc81876b8388f6f', '612414ead2502e312f2fa054aa1a6c74', 'e71fd0535a8b51ee714d4b994c34c384', 'bbe2532f8f5439dc4d74e17af8d25342', '25a16f110d6e5189d4a379ad37d0dc6b', '63ebc7ae6f5c08afda079cfa0e8851ff', '277b442349cfcf5a4edd86338e3f53ea', '0326eca601099ae8b707be6e691b2aaf', 'cd2d963360845142c82cbad7c05496ab', '331d9c547fbc1e2211623dbb855c2582', '663d7d8af21d03e8bd6a62f9c5b8f776', 'e7958592ea8caad71711e2bd6af7066b', '5ec2cd36bee2de43f64cb7e76109cba6', '0a5677ef5d2b48ea2194ba35144ff929', 'e763aa1a70a5b241b0ed7c5c713e866d', '7b7bd7f05743534f02c3e2b761e87fa3', '516bf790eeed5e2f59b5513544cc41f0', 'd70e7f371ea3c7e31c8b94685a243567', 'bc321568e56ee2ec809693a5e3080ed3', '4eff880ef1a460d2fba837ec89f7b0f2', 'b6fd00e1cb740575fb638d78188d7601', 'c29608c9b7696523cc664efb9362e53b', '798f307fa417708e7874b240c7351a6e', '465d917418eb875eb32fda21fe3d48db', 'e3cacae0c13a42c05f6930f1fe1f3a60', '78312f4a9727f8252767322c4097c7c6', '33ecbeb7f100df8e5f1275a26790f2fa', '348f9f0d8fb41c64da7eceb485709481', '5c1f68fec489e433b83854b19a44dc84', '6744f72b91d832254067842c15bb9183', '67cc7107685ed89a1eb25762652f6e3b', '4b389396cb1292b844dee544225816a2', '673b1bd3f3536364e33567ec75430c1f', 'a25f3f2412beea1a2c45c7a3894c2c58', 'c84a8e9ff873506ba3784f97d119c4f0', '713cf8f5566fc700ed65b2b86ee28a39', 'e27a217cb7258ad6aa9d4c0ea02afc75', '9ff986602ed2e37eaf4e24a1986b753d', '8c9ea4124e7af71782fb5d091196fed8', '0e15b04d197043869ea5452b8bdb6c38', 'fd275dfc1b779c90c9f7d18f95ccbde8', '65fac30b35b6e1730eac7b4b9d5f796e', '9c2e761dc0fba387bb5916832b75cf51', 'f54babc3b9a4146f840814a5736b435c', 'f82ee520f10b4f6cdd06d34a6ec1c06a', 'e1a20682d96bb47bd9b0da8b15dcf80c', '57e5d34af3f2665039e68b92ec351811', 'bb8c43f0eae26ebafcc2fce2994920d4', '2af0410d5bc8578b0255c1ea4c7d453e', '5d75eb8ec2316ec3b19e07472ad2834b', 'a5ee4ea258f1039d98a47886691f153c', 'edb3917180538baa7e04edfe8f318066', '835a7a116ecef08823aef40dd5c50a1b', '94897f4a18a1e60c34e34e88686327ef', '3df892a73aa4090547f860e12c4bf005', '38ea30109a1c4da3c740eda9eec25b66', '7348ce25acb04a542d0412b8937fc15e', '03dddebd053a0f7f373c3419f15bc05a', '07451325c75f9080ac053ad0b9a37c81', '5bd0c936f7bd27157508713294bf538f', '5f92a78ed1257bc027a9994523b2d888', '08398eaca4f8e17a0d9ef04cc84f87b0', '5a1ffe6f91e690d83612e8196bf76ae8', '619ac1d73b1a04bacd6894660586e714', 'ef1bf6a55a738fae62cd85a09eeccb83', '41e88a612128c05dc443599af6930c63', '4744968cbd5deb90805d79ed753493f2', 'bd94aa094f718e5caba00adf69e95c34', '9f450b978442cb2c3e2936ac2393883b', '0f479a61fded94a901179a0ffc56e8d0', 'c32a847470a6a51d6dd52555f000cdcc', '359a1283fdd71b37573b4dded26d221e', 'd6f28789ef020880ccaabb417e7c392d', 'ab0381add9a7a7ce225080995f133eb0', 'ffc3008102810677dfe22792867ed3df', '958b27dac46b2d39f3ee627c196b693d', '928e95cf30c0e3cd2776d80fb0874c07', 'c1c3040695f58852040320b26d09f242', '800a17926cec3cc0f3b1d9687d05d902', 'f7258b3c0d4d8a5865afc5124ec2c914', 'f06b9dd7c0d92bb25eab10bc4e221b22', '8e8ebf221da4650b2503f8221bd4fe4a', '0a5abd4ef4695b7e82d04968d0e5698d', '4517b1c9e84bf10323d2258bba8f19c4', '2474d5b4dc2c2549959a6adceea2db4e', '5dff8275f7e0dbb4326e6a6158f5d6e2', '95d3e8e78ca0c4d884aafbc589c97ebf', 'bdb8f1f19f6dce8123a0d71b9fd48b8c', 'c5ac603dab436fc9dfdd5c23839fa41b', '3b2fa335e5f8760259b5b595be4f4770', '00db34301f1b49d065ebbeb7b0be3a20', 'e25fd2c3f3321cd552a6e21358b325b2', '4078a86862984fe36d64847904fb328f', '4e3cbbf0a215084a5b3e89c41880ac04', 'b1e6a9c4e38ba1016aa51707d7e8c993', 'ee70eed2e06522145d644430e581140e', '05929206f5d09a6f01aa13df474bfce7', '4daf7c4470cbae7b63b309a3194a88a5', '320467f58f1e90c8d0e5705ea04d64b3', '47b56c401a032a9debcb4768f16789fd', '4bd2591de3568fc4ad4414b6186b99aa', '30e1e6929d92839bccfc89a298f6b595', '4ad0b19e2bdd67c590297274ac34d282', '20b36c8dc1ccff88ae8a7cdef41a97be', '0f38c1aa7b0f619c74c570be7bd17d32', '653cc3b7add21941c90c0fb2de97d15d', '17768c3d6ca85c24d05c27cee67d5cb8', '1e1f78215f9d5bb044315bda7c57a244', '309090680342bad4de9e93bf288f5819', '5c8b2bba64be092e5bc683e16cf2198f', '871222aea4efe923d30e4486292b8049', 'b5ee10d0a8427fbe5af50b8d6509919d', '29abad0034a4651f61c7e475a670429f', '286ef9d2f429f76e56e46eb5d659afad', '66fad5e63a48cf8a87550cc77136803b', 'fcf5ac2673b92680e64463d1eabe0a8f', '58afd8e454e2c3bda5eeeed1a7ecbf6f', 'a8414cb27e60d4983945dad1c2cd0726', '1d17865b74c23b24cad314a0a2febc45', 'aee959a29749631c7bcb23e3692cbfc1', '8f0fcf4320ef2e8636673146433bb393', '0c400daaf3914c63871899fb36b6a10a', '8a531071d9be7abdf7ef610b5a2f78b4', 'ce971781606e0e7c60acde77f7f63a05', 'c97fc6f897e15484f54d5a9d614588f0', '7bf63eca2bdccdf068ea5723b678451f', 'bb8a0144638d555b8c192e1596514072', 'a6ed68a6db6ba800a5eac4405f06bebc', 'da252f934df94b278de0a794bbca4b8b', 'd342dc0895df899b8fa96b22ef00369a', 'f849b5b984d2852270cb97417791701b', '60e49b25c1238c01ef0961b909f7f36c', '48659325b982012a506238971cf9c547', 'acdc4cdf57095eaed5f089ee7eb0b7ee', '27798d79bcc45737eec827b9edac2f92', '6497a34428fa19a46b8c09989e13bb1f', '50073d27f7aeb74278f85dd36d1675c5', '1a1e948960dd3916dd8a406e800e31b1', 'f06dd07063f7db7a9b43453dd61075f9', 'eb49db779292ee56d01ba1efa02434de', 'd9db67bd85537e3b5a55a3b6369dbaf1', 'eb6cfd303c1787b1286df167cbbfaccb', '86c05c1ad72677e0db2a87eb69d5fe62', '6a4c8b0000b59cc364821588bada586f', 'a888b77bd223812011a0304353b1a91d', '9257f9c2cdd515a31cf5011738270f85', '72a918f91b81554e3832401589b89a4c', '80adb1831c4ac58ad200f729a6d5ad2a', '50708bec1cde62ed4e1f01eb93a20c6d', '3ba0f8a5689e7e2aa53c15e255bd3596', '0273119f1fe71e55f0a21ce3f8eb306c', '3e8a27ba3aa29dd27b2b14459d87ae25', '2790fea49cc8abf1c12f20201d5d0288', 'e5c707e3f5f69cf11094310dfb1a42ee', '5fc781ea85e9b8e9c9c9a1a4091b82e1', '33dc44ea94cde03362a2c36535a92105', '3d155a45d1ecaf48f5f0c477901e69df', 'f8f4c59153b584dc8f5d90d4fd8b45c3', '75828fd4efe9409a8f4e758a083263f4', '20305af222d6c0b401f295437bfa1853', 'dd0f9da259f828ea5897c437bbff0bc8', 'b49e9fe451726c920e32fc261c38837c', '0150e5474c3e3249140864aa0f7395ef', '1020c786410ed6543e76ad467b168d0b', '9d93b73ddaadc7b1519d0441bd3814f6', 'db12537bfa5a6e5306bdea0d37cdedda', 'ae38cf2f4a0b6811fee3c9ce3081f721', '451bdc2272a7fc38d884a303133d2e3f', 'a5a1b0f6f3d398d53a70aa467bfc5bf5', 'd6b33f4f70c3082e7d93b0827021ad24', '4a613c0b750757e9b1cefc6ac1d3da8b', '2f3fd607fbbc5fa0b8839cfe4eddee66', '42103b2e63800a9efde2d2dc3482a0cc', '47c2cc64f987e8d4b8ccfd1a46434f1f', '1a538fa0094cb58a3800e51b3c013709', '7a320b975ae6163f71f9cdbe2edbbde8', 'cacd7c9604d8b001decb02a86ae29679', '51d9b089955819a9e165a6d89e21886f', 'd224b41c479f581abcff66f452821aba', 'f110e08fdaaa09b717fd05d6d22f7ec7', '28d629a54f119f20f78de60a3648309b', '45509c935326294db1f1caf64051b760', '0b73bddd88b69f754c82010995b240c6', 'a0940c5ba324c7f8a5e2ee0d1453899b', '2a9ebce817c37218b194e93e8b1e2a2b', 'a80bc0e04656963b9f4140607e6e7c2d', 'f3ba530b4c1427ee49fe0bdcf586b907', '0c8f0b5570f9833960fef1175340d95a', '359a3d932c7bf905f5b397b4aa91b70f', '64e6b1e9063192e000d5802c2c91383b', '46cad882407228f2106810c4e34cc7a5', 'ad7435702f3c04fc7bb05e2ef678bd25', '03eaae29c0c72b686782697c72fab4d1', '79cdaa9672ae80c20a9219a195913db0', '77891e31017b69c326e78fd5a108ac55', 'a9847e3bbfe0bf3e942bb0e0a7e60e9c', '872bc089dc6f6aa4fa0ddd5e052419d9', '2a0c17615c1ec3fffee8c6139f21969b', '9f14d8d8d2a69e490779d9bfdc41b04f', 'cf630925047e66f4bf28a429a34fcae1', '42a67a6ce5b1adaa03e16c01a876a139', 'e430ec0ec8ab88866a26467184b4affc', '876d3b3a5266f31e9a10d14dd051fd42', '47eb1635572143d216bfa9c9fc976455', '6e042a3b60e3e0089aa2b8ccbf4f7105', '0ee4d83dae945efce785c2dc04cd9b86', 'febc5de5a3746c751e5174405682dad3', '422f5efa3a1defca898e56d9275ab8ab', '8e83e544a2dc3c0c98b47943683f5773', '3c4f3e398959b56b0aa9777b6ffac64d', 'ec97be6955353173a002361318256e6e', '391945e0197087d24e6323d05ed00357', '2008badca8bac3c1f789945eb199725e', '6cead0af3589a7c7d0ef84509819b666', 'b3520b35f06b73cc85ef1421a47346b7', 'f29a4b399dbf7ff34d49d9cfd84b9f3a', '0a8f60cc0a1110cf51e9eeb6056755f1', 'a44630290849462284bf6a995e270187', '668a14a2981358b3ae96d4323ea6c78d', '7f56f6076a9c0a6521a3e459f30696be', '7498efbdda4f6b6c5fd951f8c3f1ed27', 'e28f475c518638bc1f56b70451c945d8', 'f5bba181468d42f241326663c16adecc', '9d39d8119adbd9a1b43e2c151df11998', '00d1aad59af26c7b7c398781564c80eb', '51b779ee3e0be38d53ecc4fa0f8eafd5', 'd7538060146cad6edca0e7e5937b1c28', '7a97dcad1198a90ea0bb356e335aa18e', '0013b11b9afb8f2ceeb51342562cdba0', 'be5bcd70f522ba147a928dc906665c32', '6be839c9312ae76f62a258b6346a1bcf', '2d49049f79b5ef4cc23cf4ce5104d1d9', '9dc3ca78d1d420d87699379e5b86db48', 'c754989ac67e2d488fcef8dadea12ba2', '5ef788bcd5f73b03ffdd997c8a2bfa80', 'a3cc4e6a3ab3480388d41ac4938ebf54', '24fd45a9543b9d2ae5623fce1c65c13b', 'e49b88c14184a8b81293a1f115fc7ea7', '15b357fc1c74747fd39c761838297c27', '5f5407e08ff6b8f3e7aad033d72399d7', '83a608e327bc4b858472d78ccdc1bf58', '66b1c53c8e1eca84539dd4603e4fc535', '11c53f22d1347ca61a9d5bb86d50dd1a', 'f685da1c55aec548a6d4bd7389efdda8', 'a14c19499104511cc2d4697e81a8dce1', '4a88de335fd28c7e7498958313e2d695', '0c77d56d02d5e6afe6fcdd112b36dd3b', 'a63ea9e5f75a14cc88e8fbd149608412', '4b0e33f71c2f589d58e696a1bd286818', '02d08b5d638bdfcec1a4aa97efe76420', '0b149cac3b2c60f9c23eed9ec8b3c67e', '157b6ca81557e8e81ccd17a12455de8d', 'c24e72b847ad54803a7ca914a05bf966', 'e1bad2241c37381931bab8b5de92f857', '0d6337d5bd8e8f724dff2a899dd3452e', '747b89bdef62e61a91303de272edcbde', '409dbad7d03073458c697b39c9e9ffaa', 'c7625747fa0b5cdb3abdd5d6ee900f53', '34c2bd3a84af3875b31b6c733f67e59e', 'b116b7569d848790c9deeecdf4c8bc45', 'ee177f661c4678ec1d619b2d55a64e08', 'deb2764a159465a36c9fd74df49d34b2', 'e6808972d55a076bab913dba5f10641c', 'e3c12c10db5082cd14fdd27cf326dff6', '603d8da3aadbeea8a017954a6a65382f', 'b89d1655be705334eb8cd351fa64ba36', '08796e9f540e7d1ca1058e394c30baf6', '5e3d8364998af53bb4f54a54bb7ef254', 'b45c47bb0c2cc39865e27424b43be244', 'd4fa23ac7a3050bfb10aecd6b3e8f9c0', 'daac4910d3298d73330657a1e90b5820', '0ca0c44af954b4f9716b02723cdf074d', '31bb5305af817f91dfc0d0276b7edb17', '8784411280c7d98f901b13cd9e4b171e', '4af73d958c20bf3f163282ff01c40884', '8db1f8b40475645808d6ee65d67ae588', '38f6593cb25b13040ed958233b7f6941', '6719d2b30c510f1bedf6df0154622248', '122d95e19d980de271b722590690f644', '96c42e0cd97131a1ed635afa69511a55', '964a84ea9cc0feb54ca9dccaf8f9fd43', 'b2cf4bf6e0f7af076c7d539bd65d3a9d', '5947075975810eb068eb3ce9f0be0e67', 'c933d1e8e42049724d9895b7a0abc2fa', 'b57d64104854cd59c7fdd1b2e95a5c60', '67467a0c85ab0550eb18a96b274bb559', '993dac52a63d467cd33131520396ffb8', '105c1cf31728f73e53011181cd68e2b9', '1b235a8903c957e8bb294d8762e6cb7f', '745317223f85a91d78d423672ba88f52', 'eb73fd12ea368d18164f24c75267343c', 'edafb79cac0e5172627e7bacdcd0318b', '130973f01f9b6925ea71e46eb306b9cf', '996e95b4e9133e55594d66a77636619d', 'cecb8f7da358828d7b31d35f161c9d2d', '2b0828f6e69107ef58fb3ca58019f04d', '502a8b7974de206edb03aef0f7f86676');
@@ -0,0 +1,251 @@
+-- OLTP point queries, one per line.
+SELECT id, name, email, created_at FROM payments WHERE id = 719590;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 272449 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 666607 AND version = 6;
+INSERT INTO orders (id, name, payload) VALUES (600772, 'name_600772', '{"k": 600772}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 28291 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 426499;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 108264 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 334642 AND version = 30;
+INSERT INTO sessions (id, name, payload) VALUES (471231, 'name_471231', '{"k": 471231}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 218789 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 332298;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 952774 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 351870 AND version = 21;
+INSERT INTO order_items (id, name, payload) VALUES (97229, 'name_97229', '{"k": 97229}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 543005 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 424604;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 216367 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 254429 AND version = 2;
+INSERT INTO accounts (id, name, payload) VALUES (99117, 'name_99117', '{"k": 99117}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 199584 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 727123;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 319883 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 269257 AND version = 10;
+INSERT INTO sessions (id, name, payload) VALUES (123415, 'name_123415', '{"k": 123415}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 280551 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 245325;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 601811 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 58734 AND version = 0;
+INSERT INTO payments (id, name, payload) VALUES (647677, 'name_647677', '{"k": 647677}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 292971 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 728530;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 352173 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 756331 AND version = 28;
+INSERT INTO accounts (id, name, payload) VALUES (967239, 'name_967239', '{"k": 967239}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 287103 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 873260;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 164344 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 425487 AND version = 45;
+INSERT INTO users (id, name, payload) VALUES (723311, 'name_723311', '{"k": 723311}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 817651 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 449367;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 234906 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 950854 AND version = 38;
+INSERT INTO users (id, name, payload) VALUES (544723, 'name_544723', '{"k": 544723}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 457638 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 180697;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 120410 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE orders SET updated_at = now(), version = version + 1 WHERE id = 2097 AND version = 41;
+INSERT INTO orders (id, name, payload) VALUES (704925, 'name_704925', '{"k": 704925}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 421628 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 556111;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 57001 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 172067 AND version = 7;
+INSERT INTO order_items (id, name, payload) VALUES (584346, 'name_584346', '{"k": 584346}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 13289 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 601699;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 113877 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 348946 AND version = 16;
+INSERT INTO payments (id, name, payload) VALUES (90092, 'name_90092', '{"k": 90092}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 819098 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 695882;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 825889 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 203844 AND version = 14;
+INSERT INTO sessions (id, name, payload) VALUES (531251, 'name_531251', '{"k": 531251}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 12744 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 24941;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 780917 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 939790 AND version = 8;
+INSERT INTO orders (id, name, payload) VALUES (917380, 'name_917380', '{"k": 917380}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 439329 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 114529;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 103428 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 251453 AND version = 12;
+INSERT INTO accounts (id, name, payload) VALUES (101933, 'name_101933', '{"k": 101933}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 131465 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 408690;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 679446 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 470306 AND version = 31;
+INSERT INTO users (id, name, payload) VALUES (187452, 'name_187452', '{"k": 187452}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 853493 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 326412;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 988052 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 952977 AND version = 18;
+INSERT INTO accounts (id, name, payload) VALUES (382198, 'name_382198', '{"k": 382198}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 312708 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 709318;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 103471 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 289643 AND version = 3;
+INSERT INTO order_items (id, name, payload) VALUES (391366, 'name_391366', '{"k": 391366}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 296253 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 877577;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 849550 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 69846 AND version = 36;
+INSERT INTO order_items (id, name, payload) VALUES (221570, 'name_221570', '{"k": 221570}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 734952 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 554977;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 967399 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 652718 AND version = 21;
+INSERT INTO payments (id, name, payload) VALUES (16274, 'name_16274', '{"k": 16274}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 291090 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 638782;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 2555 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 221579 AND version = 47;
+INSERT INTO accounts (id, name, payload) VALUES (648303, 'name_648303', '{"k": 648303}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 722046 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 82008;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 888698 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE orders SET updated_at = now(), version = version + 1 WHERE id = 827943 AND version = 18;
+INSERT INTO order_items (id, name, payload) VALUES (52304, 'name_52304', '{"k": 52304}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 144386 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 394214;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 416616 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE order_items SET updated_at = now(), version = version + 1 WHERE id = 266722 AND version = 0;
+INSERT INTO order_items (id, name, payload) VALUES (96159, 'name_96159', '{"k": 96159}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 913635 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 334649;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 812071 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 307163 AND version = 28;
+INSERT INTO orders (id, name, payload) VALUES (398642, 'name_398642', '{"k": 398642}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 653689 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 365107;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 95677 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 859836 AND version = 23;
+INSERT INTO users (id, name, payload) VALUES (797494, 'name_797494', '{"k": 797494}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 500205 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 568161;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 310293 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 7005 AND version = 8;
+INSERT INTO payments (id, name, payload) VALUES (381077, 'name_381077', '{"k": 381077}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 556114 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 19838;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 453634 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 470778 AND version = 15;
+INSERT INTO order_items (id, name, payload) VALUES (406994, 'name_406994', '{"k": 406994}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 562101 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 952893;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 530488 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 680527 AND version = 45;
+INSERT INTO orders (id, name, payload) VALUES (650805, 'name_650805', '{"k": 650805}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 686012 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 281711;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 774789 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 487707 AND version = 42;
+INSERT INTO payments (id, name, payload) VALUES (893219, 'name_893219', '{"k": 893219}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 507995 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 370700;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 938626 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 946765 AND version = 35;
+INSERT INTO accounts (id, name, payload) VALUES (670145, 'name_670145', '{"k": 670145}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 737276 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 715643;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 565076 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 782777 AND version = 17;
+INSERT INTO payments (id, name, payload) VALUES (40889, 'name_40889', '{"k": 40889}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 198682 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 409713;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 573064 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 738840 AND version = 19;
+INSERT INTO order_items (id, name, payload) VALUES (660844, 'name_660844', '{"k": 660844}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 983307 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 135095;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 922103 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 594324 AND version = 42;
+INSERT INTO users (id, name, payload) VALUES (924536, 'name_924536', '{"k": 924536}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 356205 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 257300;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 333298 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 153089 AND version = 16;
+INSERT INTO orders (id, name, payload) VALUES (100566, 'name_100566', '{"k": 100566}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 319004 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 519341;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 528505 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 498696 AND version = 30;
+INSERT INTO order_items (id, name, payload) VALUES (747400, 'name_747400', '{"k": 747400}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 775627 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 99898;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 946175 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 860979 AND version = 45;
+INSERT INTO orders (id, name, payload) VALUES (526721, 'name_526721', '{"k": 526721}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 439231 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 477724;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 718783 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 507147 AND version = 9;
+INSERT INTO accounts (id, name, payload) VALUES (199163, 'name_199163', '{"k": 199163}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 303688 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 199565;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 420470 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE order_items SET updated_at = now(), version = version + 1 WHERE id = 71336 AND version = 49;
+INSERT INTO orders (id, name, payload) VALUES (667313, 'name_667313', '{"k": 667313}') ON CONFLICT DO NOTHING;
+DELETE FROM sessions WHERE id = 120125 RETURNING id;
+SELECT id, name, email, created_at FROM accounts WHERE id = 755986;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 762873 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE orders SET updated_at = now(), version = version + 1 WHERE id = 911333 AND version = 13;
+INSERT INTO sessions (id, name, payload) VALUES (302950, 'name_302950', '{"k": 302950}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 895337 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 99442;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 543792 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 784527 AND version = 11;
+INSERT INTO sessions (id, name, payload) VALUES (599833, 'name_599833', '{"k": 599833}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 853809 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 158162;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 351520 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE order_items SET updated_at = now(), version = version + 1 WHERE id = 154225 AND version = 18;
+INSERT INTO sessions (id, name, payload) VALUES (960983, 'name_960983', '{"k": 960983}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 134931 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 69576;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 623809 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE sessions SET updated_at = now(), version = version + 1 WHERE id = 547168 AND version = 2;
+INSERT INTO users (id, name, payload) VALUES (906707, 'name_906707', '{"k": 906707}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 918709 RETURNING id;
+SELECT id, name, email, created_at FROM order_items WHERE id = 589894;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 559113 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 632245 AND version = 43;
+INSERT INTO order_items (id, name, payload) VALUES (466044, 'name_466044', '{"k": 466044}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 980335 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 45537;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 717037 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 871908 AND version = 11;
+INSERT INTO users (id, name, payload) VALUES (520542, 'name_520542', '{"k": 520542}') ON CONFLICT DO NOTHING;
+DELETE FROM payments WHERE id = 627473 RETURNING id;
+SELECT id, name, email, created_at FROM sessions WHERE id = 786018;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 312804 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 254875 AND version = 17;
+INSERT INTO accounts (id, name, payload) VALUES (122983, 'name_122983', '{"k": 122983}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 577463 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 561868;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 467270 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE order_items SET updated_at = now(), version = version + 1 WHERE id = 352193 AND version = 15;
+INSERT INTO sessions (id, name, payload) VALUES (765862, 'name_765862', '{"k": 765862}') ON CONFLICT DO NOTHING;
+DELETE FROM accounts WHERE id = 535035 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 473241;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 531732 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE users SET updated_at = now(), version = version + 1 WHERE id = 299669 AND version = 1;
+INSERT INTO orders (id, name, payload) VALUES (805158, 'name_805158', '{"k": 805158}') ON CONFLICT DO NOTHING;
+DELETE FROM orders WHERE id = 275620 RETURNING id;
+SELECT id, name, email, created_at FROM orders WHERE id = 559199;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 664511 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE payments SET updated_at = now(), version = version + 1 WHERE id = 66150 AND version = 43;
+INSERT INTO orders (id, name, payload) VALUES (14522, 'name_14522', '{"k": 14522}') ON CONFLICT DO NOTHING;
+DELETE FROM users WHERE id = 605946 RETURNING id;
+SELECT id, name, email, created_at FROM payments WHERE id = 809089;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 165278 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 670089 AND version = 4;
+INSERT INTO payments (id, name, payload) VALUES (462811, 'name_462811', '{"k": 462811}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 874536 RETURNING id;
+SELECT id, name, email, created_at FROM users WHERE id = 921;
+SELECT o.id, o.total FROM orders o JOIN users u ON u.id = o.user_id WHERE u.id = 792248 AND o.status = 'open' ORDER BY o.created_at DESC LIMIT 20;
+UPDATE accounts SET updated_at = now(), version = version + 1 WHERE id = 408073 AND version = 34;
+INSERT INTO sessions (id, name, payload) VALUES (843138, 'name_843138', '{"k": 843138}') ON CONFLICT DO NOTHING;
+DELETE FROM order_items WHERE id = 97885 RETURNING id;
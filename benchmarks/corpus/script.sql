@@ -0,0 +1,684 @@
+-- A migration script, parsed as a whole.
+BEGIN;
+-- Table 0
+CREATE TABLE IF NOT EXISTS table_0 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_0_name_idx ON table_0 (lower(name));
+INSERT INTO table_0 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_0 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_0_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_0 ADD COLUMN note text;
+-- Table 1
+CREATE TABLE IF NOT EXISTS table_1 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_1_name_idx ON table_1 (lower(name));
+INSERT INTO table_1 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_1 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_1_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_1 ADD COLUMN note text;
+-- Table 2
+CREATE TABLE IF NOT EXISTS table_2 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_2_name_idx ON table_2 (lower(name));
+INSERT INTO table_2 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_2 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_2_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_2 ADD COLUMN note text;
+-- Table 3
+CREATE TABLE IF NOT EXISTS table_3 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_3_name_idx ON table_3 (lower(name));
+INSERT INTO table_3 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_3 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_3_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_3 ADD COLUMN note text;
+-- Table 4
+CREATE TABLE IF NOT EXISTS table_4 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_4_name_idx ON table_4 (lower(name));
+INSERT INTO table_4 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_4 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_4_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_4 ADD COLUMN note text;
+-- Table 5
+CREATE TABLE IF NOT EXISTS table_5 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_5_name_idx ON table_5 (lower(name));
+INSERT INTO table_5 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_5 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_5_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_5 ADD COLUMN note text;
+-- Table 6
+CREATE TABLE IF NOT EXISTS table_6 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_6_name_idx ON table_6 (lower(name));
+INSERT INTO table_6 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_6 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_6_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_6 ADD COLUMN note text;
+-- Table 7
+CREATE TABLE IF NOT EXISTS table_7 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_7_name_idx ON table_7 (lower(name));
+INSERT INTO table_7 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_7 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_7_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_7 ADD COLUMN note text;
+-- Table 8
+CREATE TABLE IF NOT EXISTS table_8 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_8_name_idx ON table_8 (lower(name));
+INSERT INTO table_8 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_8 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_8_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_8 ADD COLUMN note text;
+-- Table 9
+CREATE TABLE IF NOT EXISTS table_9 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_9_name_idx ON table_9 (lower(name));
+INSERT INTO table_9 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_9 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_9_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_9 ADD COLUMN note text;
+-- Table 10
+CREATE TABLE IF NOT EXISTS table_10 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_10_name_idx ON table_10 (lower(name));
+INSERT INTO table_10 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_10 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_10_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_10 ADD COLUMN note text;
+-- Table 11
+CREATE TABLE IF NOT EXISTS table_11 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_11_name_idx ON table_11 (lower(name));
+INSERT INTO table_11 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_11 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_11_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_11 ADD COLUMN note text;
+-- Table 12
+CREATE TABLE IF NOT EXISTS table_12 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_12_name_idx ON table_12 (lower(name));
+INSERT INTO table_12 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_12 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_12_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_12 ADD COLUMN note text;
+-- Table 13
+CREATE TABLE IF NOT EXISTS table_13 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_13_name_idx ON table_13 (lower(name));
+INSERT INTO table_13 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_13 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_13_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_13 ADD COLUMN note text;
+-- Table 14
+CREATE TABLE IF NOT EXISTS table_14 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_14_name_idx ON table_14 (lower(name));
+INSERT INTO table_14 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_14 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_14_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_14 ADD COLUMN note text;
+-- Table 15
+CREATE TABLE IF NOT EXISTS table_15 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_15_name_idx ON table_15 (lower(name));
+INSERT INTO table_15 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_15 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_15_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_15 ADD COLUMN note text;
+-- Table 16
+CREATE TABLE IF NOT EXISTS table_16 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_16_name_idx ON table_16 (lower(name));
+INSERT INTO table_16 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_16 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_16_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_16 ADD COLUMN note text;
+-- Table 17
+CREATE TABLE IF NOT EXISTS table_17 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_17_name_idx ON table_17 (lower(name));
+INSERT INTO table_17 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_17 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_17_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_17 ADD COLUMN note text;
+-- Table 18
+CREATE TABLE IF NOT EXISTS table_18 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_18_name_idx ON table_18 (lower(name));
+INSERT INTO table_18 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_18 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_18_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_18 ADD COLUMN note text;
+-- Table 19
+CREATE TABLE IF NOT EXISTS table_19 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_19_name_idx ON table_19 (lower(name));
+INSERT INTO table_19 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_19 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_19_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_19 ADD COLUMN note text;
+-- Table 20
+CREATE TABLE IF NOT EXISTS table_20 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_20_name_idx ON table_20 (lower(name));
+INSERT INTO table_20 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_20 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_20_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_20 ADD COLUMN note text;
+-- Table 21
+CREATE TABLE IF NOT EXISTS table_21 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_21_name_idx ON table_21 (lower(name));
+INSERT INTO table_21 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_21 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_21_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_21 ADD COLUMN note text;
+-- Table 22
+CREATE TABLE IF NOT EXISTS table_22 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_22_name_idx ON table_22 (lower(name));
+INSERT INTO table_22 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_22 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_22_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_22 ADD COLUMN note text;
+-- Table 23
+CREATE TABLE IF NOT EXISTS table_23 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_23_name_idx ON table_23 (lower(name));
+INSERT INTO table_23 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_23 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_23_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_23 ADD COLUMN note text;
+-- Table 24
+CREATE TABLE IF NOT EXISTS table_24 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_24_name_idx ON table_24 (lower(name));
+INSERT INTO table_24 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_24 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_24_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_24 ADD COLUMN note text;
+-- Table 25
+CREATE TABLE IF NOT EXISTS table_25 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_25_name_idx ON table_25 (lower(name));
+INSERT INTO table_25 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_25 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_25_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_25 ADD COLUMN note text;
+-- Table 26
+CREATE TABLE IF NOT EXISTS table_26 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_26_name_idx ON table_26 (lower(name));
+INSERT INTO table_26 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_26 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_26_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_26 ADD COLUMN note text;
+-- Table 27
+CREATE TABLE IF NOT EXISTS table_27 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_27_name_idx ON table_27 (lower(name));
+INSERT INTO table_27 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_27 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_27_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_27 ADD COLUMN note text;
+-- Table 28
+CREATE TABLE IF NOT EXISTS table_28 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_28_name_idx ON table_28 (lower(name));
+INSERT INTO table_28 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_28 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_28_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_28 ADD COLUMN note text;
+-- Table 29
+CREATE TABLE IF NOT EXISTS table_29 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_29_name_idx ON table_29 (lower(name));
+INSERT INTO table_29 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_29 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_29_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_29 ADD COLUMN note text;
+-- Table 30
+CREATE TABLE IF NOT EXISTS table_30 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_30_name_idx ON table_30 (lower(name));
+INSERT INTO table_30 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_30 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_30_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_30 ADD COLUMN note text;
+-- Table 31
+CREATE TABLE IF NOT EXISTS table_31 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_31_name_idx ON table_31 (lower(name));
+INSERT INTO table_31 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_31 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_31_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_31 ADD COLUMN note text;
+-- Table 32
+CREATE TABLE IF NOT EXISTS table_32 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_32_name_idx ON table_32 (lower(name));
+INSERT INTO table_32 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_32 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_32_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_32 ADD COLUMN note text;
+-- Table 33
+CREATE TABLE IF NOT EXISTS table_33 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_33_name_idx ON table_33 (lower(name));
+INSERT INTO table_33 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_33 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_33_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_33 ADD COLUMN note text;
+-- Table 34
+CREATE TABLE IF NOT EXISTS table_34 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_34_name_idx ON table_34 (lower(name));
+INSERT INTO table_34 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_34 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_34_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_34 ADD COLUMN note text;
+-- Table 35
+CREATE TABLE IF NOT EXISTS table_35 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_35_name_idx ON table_35 (lower(name));
+INSERT INTO table_35 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_35 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_35_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_35 ADD COLUMN note text;
+-- Table 36
+CREATE TABLE IF NOT EXISTS table_36 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_36_name_idx ON table_36 (lower(name));
+INSERT INTO table_36 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_36 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_36_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_36 ADD COLUMN note text;
+-- Table 37
+CREATE TABLE IF NOT EXISTS table_37 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_37_name_idx ON table_37 (lower(name));
+INSERT INTO table_37 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_37 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_37_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_37 ADD COLUMN note text;
+-- Table 38
+CREATE TABLE IF NOT EXISTS table_38 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_38_name_idx ON table_38 (lower(name));
+INSERT INTO table_38 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_38 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_38_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_38 ADD COLUMN note text;
+-- Table 39
+CREATE TABLE IF NOT EXISTS table_39 (
+    id bigserial PRIMARY KEY,
+    name text NOT NULL,
+    amount numeric(12, 2) DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX table_39_name_idx ON table_39 (lower(name));
+INSERT INTO table_39 (name, amount) VALUES ('row_0', 0.00), ('row_1', 1.01), ('row_2', 2.02), ('row_3', 3.03), ('row_4', 4.04), ('row_5', 5.05), ('row_6', 6.06), ('row_7', 7.07), ('row_8', 8.08), ('row_9', 9.09), ('row_10', 10.10), ('row_11', 11.11), ('row_12', 12.12), ('row_13', 13.13), ('row_14', 14.14), ('row_15', 15.15), ('row_16', 16.16), ('row_17', 17.17), ('row_18', 18.18), ('row_19', 19.19);
+UPDATE table_39 SET amount = amount * 1.1 WHERE name LIKE 'row_1%';
+CREATE FUNCTION table_39_touch() RETURNS trigger AS $$
+BEGIN
+    NEW.created_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+ALTER TABLE table_39 ADD COLUMN note text;
+SELECT count(*) FROM table_0 JOIN table_1 USING (id);
+COMMIT;
@@ -0,0 +1,62 @@
+"""
+JSON decoder throughput.
+
+Compares decoding the libpg_query output with the stdlib json module
+against the psqlparse decoder, both into dicts (parse_dict) and into node
+objects (parse), on a small OLTP query and on a ~100 KB analytic query.
+
+Usage::
+
+    python benchmarks/decoder.py
+"""
+from __future__ import print_function
+
+import json
+import timeit
+
+import psqlparse
+from psqlparse.nodes.utils import build_from_obj
+
+
+OLTP_QUERY = ("SELECT id, name, email FROM users "
+              "WHERE id = 42 AND active ORDER BY name LIMIT 1")
+
+ANALYTIC_QUERY = (
+    "SELECT " +
+    ", ".join("sum(CASE WHEN t.kind = %d THEN t.amount * 1.5 ELSE 0 END) "
+              "AS kind_%d" % (i, i) for i in range(1200)) +
+    " FROM transactions t JOIN accounts a ON a.id = t.account_id "
+    "WHERE t.created >= '2016-01-01' AND a.region IN (" +
+    ", ".join("'region_%d'" % i for i in range(1200)) +
+    ") GROUP BY a.region ORDER BY 1")
+
+
+def stdlib_dicts(query):
+    return json.loads(psqlparse.parse_json(query), strict=False)
+
+
+def stdlib_nodes(query):
+    return [build_from_obj(obj) for obj in stdlib_dicts(query)]
+
+
+def latency(func, query):
+    number = max(1, 200000 // len(query))
+    return min(timeit.repeat(lambda: func(query), number=number,
+                             repeat=3)) / number * 1e6
+
+
+def main():
+    for name, query in (('oltp', OLTP_QUERY), ('analytic', ANALYTIC_QUERY)):
+        print('%s query: %d bytes of SQL, %d bytes of JSON' %
+              (name, len(query), len(psqlparse.parse_json(query))))
+        for output, stdlib, decoder in (
+                ('dicts', stdlib_dicts, psqlparse.parse_dict),
+                ('nodes', stdlib_nodes, psqlparse.parse)):
+            before = latency(stdlib, query)
+            after = latency(decoder, query)
+            print('  %s: json %10.1f us  decoder %10.1f us  (x%.2f)' %
+                  (output, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Parsing pathologically deep queries.
+
+Parses queries nested DEPTH levels deep, as long chains of + operators and
+of UNIONs, with parse, and with parse_dict followed by build_from_obj, which
+falls back to an explicit stack when the tree is too deep for recursion.
+
+Usage::
+
+    python benchmarks/deep.py [--depth N [N ...]]
+"""
+from __future__ import print_function
+
+import argparse
+import time
+
+import psqlparse
+from psqlparse.nodes.utils import build_from_obj
+
+
+SHAPES = (
+    ('operators', lambda depth: "SELECT " + " + ".join(["a"] * depth)),
+    ('union', lambda depth: " UNION ".join("SELECT %d" % i
+                                           for i in range(depth))),
+)
+
+
+def timed(func, query):
+    start = time.time()
+    func(query)
+    return (time.time() - start) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--depth', type=int, nargs='+',
+                        default=[100, 1000, 10000, 50000])
+    args = parser.parse_args()
+
+    for name, make_query in SHAPES:
+        for depth in args.depth:
+            query = make_query(depth)
+            print('%-9s depth %6d: parse %9.1f ms  '
+                  'parse_dict + build_from_obj %9.1f ms' %
+                  (name, depth, timed(psqlparse.parse, query),
+                   timed(lambda q: build_from_obj(psqlparse.parse_dict(q)),
+                         query)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Selective materialization.
+
+Compares building every node with parse(query) to only building some
+clauses or node classes with parse(query, include=...), on the queries of
+benchmarks/tables.py.
+
+Usage::
+
+    python benchmarks/include.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+import psqlparse
+from psqlparse import nodes
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from tables import QUERIES  # noqa: E402
+
+
+INCLUDES = (
+    ('where_clause', ['where_clause']),
+    ('from_clause', ['from_clause']),
+    ('RangeVar', [nodes.RangeVar]),
+)
+
+
+def latency(func, query):
+    number = max(1, 200000 // len(query))
+    return min(timeit.repeat(lambda: func(query), number=number,
+                             repeat=5)) / number * 1e6
+
+
+def main():
+    for name, query in QUERIES:
+        # What libpg_query takes, which no option can save.
+        print('%-8s parse_json %31.1f us' %
+              (name, latency(psqlparse.parse_json, query)))
+        full = latency(psqlparse.parse, query)
+        print('%-8s parse %36.1f us' % (name, full))
+        for label, include in INCLUDES:
+            selected = latency(
+                lambda query: psqlparse.parse(query, include=include), query)
+            print('%-8s parse(include=%-12s) %14.1f us  (x%.2f)' %
+                  (name, label, selected, full / selected))
+
+
+if __name__ == '__main__':
+    main()
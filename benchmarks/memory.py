@@ -0,0 +1,64 @@
+"""
+Memory used by parse trees.
+
+Parses a wide analytic query and reports the memory held by the resulting
+node tree, measured with tracemalloc, per node object.
+
+Usage::
+
+    python benchmarks/memory.py [--columns N]
+"""
+from __future__ import print_function
+
+import argparse
+import gc
+import tracemalloc
+
+import psqlparse
+from psqlparse.nodes import Node
+
+
+def analytic_query(columns):
+    return ("SELECT " +
+            ", ".join("sum(CASE WHEN t.kind = %d THEN t.amount ELSE 0 END) "
+                      "AS kind_%d" % (i, i) for i in range(columns)) +
+            " FROM transactions t WHERE t.region IN (" +
+            ", ".join("'region_%d'" % i for i in range(columns)) + ")")
+
+
+def count_nodes(obj):
+    count = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, Node):
+            count += 1
+            stack.extend(getattr(obj, attr) for attr, _ in obj._children)
+        elif hasattr(obj, 'val'):
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--columns', type=int, default=2000)
+    args = parser.parse_args()
+
+    query = analytic_query(args.columns)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    statements = psqlparse.parse(query)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    n_nodes = count_nodes(statements)
+    print('%d nodes, %.1f MB, %.1f bytes per node' %
+          (n_nodes, used / 1e6, float(used) / n_nodes))
+
+
+if __name__ == '__main__':
+    main()
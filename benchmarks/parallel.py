@@ -0,0 +1,76 @@
+"""
+Process-pool parse throughput.
+
+Parses a batch of generated statements with ``psqlparse.parse_parallel``
+for an increasing number of processes, in each of its modes, and reports
+the throughput against the single-process equivalent: ``parse_many`` for
+nodes, ``parse_dict_many`` for dicts, and ``parse_many`` followed by the
+analysis for a worker-side ``func``.
+
+Usage::
+
+    python benchmarks/parallel.py [--queries N] [--processes 1,2,4,8]
+"""
+from __future__ import print_function
+
+import argparse
+import time
+
+import psqlparse
+
+
+TEMPLATES = [
+    "SELECT * FROM users WHERE id = %d",
+    "UPDATE accounts SET balance = balance - %d WHERE id = 42",
+    "INSERT INTO events (kind, payload) VALUES (%d, 'x')",
+    "SELECT o.id, sum(l.amount) FROM orders o JOIN lines l "
+    "ON l.order_id = o.id WHERE o.customer_id = %d GROUP BY o.id",
+]
+
+
+def generate(n_queries):
+    return [TEMPLATES[i % len(TEMPLATES)] % i for i in range(n_queries)]
+
+
+def timed(function, *args, **kwargs):
+    start = time.time()
+    function(*args, **kwargs)
+    return time.time() - start
+
+
+def tables(statements):
+    return [statement.tables() for statement in statements]
+
+
+def serial_tables(queries):
+    return [tables(result) for result in psqlparse.parse_many(queries)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--queries', type=int, default=200000)
+    parser.add_argument('--processes', default='1,2,4,8')
+    parser.add_argument('--chunksize', type=int, default=1000)
+    args = parser.parse_args()
+
+    queries = generate(args.queries)
+    modes = [
+        ('nodes', psqlparse.parse_many, {}),
+        ('dicts', psqlparse.parse_dict_many, {'as_dict': True}),
+        ('func', serial_tables, {'func': tables}),
+    ]
+    for label, serial, options in modes:
+        baseline = timed(serial, queries)
+        print('%s, serial:     %10.0f queries/s' %
+              (label, len(queries) / baseline))
+        for processes in [int(n) for n in args.processes.split(',')]:
+            elapsed = timed(psqlparse.parse_parallel, queries,
+                            processes=processes, chunksize=args.chunksize,
+                            **options)
+            print('%s, %2d processes: %10.0f queries/s (x%.2f)' %
+                  (label, processes, len(queries) / elapsed,
+                   baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
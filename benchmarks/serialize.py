@@ -0,0 +1,98 @@
+"""
+Size and speed of serialized parse trees.
+
+Compares psqlparse.dumps and loads with pickling the nodes by their state,
+as it was done before they had __reduce_ex__, and with the JSON parse tree,
+on the queries of benchmarks/corpus. JSON is written from the parse_dict
+output with json.dumps, and read back into nodes by the decoder.
+
+Usage::
+
+    python benchmarks/serialize.py [--number N]
+"""
+from __future__ import division, print_function
+
+import argparse
+import copyreg
+import io
+import json
+import os
+import pickle
+import timeit
+
+import psqlparse
+from psqlparse.decoder import build_from_json
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+
+def from_state(klass, state):
+    node = klass.__new__(klass)
+    node.__setstate__(state)
+    return node
+
+
+def reduce_state(node):
+    return from_state, (type(node), node.__getstate__())
+
+
+class StatePickler(pickle.Pickler):
+    # Pickles the nodes with __getstate__, ignoring their __reduce_ex__.
+    dispatch_table = copyreg.dispatch_table.copy()
+
+
+def state_dumps(statements):
+    for klass in psqlparse.nodes.utils._node_classes.values():
+        StatePickler.dispatch_table[klass] = reduce_state
+    output = io.BytesIO()
+    StatePickler(output, pickle.HIGHEST_PROTOCOL).dump(statements)
+    return output.getvalue()
+
+
+def load_queries(name):
+    with open(os.path.join(CORPUS, name + '.sql'), 'rb') as f:
+        text = f.read().decode('utf8')
+    return [text[offset:offset + length]
+            for offset, length in psqlparse.split(text)]
+
+
+def best_time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def measure(name, queries, number):
+    trees = [psqlparse.parse(query) for query in queries]
+    dicts = [psqlparse.parse_dict(query) for query in queries]
+    formats = [
+        ('dumps', lambda: [psqlparse.dumps(tree) for tree in trees],
+         psqlparse.loads),
+        ('pickle', lambda: [pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+                            for tree in trees], pickle.loads),
+        ('pickle state', lambda: [state_dumps(tree) for tree in trees],
+         pickle.loads),
+        ('json', lambda: [json.dumps(obj).encode('utf8') for obj in dicts],
+         build_from_json),
+    ]
+
+    print('%s: %d queries' % (name, len(queries)))
+    for label, dump, load in formats:
+        blobs = dump()
+        size = sum(len(blob) for blob in blobs)
+        dump_time = best_time(dump, number)
+        load_time = best_time(lambda: [load(blob) for blob in blobs], number)
+        print('  %-13s %10d bytes %10.1f us dump %10.1f us load' %
+              (label, size, dump_time * 1e6, load_time * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    for name in ('oltp', 'analytic', 'in_list'):
+        measure(name, load_queries(name), args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Splitting scripts into statements.
+
+Compares split, which only scans the text, with a full parse_json and
+parse of a script with many statements, including dollar quoted function
+bodies and string literals.
+
+Usage::
+
+    python benchmarks/split.py [--statements N]
+"""
+from __future__ import print_function
+
+import argparse
+import timeit
+
+import psqlparse
+
+
+STATEMENTS = (
+    "INSERT INTO events (id, kind, payload) VALUES (%d, 'click', "
+    "'{\"a\": \"b;c\"}')",
+    "UPDATE accounts SET balance = balance - %d WHERE id = 42",
+    "CREATE FUNCTION f_%d() RETURNS int AS $body$ BEGIN RETURN 1; END; "
+    "$body$ LANGUAGE plpgsql",
+    "SELECT a.id, count(*) FROM accounts a JOIN events e ON e.id = a.id "
+    "WHERE a.id > %d GROUP BY a.id /* totals; by account */",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--statements', type=int, default=10000)
+    args = parser.parse_args()
+
+    script = ';\n'.join(STATEMENTS[i % len(STATEMENTS)] % i
+                        for i in range(args.statements))
+    assert len(psqlparse.split(script)) == args.statements
+    print('%d statements, %d bytes' % (args.statements, len(script)))
+    baseline = None
+    for name, func in (('split', psqlparse.split),
+                       ('parse_json', psqlparse.parse_json),
+                       ('parse', psqlparse.parse)):
+        elapsed = min(timeit.repeat(lambda: func(script), number=1,
+                                    repeat=3))
+        baseline = baseline or elapsed
+        print('  %-10s %9.2f ms  (x%.0f)' %
+              (name, elapsed * 1e3, elapsed / baseline))
+
+
+if __name__ == '__main__':
+    main()
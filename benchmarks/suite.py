@@ -0,0 +1,257 @@
+"""
+Benchmark suite.
+
+Times each stage of parsing on the queries of benchmarks/corpus, and
+reports their throughput and the peak memory of parsing. Results can be
+saved as JSON, and two saved runs compared, to notice when a change makes
+parsing slower.
+
+The files of the corpus are cut into their queries with psqlparse.split,
+and each stage is timed over all of them, except for script.sql, which is
+parsed as a whole. The stages are:
+
+- parse_json: libpg_query parsing the queries into JSON text.
+- decode: decoding the JSON into dicts, which is parse_dict less
+  parse_json.
+- build_from_obj: building the nodes from the parse_dict output.
+- tables: Statement.tables() on the built nodes.
+- parse, parse_dict and psqlparse.tables, from the query text.
+
+Peak memory is measured with tracemalloc, which is only available on
+Python 3, and doesn't see the memory of libpg_query itself.
+
+Timings vary from run to run, so compare runs made on the same, otherwise
+idle, machine.
+
+Usage::
+
+    python benchmarks/suite.py [--output results.json] [--case NAME ...]
+    python benchmarks/suite.py --compare before.json after.json
+"""
+from __future__ import division, print_function
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+import psqlparse
+from psqlparse.nodes import Node
+from psqlparse.nodes.utils import build_from_obj
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+# The files parsed as a whole instead of query by query.
+WHOLE = ('script',)
+
+STAGES = ('parse_json', 'decode', 'build_from_obj', 'tables', 'parse',
+          'parse_dict', 'psqlparse.tables')
+
+
+def load_case(name):
+    with open(os.path.join(CORPUS, name + '.sql'), 'rb') as f:
+        text = f.read().decode('utf8')
+    if name in WHOLE:
+        return [text]
+    return [text[offset:offset + length]
+            for offset, length in psqlparse.split(text)]
+
+
+def stage_functions(queries):
+    dicts = [psqlparse.parse_dict(query) for query in queries]
+    statements = [psqlparse.parse(query) for query in queries]
+
+    def parse_json():
+        for query in queries:
+            psqlparse.parse_json(query)
+
+    def parse_dict():
+        for query in queries:
+            psqlparse.parse_dict(query)
+
+    def build():
+        for obj in dicts:
+            build_from_obj(obj)
+
+    def tables():
+        for stmts in statements:
+            for stmt in stmts:
+                # Statements without a node class are left as dicts.
+                if isinstance(stmt, Node):
+                    stmt.tables()
+
+    def parse():
+        for query in queries:
+            psqlparse.parse(query)
+
+    def fast_tables():
+        for query in queries:
+            psqlparse.tables(query)
+
+    return {'parse_json': parse_json, 'parse_dict': parse_dict,
+            'build_from_obj': build, 'tables': tables, 'parse': parse,
+            'psqlparse.tables': fast_tables}
+
+
+def best_time(func, min_time):
+    # The best of at least 3 runs, and of as many as fit in min_time.
+    times = []
+    start = timeit.default_timer()
+    while len(times) < 3 or timeit.default_timer() - start < min_time:
+        before = timeit.default_timer()
+        func()
+        times.append(timeit.default_timer() - before)
+    return min(times)
+
+
+def peak_memory(func, queries):
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        results = [func(query) for query in queries]
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del results
+    return peak
+
+
+def run_case(name, min_time):
+    queries = load_case(name)
+    size = sum(len(query.encode('utf8')) for query in queries)
+    functions = stage_functions(queries)
+    seconds = dict((stage, best_time(func, min_time))
+                   for stage, func in functions.items())
+    seconds['decode'] = max(seconds['parse_dict'] - seconds['parse_json'],
+                            0.0)
+
+    stages = {}
+    for stage in STAGES:
+        stages[stage] = {
+            'seconds': seconds[stage],
+            'queries_per_second': (len(queries) / seconds[stage]
+                                   if seconds[stage] else None),
+            'mb_per_second': (size / 1e6 / seconds[stage]
+                              if seconds[stage] else None),
+        }
+    return {
+        'queries': len(queries),
+        'bytes': size,
+        'stages': stages,
+        'peak_memory': {
+            'parse': peak_memory(psqlparse.parse, queries),
+            'parse_dict': peak_memory(psqlparse.parse_dict, queries),
+        },
+    }
+
+
+def revision():
+    try:
+        with open(os.devnull, 'w') as devnull:
+            output = subprocess.check_output(
+                ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(CORPUS),
+                stderr=devnull)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def report(name, case):
+    print('%s: %d queries, %.1f KB' % (name, case['queries'],
+                                       case['bytes'] / 1e3))
+    for stage in STAGES:
+        result = case['stages'][stage]
+        print('  %-18s %12.1f us %12.0f queries/s %9.2f MB/s' %
+              (stage, result['seconds'] * 1e6,
+               result['queries_per_second'] or 0,
+               result['mb_per_second'] or 0))
+    memory = case['peak_memory']
+    if memory['parse'] is not None:
+        print('  peak memory        %9.1f MB parse %9.1f MB parse_dict' %
+              (memory['parse'] / 1e6, memory['parse_dict'] / 1e6))
+
+
+def compare(before_path, after_path, threshold):
+    """
+    Print the ratio of the times of each stage in two saved runs, and
+    return whether any got slower by more than threshold.
+    """
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    slower = False
+    for name in sorted(set(before['cases']) & set(after['cases'])):
+        print(name)
+        for stage in STAGES:
+            old = before['cases'][name]['stages'].get(stage)
+            new = after['cases'][name]['stages'].get(stage)
+            if not old or not new or not old['seconds']:
+                continue
+            ratio = new['seconds'] / old['seconds']
+            flag = ''
+            if ratio > 1 + threshold:
+                flag = '  slower'
+                slower = True
+            print('  %-18s %12.1f us -> %12.1f us  x%.2f%s' %
+                  (stage, old['seconds'] * 1e6, new['seconds'] * 1e6,
+                   ratio, flag))
+    return slower
+
+
+def main():
+    cases = sorted(os.path.splitext(filename)[0]
+                   for filename in os.listdir(CORPUS)
+                   if filename.endswith('.sql'))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--case', action='append', choices=cases,
+                        help='only run these cases')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='seconds to spend timing each stage')
+    parser.add_argument('--output', help='save the results as JSON')
+    parser.add_argument('--compare', nargs=2,
+                        metavar=('BEFORE', 'AFTER'),
+                        help='compare two saved results')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown that makes --compare fail')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(args.compare[0], args.compare[1],
+                              args.threshold) else 0)
+
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'revision': revision(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        },
+        'cases': {},
+    }
+    for name in args.case or cases:
+        results['cases'][name] = run_case(name, args.min_time)
+        report(name, results['cases'][name])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
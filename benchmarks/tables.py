@@ -0,0 +1,57 @@
+"""
+Finding the tables of a query.
+
+Compares psqlparse.tables, which searches the decoded dicts, with building
+the nodes and calling tables() on them, on a small OLTP query, a query with
+subqueries and CTEs, and a ~100 KB analytic query.
+
+Usage::
+
+    python benchmarks/tables.py
+"""
+from __future__ import print_function
+
+import timeit
+
+import psqlparse
+
+
+QUERIES = (
+    ('oltp', "SELECT id, name, email FROM users "
+             "WHERE id = 42 AND active ORDER BY name LIMIT 1"),
+    ('nested', "WITH recent AS (SELECT * FROM orders "
+               "WHERE created > now() - interval '1 day') "
+               "SELECT u.id, (SELECT count(*) FROM recent r "
+               "WHERE r.user_id = u.id) FROM users u "
+               "JOIN accounts a ON a.user_id = u.id "
+               "WHERE u.id IN (SELECT user_id FROM admins)"),
+    ('analytic', "SELECT " +
+                 ", ".join("sum(CASE WHEN t.kind = %d THEN t.amount ELSE 0 "
+                           "END) AS kind_%d" % (i, i) for i in range(1200)) +
+                 " FROM transactions t JOIN accounts a "
+                 "ON a.id = t.account_id WHERE a.region IN (" +
+                 ", ".join("'region_%d'" % i for i in range(1200)) + ")"),
+)
+
+
+def parse_tables(query):
+    return set().union(*[stmt.tables() for stmt in psqlparse.parse(query)])
+
+
+def latency(func, query):
+    number = max(1, 200000 // len(query))
+    return min(timeit.repeat(lambda: func(query), number=number,
+                             repeat=5)) / number * 1e6
+
+
+def main():
+    for name, query in QUERIES:
+        assert psqlparse.tables(query) == parse_tables(query)
+        before = latency(parse_tables, query)
+        after = latency(psqlparse.tables, query)
+        print('%-8s parse + tables() %10.1f us  tables %10.1f us  (x%.2f)' %
+              (name, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Multi-threaded parse throughput.
+
+Runs the same batch of queries through ``psqlparse.parse_dict`` with an
+increasing number of threads and reports the achieved throughput. Since
+the libpg_query call releases the GIL, throughput should go up with the
+number of threads until the Python side (JSON decoding) becomes the
+bottleneck.
+
+Usage::
+
+    python benchmarks/threads.py [--queries N] [--threads 1,2,4,8]
+"""
+from __future__ import print_function
+
+import argparse
+import threading
+import time
+
+import psqlparse
+
+
+QUERY = ("SELECT a.id, b.name, count(*) FROM table_one a "
+         "JOIN table_two b ON a.id = b.one_id "
+         "WHERE a.created > now() - interval '1 day' "
+         "AND b.kind IN (1, 2, 3) AND a.flag "
+         "GROUP BY a.id, b.name HAVING count(*) > 10 "
+         "ORDER BY 3 DESC LIMIT 100")
+
+
+def run(n_queries, n_threads):
+    per_thread = n_queries // n_threads
+
+    def worker():
+        for _ in range(per_thread):
+            psqlparse.parse_dict(QUERY)
+
+    threads = [threading.Thread(target=worker) for _ in range(n_threads)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return per_thread * n_threads / (time.time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--queries', type=int, default=20000)
+    parser.add_argument('--threads', default='1,2,4,8')
+    args = parser.parse_args()
+
+    psqlparse.parse_dict(QUERY)  # warm up
+    baseline = None
+    for n_threads in [int(n) for n in args.threads.split(',')]:
+        throughput = run(args.queries, n_threads)
+        baseline = baseline or throughput
+        print('%2d threads: %10.0f queries/s (x%.2f)' %
+              (n_threads, throughput, throughput / baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,11 @@
-from .parser import parse, parse_dict
+from .parser import (parse, parse_dict, parse_json, parse_many,
+                     parse_dict_many, tables, fingerprint, normalize,
+                     normalize_many, set_cache, get_cache, set_stats,
+                     get_stats)
+from .parallel import parse_parallel
+from .stream import iter_parse
+from .scanner import split
+from .serializer import dumps, loads
+from .cache import ParseCache, SqliteCache, FingerprintCache
+from .stats import ParseStats
+from .version import __version__
@@ -0,0 +1,226 @@
+"""
+Parsing from asyncio code, without blocking the event loop.
+
+Queries are parsed in a pool of threads, where libpg_query runs without
+the GIL, so a big query doesn't stall the other tasks of the loop. Building
+the parse tree still holds the GIL, but the loop gets it back at every
+switch interval.
+
+Requires Python 3.5.2 or later, so it is not imported by psqlparse.
+"""
+import asyncio
+import collections
+import functools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from . import parser
+from .exceptions import PSqlParseError
+
+
+class ParsePool(object):
+    """
+    A pool of max_workers threads to parse queries on.
+
+    Up to max_workers queries are parsed at once, and up to max_pending
+    more wait for a thread, in the order they came. Once that many are
+    waiting, parse raises asyncio.QueueFull, so callers can shed the load
+    instead of piling up. max_pending=None doesn't limit them.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(self.max_workers)
+        # A semaphore is bound to the loop it is first awaited on, so each
+        # loop that uses the pool gets its own, with its count of waiting
+        # queries.
+        self._loops = weakref.WeakKeyDictionary()
+
+    async def _run(self, func, query, wait=False):
+        loop = asyncio.get_event_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = [
+                asyncio.Semaphore(self.max_workers), 0]
+        slots = state[0]
+        if (slots.locked() and not wait and
+                self.max_pending is not None and
+                state[1] >= self.max_pending):
+            raise asyncio.QueueFull()
+        state[1] += 1
+        try:
+            await slots.acquire()
+        finally:
+            state[1] -= 1
+        try:
+            return await loop.run_in_executor(self._executor, func, query)
+        finally:
+            slots.release()
+
+    async def parse(self, query, **options):
+        """
+        Parse a query, like psqlparse.parse, taking the same options.
+        """
+        return await self._run(functools.partial(parser.parse, **options),
+                               query)
+
+    async def parse_dict(self, query):
+        """
+        Parse a query, like psqlparse.parse_dict.
+        """
+        return await self._run(parser.parse_dict, query)
+
+    def parse_many(self, queries, as_dict=False):
+        """
+        Return an async iterator over the results of parsing queries, which
+        can be an iterable or an async iterable, like the lines of a
+        connection.
+
+        The results come in the order of the queries, either the list of
+        statements or the PSqlParseError instance for a query that failed
+        to parse, like in psqlparse.parse_many. Only max_workers queries
+        plus max_pending, or max_workers if it is None, are read ahead of
+        the results that were taken.
+        """
+        func = parser.parse_dict if as_dict else parser.parse
+        return _ResultIterator(self, func, queries)
+
+    def parse_dict_many(self, queries):
+        """
+        Like parse_many with as_dict=True.
+        """
+        return self.parse_many(queries, True)
+
+    def shutdown(self, wait=True):
+        """
+        Stop the threads, after the queries they are parsing.
+        """
+        self._executor.shutdown(wait)
+
+
+class _ResultIterator(object):
+
+    def __init__(self, pool, func, queries):
+        self._pool = pool
+        self._func = func
+        self._window = pool.max_workers + (
+            pool.max_workers if pool.max_pending is None
+            else pool.max_pending)
+        self._results = collections.deque()
+        if hasattr(queries, '__aiter__'):
+            self._queries = queries.__aiter__()
+            self._iterator = None
+        else:
+            self._queries = None
+            self._iterator = iter(queries)
+        # The next query being read from an async iterable.
+        self._next_query = None
+
+    def __aiter__(self):
+        return self
+
+    def _submit(self, query):
+        self._results.append(asyncio.ensure_future(
+            self._pool._run(self._func, query, wait=True)))
+
+    async def __anext__(self):
+        while True:
+            while (self._iterator is not None and
+                   len(self._results) < self._window):
+                try:
+                    query = next(self._iterator)
+                except StopIteration:
+                    self._iterator = None
+                    break
+                self._submit(query)
+
+            if self._results and self._results[0].done():
+                result = self._results.popleft()
+                try:
+                    return result.result()
+                except PSqlParseError as error:
+                    return error
+
+            # Wait for the first result or, if there's room, the next query
+            # of an async iterable, whichever comes first.
+            waiting = []
+            if self._results:
+                waiting.append(self._results[0])
+            if (self._next_query is None and self._queries is not None and
+                    len(self._results) < self._window):
+                self._next_query = asyncio.ensure_future(
+                    self._queries.__anext__())
+            if self._next_query is not None:
+                waiting.append(self._next_query)
+            if not waiting:
+                raise StopAsyncIteration()
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if self._next_query is not None and self._next_query.done():
+                next_query, self._next_query = self._next_query, None
+                try:
+                    self._submit(next_query.result())
+                except StopAsyncIteration:
+                    self._queries = None
+
+    async def aclose(self):
+        """
+        Stop reading queries and cancel the parsing of those that were read
+        but not taken.
+        """
+        self._iterator = self._queries = None
+        if self._next_query is not None:
+            self._next_query.cancel()
+            self._next_query = None
+        while self._results:
+            self._results.popleft().cancel()
+
+
+_pool = None
+
+
+def set_pool(pool):
+    """
+    Set the ParsePool used by the functions of this module. By default, one
+    with the default limits is created when it is first needed.
+    """
+    global _pool
+    _pool = pool
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ParsePool()
+    return _pool
+
+
+async def parse(query, **options):
+    """
+    Parse a query in the ParsePool, like psqlparse.parse.
+    """
+    return await get_pool().parse(query, **options)
+
+
+async def parse_dict(query):
+    """
+    Parse a query in the ParsePool, like psqlparse.parse_dict.
+    """
+    return await get_pool().parse_dict(query)
+
+
+def parse_many(queries, as_dict=False):
+    """
+    Return an async iterator over the results of parsing queries in the
+    ParsePool, see ParsePool.parse_many.
+    """
+    return get_pool().parse_many(queries, as_dict)
+
+
+def parse_dict_many(queries):
+    """
+    Like parse_many with as_dict=True.
+    """
+    return get_pool().parse_dict_many(queries)
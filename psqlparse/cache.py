@@ -0,0 +1,361 @@
+from collections import OrderedDict
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from .parser import PG_VERSION, fingerprint, parse
+from .version import __version__
+
+
+class ParseCache(object):
+    """
+    Thread-safe LRU cache for parse results, keyed on the encoded query.
+
+    Entries are evicted, least recently used first, when there are more than
+    max_entries of them or when their total size goes over max_bytes. Either
+    limit can be None to disable it.
+
+    Install it with psqlparse.set_cache to put it in front of parse,
+    parse_dict, parse_json and tables. The JSON parse tree is cached, which
+    is several times smaller than its dicts, and is decoded again on each
+    hit, so callers are free to modify what they get. parse keeps its
+    statements in a separate entry, which its first hit turns into the
+    format of psqlparse.dumps, smaller still and faster to load than the
+    nodes are to build.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self._entries and self._over_limits():
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def _over_limits(self):
+        return ((self.max_entries is not None and
+                 len(self._entries) > self.max_entries) or
+                (self.max_bytes is not None and self.size > self.max_bytes))
+
+
+# Connections inherited from a parent process. SQLite must not close them
+# in the child, which could release the locks of the parent and unmap the
+# shared memory of WAL databases, so they are kept here and never used
+# again, instead of being closed when they are collected.
+_inherited_connections = []
+
+# The default version of SqliteCache entries. libpg_query doesn't expose its
+# own release, which changes the parse trees within a PostgreSQL version,
+# but each psqlparse release pins one, and may change what is cached.
+CACHE_VERSION = '%s/%s' % (PG_VERSION, __version__)
+
+
+class SqliteCache(object):
+    """
+    Persistent cache for parse results, in a SQLite database at path, which
+    can be shared by several processes and outlives them.
+
+    Install it with psqlparse.set_cache like a ParseCache, so a process
+    that starts with the cache warm parses the queries in it without
+    libpg_query. Entries are keyed on the SHA-256 of the encoded query and
+    on version, by default CACHE_VERSION, the PostgreSQL version of
+    libpg_query and the psqlparse version, so upgrading either doesn't
+    reuse parse trees of the old one. Values have to be bytes, like the
+    parse trees put by parse.
+
+    Entries are evicted, least recently used first, when there are more
+    than max_entries of them or when their total size goes over max_bytes.
+    Either limit can be None to disable it. To keep most hits read-only,
+    their uses are recorded on the next put, when flush_hits entries were
+    hit, or on close, so the order is approximate.
+
+    The database is in WAL mode, so readers don't block each other or the
+    writer, and writers wait up to timeout seconds for each other. Each
+    process opens its own connection, which is shared by its threads. A
+    forked child opens a new one, and leaves the one of its parent open.
+    """
+
+    def __init__(self, path, max_entries=None, max_bytes=256 * 1024 * 1024,
+                 version=CACHE_VERSION, timeout=30.0, flush_hits=100):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = version
+        self.timeout = timeout
+        self.flush_hits = flush_hits
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        # Hashes of the entries that were hit since the last write.
+        self._used = set()
+        with self._lock:
+            self._connect()
+
+    def _connect(self):
+        if self._connection is not None:
+            if self._pid == os.getpid():
+                return self._connection
+            # A connection inherited from the parent process can't be used.
+            _inherited_connections.append(self._connection)
+        self._connection = connection = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None,
+            check_same_thread=False)
+        self._pid = os.getpid()
+        self._used.clear()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        self._begin(connection)
+        try:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'version TEXT NOT NULL, hash BLOB NOT NULL, '
+                'value BLOB NOT NULL, size INTEGER NOT NULL, '
+                'used REAL NOT NULL, PRIMARY KEY (version, hash))')
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_used ON entries (used)')
+            # The totals of the entries, kept up to date by put so the
+            # limits can be checked without scanning them.
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS totals ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), '
+                'entries INTEGER NOT NULL, size INTEGER NOT NULL)')
+            connection.execute(
+                'INSERT OR IGNORE INTO totals VALUES (0, 0, 0)')
+        finally:
+            connection.execute('COMMIT')
+        return connection
+
+    @staticmethod
+    def _begin(connection):
+        # Take the write lock up front, so concurrent writers wait for each
+        # other instead of failing to upgrade a read lock.
+        connection.execute('BEGIN IMMEDIATE')
+
+    def _hash(self, key):
+        return sqlite3.Binary(hashlib.sha256(key).digest())
+
+    def __len__(self):
+        return self.stats()['entries']
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._connect().execute(
+                'SELECT 1 FROM entries WHERE version = ? AND hash = ?',
+                (self.version, self._hash(key))).fetchone() is not None
+
+    def get(self, key):
+        key_hash = self._hash(key)
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT value FROM entries WHERE version = ? AND hash = ?',
+                (self.version, key_hash)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._used.add(bytes(key_hash))
+            self.hits += 1
+            if len(self._used) >= self.flush_hits:
+                self._flush()
+            return bytes(row[0])
+
+    def put(self, key, value, size):
+        key_hash = self._hash(key)
+        with self._lock:
+            connection = self._connect()
+            now = time.time()
+            self._begin(connection)
+            try:
+                self._write_used(connection, now)
+                old = connection.execute(
+                    'SELECT size FROM entries WHERE version = ? AND hash = ?',
+                    (self.version, key_hash)).fetchone()
+                connection.execute(
+                    'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)',
+                    (self.version, key_hash, sqlite3.Binary(value), size,
+                     now))
+                if old is None:
+                    connection.execute(
+                        'UPDATE totals SET entries = entries + 1, '
+                        'size = size + ?', (size,))
+                else:
+                    connection.execute('UPDATE totals SET size = size + ?',
+                                       (size - old[0],))
+                self._evict(connection)
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+
+    def _write_used(self, connection, now):
+        if self._used:
+            connection.executemany(
+                'UPDATE entries SET used = ? WHERE version = ? AND hash = ?',
+                [(now, self.version, sqlite3.Binary(used))
+                 for used in self._used])
+            self._used.clear()
+
+    def _flush(self):
+        if not self._used:
+            return
+        connection = self._connection
+        self._begin(connection)
+        try:
+            self._write_used(connection, time.time())
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _evict(self, connection):
+        while True:
+            entries, size = connection.execute(
+                'SELECT entries, size FROM totals').fetchone()
+            excess = 0
+            if self.max_entries is not None:
+                excess = entries - self.max_entries
+            if self.max_bytes is not None and size > self.max_bytes:
+                excess = max(excess, 1)
+            if excess <= 0:
+                return
+            rows = connection.execute(
+                'SELECT version, hash, size FROM entries '
+                'ORDER BY used LIMIT ?', (excess,)).fetchall()
+            if not rows:
+                return
+            connection.executemany(
+                'DELETE FROM entries WHERE version = ? AND hash = ?',
+                [row[:2] for row in rows])
+            connection.execute(
+                'UPDATE totals SET entries = entries - ?, size = size - ?',
+                (len(rows), sum(row[2] for row in rows)))
+            self.evictions += len(rows)
+
+    def clear(self):
+        """
+        Remove all the entries, of every version.
+        """
+        with self._lock:
+            connection = self._connect()
+            self._begin(connection)
+            connection.execute('DELETE FROM entries')
+            connection.execute('UPDATE totals SET entries = 0, size = 0')
+            connection.execute('COMMIT')
+            self._used.clear()
+
+    def close(self):
+        """
+        Record the uses of the entries that were hit and close the
+        connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                if self._pid == os.getpid():
+                    try:
+                        self._flush()
+                    finally:
+                        self._connection.close()
+                else:
+                    _inherited_connections.append(self._connection)
+            self._connection = None
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._connect().execute(
+                'SELECT entries, size FROM totals').fetchone()
+            return {
+                'entries': entries,
+                'size': size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class FingerprintCache(object):
+    """
+    Cache for results derived from parse trees, shared by all the queries
+    with the same fingerprint.
+
+    func receives the list of statements returned by parse and its result is
+    stored under the query fingerprint, so it is computed once for
+    "SELECT * FROM t WHERE id = 1", "SELECT * FROM t WHERE id = 2" and so
+    on. Since results are shared between queries, func should return
+    immutable values:
+
+        tables = FingerprintCache(
+            lambda stmts: frozenset().union(*[s.tables() for s in stmts]))
+        tables("SELECT * FROM my_table WHERE id = 1")
+
+    Only the fingerprint is computed on hits, which skips the JSON decoding,
+    the node building and func.
+    """
+
+    def __init__(self, func, max_entries=1024):
+        self.func = func
+        self._cache = ParseCache(max_entries=max_entries)
+
+    def __call__(self, query):
+        key = fingerprint(query)
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = (self.func(parse(query)),)
+            self._cache.put(key, entry, 1)
+        return entry[0]
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self):
+        return self._cache.stats()
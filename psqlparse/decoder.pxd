@@ -0,0 +1,4 @@
+cdef object decode(const char *buf)
+cdef object build_nodes(const char *buf)
+cdef object build_included_nodes(const char *buf, frozenset included)
+cdef set find_tables(const char *buf)
@@ -0,0 +1,808 @@
+"""
+Single-pass reader for the JSON parse trees written by libpg_query.
+
+It reads straight from the C buffer returned by pg_query_parse, without
+decoding it into a str first, and either gives the same dicts and lists
+as json.loads (decode) or builds the node objects while it goes
+(build_nodes), so the intermediate dict tree is never created.
+
+build_nodes gives the same result as json.loads followed by
+build_from_obj: wrapper objects like {"SelectStmt": {...}} whose tag has a
+node class become instances of that class, and the subtrees under tags
+without a class are kept as plain dicts and lists.
+
+Nested arrays and objects are tracked on an explicit stack instead of the C
+stack, so parse trees of any depth can be read.
+"""
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.dict cimport PyDict_GetItem, PyDict_Next
+from cpython.list cimport PyList_GET_ITEM
+from cpython.ref cimport PyObject
+from libc.string cimport memcmp, strncmp
+
+from .nodes.nodes import Node
+from .nodes.utils import (get_builder, get_include_info, get_table_info,
+                          _built_builders, _include_infos, _table_infos,
+                          _Unbuilt)
+
+
+cdef extern from "Python.h":
+    unicode PyUnicode_DecodeUTF8(const char *s, Py_ssize_t size,
+                                 const char *errors)
+    unicode PyUnicode_FromOrdinal(int ordinal)
+
+
+cdef dict _builders = _built_builders
+
+
+cdef dict _table_infos_cache = _table_infos
+
+
+cdef object _table_info(tag):
+    cdef PyObject *info = PyDict_GetItem(_table_infos_cache, tag)
+    if info == NULL:
+        return get_table_info(tag)
+    return <object>info
+
+
+cdef object _lazy_node(tuple info, dict fields, list keys):
+    # info is from get_include_info, and keys are those of the children
+    # that were built.
+    node = info[2].lazy(fields)
+    for key in keys:
+        setattr(node, (<dict>info[3])[key], fields[key])
+    return node
+
+
+cdef object _get_builder(key):
+    cdef PyObject *builder = PyDict_GetItem(_builders, key)
+    if builder == NULL:
+        return get_builder(key, True)
+    return <object>builder
+
+
+# Object keys come from a small vocabulary (the node and field names), so
+# they are interned in an open addressing table looked up straight from the
+# buffer. This saves creating a new str for every key of every object.
+cdef enum:
+    _KEY_SLOTS = 4096
+    _KEY_PROBES = 8
+
+
+cdef struct _KeySlot:
+    const char *data
+    Py_ssize_t size
+    PyObject *key
+
+
+cdef _KeySlot _key_slots[_KEY_SLOTS]
+cdef list _key_refs = []
+
+
+cdef object _intern_key(const char *data, Py_ssize_t size):
+    cdef unsigned int index = 2166136261u
+    cdef _KeySlot *slot
+    cdef Py_ssize_t i
+
+    for i in range(size):
+        index = (index ^ <unsigned char>data[i]) * 16777619u
+    for i in range(_KEY_PROBES):
+        slot = &_key_slots[(index + i) % _KEY_SLOTS]
+        if slot.key == NULL:
+            key = PyUnicode_DecodeUTF8(data, size, NULL)
+            data_copy = PyBytes_FromStringAndSize(data, size)
+            _key_refs.append((data_copy, key))
+            slot.data = PyBytes_AS_STRING(data_copy)
+            slot.size = size
+            slot.key = <PyObject *>key
+            return key
+        if slot.size == size and not memcmp(slot.data, data, size):
+            return <object>slot.key
+    return PyUnicode_DecodeUTF8(data, size, NULL)
+
+
+cdef dict _escapes = {
+    c'"': u'"', c'\\': u'\\', c'/': u'/', c'b': u'\b', c'f': u'\f',
+    c'n': u'\n', c'r': u'\r', c't': u'\t',
+}
+
+
+cdef enum _Kind:
+    _ARRAY
+    _OBJECT
+    _FIELDS
+    _SELECTED
+    _NODE
+
+
+# How the next value is read: as plain JSON, building the nodes in it,
+# building only the included ones, kept as JSON text, or as the fields of a
+# node when it is an object.
+cdef enum _Mode:
+    _RAW
+    _BUILD
+    _SELECT
+    _SKIP
+    _AS_FIELDS
+    _AS_SELECTED
+
+
+cdef class _Frame:
+    """
+    An array or object being read. _FIELDS are the fields of a node, whose
+    values are built, _SELECTED those of a lazy node, whose values are only
+    built if they have included parts, and _NODE the wrapper object around
+    them, which is replaced by the node once it ends.
+    """
+    cdef _Kind kind
+    cdef _Mode mode
+    cdef bint found
+    cdef Py_ssize_t start
+    cdef object container
+    cdef object key
+    cdef object builder
+    cdef tuple info
+    cdef list keys
+
+
+cdef class _Reader:
+
+    cdef const char *buf
+    cdef Py_ssize_t pos
+    cdef list frames
+    cdef Py_ssize_t depth
+    cdef frozenset included
+    cdef dict include_infos
+    cdef set marks
+
+    cdef error(self, message):
+        return ValueError('%s at position %d' % (message, self.pos))
+
+    cdef inline char peek(self):
+        cdef char c = self.buf[self.pos]
+        while c == c' ' or c == c'\n' or c == c'\t' or c == c'\r':
+            self.pos += 1
+            c = self.buf[self.pos]
+        return c
+
+    cdef expect(self, char expected):
+        if self.peek() != expected:
+            raise self.error('Expecting %r' % chr(expected))
+        self.pos += 1
+
+    cdef bint next_member(self, char end) except -1:
+        """
+        Consume the separator after an array item or object member and
+        return whether there are more of them.
+        """
+        cdef char c = self.peek()
+        self.pos += 1
+        if c == c',':
+            return True
+        if c == end:
+            return False
+        raise self.error('Expecting %r or %r' % (',', chr(end)))
+
+    cdef object include_info(self, tag):
+        cdef PyObject *info = PyDict_GetItem(self.include_infos, tag)
+        if info == NULL:
+            return get_include_info(self.included, tag)
+        return <object>info
+
+    cdef _Frame push(self, _Kind kind, container):
+        cdef _Frame frame
+
+        # Frames are reused, so only the first read to a depth allocates.
+        if self.depth == len(self.frames):
+            frame = _Frame()
+            self.frames.append(frame)
+        else:
+            frame = <_Frame>PyList_GET_ITEM(self.frames, self.depth)
+        self.depth += 1
+        frame.kind = kind
+        frame.container = container
+        return frame
+
+    cdef _Mode field_mode(self, tuple info, key):
+        """
+        Return how to read the value of a member of the fields of a lazy
+        node, which is the next one.
+        """
+        if key in <frozenset>info[4]:
+            return _BUILD
+        if key in <dict>info[3]:
+            c = self.peek()
+            if c == c'{' or c == c'[':
+                return _SELECT if self.pos in self.marks else _SKIP
+        return _RAW
+
+    cdef object read_value(self, _Mode mode):
+        cdef Py_ssize_t base = self.depth
+        cdef Py_ssize_t start
+        cdef _Frame frame
+        cdef tuple info = None
+        cdef char c
+
+        while True:
+            c = self.peek()
+            if mode == _SKIP:
+                start = self.pos
+                self.skip_value()
+                value = _Unbuilt(PyBytes_FromStringAndSize(
+                    self.buf + start, self.pos - start))
+            elif c == c'{':
+                self.pos += 1
+                if self.peek() == c'}':
+                    self.pos += 1
+                    value = {}
+                elif mode == _AS_FIELDS:
+                    frame = self.push(_FIELDS, {})
+                    frame.key = self.read_key()
+                    mode = _BUILD
+                    continue
+                elif mode == _AS_SELECTED:
+                    frame = self.push(_SELECTED, {})
+                    frame.info = info
+                    frame.keys = []
+                    frame.key = self.read_key()
+                    mode = frame.mode = self.field_mode(info, frame.key)
+                    continue
+                else:
+                    key = self.read_key()
+                    if mode == _BUILD:
+                        builder = _get_builder(key)
+                        if builder is not None:
+                            frame = self.push(_NODE, None)
+                            frame.builder = builder
+                            frame.key = key
+                            mode = _AS_FIELDS
+                            continue
+                    elif mode == _SELECT:
+                        info = self.include_info(key)
+                        if info is not None:
+                            frame = self.push(_NODE, None)
+                            frame.builder = info[0]
+                            frame.info = info
+                            frame.key = key
+                            mode = (_AS_FIELDS if frame.builder is not None
+                                    else _AS_SELECTED)
+                            continue
+                    frame = self.push(_OBJECT, {})
+                    frame.key = key
+                    mode = _RAW
+                    continue
+            elif c == c'[':
+                self.pos += 1
+                if self.peek() == c']':
+                    self.pos += 1
+                    value = []
+                else:
+                    frame = self.push(_ARRAY, [])
+                    frame.mode = (mode if mode == _BUILD or mode == _SELECT
+                                  else _RAW)
+                    mode = frame.mode
+                    continue
+            else:
+                value = self.read_scalar(c)
+
+            # Add the value to the enclosing containers, ending those that
+            # are complete, until one has more members to read.
+            while self.depth > base:
+                frame = <_Frame>PyList_GET_ITEM(self.frames, self.depth - 1)
+                if frame.kind == _ARRAY:
+                    (<list>frame.container).append(value)
+                    if self.next_member(c']'):
+                        mode = frame.mode
+                        break
+                    value = frame.container
+                elif frame.kind == _NODE:
+                    # Like build_from_obj, only the first member is used.
+                    if frame.key is not None:
+                        frame.container = value
+                        frame.key = None
+                    if self.next_member(c'}'):
+                        self.read_key()
+                        mode = _RAW
+                        break
+                    if frame.builder is not None:
+                        value = frame.builder(frame.container)
+                        frame.builder = None
+                    elif isinstance(frame.container, Node):
+                        value = frame.container
+                    else:
+                        # The fields were empty.
+                        value = frame.info[2].lazy(frame.container)
+                    frame.info = None
+                elif frame.kind == _SELECTED:
+                    (<dict>frame.container)[frame.key] = value
+                    if frame.mode == _BUILD or frame.mode == _SELECT:
+                        frame.keys.append(frame.key)
+                    if self.next_member(c'}'):
+                        frame.key = self.read_key()
+                        mode = frame.mode = self.field_mode(frame.info,
+                                                            frame.key)
+                        break
+                    value = _lazy_node(frame.info, frame.container,
+                                       frame.keys)
+                    frame.info = None
+                    frame.keys = None
+                    frame.key = None
+                else:
+                    (<dict>frame.container)[frame.key] = value
+                    if self.next_member(c'}'):
+                        frame.key = self.read_key()
+                        mode = _BUILD if frame.kind == _FIELDS else _RAW
+                        break
+                    value = frame.container
+                    frame.key = None
+                frame.container = None
+                self.depth -= 1
+            else:
+                return value
+
+    cdef object read_scalar(self, char c):
+        if c == c'"':
+            return self.read_string()
+        if c == c't':
+            return self.read_literal(b'true', True)
+        if c == c'f':
+            return self.read_literal(b'false', False)
+        if c == c'n':
+            return self.read_literal(b'null', None)
+        if c == c'-' or c'0' <= c <= c'9':
+            return self.read_number()
+        raise self.error('Expecting value')
+
+    cdef skip_value(self):
+        """
+        Skip a value without decoding it.
+        """
+        cdef Py_ssize_t depth = 0
+        cdef char c
+
+        while True:
+            c = self.peek()
+            if c == c'"':
+                self.skip_string()
+            elif c == c'{' or c == c'[':
+                depth += 1
+                self.pos += 1
+                continue
+            elif c == c'}' or c == c']':
+                if not depth:
+                    raise self.error('Expecting value')
+                depth -= 1
+                self.pos += 1
+            elif c == 0 or c == c',' and not depth:
+                raise self.error('Expecting value')
+            else:
+                # Separators, or a literal or number, which ends at the next
+                # separator, without checking it.
+                self.pos += 1
+                if depth:
+                    continue
+                c = self.buf[self.pos]
+                while (c != c',' and c != c'}' and c != c']' and c != 0 and
+                       c != c' ' and c != c'\n' and c != c'\t' and
+                       c != c'\r'):
+                    self.pos += 1
+                    c = self.buf[self.pos]
+            if not depth:
+                return
+
+    cdef skip_string(self):
+        cdef char c
+
+        self.pos += 1
+        while True:
+            c = self.buf[self.pos]
+            if c == c'"':
+                self.pos += 1
+                return
+            if c == 0 or c == c'\\' and self.buf[self.pos + 1] == 0:
+                raise self.error('Unterminated string')
+            self.pos += 2 if c == c'\\' else 1
+
+    cdef bint next_field(self, _Frame frame, bint first) except -1:
+        """
+        Move to the value of the next member, among the fields of a node,
+        whose key is in the frame, skipping the others. Return False at the
+        end of the fields.
+        """
+        while first or self.next_member(c'}'):
+            first = False
+            key = self.read_key()
+            if key in <tuple>frame.container:
+                return True
+            self.skip_value()
+        return False
+
+    cdef search(self, set names):
+        """
+        Add the names of the tables referenced in the value to names, like
+        Node.tables() does on its nodes. Only the children it searches are
+        read, and everything else is skipped.
+        """
+        cdef _Frame frame
+        cdef char c
+
+        while True:
+            c = self.peek()
+            if c == c'[':
+                self.pos += 1
+                if self.peek() == c']':
+                    self.pos += 1
+                else:
+                    self.push(_ARRAY, None)
+                    continue
+            elif c == c'{':
+                self.pos += 1
+                if self.peek() == c'}':
+                    self.pos += 1
+                else:
+                    tag = self.read_key()
+                    info = _table_info(tag)
+                    # Like build_from_obj, only the first member is used.
+                    self.push(_NODE, None)
+                    if info is None:
+                        self.skip_value()
+                    elif info[0] is not None:
+                        _search_dicts({tag: self.read_value(_RAW)}, names)
+                    elif self.peek() != c'{':
+                        self.skip_value()
+                    else:
+                        self.pos += 1
+                        if self.peek() == c'}':
+                            self.pos += 1
+                        else:
+                            frame = self.push(_FIELDS, info[1])
+                            if self.next_field(frame, True):
+                                continue
+                            frame.container = None
+                            self.depth -= 1
+            else:
+                self.skip_value()
+
+            # End the containers that are complete, until one has more
+            # values to search.
+            while self.depth:
+                frame = <_Frame>PyList_GET_ITEM(self.frames, self.depth - 1)
+                if frame.kind == _ARRAY:
+                    if self.next_member(c']'):
+                        break
+                elif frame.kind == _FIELDS:
+                    if self.next_field(frame, False):
+                        break
+                else:
+                    while self.next_member(c'}'):
+                        self.read_key()
+                        self.skip_value()
+                frame.container = None
+                self.depth -= 1
+            else:
+                return
+
+    cdef bint next_child(self, _Frame frame, bint first) except -1:
+        """
+        Move to the value of the next member, among the fields of a lazy
+        node, that is a child to search for included parts, skipping the
+        others. Return False at the end of the fields.
+        """
+        cdef tuple info = frame.info
+
+        while first or self.next_member(c'}'):
+            first = False
+            key = self.read_key()
+            if key in <frozenset>info[4]:
+                frame.found = True
+            elif key in <dict>info[3]:
+                return True
+            self.skip_value()
+        return False
+
+    cdef set mark_included(self):
+        """
+        Return the positions of the arrays and objects that have included
+        parts, without decoding them. Like search, only the children of the
+        nodes are searched.
+        """
+        cdef set marks = set()
+        cdef bint found
+        cdef Py_ssize_t start
+        cdef _Frame frame
+        cdef char c
+
+        while True:
+            c = self.peek()
+            start = self.pos
+            found = False
+            if c == c'[':
+                self.pos += 1
+                if self.peek() == c']':
+                    self.pos += 1
+                else:
+                    frame = self.push(_ARRAY, None)
+                    frame.start = start
+                    frame.found = False
+                    continue
+            elif c == c'{':
+                self.pos += 1
+                if self.peek() == c'}':
+                    self.pos += 1
+                else:
+                    info = self.include_info(self.read_key())
+                    # Like build_from_obj, only the first member is used.
+                    frame = self.push(_NODE, None)
+                    frame.start = start
+                    frame.found = info is not None and info[1]
+                    if info is None or info[0] is not None:
+                        self.skip_value()
+                    elif self.peek() != c'{':
+                        self.skip_value()
+                    else:
+                        self.pos += 1
+                        if self.peek() == c'}':
+                            self.pos += 1
+                        else:
+                            frame = self.push(_SELECTED, None)
+                            frame.info = info
+                            frame.found = False
+                            if self.next_child(frame, True):
+                                continue
+                            found = frame.found
+                            frame.info = None
+                            self.depth -= 1
+            else:
+                self.skip_value()
+
+            # End the containers that are complete, until one has more
+            # values to search.
+            while self.depth:
+                frame = <_Frame>PyList_GET_ITEM(self.frames, self.depth - 1)
+                if found:
+                    frame.found = True
+                if frame.kind == _ARRAY:
+                    if self.next_member(c']'):
+                        break
+                elif frame.kind == _SELECTED:
+                    if self.next_child(frame, False):
+                        break
+                else:
+                    while self.next_member(c'}'):
+                        self.read_key()
+                        self.skip_value()
+                found = frame.found
+                if found and frame.kind != _SELECTED:
+                    marks.add(frame.start)
+                frame.info = None
+                self.depth -= 1
+            else:
+                return marks
+
+    cdef object read_literal(self, bytes literal, value):
+        if strncmp(self.buf + self.pos, literal, len(literal)):
+            raise self.error('Expecting value')
+        self.pos += len(literal)
+        return value
+
+    cdef object read_number(self):
+        cdef Py_ssize_t start = self.pos
+        cdef long long value = 0
+        cdef bint negative = False
+        cdef char c = self.buf[self.pos]
+
+        if c == c'-':
+            negative = True
+            self.pos += 1
+            c = self.buf[self.pos]
+        while c'0' <= c <= c'9':
+            value = value * 10 + (c - c'0')
+            self.pos += 1
+            c = self.buf[self.pos]
+
+        if c == c'.' or c == c'e' or c == c'E':
+            while (c'0' <= c <= c'9' or c == c'.' or c == c'e' or
+                   c == c'E' or c == c'+' or c == c'-'):
+                self.pos += 1
+                c = self.buf[self.pos]
+            return float(self.buf[start:self.pos])
+        if self.pos - start > 18:
+            return int(self.buf[start:self.pos])
+        return -value if negative else value
+
+    cdef unicode read_string(self):
+        cdef Py_ssize_t start
+        cdef char c
+
+        self.pos += 1
+        start = self.pos
+        while True:
+            c = self.buf[self.pos]
+            if c == c'"':
+                self.pos += 1
+                return PyUnicode_DecodeUTF8(self.buf + start,
+                                            self.pos - 1 - start, NULL)
+            if c == c'\\':
+                return self.read_escaped_string(start)
+            if c == 0:
+                raise self.error('Unterminated string')
+            self.pos += 1
+
+    cdef unicode read_escaped_string(self, Py_ssize_t start):
+        cdef list chunks = []
+        cdef char c
+        cdef int code
+
+        while True:
+            c = self.buf[self.pos]
+            if c == c'"' or c == c'\\':
+                chunks.append(PyUnicode_DecodeUTF8(self.buf + start,
+                                                   self.pos - start, NULL))
+                self.pos += 1
+                if c == c'"':
+                    return u''.join(chunks)
+                c = self.buf[self.pos]
+                self.pos += 1
+                if c == c'u':
+                    code = self.read_hex()
+                    if (0xd800 <= code < 0xdc00 and
+                            self.buf[self.pos] == c'\\' and
+                            self.buf[self.pos + 1] == c'u'):
+                        self.pos += 2
+                        code = (0x10000 + ((code - 0xd800) << 10) +
+                                (self.read_hex() - 0xdc00))
+                    chunks.append(PyUnicode_FromOrdinal(code))
+                elif c in _escapes:
+                    chunks.append(_escapes[c])
+                else:
+                    raise self.error('Invalid escape')
+                start = self.pos
+            elif c == 0:
+                raise self.error('Unterminated string')
+            else:
+                self.pos += 1
+
+    cdef int read_hex(self) except -1:
+        cdef int code = 0
+        cdef int i
+        cdef char c
+
+        for i in range(4):
+            c = self.buf[self.pos]
+            if c'0' <= c <= c'9':
+                code = code * 16 + (c - c'0')
+            elif c'a' <= c <= c'f':
+                code = code * 16 + (c - c'a' + 10)
+            elif c'A' <= c <= c'F':
+                code = code * 16 + (c - c'A' + 10)
+            else:
+                raise self.error('Invalid \\uXXXX escape')
+            self.pos += 1
+        return code
+
+    cdef object read_key(self):
+        cdef Py_ssize_t start
+        cdef char c
+
+        if self.peek() != c'"':
+            raise self.error('Expecting property name')
+        start = self.pos + 1
+        while True:
+            self.pos += 1
+            c = self.buf[self.pos]
+            if c == c'"':
+                key = _intern_key(self.buf + start, self.pos - start)
+                self.pos += 1
+                break
+            if c == c'\\' or c == 0:
+                self.pos = start - 1
+                key = self.read_string()
+                break
+        self.expect(c':')
+        return key
+
+
+cdef _Reader _reader(const char *buf):
+    cdef _Reader reader = _Reader()
+    reader.buf = buf
+    reader.pos = 0
+    reader.frames = []
+    reader.depth = 0
+    return reader
+
+
+cdef object _read(const char *buf, _Mode mode):
+    cdef _Reader reader = _reader(buf)
+    value = reader.read_value(mode)
+    if reader.peek() != 0:
+        raise reader.error('Extra data')
+    return value
+
+
+cdef object decode(const char *buf):
+    """
+    Decode a JSON parse tree into dicts and lists, like json.loads.
+    """
+    return _read(buf, _RAW)
+
+
+cdef object build_nodes(const char *buf):
+    """
+    Build the statement nodes from a JSON parse tree.
+    """
+    return _read(buf, _BUILD)
+
+
+cdef object build_included_nodes(const char *buf, frozenset included):
+    """
+    Build the statement nodes from a JSON parse tree like build_included.
+
+    A first pass finds the parts of the tree that have included nodes or
+    children, without decoding it. Then only the lazy nodes above them are
+    read, and the other children are kept as their JSON text, which is
+    only decoded if they are accessed.
+    """
+    cdef _Reader reader = _reader(buf)
+    reader.included = included
+    reader.include_infos = _include_infos.setdefault(included, {})
+    reader.marks = reader.mark_included()
+    if reader.peek() != 0:
+        raise reader.error('Extra data')
+    reader.pos = 0
+    return reader.read_value(_SELECT)
+
+
+def build_from_json(bytes text):
+    """
+    Build the nodes from the JSON text of a part of a parse tree.
+    """
+    return _read(text, _BUILD)
+
+
+def decode_json(bytes text):
+    """
+    Decode the JSON text of a part of a parse tree into dicts and lists,
+    like json.loads.
+    """
+    return _read(text, _RAW)
+
+
+cdef set find_tables(const char *buf):
+    """
+    Return the names of the tables referenced in a JSON parse tree, like
+    the union of Node.tables() on its statements, without decoding it.
+    """
+    cdef _Reader reader = _reader(buf)
+    cdef set names = set()
+    reader.search(names)
+    if reader.peek() != 0:
+        raise reader.error('Extra data')
+    return names
+
+
+cdef _search_dicts(obj, set names):
+    cdef list stack = [obj]
+    cdef PyObject *tag
+    cdef PyObject *fields
+    cdef Py_ssize_t i
+
+    while stack:
+        obj = stack.pop()
+        if type(obj) is list:
+            stack.extend(<list>obj)
+            continue
+        i = 0
+        if type(obj) is not dict or not PyDict_Next(obj, &i, &tag, &fields):
+            continue
+        info = _table_info(<object>tag)
+        if info is None:
+            continue
+        builder, keys = info
+        if builder is not None:
+            builder(<object>fields)._add_tables(names)
+        if type(<object>fields) is dict:
+            for key in <tuple>keys:
+                value = (<dict>fields).get(key)
+                if value is not None:
+                    stack.append(value)
+
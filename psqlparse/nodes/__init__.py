@@ -1,3 +1,4 @@
+from .nodes import Node
 from .parsenodes import (SelectStmt, InsertStmt, UpdateStmt, DeleteStmt,
                          WithClause, CommonTableExpr, RangeSubselect,
                          ResTarget, ColumnRef, FuncCall, AStar, AExpr, AConst,
@@ -6,4 +7,11 @@ from .parsenodes import (SelectStmt, InsertStmt, UpdateStmt, DeleteStmt,
 from .primnodes import (RangeVar, JoinExpr, Alias, IntoClause, BoolExpr,
                         SubLink, SetToDefault, CaseExpr, CaseWhen, NullTest,
                         BooleanTest, RowExpr)
-from .value import Integer, String, Float
+from .value import Value, Integer, String, Float
+from .utils import register_node_class
+
+
+for _class in list(globals().values()):
+    if (isinstance(_class, type) and issubclass(_class, (Node, Value)) and
+            _class not in (Node, Value)):
+        register_node_class(_class)
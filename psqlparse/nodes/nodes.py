@@ -1,22 +1,161 @@
 import six
 
+from .utils import build_from_item, copy_node, reduce_node
 
-class Node(object):
+
+def _add_own_tables(node, tables):
+    # _add_tables of the classes that override tables(), which then
+    # searches their children too.
+    tables.update(node.tables())
+
+
+class NodeMeta(type):
+    """
+    Metaclass that gives each node class the __slots__ for the attributes
+    it declares, so nodes don't carry a per-instance __dict__, the names of
+    its children in _child_attrs, and the default _table_children.
+
+    Classes that override tables() get it called when they are found by
+    the tables() of another node, or by psqlparse.tables, and their
+    _add_tables and _table_children are moved to _node_tables, for when
+    the override calls Node.tables.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        if '__slots__' not in namespace:
+            inherited = set(attr for base in bases for klass in base.__mro__
+                            for attr in getattr(klass, '__slots__', ()))
+            declared = (namespace.get('_scalars', ()) +
+                        namespace.get('_children', ()))
+            namespace['__slots__'] = tuple(attr for attr, _ in declared
+                                           if attr not in inherited)
+        if '_children' in namespace:
+            namespace['_child_attrs'] = tuple(
+                attr for attr, _ in namespace['_children'])
+            namespace.setdefault('_table_children',
+                                 namespace['_child_attrs'])
+        klass = super(NodeMeta, mcs).__new__(mcs, name, bases, namespace)
+
+        inherited = getattr(klass, '_node_tables', None)
+        if inherited is not None or (
+                'tables' in namespace and
+                any(hasattr(base, 'tables') for base in bases)):
+            add_tables = (klass._add_tables if inherited is None or
+                          '_add_tables' in namespace else inherited[0])
+            table_children = (klass._table_children if inherited is None or
+                              '_table_children' in namespace
+                              else inherited[1])
+            klass._node_tables = (add_tables, table_children)
+            klass._add_tables = _add_own_tables
+            klass._table_children = ()
+        return klass
+
+
+class Node(six.with_metaclass(NodeMeta, object)):
+    """
+    Base class for the parse tree nodes.
+
+    Subclasses declare the attributes they read from the libpg_query
+    output, as tuples of (attribute, key) pairs: _scalars are copied as
+    they are and _children are built into nodes. They are stored in slots,
+    so subclasses keeping other attributes have to list them in __slots__.
+    _table_children names the children that tables() searches, and
+    defaults to all of them.
+    """
+
+    __slots__ = ('_obj',)
+
+    _scalars = ()
+    _children = ()
+
+    # Called by tables() with the set of names, for the nodes that reference
+    # tables themselves.
+    _add_tables = None
+
+    def __init__(self, obj):
+        for attr, key in self._scalars:
+            setattr(self, attr, obj.get(key))
+        for attr, key in self._children:
+            setattr(self, attr, build_from_item(obj, key))
+
+    @classmethod
+    def lazy(cls, obj):
+        """
+        Create a node whose children are built from obj the first time they
+        are accessed, instead of right away.
+        """
+        if cls.__init__ != Node.__init__:
+            return cls(obj)
+        node = cls.__new__(cls)
+        for attr, key in cls._scalars:
+            setattr(node, attr, obj.get(key))
+        node._obj = obj
+        return node
+
+    def __getstate__(self):
+        # Unset slots, like the children of a lazy node that were not
+        # accessed yet, are left out.
+        state = {}
+        for klass in type(self).__mro__:
+            for attr in getattr(klass, '__slots__', ()):
+                try:
+                    state[attr] = getattr(klass, attr).__get__(self)
+                except AttributeError:
+                    pass
+        return state
+
+    def __setstate__(self, state):
+        for attr, value in six.iteritems(state):
+            setattr(self, attr, value)
+
+    def __reduce_ex__(self, protocol):
+        return reduce_node(self, protocol)
+
+    def __copy__(self):
+        return copy_node(self)
+
+    def __getattr__(self, name):
+        # Only called for missing attributes, which in a lazy node are the
+        # children that were not accessed yet.
+        obj = getattr(self, '_obj', None) if name != '_obj' else None
+        if obj is not None:
+            for attr, key in self._children:
+                if attr == name:
+                    value = build_from_item(obj, key, lazy=True)
+                    setattr(self, attr, value)
+                    return value
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (type(self).__name__, name))
 
     def tables(self):
         """
-        Generic method that does a depth-first search on the node attributes.
+        Return the names of the tables referenced in the node and its
+        children.
 
-        Child classes should override this method for better performance.
+        The tree is searched in a single pass with an explicit stack, adding
+        the names to one set, so trees of any depth can be searched. The
+        nodes of classes that override tables() are searched by it.
         """
         _tables = set()
-
-        for attr in six.itervalues(self.__dict__):
-            if isinstance(attr, list):
-                for item in attr:
-                    if isinstance(item, Node):
-                        _tables |= item.tables()
-            elif isinstance(attr, Node):
-                _tables |= attr.tables()
-
+        add_tables, table_children = getattr(
+            type(self), '_node_tables',
+            (type(self)._add_tables, self._table_children))
+        if add_tables is not None:
+            add_tables(self, _tables)
+        stack = []
+        for attr in table_children:
+            value = getattr(self, attr)
+            if value is not None:
+                stack.append(value)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, Node):
+                if node._add_tables is not None:
+                    node._add_tables(_tables)
+                for attr in node._table_children:
+                    value = getattr(node, attr)
+                    if value is not None:
+                        stack.append(value)
         return _tables
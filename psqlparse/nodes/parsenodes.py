@@ -1,6 +1,5 @@
 import six
 
-from .utils import build_from_item
 from .nodes import Node
 
 
@@ -16,128 +15,95 @@ class SelectStmt(Statement):
 
     statement = 'SELECT'
 
-    def __init__(self, obj):
-        self.distinct_clause = build_from_item(obj, 'distinctClause')
-        self.into_clause = build_from_item(obj, 'intoClause')
-        self.target_list = build_from_item(obj, 'targetList')
-        self.from_clause = build_from_item(obj, 'fromClause')
-        self.where_clause = build_from_item(obj, 'whereClause')
-        self.group_clause = build_from_item(obj, 'groupClause')
-        self.having_clause = build_from_item(obj, 'havingClause')
-        self.window_clause = build_from_item(obj, 'windowClause')
-
-        self.values_lists = build_from_item(obj, 'valuesLists')
-
-        self.sort_clause = build_from_item(obj, 'sortClause')
-        self.limit_offset = build_from_item(obj, 'limitOffset')
-        self.limit_count = build_from_item(obj, 'limitCount')
-        self.locking_clause = build_from_item(obj, 'lockingClause')
-        self.with_clause = build_from_item(obj, 'withClause')
-
-        self.op = obj.get('op')
-        self.all = obj.get('all')
-        self.larg = build_from_item(obj, 'larg')
-        self.rarg = build_from_item(obj, 'rarg')
-
-    def tables(self):
-        _tables = set()
-        if self.target_list:
-            for item in self.target_list:
-                _tables |= item.tables()
-        if self.from_clause:
-            for item in self.from_clause:
-                _tables |= item.tables()
-        if self.where_clause:
-            _tables |= self.where_clause.tables()
-        if self.with_clause:
-            _tables |= self.with_clause.tables()
-
-        if self.larg:
-            _tables |= self.larg.tables()
-        if self.rarg:
-            _tables |= self.rarg.tables()
-
-        return _tables
+    _scalars = (
+        ('op', 'op'),
+        ('all', 'all'),
+    )
+
+    _children = (
+        ('distinct_clause', 'distinctClause'),
+        ('into_clause', 'intoClause'),
+        ('target_list', 'targetList'),
+        ('from_clause', 'fromClause'),
+        ('where_clause', 'whereClause'),
+        ('group_clause', 'groupClause'),
+        ('having_clause', 'havingClause'),
+        ('window_clause', 'windowClause'),
+        ('values_lists', 'valuesLists'),
+        ('sort_clause', 'sortClause'),
+        ('limit_offset', 'limitOffset'),
+        ('limit_count', 'limitCount'),
+        ('locking_clause', 'lockingClause'),
+        ('with_clause', 'withClause'),
+        ('larg', 'larg'),
+        ('rarg', 'rarg'),
+    )
+
+    _table_children = ('target_list', 'from_clause', 'where_clause',
+                       'with_clause', 'larg', 'rarg')
 
 
 class InsertStmt(Statement):
 
     statement = 'INSERT INTO'
 
-    def __init__(self, obj):
-        self.relation = build_from_item(obj, 'relation')
-        self.cols = build_from_item(obj, 'cols')
-        self.select_stmt = build_from_item(obj, 'selectStmt')
-        self.on_conflict_clause = build_from_item(obj, 'onConflictClause')
-        self.returning_list = build_from_item(obj, 'returningList')
-        self.with_clause = build_from_item(obj, 'withClause')
+    _children = (
+        ('relation', 'relation'),
+        ('cols', 'cols'),
+        ('select_stmt', 'selectStmt'),
+        ('on_conflict_clause', 'onConflictClause'),
+        ('returning_list', 'returningList'),
+        ('with_clause', 'withClause'),
+    )
 
-    def tables(self):
-        _tables = self.relation.tables() | self.select_stmt.tables()
-
-        if self.with_clause:
-            _tables |= self.with_clause.tables()
-
-        return _tables
+    _table_children = ('relation', 'select_stmt', 'with_clause')
 
 
 class UpdateStmt(Statement):
 
     statement = 'UPDATE'
 
-    def __init__(self, obj):
-        self.relation = build_from_item(obj, 'relation')
-        self.target_list = build_from_item(obj, 'targetList')
-        self.where_clause = build_from_item(obj, 'whereClause')
-        self.from_clause = build_from_item(obj, 'fromClause')
-        self.returning_list = build_from_item(obj, 'returningList')
-        self.with_clause = build_from_item(obj, 'withClause')
-
-    def tables(self):
-        _tables = self.relation.tables()
+    _children = (
+        ('relation', 'relation'),
+        ('target_list', 'targetList'),
+        ('where_clause', 'whereClause'),
+        ('from_clause', 'fromClause'),
+        ('returning_list', 'returningList'),
+        ('with_clause', 'withClause'),
+    )
 
-        if self.where_clause:
-            _tables |= self.where_clause.tables()
-        if self.from_clause:
-            for item in self.from_clause:
-                _tables |= item.tables()
-        if self.with_clause:
-            _tables |= self.with_clause.tables()
-
-        return _tables
+    _table_children = ('relation', 'where_clause', 'from_clause',
+                       'with_clause')
 
 
 class DeleteStmt(Statement):
 
     statement = 'DELETE FROM'
 
-    def __init__(self, obj):
-        self.relation = build_from_item(obj, 'relation')
-        self.using_clause = build_from_item(obj, 'usingClause')
-        self.where_clause = build_from_item(obj, 'whereClause')
-        self.returning_list = build_from_item(obj, 'returningList')
-        self.with_clause = build_from_item(obj, 'withClause')
+    _children = (
+        ('relation', 'relation'),
+        ('using_clause', 'usingClause'),
+        ('where_clause', 'whereClause'),
+        ('returning_list', 'returningList'),
+        ('with_clause', 'withClause'),
+    )
 
-    def tables(self):
-        _tables = self.relation.tables()
+    _table_children = ('relation', 'using_clause', 'where_clause',
+                       'with_clause')
 
-        if self.using_clause:
-            for item in self.using_clause:
-                _tables |= item.tables()
-        if self.where_clause:
-            _tables |= self.where_clause.tables()
-        if self.with_clause:
-            _tables |= self.with_clause.tables()
 
-        return _tables
+class WithClause(Node):
 
+    _scalars = (
+        ('recursive', 'recursive'),
+        ('location', 'location'),
+    )
 
-class WithClause(Node):
+    _children = (
+        ('ctes', 'ctes'),
+    )
 
-    def __init__(self, obj):
-        self.ctes = build_from_item(obj, 'ctes')
-        self.recursive = obj.get('recursive')
-        self.location = obj.get('location')
+    _table_children = ('ctes',)
 
     def __repr__(self):
         return '<WithClause (%d)>' % len(self.ctes)
@@ -151,40 +117,40 @@ class WithClause(Node):
              for name, query in six.iteritems(self.ctes)])
         return s
 
-    def tables(self):
-        _tables = set()
-        for item in self.ctes:
-            _tables |= item.tables()
-        return _tables
-
 
 class CommonTableExpr(Node):
 
-    def __init__(self, obj):
-        self.ctename = obj.get('ctename')
-        self.aliascolnames = build_from_item(obj, 'aliascolnames')
-        self.ctequery = build_from_item(obj, 'ctequery')
-        self.location = obj.get('location')
-        self.cterecursive = obj.get('cterecursive')
-        self.cterefcount = obj.get('cterefcount')
-        self.ctecolnames = build_from_item(obj, 'ctecolnames')
-        self.ctecoltypes = build_from_item(obj, 'ctecoltypes')
-        self.ctecoltypmods = build_from_item(obj, 'ctecoltypmods')
-        self.ctecolcollations = build_from_item(obj, 'ctecolcollations')
+    _scalars = (
+        ('ctename', 'ctename'),
+        ('location', 'location'),
+        ('cterecursive', 'cterecursive'),
+        ('cterefcount', 'cterefcount'),
+    )
+
+    _children = (
+        ('aliascolnames', 'aliascolnames'),
+        ('ctequery', 'ctequery'),
+        ('ctecolnames', 'ctecolnames'),
+        ('ctecoltypes', 'ctecoltypes'),
+        ('ctecoltypmods', 'ctecoltypmods'),
+        ('ctecolcollations', 'ctecolcollations'),
+    )
 
-    def tables(self):
-        return self.ctequery.tables()
+    _table_children = ('ctequery',)
 
 
 class RangeSubselect(Node):
 
-    def __init__(self, obj):
-        self.lateral = obj.get('lateral')
-        self.subquery = build_from_item(obj, 'subquery')
-        self.alias = build_from_item(obj, 'alias')
+    _scalars = (
+        ('lateral', 'lateral'),
+    )
+
+    _children = (
+        ('subquery', 'subquery'),
+        ('alias', 'alias'),
+    )
 
-    def tables(self):
-        return self.subquery.tables()
+    _table_children = ('subquery',)
 
 
 class ResTarget(Node):
@@ -204,180 +170,199 @@ class ResTarget(Node):
     'val' is the expression to assign.
     """
 
-    def __init__(self, obj):
-        self.name = obj.get('name')
-        self.indirection = build_from_item(obj, 'indirection')
-        self.val = build_from_item(obj, 'val')
-        self.location = obj.get('location')
+    _scalars = (
+        ('name', 'name'),
+        ('location', 'location'),
+    )
 
-    def tables(self):
-        _tables = set()
-        if isinstance(self.val, list):
-            for item in self.val:
-                _tables |= item.tables()
-        elif isinstance(self.val, Node):
-            _tables |= self.val.tables()
+    _children = (
+        ('indirection', 'indirection'),
+        ('val', 'val'),
+    )
 
-        return _tables
+    _table_children = ('val',)
 
 
 class ColumnRef(Node):
 
-    def __init__(self, obj):
-        self.fields = build_from_item(obj, 'fields')
-        self.location = obj.get('location')
+    _scalars = (
+        ('location', 'location'),
+    )
 
-    def tables(self):
-        return set()
+    _children = (
+        ('fields', 'fields'),
+    )
 
+    _table_children = ()
 
-class FuncCall(Node):
 
-    def __init__(self, obj):
-        self.funcname = build_from_item(obj, 'funcname')
-        self.args = build_from_item(obj, 'args')
-        self.agg_order = build_from_item(obj, 'agg_order')
-        self.agg_filter = build_from_item(obj, 'agg_filter')
-        self.agg_within_group = obj.get('agg_within_group')
-        self.agg_star = obj.get('agg_star')
-        self.agg_distinct = obj.get('agg_distinct')
-        self.func_variadic = obj.get('func_variadic')
-        self.over = build_from_item(obj, 'over')
-        self.location = obj.get('location')
-
-    def tables(self):
-        _tables = set()
-        if self.args:
-            for item in self.args:
-                _tables |= item.tables()
-        return _tables
+class FuncCall(Node):
 
+    _scalars = (
+        ('agg_within_group', 'agg_within_group'),
+        ('agg_star', 'agg_star'),
+        ('agg_distinct', 'agg_distinct'),
+        ('func_variadic', 'func_variadic'),
+        ('location', 'location'),
+    )
 
-class AStar(Node):
+    _children = (
+        ('funcname', 'funcname'),
+        ('args', 'args'),
+        ('agg_order', 'agg_order'),
+        ('agg_filter', 'agg_filter'),
+        ('over', 'over'),
+    )
 
-    def __init__(self, obj):
-        pass
+    _table_children = ('args',)
 
-    def tables(self):
-        return set()
 
+class AStar(Node):
 
-class AExpr(Node):
+    _table_children = ()
 
-    def __init__(self, obj):
-        self.kind = obj.get('kind')
-        self.name = build_from_item(obj, 'name')
-        self.lexpr = build_from_item(obj, 'lexpr')
-        self.rexpr = build_from_item(obj, 'rexpr')
-        self.location = obj.get('location')
 
-    def tables(self):
-        _tables = set()
+class AExpr(Node):
 
-        if isinstance(self.lexpr, list):
-            for item in self.lexpr:
-                _tables |= item.tables()
-        elif isinstance(self.lexpr, Node):
-            _tables |= self.lexpr.tables()
+    _scalars = (
+        ('kind', 'kind'),
+        ('location', 'location'),
+    )
 
-        if isinstance(self.rexpr, list):
-            for item in self.rexpr:
-                _tables |= item.tables()
-        elif isinstance(self.rexpr, Node):
-            _tables |= self.rexpr.tables()
+    _children = (
+        ('name', 'name'),
+        ('lexpr', 'lexpr'),
+        ('rexpr', 'rexpr'),
+    )
 
-        return _tables
+    _table_children = ('lexpr', 'rexpr')
 
 
 class AConst(Node):
 
-    def __init__(self, obj):
-        self.val = build_from_item(obj, 'val')
-        self.location = obj.get('location')
+    _scalars = (
+        ('location', 'location'),
+    )
 
-    def tables(self):
-        return set()
+    _children = (
+        ('val', 'val'),
+    )
+
+    _table_children = ()
 
 
 class TypeCast(Node):
 
-    def __init__(self, obj):
-        self.arg = build_from_item(obj, 'arg')
-        self.type_name = build_from_item(obj, 'typeName')
-        self.location = obj.get('location')
+    _scalars = (
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('arg', 'arg'),
+        ('type_name', 'typeName'),
+    )
 
 
 class TypeName(Node):
 
-    def __init__(self, obj):
-        self.names = build_from_item(obj, 'names')
-        self.type_oid = obj.get('typeOid')
-        self.setof = obj.get('setof')
-        self.pct_type = obj.get('pct_type')
-        self.typmods = build_from_item(obj, 'typmods')
-        self.typemod = obj.get('typemod')
-        self.array_bounds = build_from_item(obj, 'arrayBounds')
-        self.location = obj.get('location')
+    _scalars = (
+        ('type_oid', 'typeOid'),
+        ('setof', 'setof'),
+        ('pct_type', 'pct_type'),
+        ('typemod', 'typemod'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('names', 'names'),
+        ('typmods', 'typmods'),
+        ('array_bounds', 'arrayBounds'),
+    )
 
 
 class SortBy(Node):
 
-    def __init__(self, obj):
-        self.node = build_from_item(obj, 'node')
-        self.sortby_dir = obj.get('sortby_dir')
-        self.sortby_nulls = obj.get('sortby_nulls')
-        self.use_op = build_from_item(obj, 'useOp')
-        self.location = obj.get('location')
+    _scalars = (
+        ('sortby_dir', 'sortby_dir'),
+        ('sortby_nulls', 'sortby_nulls'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('node', 'node'),
+        ('use_op', 'useOp'),
+    )
 
 
 class WindowDef(Node):
 
-    def __init__(self, obj):
-        self.name = obj.get('name')
-        self.refname = obj.get('refname')
-        self.partition_clause = build_from_item(obj, 'partitionClause')
-        self.order_clause = build_from_item(obj, 'orderClause')
-        self.frame_options = obj.get('frameOptions')
-        self.start_offset = build_from_item(obj, 'startOffset')
-        self.end_offset = build_from_item(obj, 'endOffset')
-        self.location = obj.get('location')
+    _scalars = (
+        ('name', 'name'),
+        ('refname', 'refname'),
+        ('frame_options', 'frameOptions'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('partition_clause', 'partitionClause'),
+        ('order_clause', 'orderClause'),
+        ('start_offset', 'startOffset'),
+        ('end_offset', 'endOffset'),
+    )
 
 
 class LockingClause(Node):
 
-    def __init__(self, obj):
-        self.locked_rels = build_from_item(obj, 'lockedRels')
-        self.strength = build_from_item(obj, 'strength')
-        self.wait_policy = obj.get('waitPolicy')
+    _scalars = (
+        ('wait_policy', 'waitPolicy'),
+    )
+
+    _children = (
+        ('locked_rels', 'lockedRels'),
+        ('strength', 'strength'),
+    )
 
 
 class RangeFunction(Node):
 
-    def __init__(self, obj):
-        self.lateral = obj.get('lateral')
-        self.ordinality = obj.get('ordinality')
-        self.is_rowsfrom = obj.get('is_rowsfrom')
-        self.functions = build_from_item(obj, 'functions')
-        self.alias = build_from_item(obj, 'alias')
-        self.coldeflist = build_from_item(obj, 'coldeflist')
+    _scalars = (
+        ('lateral', 'lateral'),
+        ('ordinality', 'ordinality'),
+        ('is_rowsfrom', 'is_rowsfrom'),
+    )
+
+    _children = (
+        ('functions', 'functions'),
+        ('alias', 'alias'),
+        ('coldeflist', 'coldeflist'),
+    )
 
 
 class AArrayExpr(Node):
 
-    def __init__(self, obj):
-        self.elements = build_from_item(obj, 'elements')
-        self.location = obj.get('location')
+    _scalars = (
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('elements', 'elements'),
+    )
 
 
 class AIndices(Node):
-    def __init__(self, obj):
-        self.lidx = build_from_item(obj, 'lidx')
-        self.uidx = build_from_item(obj, 'uidx')
+    _children = (
+        ('lidx', 'lidx'),
+        ('uidx', 'uidx'),
+    )
 
 
 class MultiAssignRef(Node):
 
-    def __init__(self, obj):
-        self.source = build_from_item(obj, 'source')
-        self.colno = obj.get('colno')
-        self.ncolumns = obj.get('ncolumns')
+    _scalars = (
+        ('colno', 'colno'),
+        ('ncolumns', 'ncolumns'),
+    )
+
+    _children = (
+        ('source', 'source'),
+    )
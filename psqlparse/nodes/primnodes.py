@@ -1,25 +1,29 @@
-from .utils import build_from_item
 from .nodes import Node
 
 
 class RangeVar(Node):
+    """
+    Range variable, used in FROM clauses
+
+    Also used to represent table names in utility statements; there,
+    the alias field is not used, and inhOpt shows whether to apply the
+    operation recursively to child tables.
+    """
 
-    def __init__(self, obj):
-        """
-        Range variable, used in FROM clauses
+    _scalars = (
+        ('catalogname', 'catalogname'),
+        ('schemaname', 'schemaname'),
+        ('relname', 'relname'),
+        ('inh_opt', 'inhOpt'),
+        ('relpersistence', 'relpersistence'),
+        ('location', 'location'),
+    )
 
-        Also used to represent table names in utility statements; there,
-        the alias field is not used, and inhOpt shows whether to apply the
-        operation recursively to child tables.
-        """
+    _children = (
+        ('alias', 'alias'),
+    )
 
-        self.catalogname = obj.get('catalogname')
-        self.schemaname = obj.get('schemaname')
-        self.relname = obj.get('relname')
-        self.inh_opt = obj.get('inhOpt')
-        self.relpersistence = obj.get('relpersistence')
-        self.alias = build_from_item(obj, 'alias')
-        self.location = obj['location']
+    _table_children = ()
 
     def __repr__(self):
         return '<RangeVar (%s)>' % self.relname
@@ -27,12 +31,12 @@ class RangeVar(Node):
     def __str__(self):
         return '%s' % self.relname
 
-    def tables(self):
+    def _add_tables(self, tables):
         components = [
             getattr(self, name) for name in ('schemaname', 'relname')
             if getattr(self, name, None) is not None
         ]
-        return {'.'.join(components)}
+        tables.add('.'.join(components))
 
 
 class JoinExpr(Node):
@@ -40,14 +44,20 @@ class JoinExpr(Node):
     For SQL JOIN expressions
     """
 
-    def __init__(self, obj):
-        self.jointype = obj.get('jointype')
-        self.is_natural = obj.get('isNatural')
-        self.larg = build_from_item(obj, 'larg')
-        self.rarg = build_from_item(obj, 'rarg')
-        self.using_clause = build_from_item(obj, 'usingClause')
-        self.quals = build_from_item(obj, 'quals')
-        self.alias = build_from_item(obj, 'alias')
+    _scalars = (
+        ('jointype', 'jointype'),
+        ('is_natural', 'isNatural'),
+    )
+
+    _children = (
+        ('larg', 'larg'),
+        ('rarg', 'rarg'),
+        ('using_clause', 'usingClause'),
+        ('quals', 'quals'),
+        ('alias', 'alias'),
+    )
+
+    _table_children = ('larg', 'rarg')
 
     def __repr__(self):
         return '<JoinExpr type=%s>' % self.jointype
@@ -55,24 +65,34 @@ class JoinExpr(Node):
     def __str__(self):
         return '%s JOIN %s ON ()' % (self.larg, self.rarg)
 
-    def tables(self):
-        return self.larg.tables() | self.rarg.tables()
-
 
 class Alias(Node):
 
-    def __init__(self, obj):
-        self.aliasname = obj.get('aliasname')
-        self.colnames = build_from_item(obj, 'colnames')
+    _scalars = (
+        ('aliasname', 'aliasname'),
+    )
 
-    def tables(self):
-        return set()
+    _children = (
+        ('colnames', 'colnames'),
+    )
+
+    _table_children = ()
 
 
 class IntoClause(Node):
 
-    def __init__(self, obj):
-        self._obj = obj
+    _scalars = (
+        ('on_commit', 'onCommit'),
+        ('table_space_name', 'tableSpaceName'),
+        ('skip_data', 'skipData'),
+    )
+
+    _children = (
+        ('rel', 'rel'),
+        ('col_names', 'colNames'),
+        ('options', 'options'),
+        ('view_query', 'viewQuery'),
+    )
 
 
 class Expr(Node):
@@ -83,82 +103,106 @@ class Expr(Node):
 
 class BoolExpr(Expr):
 
-    def __init__(self, obj):
-        self.boolop = obj.get('boolop')
-        self.args = build_from_item(obj, 'args')
-        self.location = obj.get('location')
+    _scalars = (
+        ('boolop', 'boolop'),
+        ('location', 'location'),
+    )
 
-    def tables(self):
-        _tables = set()
-        for item in self.args:
-            _tables |= item.tables()
-        return _tables
+    _children = (
+        ('args', 'args'),
+    )
+
+    _table_children = ('args',)
 
 
 class SubLink(Expr):
 
-    def __init__(self, obj):
-        self.sub_link_type = obj.get('subLinkType')
-        self.sub_link_id = obj.get('subLinkId')
-        self.testexpr = build_from_item(obj, 'testexpr')
-        self.oper_name = build_from_item(obj, 'operName')
-        self.subselect = build_from_item(obj, 'subselect')
-        self.location = obj.get('location')
+    _scalars = (
+        ('sub_link_type', 'subLinkType'),
+        ('sub_link_id', 'subLinkId'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('testexpr', 'testexpr'),
+        ('oper_name', 'operName'),
+        ('subselect', 'subselect'),
+    )
 
-    def tables(self):
-        return self.subselect.tables()
+    _table_children = ('subselect',)
 
 
 class SetToDefault(Node):
 
-    def __init__(self, obj):
-        self.type_id = obj.get('typeId')
-        self.type_mod = obj.get('typeMod')
-        self.collation = obj.get('collation')
-        self.location = obj.get('location')
+    _scalars = (
+        ('type_id', 'typeId'),
+        ('type_mod', 'typeMod'),
+        ('collation', 'collation'),
+        ('location', 'location'),
+    )
 
 
 class CaseExpr(Node):
 
-    def __init__(self, obj):
-        self.casetype = obj.get('casetype')
-        self.casecollid = obj.get('casecollid')
-        self.arg = build_from_item(obj, 'arg')
-        self.args = build_from_item(obj, 'args')
-        self.defresult = build_from_item(obj, 'defresult')
-        self.location = obj.get('location')
+    _scalars = (
+        ('casetype', 'casetype'),
+        ('casecollid', 'casecollid'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('arg', 'arg'),
+        ('args', 'args'),
+        ('defresult', 'defresult'),
+    )
 
 
 class CaseWhen(Node):
 
-    def __init__(self, obj):
-        self.expr = build_from_item(obj, 'expr')
-        self.result = build_from_item(obj, 'result')
-        self.location = obj.get('location')
+    _scalars = (
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('expr', 'expr'),
+        ('result', 'result'),
+    )
 
 
 class NullTest(Node):
 
-    def __init__(self, obj):
-        self.arg = build_from_item(obj, 'arg')
-        self.nulltesttype = obj.get('nulltesttype')
-        self.argisrow = obj.get('argisrow')
-        self.location = obj.get('location')
+    _scalars = (
+        ('nulltesttype', 'nulltesttype'),
+        ('argisrow', 'argisrow'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('arg', 'arg'),
+    )
 
 
 class BooleanTest(Node):
 
-    def __init__(self, obj):
-        self.arg = build_from_item(obj, 'arg')
-        self.booltesttype = obj.get('booltesttype')
-        self.location = obj.get('location')
+    _scalars = (
+        ('booltesttype', 'booltesttype'),
+        ('location', 'location'),
+    )
+
+    _children = (
+        ('arg', 'arg'),
+    )
 
 
 class RowExpr(Node):
 
-    def __init__(self, obj):
-        self.args = build_from_item(obj, 'args')
-        self.colnames = build_from_item(obj, 'colnames')
-        self.location = obj['location']
-        self.row_format = obj.get('row_format')
-        self.type_id = obj.get('typeId')
+    _scalars = (
+        ('location', 'location'),
+        ('row_format', 'row_format'),
+        ('type_id', 'typeId'),
+    )
+
+    _children = (
+        ('args', 'args'),
+        ('colnames', 'colnames'),
+    )
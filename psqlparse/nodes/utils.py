@@ -1,24 +1,437 @@
-import importlib
+import sys
 
-from six import next, iterkeys, itervalues
+import six
 
 
-module = importlib.import_module('psqlparse.nodes')
+# RuntimeError is raised when the recursion limit is hit on Python 2.
+_RecursionError = getattr(six.moves.builtins, 'RecursionError', RuntimeError)
+
+_package = __name__.rpartition('.')[0]
+
+
+def _too_deep():
+    """
+    Whether the recursion error being handled comes from the depth of the
+    tree, and not from a node class called by the builders, which is when
+    most of the stack that was left is frames of this package.
+    """
+    left = sys.getrecursionlimit()
+    frame = sys._getframe()
+    while frame is not None:
+        left -= 1
+        frame = frame.f_back
+    ours = 0
+    traceback = sys.exc_info()[2]
+    while traceback is not None:
+        if traceback.tb_frame.f_globals.get('__name__', '').startswith(
+                _package):
+            ours += 1
+        traceback = traceback.tb_next
+    return ours * 2 > left
+
+
+# Registered node classes, by name without underscores.
+_node_classes = {}
+
+# Builders by libpg_query node tag, filled from _node_classes as the tags
+# are found. _builders take the node dict as it comes from parse_dict, and
+# _built_builders one whose children are already built, like the decoder
+# makes. None means that there is no class for the tag.
+_builders = {}
+_built_builders = {}
+
+# How psqlparse.tables handles the nodes with each tag, see get_table_info.
+_table_infos = {}
+
+# How parse builds the nodes with each tag for each include, see
+# get_include_info.
+_include_infos = {}
+
+# The definitions of the registered classes that psqlparse.dumps wrote, by
+# class, and the ones that psqlparse.loads read, by definition.
+_class_definitions = {}
+_read_definitions = {}
+
+
+def register_node_class(node_class, name=None):
+    """
+    Build the libpg_query nodes called name, which defaults to the class
+    name, as instances of node_class. Underscores in the name are ignored,
+    so AConst is used for A_Const nodes.
+
+    node_class is called with the node dict, unless it is a Node subclass
+    that only declares _scalars and _children, for which a specialized
+    builder is generated.
+    """
+    name = (name or node_class.__name__).replace('_', '')
+    _node_classes[name] = node_class
+    _builders.clear()
+    _built_builders.clear()
+    _table_infos.clear()
+    _include_infos.clear()
+    _class_definitions.clear()
+    _read_definitions.clear()
 
 
 def get_node_class(class_name):
-    class_name = class_name.replace('_', '')
-    return getattr(module, class_name, None)
+    return _node_classes.get(class_name.replace('_', ''))
+
+
+def reduce_node(node, protocol):
+    """
+    __reduce_ex__ of nodes and values. From protocol 2, the subtree is
+    pickled in the compact format of psqlparse.dumps, unless dumps can't
+    write it, because it has classes that are not registered, values of
+    other types, or shared nodes or cycles, which only pickle keeps. Then
+    the node is pickled by its state.
+    """
+    if protocol < 2:
+        return object.__reduce_ex__(node, protocol)
+    from ..serializer import dumps, loads
+    try:
+        return loads, (dumps(node),)
+    except (TypeError, ValueError):
+        pass
+    # The nodes under it are pickled by their state as well, or the ones
+    # shared by two subtrees that dumps can write would be copied.
+    from .nodes import Node
+    from .value import Value
+    wrapped = {id(node): node}
+    state = _by_state(node.__getstate__(), (Node, Value), wrapped)
+    return _new_node, (type(node),), state
+
+
+class _ByState(object):
+    """
+    A node under one that psqlparse.dumps can't write, which is pickled by
+    its state.
+    """
+
+    __slots__ = ('node_class', 'state')
+
+    def __reduce_ex__(self, protocol):
+        return _new_node, (self.node_class,), self.state
+
+
+def _new_node(node_class):
+    return node_class.__new__(node_class)
+
+
+def _by_state(value, node_types, wrapped):
+    # Each node, list and dict is replaced once, so pickle still finds the
+    # ones that are shared, and the cycles.
+    replaced = wrapped.get(id(value))
+    if replaced is not None:
+        return replaced
+    if isinstance(value, node_types):
+        replaced = wrapped[id(value)] = _ByState()
+        replaced.node_class = type(value)
+        replaced.state = _by_state(value.__getstate__(), node_types, wrapped)
+    elif isinstance(value, list):
+        replaced = wrapped[id(value)] = []
+        replaced.extend(_by_state(item, node_types, wrapped)
+                        for item in value)
+    elif isinstance(value, dict):
+        replaced = wrapped[id(value)] = {}
+        for key, item in six.iteritems(value):
+            replaced[key] = _by_state(item, node_types, wrapped)
+    elif isinstance(value, (tuple, set, frozenset)):
+        replaced = type(value)(_by_state(item, node_types, wrapped)
+                               for item in value)
+    else:
+        return value
+    # Kept, so their ids aren't reused by temporaries.
+    wrapped[id(value), None] = value
+    return replaced
+
+
+def copy_node(node):
+    """
+    __copy__ of nodes and values, which shares the children, unlike
+    pickling.
+    """
+    copy = type(node).__new__(type(node))
+    copy.__setstate__(node.__getstate__())
+    return copy
+
+
+def _make_builder(node_class, built_children):
+    from .nodes import Node
+
+    if (not issubclass(node_class, Node) or
+            node_class.__init__ != Node.__init__):
+        return node_class
+
+    # Straight-line code is much faster than looping over the declared
+    # attributes, like Node.__init__ does.
+    lines = ['def build(obj):', '    node = new(node_class)']
+    for attr, key in node_class._scalars:
+        lines.append('    node.%s = obj.get(%r)' % (attr, key))
+    for attr, key in node_class._children:
+        if built_children:
+            lines.append('    node.%s = obj.get(%r)' % (attr, key))
+        else:
+            lines.append('    value = obj.get(%r)' % key)
+            lines.append('    node.%s = (None if value is None else '
+                         'build_from_obj(value))' % attr)
+    lines.append('    return node')
+
+    namespace = {'__name__': __name__, 'new': object.__new__,
+                 'node_class': node_class, 'build_from_obj': _build}
+    exec('\n'.join(lines), namespace)
+    return namespace['build']
+
+
+def get_builder(tag, built_children=False):
+    """
+    Return the function that builds the node for a libpg_query tag from
+    its dict, or None if there is no node class for it.
+    """
+    builders = _built_builders if built_children else _builders
+    try:
+        return builders[tag]
+    except KeyError:
+        node_class = get_node_class(tag)
+        builder = builders[tag] = (
+            node_class and _make_builder(node_class, built_children))
+        return builder
+
+
+def get_table_info(tag):
+    """
+    Return how Node.tables() handles the nodes with a libpg_query tag, for
+    searching the parse_dict output the same way: None if they are not
+    searched, or a pair with the builder of the node, if its class adds
+    tables itself, and the keys of the children to search.
+    """
+    try:
+        return _table_infos[tag]
+    except KeyError:
+        pass
+    from .nodes import Node
 
+    info = None
+    node_class = get_node_class(tag)
+    if node_class is not None and issubclass(node_class, Node):
+        keys = dict(node_class._children)
+        info = (get_builder(tag) if node_class._add_tables is not None
+                else None,
+                tuple(keys[attr] for attr in node_class._table_children))
+    _table_infos[tag] = info
+    return info
 
-def build_from_obj(obj):
+
+def get_include_info(include, tag):
+    """
+    Return how parse(query, include=include) builds the nodes with a
+    libpg_query tag, where include is a frozenset: None if they are kept as
+    dicts, or a tuple with the builder of the nodes, with their children
+    built, whether they are included, their class, and for the classes
+    whose nodes can be lazy, a dict from the keys of their children to the
+    attributes and the keys of the children that are included.
+    """
+    infos = _include_infos.setdefault(include, {})
+    try:
+        return infos[tag]
+    except KeyError:
+        pass
+    from .nodes import Node
+
+    info = None
+    node_class = get_node_class(tag)
+    if node_class is not None:
+        included = issubclass(node_class, tuple(
+            item for item in include if isinstance(item, type)))
+        if (included or not issubclass(node_class, Node) or
+                node_class.__init__ != Node.__init__):
+            info = (get_builder(tag, True), included, node_class, None, None)
+        else:
+            info = (None, False, node_class,
+                    dict((key, attr) for attr, key in node_class._children),
+                    frozenset(key for attr, key in node_class._children
+                              if attr in include))
+    infos[tag] = info
+    return info
+
+
+class _Unbuilt(object):
+    """
+    A child of a lazy node that parse did not build, because it had nothing
+    included, kept as the JSON text of the parse tree.
+    """
+
+    __slots__ = ('json',)
+
+    def __init__(self, json):
+        self.json = json
+
+    def __reduce__(self):
+        return _Unbuilt, (self.json,)
+
+    def build(self):
+        from ..decoder import build_from_json
+        return build_from_json(self.json)
+
+
+def _lazy_items(items):
+    # The items of a list with included parts that have none themselves
+    # become lazy nodes, like the statements.
+    return [_build_lazy(item) if isinstance(item, (list, dict)) else item
+            for item in items]
+
+
+def _build_included(obj, include):
+    """
+    Build the included parts of the parse_dict output, returning them with
+    whether there were any.
+    """
+    if isinstance(obj, list):
+        items = [_build_included(item, include) for item in obj]
+        if any(found for _, found in items):
+            return _lazy_items([item for item, _ in items]), True
+        return obj, False
+    if not isinstance(obj, dict) or not obj:
+        return obj, False
+    tag, fields = next(six.iteritems(obj))
+    info = get_include_info(include, tag)
+    if info is None:
+        return obj, False
+    builder, included, node_class, children, build_keys = info
+    if builder is not None:
+        return (_build(obj), True) if included else (obj, False)
+    if not isinstance(fields, dict):
+        return obj, False
+
+    built = {}
+    for key, attr in six.iteritems(children):
+        if key not in fields:
+            continue
+        if key in build_keys:
+            built[attr] = _build(fields[key])
+        else:
+            value, found = _build_included(fields[key], include)
+            if found:
+                built[attr] = value
+    if not built:
+        return obj, False
+    node = node_class.lazy(fields)
+    for attr, value in six.iteritems(built):
+        setattr(node, attr, value)
+    return node, True
+
+
+def build_included(obj, include):
+    """
+    Build the parse_dict output of a query like parse(query,
+    include=include), from a list of statements.
+    """
+    include = frozenset(include)
+    try:
+        return _lazy_items(_build_included(obj, include)[0])
+    except _RecursionError:
+        if not _too_deep():
+            raise
+        # Building everything gives the same tree, only sooner.
+        return build_from_obj(obj)
+
+
+def _build_list(obj):
+    return [_build(item) for item in obj]
+
+
+def _build_dict(obj):
+    for tag, value in six.iteritems(obj):
+        try:
+            builder = _builders[tag]
+        except KeyError:
+            builder = get_builder(tag)
+        return builder(value) if builder else obj
+    return obj
+
+
+_type_builders = {list: _build_list, dict: _build_dict}
+
+
+def _build_lazy(obj):
     if isinstance(obj, list):
-        return [build_from_obj(item) for item in obj]
-    if not isinstance(obj, dict):
+        return [_build_lazy(item) for item in obj]
+    if not isinstance(obj, dict) or not obj:
+        return obj.build() if isinstance(obj, _Unbuilt) else obj
+    tag, value = next(six.iteritems(obj))
+    _class = get_node_class(tag)
+    if not _class:
         return obj
-    _class = get_node_class(next(iterkeys(obj)))
-    return _class(next(itervalues(obj))) if _class else obj
+    if hasattr(_class, 'lazy'):
+        return _class.lazy(value)
+    return _class(value)
+
+
+def _build(obj):
+    builder = _type_builders.get(type(obj))
+    if builder is not None:
+        return builder(obj)
+    if isinstance(obj, list):
+        return _build_list(obj)
+    if isinstance(obj, dict):
+        return _build_dict(obj)
+    return obj
+
+
+def _build_deep(obj):
+    """
+    Build the nodes like _build, but with an explicit stack instead of
+    recursion, so the depth of the tree is not limited. The containers are
+    copied and the nodes found in a first pass, and the nodes are built in
+    reverse order, so the children of each node are built before it.
+    """
+    root = [obj]
+    stack = [(root, 0)]
+    nodes = []
+    while stack:
+        container, key = stack.pop()
+        value = container[key]
+        if isinstance(value, list):
+            items = container[key] = list(value)
+            stack.extend((items, i) for i in range(len(items)))
+        elif isinstance(value, dict) and value:
+            tag, fields = next(six.iteritems(value))
+            builder = get_builder(tag, True)
+            if builder is None:
+                continue
+            node_class = get_node_class(tag)
+            if builder is node_class:
+                container[key] = node_class(fields)
+                continue
+            fields = dict(fields)
+            for _, child_key in node_class._children:
+                if isinstance(fields.get(child_key), (list, dict)):
+                    stack.append((fields, child_key))
+            nodes.append((container, key, builder, fields))
+    for container, key, builder, fields in reversed(nodes):
+        container[key] = builder(fields)
+    return root[0]
+
+
+def build_from_obj(obj, lazy=False):
+    """
+    Build the nodes from the parse_dict output.
+
+    With lazy=True, the children of each node are only built when they are
+    first accessed.
+    """
+    if lazy:
+        return _build_lazy(obj)
+    try:
+        return _build(obj)
+    except _RecursionError:
+        # The recursive builders are faster, but can't build deeply nested
+        # queries, like long chains of UNION or of + operators. Telling
+        # those apart beforehand takes a walk over the tree that costs
+        # most of a build, so only the rare deep trees pay for it.
+        if not _too_deep():
+            raise
+        return _build_deep(obj)
 
 
-def build_from_item(obj, key):
-    return build_from_obj(obj[key]) if key in obj else None
+def build_from_item(obj, key, lazy=False):
+    return build_from_obj(obj[key], lazy) if key in obj else None
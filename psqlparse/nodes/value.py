@@ -1,8 +1,13 @@
 import abc
 
+import six
+
+from .utils import copy_node, reduce_node
+
 
 class Value(object):
     __metaclass__ = abc.ABCMeta
+    __slots__ = ()
 
     def __str__(self):
         return str(self.val)
@@ -11,8 +16,23 @@ class Value(object):
     def val(self):
         pass
 
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr))
+                    for attr in type(self).__slots__)
+
+    def __setstate__(self, state):
+        for attr, value in six.iteritems(state):
+            setattr(self, attr, value)
+
+    def __reduce_ex__(self, protocol):
+        return reduce_node(self, protocol)
+
+    def __copy__(self):
+        return copy_node(self)
+
 
 class Integer(Value):
+    __slots__ = ('ival',)
 
     def __init__(self, obj):
         self.ival = obj.get('ival')
@@ -26,6 +46,7 @@ class Integer(Value):
 
 
 class String(Value):
+    __slots__ = ('str',)
 
     def __init__(self, obj):
         self.str = obj.get('str')
@@ -36,6 +57,7 @@ class String(Value):
 
 
 class Float(Value):
+    __slots__ = ('str', 'fval')
 
     def __init__(self, obj):
         self.str = obj.get('str')
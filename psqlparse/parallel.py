@@ -0,0 +1,73 @@
+import functools
+import itertools
+import multiprocessing
+
+from .decoder import build_from_json, decode_json
+from .exceptions import PSqlParseError
+from .parser import parse_dict_many, parse_json, parse_many
+
+
+def _chunks(queries, chunksize):
+    queries = iter(queries)
+    while True:
+        chunk = list(itertools.islice(queries, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_json_chunk(chunk):
+    results = []
+    for query in chunk:
+        try:
+            results.append(parse_json(query).encode('utf8'))
+        except PSqlParseError as e:
+            results.append(e)
+    return results
+
+
+def _parse_chunk(chunk, as_dict, func):
+    if func is None:
+        return _parse_json_chunk(chunk)
+    results = parse_dict_many(chunk) if as_dict else parse_many(chunk)
+    return [result if isinstance(result, PSqlParseError) else func(result)
+            for result in results]
+
+
+def parse_parallel(queries, processes=None, chunksize=1000, as_dict=False,
+                   func=None):
+    """
+    Parse an iterable of queries in a pool of processes.
+
+    Chunks of chunksize queries are sent to the workers. Results keep the
+    input order and, like in parse_many, queries that fail to parse give a
+    PSqlParseError instance in their position.
+
+    The workers send back the JSON parse trees, which are much cheaper to
+    send than dicts, and the decoder turns them into the statement nodes,
+    or their parse_dict output with as_dict=True, in the calling process.
+    That is still most of the cost of parse_many, so it doesn't scale much
+    with the processes.
+
+    To scale, pass func, a picklable function that is called in the
+    workers with the statements of each query, nodes or dicts with
+    as_dict=True, and whose return value is sent back in their place, so
+    only the results of the analysis cross the process boundary.
+    """
+    worker = functools.partial(_parse_chunk, as_dict=as_dict, func=func)
+    decode = decode_json if as_dict else build_from_json
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = []
+        for chunk in pool.imap(worker, _chunks(queries, chunksize)):
+            if func is not None:
+                results.extend(chunk)
+                continue
+            for item in chunk:
+                if not isinstance(item, PSqlParseError):
+                    item = decode(item)
+                results.append(item)
+        return results
+    finally:
+        pool.close()
+        pool.join()
@@ -1,36 +1,544 @@
-import json
+import threading
+from timeit import default_timer
 
+from cpython.buffer cimport (PyObject_CheckBuffer, PyObject_GetBuffer,
+                             PyBuffer_Release, PyBUF_SIMPLE)
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from libc.string cimport memcpy
 import six
 
 from .nodes.utils import build_from_obj
 from .exceptions import PSqlParseError
+from .serializer import _dumps_built, loads
+from .decoder cimport (decode, build_nodes, build_included_nodes,
+                       find_tables)
 from .pg_query cimport (pg_query_parse, pg_query_free_parse_result,
-                       PgQueryParseResult)
+                       pg_query_fingerprint, pg_query_free_fingerprint_result,
+                       pg_query_normalize, pg_query_free_normalize_result,
+                       PgQueryParseResult, PgQueryFingerprintResult,
+                       PgQueryNormalizeResult, PgQueryError,
+                       PG_VERSION as _PG_VERSION)
 
 
-def parse_dict(query):
-    cdef bytes encoded_query
-    cdef PgQueryParseResult result
+# The PostgreSQL version of the parser, which identifies the format of the
+# parse trees.
+PG_VERSION = (<bytes>_PG_VERSION).decode('ascii')
+
+
+cdef extern from *:
+    """
+    /* The text of an ASCII str, which is also its UTF-8 encoding, with no
+       copy. NULL for other strings, and on Python 2. */
+    static const char *psqlparse_ascii_text(PyObject *s, Py_ssize_t *size)
+    {
+    #if PY_MAJOR_VERSION >= 3
+        if (PyUnicode_IS_ASCII(s))
+            return PyUnicode_AsUTF8AndSize(s, size);
+    #endif
+        return NULL;
+    }
+    """
+    const char *psqlparse_ascii_text(object s, Py_ssize_t *size)
+
+
+cdef class _Query:
+    """
+    The UTF-8 text of a query, NUL-terminated for libpg_query.
 
+    It points into the object the query was given as whenever its text can
+    be used in place: bytes, bytearray and ASCII str are NUL-terminated, and
+    so are the buffers whose last byte is NUL, which isn't part of the
+    query. Other buffers, like memoryview slices of an mmap, are copied
+    once, with no bytes object made. The buffer is held until the query is
+    released, so it can't be resized or closed while it is parsed.
+    """
+    cdef object owner
+    cdef const char *text
+    cdef Py_ssize_t size
+    cdef Py_buffer view
+    cdef bint has_view
+    cdef char *copy
+
+    def __dealloc__(self):
+        if self.has_view:
+            PyBuffer_Release(&self.view)
+        PyMem_Free(self.copy)
+
+    cdef bytes key(self):
+        """
+        Return the text as bytes, to key the cache, which copies it unless
+        the query was given as bytes.
+        """
+        if type(self.owner) is bytes:
+            return self.owner
+        return PyBytes_FromStringAndSize(self.text, self.size)
+
+
+cdef _Query _encode(query):
+    cdef _Query encoded = _Query.__new__(_Query)
+    cdef const char *buf
+
+    if isinstance(query, bytes):
+        encoded.owner = query
+        encoded.text = PyBytes_AS_STRING(query)
+        encoded.size = len(<bytes>query)
+        return encoded
     if isinstance(query, six.text_type):
-        encoded_query = query.encode('utf8')
-    elif isinstance(query, six.binary_type):
-        encoded_query = query
+        encoded.text = psqlparse_ascii_text(query, &encoded.size)
+        if encoded.text != NULL:
+            encoded.owner = query
+            return encoded
+        return _encode(query.encode('utf8'))
+    if not PyObject_CheckBuffer(query):
+        return _encode(six.text_type(query).encode('utf8'))
+
+    PyObject_GetBuffer(query, &encoded.view, PyBUF_SIMPLE)
+    encoded.has_view = True
+    encoded.owner = query
+    buf = <const char *>encoded.view.buf
+    encoded.size = encoded.view.len
+    if isinstance(query, bytearray):
+        encoded.text = buf
+    elif encoded.size > 0 and buf[encoded.size - 1] == 0:
+        encoded.size -= 1
+        encoded.text = buf
     else:
-        encoded_query = six.text_type(query).encode('utf8')
+        encoded.copy = <char *>PyMem_Malloc(encoded.size + 1)
+        if encoded.copy == NULL:
+            raise MemoryError()
+        memcpy(encoded.copy, buf, encoded.size)
+        encoded.copy[encoded.size] = 0
+        encoded.text = encoded.copy
+    return encoded
+
+
+cdef object _make_error(PgQueryError *error):
+    return PSqlParseError(error.message.decode('utf8'), error.lineno,
+                          error.cursorpos)
+
+
+cdef object _cache = None
+cdef object _stats = None
+
+
+cdef enum _Output:
+    _JSON
+    _BYTES
+    _DICTS
+    _NODES
+    _INCLUDED
+    _TABLES
+
+
+cdef object _convert(const char *parse_tree, _Output output,
+                     frozenset included):
+    if output == _NODES:
+        return build_nodes(parse_tree)
+    if output == _DICTS:
+        return decode(parse_tree)
+    if output == _INCLUDED:
+        return build_included_nodes(parse_tree, included)
+    if output == _TABLES:
+        return find_tables(parse_tree)
+    if output == _BYTES:
+        return <bytes>parse_tree
+    return parse_tree.decode('utf8')
+
+
+cdef object _parse(_Query encoded_query, _Output output,
+                   frozenset included=None, record=None):
+    """
+    Parse an encoded query, returning either the parse tree, as JSON text
+    or bytes, dicts, nodes or only the include ones, the tables it
+    references, or a PSqlParseError instance. It never raises on a syntax
+    error.
+
+    With a ParseRecord, the time of libpg_query and of the conversion of
+    its output are added to it.
+    """
+    cdef const char *c_query = encoded_query.text
+    cdef PgQueryParseResult result
+
+    if record is not None:
+        start = default_timer()
+    # libpg_query keeps its memory contexts in thread-local storage, so the
+    # parser can run concurrently from several threads without the GIL.
+    # Unless it is built with DEBUG defined, as setup.py does, its raw
+    # parser also redirects the stderr of the whole process to a pipe with
+    # dup2 while it runs, which concurrent calls, and any other thread
+    # writing to stderr, would race on.
+    with nogil:
+        result = pg_query_parse(c_query)
+    if record is not None:
+        parsed = default_timer()
+        record.seconds['parse'] += parsed - start
+    try:
+        if result.error:
+            return _make_error(result.error)
+        value = _convert(result.parse_tree, output, included)
+        if record is not None:
+            record.seconds['decode'] += default_timer() - parsed
+        return value
+    finally:
+        with nogil:
+            pg_query_free_parse_result(result)
+
+
+# The suffix of the cache keys of the statement nodes, which are kept apart
+# from the JSON parse trees. Queries that end in NUL parse like the ones
+# without it, so the values of their keys can be either.
+cdef bytes _NODES_KEY = b'\0'
+cdef bytes _SERIALIZED = b'PQT'
+
+
+cdef object _parse_cached(_Query encoded_query, _Output output,
+                          frozenset included=None, record=None):
+    """
+    Like _parse, but raising PSqlParseError, and going through the cache if
+    there is one.
+
+    The cache keeps the JSON parse tree, which is several times smaller
+    than its dicts, and each hit converts it again, so no part of the tree
+    is shared with the callers, and no copy of it is made. The statement
+    nodes of the queries that were hit are kept in the format of
+    psqlparse.dumps instead, which is smaller, and loads in about half the
+    time it takes to build them from the JSON.
+    """
+    cache = _cache
+    if cache is None:
+        value = _parse(encoded_query, output, included, record)
+        if isinstance(value, PSqlParseError):
+            raise value
+        return value
+
+    if output == _NODES:
+        return _parse_cached_nodes(cache, encoded_query, record)
+    key = encoded_query.key()
+    parse_tree = cache.get(key)
+    if parse_tree is not None and parse_tree.startswith(_SERIALIZED):
+        # The nodes of the query without its final NUL.
+        parse_tree = None
+    if record is not None:
+        record.cached = parse_tree is not None
+    if parse_tree is None:
+        parse_tree = _parse(encoded_query, _BYTES, None, record)
+        if isinstance(parse_tree, PSqlParseError):
+            raise parse_tree
+        cache.put(key, parse_tree, len(key) + len(parse_tree))
+    if record is None:
+        return _convert(parse_tree, output, included)
+    start = default_timer()
+    value = _convert(parse_tree, output, included)
+    record.seconds['decode'] += default_timer() - start
+    return value
+
+
+cdef object _parse_cached_nodes(cache, _Query encoded_query, record):
+    # Misses keep the JSON parse tree, like the other outputs, and the first
+    # hit replaces it with the nodes written by dumps, so the queries that
+    # are only parsed once don't pay for it.
+    key = encoded_query.key() + _NODES_KEY
+    value = cache.get(key)
+    hit = value is not None
+    if record is not None:
+        record.cached = hit
+    if not hit:
+        value = _parse(encoded_query, _BYTES, None, record)
+        if isinstance(value, PSqlParseError):
+            raise value
+        cache.put(key, value, len(key) + len(value))
+    if record is not None:
+        start = default_timer()
+    serialized = value.startswith(_SERIALIZED)
+    statements = loads(value) if serialized else build_nodes(value)
+    if record is not None:
+        record.seconds['decode'] += default_timer() - start
+    if hit and not serialized:
+        try:
+            value = _dumps_built(statements)
+        except (TypeError, ValueError):
+            # Nodes of classes that build something dumps can't write.
+            return statements
+        cache.put(key, value, len(key) + len(value))
+    return statements
+
+
+cdef object _normalize(_Query encoded_query):
+    cdef const char *c_query = encoded_query.text
+    cdef PgQueryNormalizeResult result
+
+    with nogil:
+        result = pg_query_normalize(c_query)
+    try:
+        if result.error:
+            raise _make_error(result.error)
+        return result.normalized_query.decode('utf8')
+    finally:
+        with nogil:
+            pg_query_free_normalize_result(result)
+
+
+cdef list _parse_batch(list queries, bint build):
+    cdef list results = []
+    cdef _Query encoded_query
+
+    cdef _Output output = _NODES if build else _DICTS
+    function = 'parse_many' if build else 'parse_dict_many'
+
+    # Each query is encoded as it is parsed, so only one copy of a buffer
+    # is alive at a time.
+    for query in queries:
+        encoded_query = _encode(query)
+        stats = _stats
+        if stats is None:
+            results.append(_parse(encoded_query, output))
+            continue
+        record = stats.start(function, encoded_query.size)
+        result = _parse(encoded_query, output, None, record)
+        if isinstance(result, PSqlParseError):
+            stats.finish(record, None, result)
+        else:
+            stats.finish(record, result)
+        results.append(result)
+    return results
+
+
+cdef list _parse_batch_threaded(list queries, bint build, int workers):
+    cdef int size = (len(queries) + workers - 1) // workers
+    chunks = [queries[i:i + size] for i in range(0, len(queries), size)]
+    chunk_results = [None] * len(chunks)
+    errors = []
+
+    def worker(index):
+        try:
+            chunk_results[index] = _parse_batch(chunks[index], build)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,))
+               for i in range(len(chunks))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+    return [item for chunk in chunk_results for item in chunk]
+
+
+cdef list _parse_many(queries, bint build, int workers):
+    queries = list(queries)
+    if workers > 1 and len(queries) > 1:
+        return _parse_batch_threaded(queries, build, workers)
+    return _parse_batch(queries, build)
+
+
+cdef object _parse_dict(_Query encoded_query, record):
+    return _parse_cached(encoded_query, _DICTS, None, record)
+
+
+cdef object _parse_json(_Query encoded_query, record):
+    return _parse_cached(encoded_query, _JSON, None, record)
+
+
+cdef object _parse_nodes(_Query encoded_query, bint lazy, parts, record):
+    if parts is not None:
+        return _parse_cached(encoded_query, _INCLUDED, frozenset(parts),
+                             record)
+    if not lazy:
+        return _parse_cached(encoded_query, _NODES, None, record)
+
+    statement_dicts = _parse_cached(encoded_query, _DICTS, None, record)
+    if record is None:
+        return [build_from_obj(obj, True) for obj in statement_dicts]
+    start = default_timer()
+    statements = [build_from_obj(obj, True) for obj in statement_dicts]
+    record.seconds['build'] += default_timer() - start
+    return statements
+
+
+cdef object _tables(_Query encoded_query, record):
+    return _parse_cached(encoded_query, _TABLES, None, record)
+
+
+cdef enum _Call:
+    _PARSE_DICT
+    _PARSE_JSON
+    _PARSE
+    _PARSE_TABLES
+
+
+cdef object _recorded(stats, function, _Call call, _Query encoded_query,
+                      bint lazy=False, parts=None):
+    record = stats.start(function, encoded_query.size)
+    try:
+        if call == _PARSE:
+            result = _parse_nodes(encoded_query, lazy, parts, record)
+        elif call == _PARSE_DICT:
+            result = _parse_dict(encoded_query, record)
+        elif call == _PARSE_JSON:
+            result = _parse_json(encoded_query, record)
+        else:
+            result = _tables(encoded_query, record)
+    except PSqlParseError as error:
+        stats.finish(record, None, error)
+        raise
+    stats.finish(record, result)
+    return result
+
+
+def set_cache(cache):
+    """
+    Put a cache, like psqlparse.cache.ParseCache, in front of parse,
+    parse_dict, parse_json and tables. Pass None to remove it.
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cache():
+    return _cache
+
+
+def set_stats(stats):
+    """
+    Record the timings and counters of parse calls in stats, like a
+    psqlparse.stats.ParseStats. Pass None to stop recording, which is the
+    default and adds no work to the calls.
+    """
+    global _stats
+    _stats = stats
+
+
+def get_stats():
+    return _stats
+
+
+def parse_dict(query):
+    cdef _Query encoded_query = _encode(query)
+    stats = _stats
+    if stats is not None:
+        return _recorded(stats, 'parse_dict', _PARSE_DICT, encoded_query)
+    return _parse_dict(encoded_query, None)
+
+
+def parse_json(query):
+    """
+    Return the parse tree, as the JSON text written by libpg_query.
+    """
+    cdef _Query encoded_query = _encode(query)
+    stats = _stats
+    if stats is not None:
+        return _recorded(stats, 'parse_json', _PARSE_JSON, encoded_query)
+    return _parse_json(encoded_query, None)
+
+
+def parse(query, lazy=False, **options):
+    """
+    Parse a query, returning the list of statement nodes.
+
+    With lazy=True, the children of each node are only built the first time
+    they are accessed, which makes it cheaper to look at a few parts of the
+    tree, at the cost of keeping the parse_dict output alive.
+
+    include takes node classes and names of children, like nodes.RangeVar
+    or 'where_clause', to only build the nodes of those classes and those
+    children, wherever they are in the tree, with everything in them. The
+    nodes above them are lazy, and the rest is only built if it is
+    accessed, so the cost of building tracks what was included.
+    """
+    cdef _Query encoded_query = _encode(query)
+    # include is a reserved word in Cython, so it can't name an argument
+    # or a variable.
+    parts = options.pop('include', None)
+    if options:
+        raise TypeError("parse() got an unexpected keyword argument '%s'" %
+                        next(iter(options)))
+    stats = _stats
+    if stats is not None:
+        return _recorded(stats, 'parse', _PARSE, encoded_query, lazy, parts)
+    return _parse_nodes(encoded_query, lazy, parts, None)
+
+
+def parse_dict_many(queries, workers=1):
+    """
+    Parse an iterable of queries, returning a list with one item per query,
+    in the same order.
+
+    Each item is either the list of statement dicts, as returned by
+    parse_dict, or the PSqlParseError instance for a query that failed to
+    parse. With workers > 1, the batch is split in contiguous chunks that
+    are parsed in that many threads. Only the libpg_query calls run in
+    parallel, since converting their output holds the GIL.
+    """
+    return _parse_many(queries, False, workers)
+
+
+def parse_many(queries, workers=1):
+    """
+    Same as parse_dict_many, but each successfully parsed query gives the
+    list of statement nodes, as returned by parse.
+    """
+    return _parse_many(queries, True, workers)
+
+
+def tables(query):
+    """
+    Return the names of the tables referenced in the statements of a query,
+    like the union of calling tables() on each statement from parse, but
+    without building the nodes. Statements without a node class are not
+    searched.
+    """
+    cdef _Query encoded_query = _encode(query)
+    stats = _stats
+    if stats is not None:
+        return _recorded(stats, 'tables', _PARSE_TABLES, encoded_query)
+    return _tables(encoded_query, None)
+
+
+def fingerprint(query):
+    """
+    Return the libpg_query fingerprint of a query, as an hex string.
+
+    Queries that only differ in their constant values, like
+    "SELECT * FROM t WHERE id = 1" and "SELECT * FROM t WHERE id = 2", have
+    the same fingerprint.
+    """
+    cdef _Query encoded_query = _encode(query)
+    cdef const char *c_query = encoded_query.text
+    cdef PgQueryFingerprintResult result
+
+    with nogil:
+        result = pg_query_fingerprint(c_query)
+    try:
+        if result.error:
+            raise _make_error(result.error)
+        return result.hexdigest.decode('ascii')
+    finally:
+        with nogil:
+            pg_query_free_fingerprint_result(result)
+
+
+def normalize(query):
+    """
+    Return the query text with its constants replaced by $n placeholders,
+    like "SELECT * FROM t WHERE id = $1".
 
-    result = pg_query_parse(encoded_query)
-    if result.error:
-        error = PSqlParseError(result.error.message.decode('utf8'),
-                               result.error.lineno, result.error.cursorpos)
-        pg_query_free_parse_result(result)
-        raise error
+    No parse tree is built, not even the JSON one, so this is the cheapest
+    way of grouping queries by their shape.
+    """
+    return _normalize(_encode(query))
 
-    statement_dicts = json.loads(result.parse_tree.decode('utf8'),
-                                 strict=False)
-    pg_query_free_parse_result(result)
-    return statement_dicts
 
+def normalize_many(queries):
+    """
+    Normalize an iterable of queries, returning a list in the same order.
 
-def parse(query):
-    return [build_from_obj(obj) for obj in parse_dict(query)]
+    It raises PSqlParseError on the first query that fails to parse.
+    """
+    cdef list results = []
+    for query in queries:
+        results.append(_normalize(_encode(query)))
+    return results
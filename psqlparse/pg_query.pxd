@@ -1,4 +1,4 @@
-cdef extern from "pg_query.h":
+cdef extern from "pg_query.h" nogil:
 
     ctypedef struct PgQueryError:
         char *message
@@ -9,6 +9,21 @@ cdef extern from "pg_query.h":
         char *parse_tree
         PgQueryError *error
 
+    ctypedef struct PgQueryFingerprintResult:
+        char *hexdigest
+        PgQueryError *error
+
+    ctypedef struct PgQueryNormalizeResult:
+        char *normalized_query
+        PgQueryError *error
+
+    # The version of PostgreSQL whose parser libpg_query is built from.
+    const char *PG_VERSION
+
     PgQueryParseResult pg_query_parse(const char* input)
+    PgQueryFingerprintResult pg_query_fingerprint(const char* input)
+    PgQueryNormalizeResult pg_query_normalize(const char* input)
 
     void pg_query_free_parse_result(PgQueryParseResult result);
+    void pg_query_free_fingerprint_result(PgQueryFingerprintResult result);
+    void pg_query_free_normalize_result(PgQueryNormalizeResult result);
@@ -0,0 +1,261 @@
+"""
+Statement scanner for SQL scripts.
+
+libpg_query 9.5 has no scanner API, so this is a small lexer that only
+knows enough of the PostgreSQL syntax to find the semicolons that end
+statements, like psql does: those in comments, string literals, quoted
+identifiers, dollar quoted strings and parentheses are skipped. It works on
+the UTF-8 encoded text, so positions are byte offsets, like the location of
+the nodes.
+"""
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.string cimport memchr, memcmp
+import six
+
+
+cdef inline bint _is_ident_start(unsigned char c):
+    return (c'a' <= c <= c'z' or c'A' <= c <= c'Z' or c == c'_' or
+            c >= 0x80)
+
+
+cdef inline bint _is_ident_char(unsigned char c):
+    return _is_ident_start(c) or c'0' <= c <= c'9' or c == c'$'
+
+
+cdef inline bint _is_word(const unsigned char *s, Py_ssize_t size,
+                          const char *word):
+    # word is lower case and size its length.
+    cdef Py_ssize_t i
+    for i in range(size):
+        if s[i] | 0x20 != <unsigned char>word[i]:
+            return False
+    return True
+
+
+cdef Py_ssize_t _skip_quoted(const unsigned char *s, Py_ssize_t i,
+                             Py_ssize_t n, unsigned char quote,
+                             bint backslashes):
+    # Doubled quotes stand for the quote itself.
+    i += 1
+    while i < n:
+        if s[i] == quote:
+            if i + 1 < n and s[i + 1] == quote:
+                i += 2
+                continue
+            return i + 1
+        i += 2 if backslashes and s[i] == c'\\' else 1
+    return n
+
+
+cdef Py_ssize_t _skip_comment(const unsigned char *s, Py_ssize_t i,
+                              Py_ssize_t n):
+    # Block comments nest.
+    cdef Py_ssize_t depth = 1
+    i += 2
+    while i < n and depth:
+        if s[i] == c'/' and i + 1 < n and s[i + 1] == c'*':
+            depth += 1
+            i += 2
+        elif s[i] == c'*' and i + 1 < n and s[i + 1] == c'/':
+            depth -= 1
+            i += 2
+        else:
+            i += 1
+    return i
+
+
+cdef Py_ssize_t _skip_line(const unsigned char *s, Py_ssize_t i,
+                           Py_ssize_t n):
+    cdef const unsigned char *newline = <const unsigned char *>memchr(
+        s + i, c'\n', n - i)
+    return n if newline == NULL else newline - s + 1
+
+
+cdef Py_ssize_t _skip_dollar_quoted(const unsigned char *s, Py_ssize_t i,
+                                    Py_ssize_t n):
+    """
+    Return the position after the dollar quoted string starting at i, n if
+    it is not closed, or -1 if there is no dollar quote at i, like in $1.
+    """
+    cdef Py_ssize_t end = i + 1
+    cdef Py_ssize_t size
+    cdef const unsigned char *found
+
+    if end < n and _is_ident_start(s[end]):
+        end += 1
+        while end < n and (_is_ident_start(s[end]) or
+                           c'0' <= s[end] <= c'9'):
+            end += 1
+    if end >= n or s[end] != c'$':
+        return -1
+    size = end + 1 - i
+    end += 1
+    while True:
+        found = <const unsigned char *>memchr(s + end, c'$', n - end)
+        if found == NULL or found - s + size > n:
+            return n
+        end = found - s
+        if not memcmp(s + i, found, size):
+            return end + size
+        end += 1
+
+
+def scan(bytes buf, Py_ssize_t pos=0, bint final=True):
+    """
+    Find the statements in buf, starting at pos.
+
+    Return a list with the (start, end) positions of each statement, from
+    its first token to the end of its last one, the position after the
+    text that was scanned and whether it ends in a COPY FROM STDIN
+    statement. Empty statements are left out.
+
+    Unless final, the text after the last semicolon may be the start of a
+    statement that continues after buf, so it is not scanned. Scanning
+    stops after a COPY FROM STDIN statement, since the data that follows it
+    is not SQL. Lines starting with a backslash at the start of a
+    statement are psql meta-commands, and are skipped.
+    """
+    cdef const unsigned char *s = <const unsigned char *><const char *>buf
+    cdef Py_ssize_t n = len(buf)
+    cdef Py_ssize_t i = pos, start = -1, end = -1, depth = 0, token, size
+    cdef Py_ssize_t scanned = pos
+    cdef bint copy = False, after_from = False, copy_from_stdin = False
+    cdef unsigned char c
+    cdef list statements = []
+
+    while i < n:
+        c = s[i]
+        if c == c' ' or c == c'\n' or c == c'\t' or c == c'\r' or c == c'\f':
+            i += 1
+            continue
+        if c == c'-' and i + 1 < n and s[i + 1] == c'-':
+            i = _skip_line(s, i, n)
+            continue
+        if c == c'/' and i + 1 < n and s[i + 1] == c'*':
+            i = _skip_comment(s, i, n)
+            continue
+        if c == c';' and depth == 0:
+            i += 1
+            if start >= 0:
+                statements.append((start, end))
+                start = -1
+                if copy_from_stdin:
+                    return statements, i, True
+            scanned = i
+            continue
+        if start < 0:
+            if c == c'\\':
+                i = _skip_line(s, i, n)
+                continue
+            start = i
+            copy = c | 0x20 == c'c'
+            after_from = copy_from_stdin = False
+
+        token = i
+        if _is_ident_start(c):
+            i += 1
+            while i < n and _is_ident_char(s[i]):
+                i += 1
+            size = i - token
+            if size == 1 and c | 0x20 == c'e' and i < n and s[i] == c"'":
+                i = _skip_quoted(s, i, n, c"'", True)
+                after_from = False
+            elif copy and depth == 0:
+                if token == start:
+                    copy = size == 4 and _is_word(s + token, 4, b'copy')
+                elif after_from and size == 5 and _is_word(s + token, 5,
+                                                           b'stdin'):
+                    copy_from_stdin = True
+                after_from = size == 4 and _is_word(s + token, 4, b'from')
+        else:
+            after_from = False
+            if c == c"'" or c == c'"':
+                i = _skip_quoted(s, i, n, c, False)
+            elif c == c'$':
+                i = _skip_dollar_quoted(s, i, n)
+                if i < 0:
+                    i = token + 1
+            else:
+                if c == c'(':
+                    depth += 1
+                elif c == c')' and depth:
+                    depth -= 1
+                i += 1
+        end = i
+
+    if final:
+        if start >= 0:
+            statements.append((start, end))
+        scanned = n
+    return statements, scanned, False
+
+
+def skip_copy_data(bytes buf, Py_ssize_t pos=0, bint final=True):
+    """
+    Skip the data of a COPY FROM STDIN statement, starting at pos, after
+    the statement or at the start of a line. The data ends with a line
+    holding only a backslash and a period.
+
+    Return the position after the data and True, or, if buf ends before,
+    the start of the first line that was not complete and False. When
+    final, the data ends at the end of buf.
+    """
+    cdef const unsigned char *s = <const unsigned char *><const char *>buf
+    cdef Py_ssize_t n = len(buf)
+    cdef Py_ssize_t i = pos, line_end, size
+
+    while i < n:
+        line_end = _skip_line(s, i, n)
+        if s[line_end - 1] != c'\n' and not final:
+            break
+        size = line_end - i
+        if size and s[line_end - 1] == c'\n':
+            size -= 2 if size > 1 and s[line_end - 2] == c'\r' else 1
+        if size == 2 and s[i] == c'\\' and s[i + 1] == c'.':
+            return line_end, True
+        i = line_end
+    return (n, True) if final else (i, False)
+
+
+def split(query):
+    """
+    Split a SQL script into its statements, without parsing them.
+
+    Return an (offset, length) pair for each statement, spanning from its
+    first token to the end of its last one, so query[offset:offset + length]
+    is the statement without comments around it or the semicolon. They are
+    character positions for text queries, and byte positions for bytes and
+    other buffers, like bytearray and memoryview. Empty statements, psql
+    meta-commands and COPY FROM STDIN data are left out.
+    """
+    cdef list statements = []
+    cdef Py_ssize_t pos = 0, offset = 0, position = 0
+
+    if isinstance(query, bytes):
+        encoded = query
+    elif PyObject_CheckBuffer(query):
+        # The scanner reads bytes, so other buffers are copied into one.
+        encoded = query = bytes(memoryview(query))
+    else:
+        query = six.text_type(query)
+        encoded = query.encode('utf8')
+
+    while True:
+        found, pos, copy = scan(encoded, pos)
+        statements.extend(found)
+        if not copy:
+            break
+        pos = skip_copy_data(encoded, pos)[0]
+
+    if len(encoded) == len(query):
+        return [(start, end - start) for start, end in statements]
+
+    # Count the characters up to each position, with multibyte ones.
+    pairs = []
+    for start, end in statements:
+        offset += len(encoded[position:start].decode('utf8'))
+        length = len(encoded[start:end].decode('utf8'))
+        pairs.append((offset, length))
+        offset += length
+        position = end
+    return pairs
@@ -0,0 +1,762 @@
+"""
+Compact binary format for parse trees.
+
+dumps writes a tree of nodes, lists, dicts, strings, numbers, booleans and
+None as a header followed by its values in prefix order, each one a type
+byte and its payload:
+
+- None, False and True are only the type byte.
+- Integers are zigzag varints, and floats 8 bytes, little endian.
+- Strings are a varint length and their UTF-8 text the first time they
+  appear, and the varint index of that first appearance afterwards.
+- Lists and dicts are a varint count followed by their items, or by the
+  key and value of each of their entries.
+- The first node of each class brings its definition, which gives the
+  class the next small integer tag: the varint size of the definition,
+  and the name the class is registered with, the number of its attributes
+  and their names, each one a varint length and UTF-8 text. A node is its
+  tag, a varint mask of its attributes that are not None, and the values
+  of those, in order.
+
+The children of lazy nodes are accessed to write them, which builds them,
+so loads gives the same tree as a full parse. Trees of any depth can be
+read and written, as both use an explicit stack.
+"""
+import types
+
+import six
+
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.list cimport PyList_GetSlice
+from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
+from cpython.object cimport PyTypeObject
+from cpython.ref cimport PyObject
+from libc.stdint cimport int64_t, uint64_t
+from libc.string cimport memcpy
+
+from .nodes.nodes import Node
+from .nodes.utils import (_node_classes, _Unbuilt, get_node_class,
+                          _class_definitions as _class_definitions_,
+                          _read_definitions as _read_definitions_)
+from .nodes.value import Value
+
+
+cdef extern from "Python.h":
+    unicode PyUnicode_DecodeUTF8(const char *s, Py_ssize_t size,
+                                 const char *errors)
+    # With NULL items, which cpython.list doesn't allow.
+    int PyList_SetSlice(list list, Py_ssize_t low, Py_ssize_t high,
+                        PyObject *items) except -1
+
+    bint PyType_IsSubtype(PyTypeObject *a, PyTypeObject *b)
+
+    ctypedef struct PyMemberDescrObject:
+        PyMemberDef *d_member
+
+
+cdef extern from "structmember.h":
+    ctypedef struct PyMemberDef:
+        pass
+
+    object PyMember_GetOne(const char *addr, PyMemberDef *member)
+    int PyMember_SetOne(char *addr, PyMemberDef *member,
+                        object value) except -1
+
+
+cdef bytes _MAGIC = b'PQT'
+
+cdef enum:
+    _VERSION = 1
+    _MAX_FIELDS = 64
+
+cdef enum:
+    _NONE = 0
+    _FALSE = 1
+    _TRUE = 2
+    _INT = 3
+    _BIG_INT = 4
+    _FLOAT = 5
+    _STR = 6
+    _STR_REF = 7
+    _BYTES = 8
+    _LIST = 9
+    _DICT = 10
+    _CLASS = 11
+    _NODE = 12
+    # Type bytes from here on are nodes with the tag that is their
+    # difference with it.
+    _SMALL_NODE = 16
+
+cdef object _new = object.__new__
+
+
+cdef class _ClassInfo:
+    """
+    How a class is written and read: the names of its attributes, all its
+    slots but _obj, a function returning their values and one creating a
+    node from them.
+
+    When the attributes are all plain slots, members has their
+    definitions, to get and set them without going through Python code.
+    built is whether the nodes of the class that parse builds can't share
+    values: the nodes built from their declared attributes, and the values
+    of the package.
+    """
+
+    cdef tuple attrs
+    cdef object get
+    cdef object load
+    cdef PyMemberDef **members
+    cdef bint built
+
+    def __cinit__(self):
+        self.members = NULL
+
+    def __dealloc__(self):
+        PyMem_Free(self.members)
+
+    cdef void find_members(self, klass) except *:
+        cdef Py_ssize_t i
+        if (klass.__getattribute__ is not object.__getattribute__ or
+                klass.__setattr__ is not object.__setattr__):
+            return
+        descriptors = [getattr(klass, attr) for attr in self.attrs]
+        for descriptor in descriptors:
+            if type(descriptor) is not types.MemberDescriptorType:
+                return
+        self.members = <PyMemberDef **>PyMem_Malloc(
+            max(len(self.attrs), 1) * sizeof(PyMemberDef *))
+        if self.members == NULL:
+            raise MemoryError()
+        for i in range(len(self.attrs)):
+            self.members[i] = (
+                (<PyMemberDescrObject *>descriptors[i]).d_member)
+
+
+cdef dict _class_infos = {}
+
+
+cdef _ClassInfo _get_class_info(klass):
+    cdef _ClassInfo info = _class_infos.get(klass)
+    if info is not None:
+        return info
+    attrs = tuple(attr for base in reversed(klass.__mro__)
+                  for attr in getattr(base, '__slots__', ())
+                  if attr not in ('_obj', '__weakref__', '__dict__'))
+    if len(attrs) > _MAX_FIELDS:
+        raise ValueError('%s has more than %d attributes' %
+                         (klass.__name__, _MAX_FIELDS))
+
+    # Straight-line code, like the builders of nodes.utils. Reading an
+    # attribute that is not set builds it, for the children of lazy nodes.
+    lines = ['def get(node):', '    return (']
+    lines.extend('        node.%s,' % attr for attr in attrs)
+    lines.append('    )')
+    lines.extend(['def load(values):', '    node = new(node_class)'])
+    lines.extend('    node.%s = values[%d]' % (attr, i)
+                 for i, attr in enumerate(attrs))
+    lines.append('    return node')
+    namespace = {'new': _new, 'node_class': klass}
+    exec('\n'.join(lines), namespace)
+
+    info = _ClassInfo()
+    info.attrs = attrs
+    info.get = namespace['get']
+    info.load = namespace['load']
+    info.find_members(klass)
+    if issubclass(klass, Node):
+        info.built = klass.__init__ == Node.__init__
+    else:
+        info.built = klass.__module__ == Value.__module__
+    _class_infos[klass] = info
+    return info
+
+
+cdef bytes _varint(Py_ssize_t value):
+    cdef bytearray data = bytearray()
+    while value >= 0x80:
+        data.append(value & 0x7f | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+cdef bytes _text(value):
+    cdef bytes encoded = value.encode('utf8')
+    return _varint(len(encoded)) + encoded
+
+
+# The definition of each class, cleared when a class is registered, which
+# can change the name it is registered with.
+cdef dict _class_definitions = _class_definitions_
+
+
+cdef bytes _class_definition(klass):
+    cdef bytes definition = _class_definitions.get(klass)
+    if definition is not None:
+        return definition
+    for name, node_class in _node_classes.items():
+        if node_class is klass:
+            break
+    else:
+        raise ValueError('%s is not a registered node class' %
+                         klass.__name__)
+    attrs = _get_class_info(klass).attrs
+    definition = (_text(name) + _varint(len(attrs)) +
+                  b''.join([_text(attr) for attr in attrs]))
+    definition = _varint(len(definition)) + definition
+    _class_definitions[klass] = definition
+    return definition
+
+
+cdef class _Writer:
+    cdef char *data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef dict strings
+    cdef dict classes
+    # The nodes and containers written, by id, which would be written again
+    # if they are shared, and forever if they are in a cycle. None for the
+    # trees that parse just built, which can't have either.
+    cdef dict seen
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.capacity = 0
+        self.strings = {}
+        self.classes = {}
+        self.seen = {}
+
+    def __dealloc__(self):
+        PyMem_Free(self.data)
+
+    cdef void reserve(self, Py_ssize_t size) except *:
+        cdef Py_ssize_t capacity = self.capacity or 256
+        cdef char *data
+        if self.size + size <= self.capacity:
+            return
+        while capacity < self.size + size:
+            capacity *= 2
+        data = <char *>PyMem_Realloc(self.data, capacity)
+        if data == NULL:
+            raise MemoryError()
+        self.data = data
+        self.capacity = capacity
+
+    cdef inline void write_byte(self, unsigned char value) except *:
+        self.reserve(1)
+        self.data[self.size] = <char>value
+        self.size += 1
+
+    cdef void write_bytes(self, const char *data, Py_ssize_t size) except *:
+        self.reserve(size)
+        memcpy(self.data + self.size, data, size)
+        self.size += size
+
+    cdef void write_varint(self, uint64_t value) except *:
+        self.reserve(10)
+        while value >= 0x80:
+            self.data[self.size] = <char>(value & 0x7f | 0x80)
+            self.size += 1
+            value >>= 7
+        self.data[self.size] = <char>value
+        self.size += 1
+
+    cdef void write_string(self, value) except *:
+        cdef bytes encoded
+        index = self.strings.get(value)
+        if index is not None:
+            self.write_byte(_STR_REF)
+            self.write_varint(index)
+            return
+        self.strings[value] = len(self.strings)
+        encoded = value.encode('utf8')
+        self.write_byte(_STR)
+        self.write_varint(len(encoded))
+        self.write_bytes(encoded, len(encoded))
+
+    cdef void write_int(self, value) except *:
+        cdef int64_t number
+        if -(1 << 62) <= value < (1 << 62):
+            number = value
+            self.write_byte(_INT)
+            self.write_varint((<uint64_t>number << 1) ^
+                              <uint64_t>(number >> 63))
+        else:
+            self.write_byte(_BIG_INT)
+            self.write_string(six.text_type(value))
+
+    cdef void write_float(self, double value) except *:
+        cdef uint64_t bits
+        cdef int i
+        memcpy(&bits, &value, 8)
+        self.write_byte(_FLOAT)
+        self.reserve(8)
+        for i in range(8):
+            self.data[self.size + i] = <char>(bits >> (8 * i) & 0xff)
+        self.size += 8
+
+    cdef void write_node(self, node, list stack) except *:
+        """
+        Write the tag and the mask of a node, and push its values that are
+        not None on the stack.
+        """
+        cdef _ClassInfo info
+        cdef tuple values
+        cdef uint64_t mask = 0
+        cdef Py_ssize_t i
+        cdef char *address = <char *><PyObject *>node
+
+        klass = type(node)
+        tag = self.classes.get(klass)
+        info = _get_class_info(klass)
+        if self.seen is None and not info.built:
+            raise _MayShare()
+        if tag is None:
+            self.classes[klass] = len(self.classes)
+            definition = _class_definition(klass)
+            self.write_byte(_CLASS)
+            self.write_bytes(definition, len(definition))
+        elif <Py_ssize_t>tag < 256 - _SMALL_NODE:
+            self.write_byte(_SMALL_NODE + <Py_ssize_t>tag)
+        else:
+            self.write_byte(_NODE)
+            self.write_varint(tag)
+
+        if info.members == NULL:
+            values = info.get(node)
+        for i in range(len(info.attrs) - 1, -1, -1):
+            if info.members == NULL:
+                value = values[i]
+            else:
+                try:
+                    value = PyMember_GetOne(address, info.members[i])
+                except AttributeError:
+                    value = getattr(node, info.attrs[i])
+            if value is not None:
+                mask |= (<uint64_t>1) << i
+                stack.append(value)
+        self.write_varint(mask)
+
+    cdef void visit(self, value) except *:
+        cdef Py_ssize_t size
+        if self.seen is None:
+            return
+        size = len(self.seen)
+        # The values are kept, so their ids aren't reused by temporaries.
+        self.seen.setdefault(id(value), value)
+        if len(self.seen) == size:
+            raise ValueError('%s object appears more than once in the tree' %
+                             type(value).__name__)
+
+    cdef void write(self, root) except *:
+        cdef list stack = [root]
+        cdef Py_ssize_t i
+
+        while stack:
+            value = stack.pop()
+            value_type = type(value)
+            if value_type is unicode:
+                self.write_string(value)
+            elif value is None:
+                self.write_byte(_NONE)
+            elif value_type is int:
+                self.write_int(value)
+            elif value is False:
+                self.write_byte(_FALSE)
+            elif value is True:
+                self.write_byte(_TRUE)
+            elif value_type is list:
+                self.visit(value)
+                self.write_byte(_LIST)
+                self.write_varint(len(<list>value))
+                for i in range(len(<list>value) - 1, -1, -1):
+                    stack.append((<list>value)[i])
+            # Unlike isinstance, this doesn't call the __instancecheck__ of
+            # the metaclass of Node.
+            elif (PyType_IsSubtype(<PyTypeObject *>value_type,
+                                   <PyTypeObject *>Node) or
+                  PyType_IsSubtype(<PyTypeObject *>value_type,
+                                   <PyTypeObject *>Value)):
+                self.visit(value)
+                self.write_node(value, stack)
+            elif isinstance(value, six.integer_types):
+                self.write_int(value)
+            elif isinstance(value, six.text_type):
+                self.write_string(value)
+            elif isinstance(value, float):
+                self.write_float(value)
+            elif isinstance(value, bytes):
+                self.write_byte(_BYTES)
+                self.write_varint(len(<bytes>value))
+                self.write_bytes(value, len(<bytes>value))
+            elif isinstance(value, list):
+                stack.append(list(value))
+            elif isinstance(value, dict):
+                self.visit(value)
+                self.write_byte(_DICT)
+                self.write_varint(len(<dict>value))
+                items = list((<dict>value).items())
+                for i in range(len(items) - 1, -1, -1):
+                    stack.append(items[i][1])
+                    stack.append(items[i][0])
+            elif isinstance(value, _Unbuilt):
+                stack.append(value.build())
+            else:
+                raise TypeError('%s objects are not supported' %
+                                type(value).__name__)
+
+
+def dumps(obj):
+    """
+    Serialize a parse tree, like the output of parse or parse_dict, or any
+    of its nodes, to bytes in the compact format of loads.
+
+    Raises ValueError for nodes of classes that are not registered, and for
+    nodes, lists or dicts that appear more than once, which pickle keeps,
+    and TypeError for values of other types.
+    """
+    return _dumps(obj, True)
+
+
+class _MayShare(Exception):
+    pass
+
+
+def _dumps_built(statements):
+    """
+    dumps for the statements that parse just built, skipping the search for
+    shared values, which takes memory in proportion to the tree, unless
+    they have nodes of classes that build themselves.
+    """
+    try:
+        return _dumps(statements, False)
+    except _MayShare:
+        return _dumps(statements, True)
+
+
+cdef bytes _dumps(obj, bint check_shared):
+    cdef _Writer writer = _Writer()
+    if not check_shared:
+        writer.seen = None
+    writer.write_bytes(_MAGIC, len(_MAGIC))
+    writer.write_byte(_VERSION)
+    writer.write(obj)
+    return PyBytes_FromStringAndSize(writer.data, writer.size)
+
+
+cdef enum _Kind:
+    _IN_LIST
+    _IN_DICT
+    _IN_NODE
+
+
+cdef struct _Frame:
+    # A container whose items are being read, onto the end of the values
+    # of the reader, from position start.
+    _Kind kind
+    Py_ssize_t start
+    Py_ssize_t count
+    uint64_t mask
+    # The _ReadClass of a node, kept alive by the classes of the reader.
+    PyObject *info
+
+
+cdef class _ReadClass:
+    """
+    A class definition that was read: the number of attributes it was
+    written with, the positions of those in the current class, or None if
+    they are the same, and how the current class is read.
+    """
+
+    cdef Py_ssize_t count
+    cdef tuple positions
+    cdef object klass
+    cdef _ClassInfo info
+
+
+# The class definitions that were read, as returned by read_class, cleared
+# when a class is registered.
+cdef dict _read_definitions = _read_definitions_
+
+
+cdef class _Reader:
+    cdef const unsigned char *data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t pos
+    cdef list strings
+    cdef list classes
+    cdef _Frame *frames
+    cdef Py_ssize_t depth
+    cdef Py_ssize_t capacity
+
+    def __cinit__(self):
+        self.frames = NULL
+        self.depth = 0
+        self.capacity = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.frames)
+
+    cdef _Frame *push_frame(self, _Kind kind) except NULL:
+        cdef Py_ssize_t capacity = self.capacity * 2 or 64
+        cdef _Frame *frames
+        if self.depth == self.capacity:
+            frames = <_Frame *>PyMem_Realloc(self.frames,
+                                             capacity * sizeof(_Frame))
+            if frames == NULL:
+                raise MemoryError()
+            self.frames = frames
+            self.capacity = capacity
+        self.depth += 1
+        self.frames[self.depth - 1].kind = kind
+        self.frames[self.depth - 1].info = NULL
+        return &self.frames[self.depth - 1]
+
+    cdef inline unsigned char read_byte(self) except? 0:
+        if self.pos >= self.size:
+            raise ValueError('Truncated parse tree data')
+        self.pos += 1
+        return self.data[self.pos - 1]
+
+    cdef uint64_t read_varint(self) except? 0:
+        cdef uint64_t value = 0
+        cdef int shift = 0
+        cdef unsigned char byte
+        while True:
+            byte = self.read_byte()
+            if shift > 63:
+                raise ValueError('Invalid varint at position %d' % self.pos)
+            value |= (<uint64_t>(byte & 0x7f)) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    cdef Py_ssize_t read_count(self) except -1:
+        # Every item takes a byte at least, which bounds the counts of
+        # valid data.
+        cdef uint64_t count = self.read_varint()
+        if count > <uint64_t>(self.size - self.pos):
+            raise ValueError('Invalid count at position %d' % self.pos)
+        return <Py_ssize_t>count
+
+    cdef const char *read_bytes(self, Py_ssize_t size) except NULL:
+        if self.size - self.pos < size:
+            raise ValueError('Truncated parse tree data')
+        self.pos += size
+        return <const char *>self.data + self.pos - size
+
+    cdef object new_string(self):
+        cdef Py_ssize_t size = self.read_count()
+        value = PyUnicode_DecodeUTF8(self.read_bytes(size), size, NULL)
+        self.strings.append(value)
+        return value
+
+    cdef object string_ref(self):
+        cdef uint64_t index = self.read_varint()
+        if index >= <uint64_t>len(self.strings):
+            raise ValueError('Invalid string reference at position %d' %
+                             self.pos)
+        return self.strings[index]
+
+    cdef object read_string(self):
+        cdef unsigned char kind = self.read_byte()
+        if kind == _STR:
+            return self.new_string()
+        if kind == _STR_REF:
+            return self.string_ref()
+        raise ValueError('Expected a string at position %d' % (self.pos - 1))
+
+    cdef double read_float(self) except? -1:
+        cdef const unsigned char *data = <const unsigned char *>(
+            self.read_bytes(8))
+        cdef uint64_t bits = 0
+        cdef double value
+        cdef int i
+        for i in range(8):
+            bits |= (<uint64_t>data[i]) << (8 * i)
+        memcpy(&value, &bits, 8)
+        return value
+
+    cdef object read_text(self):
+        cdef Py_ssize_t size = self.read_count()
+        return PyUnicode_DecodeUTF8(self.read_bytes(size), size, NULL)
+
+    cdef _ReadClass read_class(self):
+        cdef Py_ssize_t size = self.read_count()
+        cdef Py_ssize_t count
+        cdef _ReadClass info
+        definition = PyBytes_FromStringAndSize(self.read_bytes(size), size)
+        info = _read_definitions.get(definition)
+        if info is not None:
+            self.classes.append(info)
+            return info
+
+        self.pos -= size
+        name = self.read_text()
+        klass = get_node_class(name)
+        if klass is None:
+            raise ValueError('Unknown node class %s' % name)
+        class_info = _get_class_info(klass)
+        attrs = class_info.attrs
+        count = self.read_count()
+        if count > _MAX_FIELDS:
+            raise ValueError('Too many attributes for %s' % name)
+        written = tuple([self.read_text() for _ in range(count)])
+        positions = None
+        if written != attrs:
+            indexes = dict((attr, i) for i, attr in enumerate(attrs))
+            for attr in written:
+                if attr not in indexes:
+                    raise ValueError('%s has no attribute %s' %
+                                     (klass.__name__, attr))
+            positions = tuple([indexes[attr] for attr in written])
+        info = _ReadClass()
+        info.count = count
+        info.positions = positions
+        info.klass = klass
+        info.info = class_info
+        if positions is None:
+            _read_definitions[definition] = info
+        self.classes.append(info)
+        return info
+
+    cdef object load_node(self, _Frame *frame, list values):
+        cdef _ReadClass read_class = <_ReadClass>frame.info
+        cdef _ClassInfo info = read_class.info
+        cdef Py_ssize_t size = len(info.attrs)
+        cdef Py_ssize_t i
+        cdef Py_ssize_t position
+        cdef Py_ssize_t n = frame.start
+        cdef list full
+        cdef char *address
+
+        if info.members != NULL:
+            node = _new(read_class.klass)
+            address = <char *><PyObject *>node
+            for i in range(size):
+                PyMember_SetOne(address, info.members[i], None)
+        else:
+            full = [None] * size
+        for i in range(read_class.count):
+            if frame.mask & ((<uint64_t>1) << i):
+                position = (i if read_class.positions is None
+                            else <Py_ssize_t>read_class.positions[i])
+                if info.members != NULL:
+                    PyMember_SetOne(address, info.members[position],
+                                    values[n])
+                else:
+                    full[position] = values[n]
+                n += 1
+        if info.members != NULL:
+            return node
+        return info.load(full)
+
+    cdef object read(self):
+        cdef list values = []
+        cdef _Frame *frame
+        cdef unsigned char kind
+        cdef uint64_t number
+        cdef Py_ssize_t count
+        cdef Py_ssize_t i
+        cdef _ReadClass info
+
+        while True:
+            # Push the next value, or the frame of a container with items.
+            kind = self.read_byte()
+            if kind >= _SMALL_NODE or kind == _NODE or kind == _CLASS:
+                if kind == _CLASS:
+                    info = self.read_class()
+                else:
+                    number = (kind - _SMALL_NODE if kind >= _SMALL_NODE
+                              else self.read_varint())
+                    if number >= <uint64_t>len(self.classes):
+                        raise ValueError('Invalid node tag at position %d' %
+                                         self.pos)
+                    info = self.classes[number]
+                frame = self.push_frame(_IN_NODE)
+                frame.start = len(values)
+                frame.info = <PyObject *>info
+                frame.mask = self.read_varint()
+                count = info.count
+                if count < 64 and frame.mask >> count:
+                    raise ValueError('Invalid node mask at position %d' %
+                                     self.pos)
+                frame.count = 0
+                for i in range(count):
+                    if frame.mask & ((<uint64_t>1) << i):
+                        frame.count += 1
+            elif kind == _STR:
+                values.append(self.new_string())
+            elif kind == _STR_REF:
+                values.append(self.string_ref())
+            elif kind == _INT:
+                number = self.read_varint()
+                values.append(<int64_t>(number >> 1) ^
+                              -<int64_t>(number & 1))
+            elif kind == _NONE:
+                values.append(None)
+            elif kind == _FALSE:
+                values.append(False)
+            elif kind == _TRUE:
+                values.append(True)
+            elif kind == _LIST or kind == _DICT:
+                frame = self.push_frame(_IN_LIST if kind == _LIST
+                                        else _IN_DICT)
+                frame.start = len(values)
+                frame.count = self.read_count()
+                if kind == _DICT:
+                    frame.count *= 2
+            elif kind == _BIG_INT:
+                values.append(int(self.read_string()))
+            elif kind == _FLOAT:
+                values.append(self.read_float())
+            elif kind == _BYTES:
+                count = self.read_count()
+                values.append(PyBytes_FromStringAndSize(
+                    self.read_bytes(count), count))
+            else:
+                raise ValueError('Invalid type %d at position %d' %
+                                 (kind, self.pos - 1))
+
+            # Replace the items of the containers that are complete with
+            # the containers.
+            while self.depth:
+                frame = &self.frames[self.depth - 1]
+                if len(values) - frame.start < frame.count:
+                    break
+                self.depth -= 1
+                if frame.kind == _IN_NODE:
+                    value = self.load_node(frame, values)
+                elif frame.kind == _IN_LIST:
+                    value = PyList_GetSlice(values, frame.start, len(values))
+                else:
+                    value = {}
+                    for i in range(frame.start, len(values), 2):
+                        value[values[i]] = values[i + 1]
+                PyList_SetSlice(values, frame.start, len(values), NULL)
+                values.append(value)
+            if not self.depth:
+                return values[0]
+
+
+def loads(bytes data):
+    """
+    Deserialize a parse tree written by dumps. The nodes are instances of
+    the classes currently registered for the names they were written with.
+    """
+    cdef _Reader reader = _Reader()
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError('Not a serialized parse tree')
+    reader.data = data
+    reader.size = len(data)
+    reader.pos = len(_MAGIC)
+    if reader.read_byte() != _VERSION:
+        raise ValueError('Unsupported parse tree format version')
+    reader.strings = []
+    reader.classes = []
+    value = reader.read()
+    if reader.pos != reader.size:
+        raise ValueError('Extra data after the parse tree')
+    return value
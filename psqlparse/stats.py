@@ -0,0 +1,185 @@
+from collections import defaultdict
+import threading
+from timeit import default_timer
+
+import six
+
+from .nodes import Node
+from .nodes.value import Value
+
+
+PHASES = ('parse', 'decode', 'build')
+
+
+class ParseRecord(object):
+    """
+    Timings and counters of a single parse call.
+
+    seconds has the time spent in each phase: 'parse' in libpg_query,
+    'decode' turning its JSON output into dicts, or into nodes when they are
+    built while decoding, and 'build' building nodes from dicts. elapsed is
+    the time of the whole call. nodes maps node class names to how many were
+    built, or is None when not counted, and error is the PSqlParseError the
+    call raised, if any.
+    """
+
+    __slots__ = ('function', 'bytes', 'seconds', 'elapsed', 'nodes',
+                 'error', 'cached', '_start')
+
+    def __init__(self, function, size):
+        self.function = function
+        self.bytes = size
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.elapsed = 0.0
+        self.nodes = None
+        self.error = None
+        # None when there is no cache, else whether the query was in it.
+        self.cached = None
+        self._start = default_timer()
+
+    def as_dict(self):
+        return {
+            'function': self.function,
+            'bytes': self.bytes,
+            'seconds': dict(self.seconds),
+            'elapsed': self.elapsed,
+            'nodes': dict(self.nodes) if self.nodes is not None else None,
+            'error': str(self.error) if self.error is not None else None,
+            'cached': self.cached,
+        }
+
+
+# The slot descriptors of the attributes of each node class that can hold
+# nodes, read directly so the unset children of lazy nodes aren't built.
+_child_slots = {}
+
+
+def _get_child_slots(klass):
+    slots = _child_slots.get(klass)
+    if slots is None:
+        scalars = set(attr for attr, _ in klass._scalars)
+        slots = _child_slots[klass] = tuple(
+            getattr(base, attr)
+            for base in klass.__mro__
+            for attr in getattr(base, '__slots__', ())
+            if attr != '_obj' and attr not in scalars)
+    return slots
+
+
+def count_nodes(result):
+    """
+    Count the nodes in a parse result by class name. Children of lazy nodes
+    that were not built yet are not counted.
+    """
+    counts = defaultdict(int)
+    stack = [result]
+    while stack:
+        item = stack.pop()
+        if type(item) is list:
+            stack.extend(item)
+        elif isinstance(item, Node):
+            klass = type(item)
+            counts[klass.__name__] += 1
+            for slot in _get_child_slots(klass):
+                try:
+                    stack.append(slot.__get__(item))
+                except AttributeError:
+                    pass
+        elif isinstance(item, Value):
+            counts[type(item).__name__] += 1
+    return dict(counts)
+
+
+class ParseStats(object):
+    """
+    Thread-safe timings and counters of parse calls, to tell where the time
+    of parsing goes.
+
+    Install it with psqlparse.set_stats. Each call of parse, parse_dict,
+    parse_json and tables, and each query of parse_many and
+    parse_dict_many, then makes a ParseRecord, which is added to the totals
+    and passed to callback, if any, in the thread that made the call.
+
+    With count_nodes, the nodes in the results of parse and parse_many are
+    counted by class. That takes a walk over each tree in Python, which can
+    cost more than building it, so it is off by default.
+    """
+
+    def __init__(self, callback=None, count_nodes=False):
+        self.callback = callback
+        self.count_nodes = count_nodes
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = defaultdict(int)
+            self.errors = 0
+            self.cache_hits = 0
+            self.bytes = 0
+            self.seconds = dict.fromkeys(PHASES, 0.0)
+            self.elapsed = 0.0
+            self.nodes = defaultdict(int)
+
+    def start(self, function, size):
+        """
+        Return the ParseRecord of a call of function on size bytes.
+        """
+        return ParseRecord(function, size)
+
+    def finish(self, record, result=None, error=None):
+        """
+        Complete the record of a call that returned result or raised error,
+        and add it to the totals.
+        """
+        record.elapsed = default_timer() - record._start
+        record.error = error
+        if self.count_nodes and error is None and record.function in (
+                'parse', 'parse_many'):
+            record.nodes = count_nodes(result)
+
+        with self._lock:
+            self.calls[record.function] += 1
+            if error is not None:
+                self.errors += 1
+            if record.cached:
+                self.cache_hits += 1
+            self.bytes += record.bytes
+            for phase, seconds in six.iteritems(record.seconds):
+                self.seconds[phase] += seconds
+            self.elapsed += record.elapsed
+            if record.nodes:
+                for name, count in six.iteritems(record.nodes):
+                    self.nodes[name] += count
+
+        if self.callback is not None:
+            self.callback(record)
+
+    def snapshot(self):
+        """
+        Return a copy of the totals, as a dict.
+        """
+        with self._lock:
+            return {
+                'calls': dict(self.calls),
+                'errors': self.errors,
+                'cache_hits': self.cache_hits,
+                'bytes': self.bytes,
+                'seconds': dict(self.seconds),
+                'elapsed': self.elapsed,
+                'nodes': dict(self.nodes),
+            }
+
+    def metrics(self, prefix='psqlparse'):
+        """
+        Return the totals as a flat dict of dotted metric names to numbers,
+        like {'psqlparse.seconds.parse': 0.25}, to feed a metrics system.
+        """
+        metrics = {}
+        for name, value in six.iteritems(self.snapshot()):
+            if isinstance(value, dict):
+                for key, item in six.iteritems(value):
+                    metrics['%s.%s.%s' % (prefix, name, key)] = item
+            else:
+                metrics['%s.%s' % (prefix, name)] = value
+        return metrics
@@ -0,0 +1,71 @@
+import six
+
+from .exceptions import PSqlParseError
+from .parser import parse
+from .scanner import scan, skip_copy_data
+
+
+def _read(stream, size):
+    chunk = stream.read(size)
+    if isinstance(chunk, six.text_type):
+        chunk = chunk.encode('utf8')
+    return chunk
+
+
+def _iter_statements(stream, chunk_size):
+    """
+    Yield the offset and the text of each statement read from stream,
+    keeping in memory only the statement being read and the next chunk.
+    """
+    buf = b''
+    offset = 0
+    pos = 0
+    copy_data = final = False
+    while not final:
+        # Statements that don't fit in a chunk double the size of the next
+        # read, so they are scanned O(1) times on average.
+        chunk = _read(stream, max(chunk_size, len(buf) - pos))
+        final = not chunk
+        buf = buf[pos:] + chunk
+        offset += pos
+        pos = 0
+        while True:
+            if copy_data:
+                pos, done = skip_copy_data(buf, pos, final)
+                if not done:
+                    break
+            statements, pos, copy_data = scan(buf, pos, final)
+            for start, end in statements:
+                yield offset + start, buf[start:end]
+            if not copy_data:
+                break
+
+
+def iter_parse(source, chunk_size=1024 * 1024):
+    """
+    Parse a SQL script, like a pg_dump output, one statement at a time.
+
+    source is a path or a file object, in text or binary mode. It is read
+    chunk_size bytes or characters at a time, and only the statement being
+    parsed is kept in memory, so scripts of any size can be parsed.
+
+    Yield an (offset, length, statement) tuple for each statement, where
+    offset and length locate the statement in the UTF-8 encoded script.
+    The locations in the nodes are relative to the statement. Like in
+    parse_many, statements that fail to parse give a PSqlParseError
+    instance. psql meta-commands and the data of COPY FROM STDIN
+    statements are skipped.
+    """
+    if isinstance(source, six.string_types):
+        with open(source, 'rb') as stream:
+            for item in iter_parse(stream, chunk_size):
+                yield item
+        return
+
+    for offset, text in _iter_statements(source, chunk_size):
+        try:
+            statements = parse(text)
+        except PSqlParseError as e:
+            statements = [e]
+        for statement in statements:
+            yield offset, len(text), statement
@@ -0,0 +1,2 @@
+# Read by setup.py, which can't import the package before it is built.
+__version__ = '1.0-rc7'
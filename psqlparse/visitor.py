@@ -0,0 +1,157 @@
+from .nodes import Node
+from .nodes.value import Value
+
+
+# Returned by Visitor handlers to not visit the children of a node, or to
+# end the walk.
+SKIP = object()
+STOP = object()
+
+_REMOVED = object()
+
+
+class Visitor(object):
+    """
+    Walks the nodes of a parse tree, parent before children and children
+    in the order their classes declare them, calling visit_<ClassName>
+    with each node.
+
+    A handler for a base class, like visit_Expr or visit_Node, is called
+    for the nodes of its subclasses that have no handler of their own, and
+    generic_visit for the rest. Handlers return None to go on into the
+    children of the node, SKIP to go past them, or STOP to end the walk.
+
+    The handler for each node class is looked up once per visitor class,
+    and the tree is walked with an explicit stack, so trees of any depth
+    can be visited. Plain dicts, kept for the nodes without a class, are
+    not walked into.
+    """
+
+    def generic_visit(self, node):
+        return None
+
+    @classmethod
+    def _dispatch_table(cls):
+        # Kept in the class itself, not inherited from a base visitor.
+        table = cls.__dict__.get('_handlers')
+        if table is None:
+            table = {}
+            setattr(cls, '_handlers', table)
+        return table
+
+    @classmethod
+    def _dispatch(cls, node_class):
+        """
+        Return the handler for node_class and the attributes of its
+        children, reversed to be pushed on the stack, or None if it is not a
+        node class.
+        """
+        entry = None
+        if issubclass(node_class, (Node, Value)):
+            handler = cls.generic_visit
+            for klass in node_class.__mro__:
+                method = getattr(cls, 'visit_' + klass.__name__, None)
+                if method is not None:
+                    handler = method
+                    break
+            attrs = getattr(node_class, '_child_attrs', ())
+            entry = handler, attrs[::-1]
+        cls._dispatch_table()[node_class] = entry
+        return entry
+
+    def visit(self, tree):
+        """
+        Visit the nodes in tree, which can be a node or a list of them, like
+        the result of psqlparse.parse. Return False if a handler stopped the
+        walk, True otherwise.
+        """
+        table = self._dispatch_table()
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            try:
+                entry = table[type(node)]
+            except KeyError:
+                entry = self._dispatch(type(node))
+            if entry is None:
+                continue
+            action = entry[0](self, node)
+            if action is None:
+                for attr in entry[1]:
+                    child = getattr(node, attr)
+                    if child is not None:
+                        stack.append(child)
+            elif action is STOP:
+                return False
+        return True
+
+
+class Transformer(Visitor):
+    """
+    Rewrites a parse tree, replacing each node with what its handler
+    returns.
+
+    Handlers are looked up like in Visitor, but the children of a node are
+    transformed before it, so handlers see the already transformed
+    children. A handler returns the node itself to keep it, another node to
+    replace it or None to remove it: nodes in lists are deleted, and other
+    children are set to None. generic_visit keeps the node.
+    """
+
+    def generic_visit(self, node):
+        return node
+
+    def visit(self, tree):
+        """
+        Transform the nodes in tree in place and return the new tree.
+        """
+        table = self._dispatch_table()
+        root = [tree]
+        stack = [(root, 0, tree)]
+        # Found parent first, with the children pushed in order so they are
+        # found last to first. Transforming them in the reverse order then
+        # goes through them in order, each node after its children.
+        found = []
+        while stack:
+            container, key, node = stack.pop()
+            if isinstance(node, list):
+                # Removed items are taken out of the list once all of them
+                # are transformed, so the indexes stay valid until then.
+                found.append((container, key, node, None))
+                stack.extend((node, index, item)
+                             for index, item in enumerate(node))
+                continue
+            try:
+                entry = table[type(node)]
+            except KeyError:
+                entry = self._dispatch(type(node))
+            if entry is None:
+                continue
+            found.append((container, key, node, entry[0]))
+            for attr in reversed(entry[1]):
+                child = getattr(node, attr)
+                if child is not None:
+                    stack.append((node, attr, child))
+
+        removed = set()
+        for container, key, node, node_handler in reversed(found):
+            if node_handler is None:
+                if id(node) in removed:
+                    node[:] = [item for item in node if item is not _REMOVED]
+                continue
+            new_node = node_handler(self, node)
+            if new_node is node:
+                continue
+            if not isinstance(container, list):
+                setattr(container, key, new_node)
+            elif new_node is None:
+                container[key] = _REMOVED
+                removed.add(id(container))
+            else:
+                container[key] = new_node
+        if id(root) in removed:
+            return None
+        return root[0]
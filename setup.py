@@ -1,17 +1,28 @@
 from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext
 import os.path
+import re
 import subprocess
 import sys
 
 
 libpg_query = os.path.join('.', 'libpg_query')
 
+with open(os.path.join('psqlparse', 'version.py')) as version_file:
+    version = re.search(r"__version__ = '(.*)'", version_file.read()).group(1)
+
 
 class PSqlParseBuildExt(build_ext):
 
     def run(self):
-        return_code = subprocess.call(['make', '-C', libpg_query, 'build'])
+        # Without DEBUG, pg_query_parse redirects the stderr of the process
+        # to a pipe while it parses, which isn't safe when queries are
+        # parsed from several threads without the GIL. Nothing else in
+        # libpg_query depends on it. make doesn't track flags, so an
+        # existing libpg_query.a needs a make clean first.
+        cppflags = (os.environ.get('CPPFLAGS', '') + ' -DDEBUG').strip()
+        return_code = subprocess.call(['make', '-C', libpg_query, 'build',
+                                       'CPPFLAGS=' + cppflags])
         if return_code:
             sys.stderr.write('''
 An error occurred during extension building.
@@ -32,7 +43,13 @@ extensions = [
               ['psqlparse/parser' + ext],
               libraries=libraries,
               include_dirs=[libpg_query],
-              library_dirs=[libpg_query])
+              library_dirs=[libpg_query]),
+    Extension('psqlparse.decoder',
+              ['psqlparse/decoder' + ext]),
+    Extension('psqlparse.scanner',
+              ['psqlparse/scanner' + ext]),
+    Extension('psqlparse.serializer',
+              ['psqlparse/serializer' + ext]),
 ]
 
 if USE_CYTHON:
@@ -40,7 +57,7 @@ if USE_CYTHON:
     extensions = cythonize(extensions)
 
 setup(name='psqlparse',
-      version='1.0-rc7',
+      version=version,
       url='https://github.com/alculquicondor/psqlparse',
       author='Aldo Culquicondor',
       author_email='aldo@amigocloud.com',
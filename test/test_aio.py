@@ -0,0 +1,153 @@
+import sys
+import unittest
+
+from psqlparse import nodes, parse
+from psqlparse.exceptions import PSqlParseError
+
+if sys.version_info >= (3, 5, 2):
+    import asyncio
+    from psqlparse import aio
+
+
+class AsyncQueries(object):
+    # An async iterable, written without the async syntax of Python 3.5.
+
+    def __init__(self, loop, queries):
+        self.loop = loop
+        self.queries = iter(queries)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        future = self.loop.create_future()
+        try:
+            future.set_result(next(self.queries))
+        except StopIteration:
+            future.set_exception(StopAsyncIteration())
+        return future
+
+
+@unittest.skipIf(sys.version_info < (3, 5, 2), 'requires Python 3.5.2')
+class ParsePoolTest(unittest.TestCase):
+
+    queries = ["SELECT * FROM table_one", "SELECT * FRO table_two",
+               "DELETE FROM table_three", "SELECT 1; SELECT 2"]
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.pool = aio.ParsePool(max_workers=2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def collect(self, results):
+        items = []
+        while True:
+            try:
+                items.append(self.run_async(results.__anext__()))
+            except StopAsyncIteration:
+                return items
+
+    def check(self, results, as_dict=False):
+        self.assertEqual(len(results), len(self.queries))
+        for query, result in zip(self.queries, results):
+            try:
+                expected = parse(query)
+            except PSqlParseError:
+                self.assertIsInstance(result, PSqlParseError)
+                continue
+            if as_dict:
+                self.assertEqual(list(result[0]), [type(expected[0]).__name__])
+            else:
+                self.assertEqual([stmt.tables() for stmt in result],
+                                 [stmt.tables() for stmt in expected])
+
+    def test_parse(self):
+        stmt = self.run_async(self.pool.parse(self.queries[0]))[0]
+        self.assertIsInstance(stmt, nodes.SelectStmt)
+        self.assertEqual(stmt.tables(), {'table_one'})
+        stmt = self.run_async(self.pool.parse(self.queries[0], lazy=True))[0]
+        self.assertNotIn('from_clause', stmt.__getstate__())
+        self.assertRaises(PSqlParseError, self.run_async,
+                          self.pool.parse(self.queries[1]))
+
+    def test_loop_not_blocked(self):
+        task = self.loop.create_task(self.pool.parse(
+            "SELECT " + ", ".join(["a + 1"] * 20000)))
+        ticks = []
+
+        def tick():
+            ticks.append(None)
+            if not task.done():
+                self.loop.call_soon(tick)
+
+        self.loop.call_soon(tick)
+        self.assertEqual(len(self.run_async(task)[0].target_list), 20000)
+        self.assertGreater(len(ticks), 1)
+
+    def test_parse_dict(self):
+        self.assertEqual(
+            list(self.run_async(self.pool.parse_dict(self.queries[0]))[0]),
+            ['SelectStmt'])
+
+    def test_queue_full(self):
+        pool = aio.ParsePool(max_workers=1, max_pending=1)
+        tasks = [self.loop.create_task(pool.parse(self.queries[0]))
+                 for _ in range(3)]
+        try:
+            results = self.run_async(
+                asyncio.gather(*tasks, return_exceptions=True))
+        finally:
+            pool.shutdown()
+        self.assertIsInstance(results[0][0], nodes.SelectStmt)
+        self.assertIsInstance(results[1][0], nodes.SelectStmt)
+        self.assertIsInstance(results[2], asyncio.QueueFull)
+
+    def test_parse_many(self):
+        self.check(self.collect(self.pool.parse_many(iter(self.queries))))
+        self.check(self.collect(self.pool.parse_dict_many(self.queries)),
+                   True)
+
+    def test_parse_many_async_iterable(self):
+        queries = AsyncQueries(self.loop, self.queries)
+        self.check(self.collect(self.pool.parse_many(queries)))
+
+    def test_parse_many_reads_ahead_a_window(self):
+        queries = iter(self.queries * 10)
+        results = self.pool.parse_many(queries)
+        self.run_async(results.__anext__())
+        # Two workers, and two more queries waiting, by default.
+        self.assertEqual(len(list(queries)), 40 - 4)
+        self.run_async(results.aclose())
+
+    def test_several_loops(self):
+        # More queries than workers, so they wait on the semaphore of each
+        # loop.
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                tasks = [loop.create_task(self.pool.parse(self.queries[0]))
+                         for _ in range(8)]
+                results = loop.run_until_complete(asyncio.gather(*tasks))
+                parsed = loop.run_until_complete(
+                    self.pool.parse_many(self.queries * 3).__anext__())
+            finally:
+                loop.close()
+            self.assertEqual([stmts[0].tables() for stmts in results],
+                             [{'table_one'}] * 8)
+            self.assertEqual(parsed[0].tables(), {'table_one'})
+
+    def test_default_pool(self):
+        aio.set_pool(self.pool)
+        try:
+            self.assertIs(aio.get_pool(), self.pool)
+            stmt = self.run_async(aio.parse(self.queries[0]))[0]
+            self.assertEqual(stmt.tables(), {'table_one'})
+            self.check(self.collect(aio.parse_many(self.queries)))
+        finally:
+            aio.set_pool(None)
@@ -0,0 +1,358 @@
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+import psqlparse
+from psqlparse import cache as cache_module, nodes
+from psqlparse.nodes import utils
+from psqlparse.cache import ParseCache, SqliteCache, FingerprintCache
+from psqlparse.exceptions import PSqlParseError
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ParseCache(max_entries=2)
+        cache.put(b'a', 'A', 1)
+        cache.put(b'b', 'B', 1)
+        self.assertEqual(cache.get(b'a'), 'A')
+        cache.put(b'c', 'C', 1)
+
+        self.assertNotIn(b'b', cache)
+        self.assertIn(b'a', cache)
+        self.assertIn(b'c', cache)
+        self.assertEqual(cache.stats(), {'entries': 2, 'size': 2, 'hits': 1,
+                                         'misses': 0, 'evictions': 1})
+
+    def test_max_bytes(self):
+        cache = ParseCache(max_entries=None, max_bytes=10)
+        cache.put(b'a', 'A', 6)
+        cache.put(b'b', 'B', 6)
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(b'a'))
+        self.assertEqual(cache.get(b'b'), 'B')
+        self.assertEqual(cache.size, 6)
+
+    def test_replace(self):
+        cache = ParseCache()
+        cache.put(b'a', 'A', 6)
+        cache.put(b'a', 'AA', 4)
+        self.assertEqual(cache.get(b'a'), 'AA')
+        self.assertEqual(cache.size, 4)
+
+    def test_concurrent_access(self):
+        cache = ParseCache(max_entries=10)
+
+        def worker(offset):
+            for i in range(1000):
+                key = str((i + offset) % 20).encode('utf8')
+                if cache.get(key) is None:
+                    cache.put(key, i, 1)
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cache), 10)
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(cache.hits + cache.misses, 4000)
+
+
+class CachedParseTest(unittest.TestCase):
+
+    query = "SELECT * FROM my_table WHERE id = 5"
+
+    def setUp(self):
+        self.cache = ParseCache(max_entries=10)
+        psqlparse.set_cache(self.cache)
+
+    def tearDown(self):
+        psqlparse.set_cache(None)
+
+    def test_parse_dict(self):
+        first = psqlparse.parse_dict(self.query)
+        second = psqlparse.parse_dict(self.query)
+        self.assertEqual(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_parse(self):
+        # The JSON parse tree is kept until the first hit, which replaces it
+        # with the nodes written by dumps.
+        key = self.query.encode('utf8')
+        results = []
+        for _ in range(3):
+            results.append(psqlparse.parse(self.query))
+            self.assertEqual(self.cache.get(key + b'\0')[:3] == b'PQT',
+                             len(results) > 1)
+        self.assertIsNot(results[1][0], results[2][0])
+        for result in results[1:]:
+            self.assertEqual(psqlparse.dumps(result),
+                             psqlparse.dumps(results[0]))
+
+        # The nodes are kept apart from the JSON parse tree.
+        self.assertNotIn(key, self.cache)
+        psqlparse.parse_dict(self.query)
+        self.assertIn(key, self.cache)
+
+    def test_nodes_key_of_other_query(self):
+        # The key of the nodes of a query is the one of the JSON parse tree
+        # of the query followed by NUL, which parses the same.
+        query = b'SELECT * FROM my_table'
+        psqlparse.parse(query)
+        psqlparse.parse(query)
+        self.assertEqual(psqlparse.parse_json(query + b'\0'),
+                         psqlparse.parse_json(query))
+        psqlparse.parse_dict(query + b'\0')
+        self.assertEqual(psqlparse.parse(query)[0].tables(), {'my_table'})
+
+    def test_self_built_nodes(self):
+        # Nodes of classes that build themselves can share values, which
+        # dumps refuses, so their parse trees stay JSON.
+        class RangeVar(nodes.RangeVar):
+            __slots__ = ('me',)
+
+            def __init__(self, obj):
+                super(RangeVar, self).__init__(obj)
+                self.me = self
+
+        utils.register_node_class(RangeVar)
+        try:
+            for _ in range(3):
+                range_var = psqlparse.parse(self.query)[0].from_clause[0]
+                self.assertIs(range_var.me, range_var)
+            value = self.cache.get(self.query.encode('utf8') + b'\0')
+        finally:
+            utils.register_node_class(nodes.RangeVar)
+        self.assertFalse(value.startswith(b'PQT'))
+
+    def test_returns_copies(self):
+        psqlparse.parse_dict(self.query)[0]['SelectStmt'].clear()
+        psqlparse.parse(self.query)[0].from_clause.pop()
+
+        stmt = psqlparse.parse(self.query)[0]
+        self.assertIsInstance(stmt, nodes.SelectStmt)
+        self.assertEqual(stmt.tables(), {'my_table'})
+
+    def test_tables(self):
+        for _ in range(2):
+            self.assertEqual(psqlparse.tables(self.query), {'my_table'})
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(psqlparse.parse(self.query)[0].tables(),
+                         {'my_table'})
+
+    def test_keyed_on_encoded_query(self):
+        psqlparse.parse(self.query)
+        psqlparse.parse(self.query.encode('utf8'))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            self.assertRaises(PSqlParseError, psqlparse.parse,
+                              "SELECT * FRO my_table")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_deep_query(self):
+        query = " UNION ".join("SELECT %d" % i for i in range(5000))
+        for _ in range(2):
+            stmt = psqlparse.parse(query)[0]
+            for _ in range(4999):
+                stmt = stmt.larg
+            self.assertIsNone(stmt.larg)
+        self.assertEqual(self.cache.hits, 1)
+
+
+def _parse_with_cache(path, offset):
+    psqlparse.set_cache(SqliteCache(path, max_entries=30))
+    for i in range(50):
+        psqlparse.parse("SELECT %d FROM my_table" % ((i + offset) % 40))
+
+
+class SqliteCacheTest(unittest.TestCase):
+
+    query = "SELECT * FROM my_table WHERE id = 5"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache.db')
+
+    def tearDown(self):
+        psqlparse.set_cache(None)
+        psqlparse.set_stats(None)
+        shutil.rmtree(self.directory)
+
+    def test_persistent(self):
+        cache = SqliteCache(self.path)
+        psqlparse.set_cache(cache)
+        expected = psqlparse.parse_dict(self.query)
+        psqlparse.parse(self.query)
+        cache.close()
+
+        # A new cache on the same file, as after a restart, skips
+        # libpg_query.
+        records = []
+        cache = SqliteCache(self.path)
+        psqlparse.set_cache(cache)
+        psqlparse.set_stats(psqlparse.ParseStats(callback=records.append))
+        self.assertEqual(psqlparse.parse_dict(self.query), expected)
+        self.assertEqual(psqlparse.parse(self.query)[0].tables(),
+                         {'my_table'})
+        self.assertEqual([record.cached for record in records],
+                         [True, True])
+        self.assertEqual(records[0].seconds['parse'], 0)
+        self.assertEqual(cache.stats()['misses'], 0)
+        cache.close()
+
+    def test_eviction(self):
+        cache = SqliteCache(self.path, max_entries=2, max_bytes=10)
+        cache.put(b'a', b'A', 4)
+        cache.put(b'b', b'B', 4)
+        self.assertEqual(cache.get(b'a'), b'A')
+        cache.put(b'c', b'C', 4)
+        self.assertNotIn(b'b', cache)
+        self.assertIn(b'a', cache)
+        cache.put(b'a', b'AA', 8)
+        self.assertEqual(cache.stats(), {'entries': 1, 'size': 8, 'hits': 1,
+                                         'misses': 0, 'evictions': 2})
+        self.assertEqual(cache.get(b'a'), b'AA')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_version(self):
+        old = SqliteCache(self.path, version='9.4')
+        old.put(b'a', b'A', 1)
+        cache = SqliteCache(self.path)
+        self.assertIsNone(cache.get(b'a'))
+        cache.put(b'a', b'B', 1)
+        self.assertEqual(old.get(b'a'), b'A')
+        self.assertEqual(cache.get(b'a'), b'B')
+
+    def test_default_version(self):
+        cache = SqliteCache(self.path)
+        self.assertEqual(cache.version, '%s/%s' % (psqlparse.parser.PG_VERSION,
+                                                   psqlparse.__version__))
+
+    def test_flush_hits(self):
+        cache = SqliteCache(self.path, flush_hits=2)
+        for key in (b'a', b'b', b'c'):
+            cache.put(key, key.upper(), 1)
+        put = self._used_times()
+        time.sleep(0.01)
+        # Two hits are written right away, the next one on close.
+        cache.get(b'a')
+        cache.get(b'b')
+        self.assertEqual(cache._used, set())
+        used = self._used_times()
+        self.assertGreater(used[b'A'], put[b'A'])
+        self.assertGreater(used[b'B'], put[b'B'])
+        self.assertEqual(used[b'C'], put[b'C'])
+        cache.get(b'c')
+        cache.close()
+        self.assertGreater(self._used_times()[b'C'], put[b'C'])
+
+    def _used_times(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            return dict((bytes(value), used) for value, used in
+                        connection.execute('SELECT value, used FROM entries'))
+        finally:
+            connection.close()
+
+    def test_processes(self):
+        processes = [multiprocessing.Process(target=_parse_with_cache,
+                                             args=(self.path, i * 10))
+                     for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        cache = SqliteCache(self.path)
+        self.assertEqual(len(cache), 30)
+        self.assertEqual(
+            cache.stats()['size'],
+            sum(len(key) + len(cache.get(key))
+                for key in (("SELECT %d FROM my_table\0" % i).encode('utf8')
+                            for i in range(40)) if key in cache))
+        psqlparse.set_cache(cache)
+        self.assertEqual(psqlparse.parse("SELECT 39 FROM my_table")[0]
+                         .tables(), {'my_table'})
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork(self):
+        cache = SqliteCache(self.path)
+        cache.put(b'a', b'A', 1)
+        inherited = cache._connection
+        pid = os.fork()
+        if pid == 0:
+            # The child uses a connection of its own, and doesn't close the
+            # one of its parent when it is done with the cache.
+            ok = False
+            try:
+                cache.put(b'b', cache.get(b'a') + b'B', 2)
+                cache.close()
+                ok = (cache_module._inherited_connections[-1] is
+                      inherited)
+            finally:
+                os._exit(0 if ok else 1)
+        self.assertEqual(os.waitpid(pid, 0)[1], 0)
+        self.assertIs(cache._connection, inherited)
+        self.assertEqual(cache.get(b'b'), b'AB')
+        cache.put(b'c', b'C', 1)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(inherited.execute(
+            'PRAGMA integrity_check').fetchone()[0], 'ok')
+        cache.close()
+
+
+class FingerprintTest(unittest.TestCase):
+
+    def test_constants_ignored(self):
+        self.assertEqual(
+            psqlparse.fingerprint("SELECT * FROM my_table WHERE id = 1"),
+            psqlparse.fingerprint("SELECT * FROM my_table WHERE id = 2"))
+
+    def test_tables_not_ignored(self):
+        self.assertNotEqual(
+            psqlparse.fingerprint("SELECT * FROM table_one WHERE id = 1"),
+            psqlparse.fingerprint("SELECT * FROM table_two WHERE id = 1"))
+
+    def test_syntax_error(self):
+        self.assertRaises(PSqlParseError, psqlparse.fingerprint,
+                          "SELECT * FRO my_table")
+
+
+class FingerprintCacheTest(unittest.TestCase):
+
+    def test_shared_analysis(self):
+        calls = []
+
+        def tables(stmts):
+            calls.append(stmts)
+            return frozenset(stmts[0].tables())
+
+        cache = FingerprintCache(tables)
+        self.assertEqual(cache("SELECT * FROM my_table WHERE id = 1"),
+                         {'my_table'})
+        self.assertEqual(cache("SELECT * FROM my_table WHERE id = 2"),
+                         {'my_table'})
+        self.assertEqual(cache("SELECT * FROM other_table WHERE id = 2"),
+                         {'other_table'})
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_none_result_cached(self):
+        calls = []
+        cache = FingerprintCache(calls.append)
+        cache("SELECT 1")
+        cache("SELECT 2")
+        self.assertEqual(len(calls), 1)
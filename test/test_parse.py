@@ -1,8 +1,24 @@
+import gc
+import json
+import mmap
+import os
+import pickle
+import tempfile
+import threading
 import unittest
 
-from psqlparse import parse
+from psqlparse import (parse, parse_dict, parse_json, parse_many,
+                       parse_dict_many, parse_parallel, tables, normalize,
+                       normalize_many, fingerprint, set_cache, ParseCache)
 from psqlparse.exceptions import PSqlParseError
 from psqlparse import nodes
+from psqlparse.nodes import utils
+from psqlparse.nodes.utils import build_from_obj
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
 
 
 class SelectQueriesTest(unittest.TestCase):
@@ -355,6 +371,14 @@ class InsertQueriesTest(unittest.TestCase):
         self.assertIsInstance(stmt.returning_list[1], nodes.ResTarget)
         self.assertEqual(str(stmt.returning_list[1].val.fields[0]), 'date')
 
+    def test_insert_default_values(self):
+        query = "INSERT INTO my_table DEFAULT VALUES"
+        stmt = parse(query).pop()
+
+        self.assertIsInstance(stmt, nodes.InsertStmt)
+        self.assertIsNone(stmt.select_stmt)
+        self.assertEqual(stmt.tables(), {'my_table'})
+
 
 class UpdateQueriesTest(unittest.TestCase):
 
@@ -539,3 +563,599 @@ class TablesTest(unittest.TestCase):
         stmt = parse(query).pop()
         self.assertIsInstance(stmt, nodes.SelectStmt)
         self.assertEqual(stmt.tables(), {'table_one'})
+
+
+class ThreadedParseTest(unittest.TestCase):
+
+    def test_parse_from_many_threads(self):
+        queries = ['SELECT * FROM table_%d WHERE id = %d' % (i, i)
+                   for i in range(200)]
+        results = [None] * len(queries)
+
+        def worker(offset):
+            for i in range(offset, len(queries), 4):
+                results[i] = parse(queries[i]).pop().tables()
+
+        threads = [threading.Thread(target=worker, args=(i,))
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results,
+                         [{'table_%d' % i} for i in range(len(queries))])
+
+    def test_stderr_kept(self):
+        # libpg_query points stderr at a pipe while it parses, which must
+        # not leak out of concurrent calls.
+        stderr = os.fstat(2)
+
+        def worker():
+            for _ in range(500):
+                fingerprint("SELECT 1")
+                parse_json("SELECT 1")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual((os.fstat(2).st_dev, os.fstat(2).st_ino),
+                         (stderr.st_dev, stderr.st_ino))
+
+
+class BatchParseTest(unittest.TestCase):
+
+    queries = ['SELECT * FROM table_one',
+               'SELECT * FRO table_two',
+               'DELETE FROM table_three; SELECT 1']
+
+    def check_results(self, results):
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0][0], nodes.SelectStmt)
+        self.assertIsInstance(results[1], PSqlParseError)
+        self.assertEqual(results[1].cursorpos, 10)
+        self.assertEqual([type(stmt) for stmt in results[2]],
+                         [nodes.DeleteStmt, nodes.SelectStmt])
+
+    def test_parse_many(self):
+        self.check_results(parse_many(iter(self.queries)))
+
+    def test_parse_many_workers(self):
+        self.check_results(parse_many(self.queries, workers=2))
+
+    def test_parse_dict_many(self):
+        results = parse_dict_many(self.queries, workers=8)
+        self.assertEqual(results[0], parse_dict(self.queries[0]))
+        self.assertIsInstance(results[1], PSqlParseError)
+        self.assertEqual(results[2], parse_dict(self.queries[2]))
+
+    def test_empty(self):
+        self.assertEqual(parse_many([], workers=4), [])
+
+
+class BufferInputTest(unittest.TestCase):
+
+    query = u"SELECT * FROM my_table WHERE name = 'thr\xe9e'"
+
+    def test_bytes_like(self):
+        expected = parse_dict(self.query)
+        encoded = self.query.encode('utf8')
+        for query in (encoded, bytearray(encoded), memoryview(encoded),
+                      memoryview(encoded + b'\x00'),
+                      memoryview(b'SELECT 1; ' + encoded + b'; ')[10:-2]):
+            self.assertEqual(parse_dict(query), expected)
+            self.assertEqual(tables(query), {'my_table'})
+        self.assertEqual(parse_dict(memoryview(b'')), [])
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b'SELECT 1;\n' + self.query.encode('utf8') + b';\n')
+            f.flush()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            results = parse_many([view[:8], view[10:-2]], workers=2)
+            self.assertEqual(parse(view)[1].tables(), {'my_table'})
+            view.release()
+            mapped.close()
+        self.assertEqual(results[1][0].where_clause.rexpr.val.str,
+                         u'thr\xe9e')
+
+    def test_cache_key(self):
+        cache = ParseCache()
+        set_cache(cache)
+        try:
+            parse(self.query)
+            parse(memoryview(self.query.encode('utf8')))
+            parse(bytearray(b'SELECT 1'))
+            parse('SELECT 1')
+        finally:
+            set_cache(None)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_error_position(self):
+        with self.assertRaises(PSqlParseError) as context:
+            parse(memoryview(b'SELECT * FRO my_table; SELECT 1')[:21])
+        self.assertEqual(context.exception.cursorpos, 10)
+
+
+def _statement_tables(statements):
+    # Called in the workers of parse_parallel, so it has to be picklable.
+    return [statement.tables() for statement in statements]
+
+
+class ParallelParseTest(unittest.TestCase):
+
+    def test_parse_parallel(self):
+        queries = ['SELECT * FROM table_%d' % i for i in range(50)]
+        queries[7] = 'SELECT * FRO table_7'
+        results = parse_parallel(queries, processes=2, chunksize=8)
+        self.assertEqual(len(results), len(queries))
+        self.assertIsInstance(results[7], PSqlParseError)
+        self.assertEqual(results[7].cursorpos, 10)
+        for i, result in enumerate(results):
+            if i != 7:
+                self.assertEqual(result[0].tables(), {'table_%d' % i})
+
+    def test_parse_parallel_func(self):
+        queries = ['SELECT * FROM table_one', 'SELECT * FRO table_two',
+                   'DELETE FROM table_three']
+        results = parse_parallel(queries, processes=2, chunksize=2,
+                                 func=_statement_tables)
+        self.assertEqual(results[0], [{'table_one'}])
+        self.assertIsInstance(results[1], PSqlParseError)
+        self.assertEqual(results[2], [{'table_three'}])
+        self.assertEqual(parse_parallel(queries[:1], processes=1,
+                                        as_dict=True, func=len), [1])
+
+    def test_parse_parallel_as_dict(self):
+        queries = ['SELECT 1', 'DELETE FROM table_one']
+        self.assertEqual(parse_parallel(queries, processes=2, as_dict=True),
+                         parse_dict_many(queries))
+
+
+class TablesFunctionTest(unittest.TestCase):
+
+    queries = [
+        "SELECT * FROM my_table",
+        "SELECT * FROM my_schema.table_one t1 "
+        "JOIN table_two t2 ON t1.id = t2.id "
+        "LEFT JOIN (SELECT * FROM table_three) t3 ON t3.id = t1.id "
+        "WHERE t1.id IN (SELECT id FROM table_four) "
+        "AND EXISTS (SELECT 1 FROM table_five)",
+        "WITH cte AS (SELECT * FROM table_one) "
+        "SELECT count(*), (SELECT max(id) FROM table_two) FROM cte",
+        "SELECT 1 UNION SELECT * FROM table_one",
+        "SELECT CASE WHEN a THEN (SELECT 1 FROM table_one) END",
+        "INSERT INTO table_one (id) SELECT id FROM table_two",
+        "UPDATE table_one SET a = 1 FROM table_two "
+        "WHERE table_two.id = table_one.id",
+        "DELETE FROM table_one USING table_two "
+        "WHERE table_two.id IN (SELECT id FROM table_three)",
+        "SELECT '{\"[\\', \"my\"\"col\\\" FROM \"Table\\\"",
+        "SELECT 1",
+    ]
+
+    def test_same_as_statement_tables(self):
+        for query in self.queries:
+            self.assertEqual(tables(query), parse(query)[0].tables(), query)
+
+    def test_multiple_statements(self):
+        self.assertEqual(tables("SELECT * FROM table_one; "
+                                "CREATE TABLE table_two (id int); "
+                                "DELETE FROM table_three"),
+                         {'table_one', 'table_three'})
+
+    def test_syntax_error(self):
+        self.assertRaises(PSqlParseError, tables, "SELECT * FRO my_table")
+
+    def test_overridden_tables(self):
+        class RangeFunction(nodes.RangeFunction):
+            def tables(self):
+                # Searches the arguments too, through Node.tables.
+                names = super(RangeFunction, self).tables()
+                return names | set(
+                    'fn:' + item[0].funcname[0].val
+                    for item in self.functions)
+
+        query = ("SELECT * FROM t, generate_series(1, (SELECT max(id) "
+                 "FROM u)) UNION SELECT * FROM generate_series(1, 2)")
+        expected = {'t', 'u', 'fn:generate_series'}
+        utils.register_node_class(RangeFunction)
+        try:
+            stmt = parse(query)[0]
+            self.assertEqual(stmt.rarg.from_clause[0].tables(),
+                             {'fn:generate_series'})
+            self.assertEqual(stmt.tables(), expected)
+            self.assertEqual(tables(query), expected)
+            self.assertEqual(parse(query, lazy=True)[0].tables(), expected)
+        finally:
+            utils.register_node_class(nodes.RangeFunction)
+        self.assertEqual(tables(query), {'t', 'u'})
+
+
+class NormalizeTest(unittest.TestCase):
+
+    def test_normalize(self):
+        query = "SELECT * FROM my_table WHERE id = 5 AND name = 'five'"
+        self.assertEqual(normalize(query),
+                         "SELECT * FROM my_table WHERE id = $1 AND name = $2")
+
+    def test_normalize_many(self):
+        queries = ["SELECT 1", b"DELETE FROM my_table WHERE id = 7"]
+        self.assertEqual(normalize_many(iter(queries)),
+                         ["SELECT $1", "DELETE FROM my_table WHERE id = $1"])
+
+    def test_syntax_error(self):
+        self.assertRaises(PSqlParseError, normalize, "SELECT * FRO my_table")
+        self.assertRaises(PSqlParseError, normalize_many,
+                          ["SELECT 1", "SELECT * FRO my_table"])
+
+
+class DecoderTest(unittest.TestCase):
+    """
+    parse_dict decodes the libpg_query JSON buffer with its own decoder,
+    which must give the same result as json.loads, and parse builds the
+    nodes straight from it, which must give the same trees as decoding it
+    with parse_dict first.
+    """
+
+    def assertSameTree(self, first, second):
+        self.assertIs(type(first), type(second))
+        if isinstance(first, list):
+            self.assertEqual(len(first), len(second))
+            for first_item, second_item in zip(first, second):
+                self.assertSameTree(first_item, second_item)
+        elif isinstance(first, dict):
+            self.assertEqual(sorted(first), sorted(second))
+            for key in first:
+                self.assertSameTree(first[key], second[key])
+        elif hasattr(first, '__slots__'):
+            self.assertSameTree(first.__getstate__(), second.__getstate__())
+        else:
+            self.assertEqual(first, second)
+
+    def check(self, query):
+        statement_dicts = parse_dict(query)
+        self.assertEqual(statement_dicts,
+                         json.loads(parse_json(query), strict=False))
+        self.assertSameTree(parse(query),
+                            [build_from_obj(obj) for obj in statement_dicts])
+
+    def test_select(self):
+        self.check("SELECT a, CASE WHEN a = 1 THEN 'one' ELSE 'other' END, "
+                   "count(*) OVER (PARTITION BY b ORDER BY c) FROM t "
+                   "WHERE d IS NULL AND e = -5 AND f = 1.5e3 AND g "
+                   "GROUP BY a HAVING count(*) > 1 ORDER BY 1 FOR UPDATE")
+
+    def test_escaped_strings(self):
+        self.check("SELECT 'quote\" back\\slash', E'tab\there\nnew line'")
+
+    def test_unicode_strings(self):
+        self.check(u"SELECT '\xf1and\xfa \u2603' FROM t")
+
+    def test_big_numbers(self):
+        self.check("SELECT 99999999999999999999, -9223372036854775808")
+
+    def test_statement_without_node_class(self):
+        query = "CREATE TABLE foo (id int PRIMARY KEY, name text)"
+        self.check(query)
+        self.assertIsInstance(parse(query)[0]['CreateStmt']['relation'],
+                              dict)
+
+    def test_multiple_statements(self):
+        self.check("UPDATE t SET (a, b) = (1, 2); SELECT * INTO u FROM t; "
+                   "SELECT * FROM t1 UNION SELECT * FROM t2")
+
+    def test_into_clause(self):
+        stmt = parse("SELECT * INTO new_table FROM my_table").pop()
+        self.assertIsInstance(stmt.into_clause, nodes.IntoClause)
+        self.assertEqual(stmt.into_clause.rel.relname, 'new_table')
+
+
+class SameNodesMixin(object):
+
+    def assertSameNodes(self, first, second):
+        self.assertIs(type(first), type(second))
+        if isinstance(first, list):
+            self.assertEqual(len(first), len(second))
+            for first_item, second_item in zip(first, second):
+                self.assertSameNodes(first_item, second_item)
+        elif isinstance(first, nodes.Node):
+            for attr, _ in first._scalars + first._children:
+                self.assertSameNodes(getattr(first, attr),
+                                     getattr(second, attr))
+        elif hasattr(first, 'val'):
+            self.assertEqual(first.val, second.val)
+        else:
+            self.assertEqual(first, second)
+
+
+class LazyParseTest(SameNodesMixin, unittest.TestCase):
+
+    query = ("WITH fake_table AS (SELECT * FROM inner_table) "
+             "SELECT a, CASE WHEN a = 1 THEN 'one' END FROM fake_table "
+             "JOIN other_table USING (a) WHERE b IN (SELECT c FROM d) "
+             "ORDER BY a FOR UPDATE")
+
+    def test_same_tree(self):
+        self.assertSameNodes(parse(self.query, lazy=True), parse(self.query))
+
+    def test_children_built_on_access(self):
+        stmt = parse(self.query, lazy=True).pop()
+        self.assertIsInstance(stmt, nodes.SelectStmt)
+        self.assertNotIn('where_clause', stmt.__getstate__())
+        self.assertNotIn('locking_clause', stmt.__getstate__())
+
+        where_clause = stmt.where_clause
+        self.assertIsInstance(where_clause, nodes.SubLink)
+        self.assertIs(stmt.where_clause, where_clause)
+        self.assertNotIn('locking_clause', stmt.__getstate__())
+
+    def test_tables(self):
+        self.assertEqual(parse(self.query, lazy=True).pop().tables(),
+                         {'inner_table', 'fake_table', 'other_table', 'd'})
+
+    def test_missing_attribute(self):
+        stmt = parse(self.query, lazy=True).pop()
+        self.assertRaises(AttributeError, getattr, stmt, 'missing')
+        self.assertFalse(hasattr(parse(self.query).pop(), 'missing'))
+
+    def test_build_from_obj(self):
+        statement_dicts = parse_dict(self.query)
+        self.assertSameNodes(build_from_obj(statement_dicts, lazy=True),
+                             build_from_obj(statement_dicts))
+
+
+class IncludeParseTest(SameNodesMixin, unittest.TestCase):
+
+    query = ("WITH fake_table AS (SELECT * FROM inner_table) "
+             "SELECT a, CASE WHEN a = 1 THEN 'one' END FROM fake_table "
+             "JOIN (SELECT * FROM other_table WHERE e = 1) o USING (a) "
+             "WHERE b IN (SELECT c FROM d) ORDER BY a FOR UPDATE; "
+             "SELECT 1")
+
+    includes = (['where_clause'], ['from_clause', 'sort_clause'],
+                [nodes.RangeVar], [nodes.SelectStmt],
+                ['target_list', 'larg', nodes.AConst], [])
+
+    def tearDown(self):
+        set_cache(None)
+
+    def built(self, node):
+        return sorted(attr for attr in node.__getstate__()
+                      if attr in node._child_attrs)
+
+    def test_same_tree(self):
+        for cache in (None, ParseCache()):
+            set_cache(cache)
+            for include in self.includes:
+                self.assertSameNodes(parse(self.query, include=include),
+                                     parse(self.query))
+
+    def test_included_children(self):
+        for cache in (None, ParseCache()):
+            set_cache(cache)
+            stmt, other = parse(self.query, include=['where_clause'])
+            self.assertEqual(self.built(stmt), ['from_clause',
+                                                'where_clause'])
+            self.assertIsInstance(stmt.where_clause, nodes.SubLink)
+            self.assertNotIn('_obj', stmt.where_clause.__getstate__())
+            subquery = stmt.from_clause[0].rarg.subquery
+            self.assertEqual(self.built(subquery), ['where_clause'])
+            self.assertIsInstance(other, nodes.SelectStmt)
+            self.assertEqual(self.built(other), [])
+
+    def test_included_classes(self):
+        for cache in (None, ParseCache()):
+            set_cache(cache)
+            stmt = parse(self.query, include=[nodes.RangeVar])[0]
+            self.assertEqual(self.built(stmt), ['from_clause',
+                                                'where_clause',
+                                                'with_clause'])
+            join = stmt.from_clause[0]
+            self.assertEqual(self.built(join), ['larg', 'rarg'])
+            self.assertIsInstance(join.larg, nodes.RangeVar)
+            self.assertEqual(stmt.tables(), {'inner_table', 'fake_table',
+                                             'other_table', 'd'})
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            stmt = parse(self.query, include=['where_clause'])[0]
+            copy = pickle.loads(pickle.dumps(stmt, protocol))
+            self.assertSameNodes(copy, parse(self.query)[0])
+
+    def test_unexpected_keyword(self):
+        self.assertRaises(TypeError, parse, self.query, includes=[])
+
+
+class CompactNodesTest(unittest.TestCase):
+
+    query = ("SELECT a, 1, 2.5, 'three' FROM my_table "
+             "WHERE b IN (SELECT c FROM other_table)")
+
+    def test_no_instance_dict(self):
+        stmt = parse(self.query).pop()
+        self.assertFalse(hasattr(stmt, '__dict__'))
+        self.assertFalse(hasattr(stmt.target_list[1].val.val, '__dict__'))
+        self.assertRaises(AttributeError, setattr, stmt, 'missing', 1)
+
+    def test_pickle(self):
+        for lazy in (False, True):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                stmt = parse(self.query, lazy=lazy).pop()
+                copy = pickle.loads(pickle.dumps(stmt, protocol))
+                self.assertIsInstance(copy, nodes.SelectStmt)
+                self.assertEqual(copy.tables(), {'my_table', 'other_table'})
+                self.assertEqual([str(target.val.val)
+                                  for target in copy.target_list[1:]],
+                                 ['1', '2.5', 'three'])
+
+
+class NodeRegistryTest(unittest.TestCase):
+
+    query = "CREATE TABLE my_table (id int)"
+
+    def tearDown(self):
+        utils._node_classes.pop('CreateStmt', None)
+        utils._builders.clear()
+        utils._built_builders.clear()
+        utils._table_infos.clear()
+        utils._include_infos.clear()
+        utils._class_definitions.clear()
+        utils._read_definitions.clear()
+
+    def test_get_node_class(self):
+        self.assertIs(utils.get_node_class('A_Const'), nodes.AConst)
+        self.assertIs(utils.get_node_class('SelectStmt'), nodes.SelectStmt)
+        self.assertIsNone(utils.get_node_class('CreateStmt'))
+        self.assertIsNone(utils.get_node_class('nodes'))
+
+    def test_register_declarative_class(self):
+        class CreateStmt(nodes.Node):
+            _scalars = (('if_not_exists', 'if_not_exists'),)
+            _children = (('relation', 'relation'),
+                         ('table_elts', 'tableElts'))
+
+        self.assertIsInstance(parse(self.query)[0], dict)
+        nodes.register_node_class(CreateStmt)
+        for lazy in (False, True):
+            stmt = parse(self.query, lazy=lazy)[0]
+            self.assertIsInstance(stmt, CreateStmt)
+            self.assertIsInstance(stmt.relation, nodes.RangeVar)
+            self.assertEqual(stmt.tables(), {'my_table'})
+        stmt = build_from_obj(parse_dict(self.query))[0]
+        self.assertIsInstance(stmt, CreateStmt)
+        self.assertIsInstance(stmt.relation, nodes.RangeVar)
+        self.assertEqual(tables(self.query), {'my_table'})
+
+    def test_register_class_with_constructor(self):
+        class Create(object):
+            def __init__(self, obj):
+                self.relation = build_from_obj(obj['relation'])
+
+        nodes.register_node_class(Create, 'Create_Stmt')
+        for stmt in (parse(self.query)[0], parse(self.query, lazy=True)[0],
+                     build_from_obj(parse_dict(self.query))[0]):
+            self.assertIsInstance(stmt, Create)
+            self.assertIsInstance(stmt.relation, nodes.RangeVar)
+
+
+@unittest.skipIf(tracemalloc is None, 'requires tracemalloc')
+class PeakMemoryTest(unittest.TestCase):
+
+    query = ("SELECT " + ", ".join("a%d + %d * f(b, 'x%d')" % (i, i, i)
+                                   for i in range(2000)) +
+             " FROM my_table WHERE c IN (" +
+             ", ".join(str(i) for i in range(2000)) + ")")
+
+    def tearDown(self):
+        set_cache(None)
+
+    def measure(self, func):
+        # The first call fills the caches of builders.
+        func(self.query)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = func(self.query)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        return retained, peak
+
+    def check(self, func, bytes_per_input_byte):
+        retained, peak = self.measure(func)
+        # Nothing but the result is alive at the peak: the JSON is decoded
+        # straight from the buffer of libpg_query, or of the cache, and
+        # parse builds the nodes while decoding it, without dicts.
+        self.assertLess(peak, retained * 1.1 + 64 * 1024)
+        self.assertLess(peak, len(self.query) * bytes_per_input_byte)
+
+    def test_parse(self):
+        self.check(parse, 100)
+
+    def test_parse_dict(self):
+        self.check(parse_dict, 300)
+
+    def test_tables(self):
+        retained, peak = self.measure(tables)
+        self.assertLess(peak, len(self.query) * 2)
+
+    def test_cached(self):
+        set_cache(ParseCache())
+        self.check(parse, 100)
+        self.check(parse_dict, 300)
+
+
+class DeepQueryTest(unittest.TestCase):
+
+    depth = 5000
+
+    def spine(self, node, attr):
+        # Walked without recursion, like the trees are built.
+        length = 0
+        while getattr(node, attr, None) is not None:
+            node = getattr(node, attr)
+            length += 1
+        return length, node
+
+    def check(self, query, attr):
+        leaves = []
+        for stmt in (parse(query)[0], build_from_obj(parse_dict(query))[0]):
+            if attr == 'lexpr':
+                stmt = stmt.target_list[0].val
+            length, leaf = self.spine(stmt, attr)
+            self.assertEqual(length, self.depth - 1)
+            leaves.append(leaf)
+        return leaves
+
+    def test_operators(self):
+        query = "SELECT " + " + ".join(["a"] * self.depth)
+        for leaf in self.check(query, 'lexpr'):
+            self.assertIsInstance(leaf, nodes.ColumnRef)
+
+    def test_union(self):
+        query = " UNION ".join("SELECT %d" % i for i in range(self.depth))
+        for leaf in self.check(query, 'larg'):
+            self.assertIsInstance(leaf, nodes.SelectStmt)
+            self.assertEqual(leaf.target_list[0].val.val.ival, 0)
+
+    def test_include(self):
+        query = " UNION ".join("SELECT %d" % i for i in range(self.depth))
+        for cache in (None, ParseCache()):
+            set_cache(cache)
+            try:
+                stmt = parse(query, include=['larg', nodes.AConst])[0]
+            finally:
+                set_cache(None)
+            length, leaf = self.spine(stmt, 'larg')
+            self.assertEqual(length, self.depth - 1)
+            self.assertEqual(leaf.target_list[0].val.val.ival, 0)
+
+    def test_node_class_recursion_error(self):
+        # Raised by a node class, so the tree is not built again.
+        calls = []
+        error = utils._RecursionError
+
+        class RangeVar(nodes.RangeVar):
+            def __init__(self, obj):
+                calls.append(obj)
+                raise error()
+
+        utils.register_node_class(RangeVar)
+        try:
+            self.assertRaises(error, build_from_obj,
+                              parse_dict("SELECT * FROM my_table"))
+        finally:
+            utils.register_node_class(nodes.RangeVar)
+        self.assertEqual(len(calls), 1)
+
+    def test_tables(self):
+        query = " UNION ".join("SELECT * FROM table_%d" % (i % 10)
+                               for i in range(self.depth))
+        self.assertEqual(parse(query)[0].tables(),
+                         set('table_%d' % i for i in range(10)))
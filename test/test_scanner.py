@@ -0,0 +1,88 @@
+import unittest
+
+from psqlparse import parse, parse_dict, split
+
+
+class SplitTest(unittest.TestCase):
+
+    def check(self, query, expected):
+        self.assertEqual([query[offset:offset + length]
+                          for offset, length in split(query)], expected)
+
+    def test_statements(self):
+        query = "SELECT 1;\nSELECT * FROM t WHERE a = 2 ; DELETE FROM t"
+        self.check(query, ['SELECT 1', 'SELECT * FROM t WHERE a = 2',
+                           'DELETE FROM t'])
+        self.assertEqual(split(query), [(0, 8), (10, 27), (40, 13)])
+
+    def test_empty_statements(self):
+        self.check('', [])
+        self.check(' ;; \n ; ', [])
+        self.check('SELECT 1;;SELECT 2;', ['SELECT 1', 'SELECT 2'])
+
+    def test_comments(self):
+        self.check("-- a; b\nSELECT 1 -- c; d\n; /* e; /* f; */ g; */ "
+                   "SELECT /* h; */ 2",
+                   ['SELECT 1', 'SELECT /* h; */ 2'])
+
+    def test_string_literals(self):
+        self.check("SELECT 'a;b', 'it''s;'; SELECT E'\\';', '\\'; SELECT 1",
+                   ["SELECT 'a;b', 'it''s;'", "SELECT E'\\';', '\\'",
+                    'SELECT 1'])
+
+    def test_quoted_identifiers(self):
+        self.check('SELECT 1 AS "a;""b"; SELECT 2',
+                   ['SELECT 1 AS "a;""b"', 'SELECT 2'])
+
+    def test_dollar_quotes(self):
+        self.check("SELECT $$a;b$$; SELECT $x$ $$; $x$; SELECT 3",
+                   ['SELECT $$a;b$$', 'SELECT $x$ $$; $x$', 'SELECT 3'])
+
+    def test_dollar_in_identifiers_and_parameters(self):
+        self.check("SELECT a$b$c FROM t WHERE id = $1; SELECT 2",
+                   ['SELECT a$b$c FROM t WHERE id = $1', 'SELECT 2'])
+
+    def test_parentheses(self):
+        self.check("CREATE RULE r AS ON INSERT TO t DO ALSO "
+                   "(DELETE FROM u; DELETE FROM v); SELECT 1",
+                   ['CREATE RULE r AS ON INSERT TO t DO ALSO '
+                    '(DELETE FROM u; DELETE FROM v)', 'SELECT 1'])
+
+    def test_unterminated(self):
+        self.check("SELECT 1; SELECT 'a;", ['SELECT 1', "SELECT 'a;"])
+
+    def test_meta_commands_and_copy_data(self):
+        self.check("\\connect db\nCOPY t (a, b) FROM STDIN;\n1\t;\n\\.\n"
+                   "SELECT 1",
+                   ['COPY t (a, b) FROM STDIN', 'SELECT 1'])
+        self.check("COPY (SELECT 1) TO STDOUT; SELECT 1",
+                   ['COPY (SELECT 1) TO STDOUT', 'SELECT 1'])
+
+    def test_unicode(self):
+        query = u"SELECT 'café;'; SELECT 'ü'"
+        self.check(query, [u"SELECT 'café;'", u"SELECT 'ü'"])
+        encoded = query.encode('utf8')
+        self.assertEqual([encoded[offset:offset + length]
+                          for offset, length in split(encoded)],
+                         [u"SELECT 'café;'".encode('utf8'),
+                          u"SELECT 'ü'".encode('utf8')])
+
+    def test_buffers(self):
+        encoded = u"SELECT 'café;'; SELECT 2".encode('utf8')
+        expected = [(0, 15), (17, 8)]
+        self.assertEqual(split(encoded), expected)
+        self.assertEqual(split(bytearray(encoded)), expected)
+        self.assertEqual(split(memoryview(encoded)), expected)
+        self.assertEqual(split(memoryview(b'-- ;\n' + encoded)[5:]),
+                         expected)
+
+    def test_same_as_parse(self):
+        query = ("CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ "
+                 "LANGUAGE sql; SELECT f(), ';' FROM t; "
+                 "INSERT INTO t VALUES (1)")
+        pieces = [query[offset:offset + length]
+                  for offset, length in split(query)]
+        statements = parse_dict(query)
+        self.assertEqual([list(parse_dict(piece)[0]) for piece in pieces],
+                         [list(statement) for statement in statements])
+        self.assertEqual(parse(pieces[1])[0].tables(), {'t'})
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+import unittest
+
+from psqlparse import dumps, loads, parse, parse_dict, parse_json, nodes
+from psqlparse.nodes import utils
+
+from .test_parse import SameNodesMixin
+
+
+class TaggedRangeVar(nodes.RangeVar):
+    # Not registered, so dumps can't write it.
+    pass
+
+
+class SerializerTest(SameNodesMixin, unittest.TestCase):
+
+    query = ("WITH fake_table AS (SELECT * FROM inner_table) "
+             "SELECT a, 1, 2.5, 'thrée', CASE WHEN a = 1 THEN 'one' END "
+             "FROM fake_table JOIN other_table USING (a) "
+             "WHERE b IN (SELECT c FROM d) ORDER BY a FOR UPDATE; "
+             "INSERT INTO my_table (id) VALUES (1), (2)")
+
+    def test_nodes(self):
+        statements = parse(self.query)
+        self.assertSameNodes(loads(dumps(statements)), statements)
+        stmt = statements[0].where_clause
+        self.assertSameNodes(loads(dumps(stmt)), stmt)
+
+    def test_lazy_and_include(self):
+        expected = parse(self.query)
+        self.assertSameNodes(loads(dumps(parse(self.query, lazy=True))),
+                             expected)
+        self.assertSameNodes(
+            loads(dumps(parse(self.query, include=[nodes.RangeVar]))),
+            expected)
+
+    def test_dicts(self):
+        statement_dicts = parse_dict(self.query)
+        self.assertEqual(loads(dumps(statement_dicts)), statement_dicts)
+
+    def test_values(self):
+        values = [None, True, False, 0, -1, 300, 2 ** 62, -2 ** 62 - 1,
+                  2 ** 100, 1.5, -0.0, u'', u'thrée', b'\x00bytes',
+                  {u'a': [u'a', {}]}, []]
+        self.assertEqual(loads(dumps(values)), values)
+
+    def test_compact(self):
+        # Strings are written once, and null attributes are left out.
+        self.assertLess(len(dumps([u'a string'] * 100)), 3 * 100)
+        statements = parse(self.query)
+        self.assertLess(len(dumps(statements)) * 1.5,
+                        len(parse_json(self.query)))
+        self.assertLess(len(dumps(statements)),
+                        len(pickle.dumps([stmt.__getstate__()
+                                          for stmt in statements], 2)))
+
+    def test_pickle(self):
+        statements = parse(self.query)
+        self.assertLess(
+            len(pickle.dumps(statements[0], pickle.HIGHEST_PROTOCOL)),
+            len(dumps(statements[0])) + 100)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            data = pickle.dumps(statements[0], protocol)
+            self.assertSameNodes(pickle.loads(data), statements[0])
+            value = statements[0].target_list[1].val.val
+            self.assertEqual(pickle.loads(pickle.dumps(value, protocol)).val,
+                             1)
+
+    def test_pickle_unregistered(self):
+        stmt = parse("SELECT * FROM my_table")[0]
+        stmt.from_clause[0] = TaggedRangeVar(
+            {'relname': 'my_table', 'inh': True})
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(stmt, protocol))
+            self.assertIsInstance(loaded.from_clause[0], TaggedRangeVar)
+            self.assertEqual(loaded.tables(), {'my_table'})
+        self.assertIsInstance(copy.deepcopy(stmt.from_clause[0]),
+                              TaggedRangeVar)
+
+    def test_pickle_graphs(self):
+        # Trees that dumps can't write are pickled by their state.
+        stmt = parse("SELECT * FROM a WHERE b = 1")[0]
+        stmt.where_clause = stmt
+        self.assertRaises(ValueError, dumps, stmt)
+        loaded = pickle.loads(pickle.dumps(stmt, pickle.HIGHEST_PROTOCOL))
+        self.assertIs(loaded.where_clause, loaded)
+        self.assertIs(copy.deepcopy(stmt).where_clause.where_clause.op,
+                      stmt.op)
+
+        stmt = parse("SELECT 1 UNION SELECT 2")[0]
+        stmt.larg.where_clause = stmt.rarg.target_list[0]
+        self.assertRaises(ValueError, dumps, stmt)
+        for loaded in (pickle.loads(pickle.dumps(stmt, 2)),
+                       copy.deepcopy(stmt)):
+            self.assertIs(loaded.larg.where_clause,
+                          loaded.rarg.target_list[0])
+
+        stmt = parse("SELECT 1")[0]
+        stmt.target_list = tuple(stmt.target_list)
+        self.assertRaises(TypeError, dumps, stmt)
+        loaded = pickle.loads(pickle.dumps(stmt, 2))
+        self.assertEqual(loaded.target_list[0].val.val.ival, 1)
+
+    def test_copy(self):
+        stmt = parse(self.query)[0]
+        shallow = copy.copy(stmt)
+        self.assertIsNot(shallow, stmt)
+        self.assertIs(shallow.where_clause, stmt.where_clause)
+        deep = copy.deepcopy(stmt)
+        self.assertIsNot(deep.where_clause, stmt.where_clause)
+        self.assertSameNodes(deep, stmt)
+        value = stmt.target_list[1].val.val
+        self.assertEqual(copy.copy(value).val, 1)
+
+    def test_deep(self):
+        query = " UNION ".join("SELECT %d" % i for i in range(5000))
+        stmt = loads(dumps(parse(query)))[0]
+        for _ in range(4999):
+            stmt = stmt.larg
+        self.assertIsNone(stmt.larg)
+        self.assertEqual(stmt.target_list[0].val.val.val, 0)
+
+    def test_registered_classes(self):
+        class CreateStmt(nodes.Node):
+            _scalars = (('if_not_exists', 'if_not_exists'),)
+            _children = (('relation', 'relation'),)
+
+        utils.register_node_class(CreateStmt)
+        try:
+            data = dumps(parse("CREATE TABLE my_table (id int)"))
+            stmt = loads(data)[0]
+        finally:
+            utils._node_classes.pop('CreateStmt')
+            utils._builders.clear()
+            utils._built_builders.clear()
+            utils._class_definitions.clear()
+            utils._read_definitions.clear()
+        self.assertIsInstance(stmt, CreateStmt)
+        self.assertEqual(stmt.relation.relname, 'my_table')
+        self.assertRaises(ValueError, loads, data)
+
+        class Unregistered(nodes.RangeVar):
+            pass
+
+        self.assertRaises(ValueError, dumps, Unregistered({}))
+
+    def test_invalid_data(self):
+        data = dumps(parse(self.query))
+        self.assertRaises(ValueError, loads, b'not a parse tree')
+        self.assertRaises(ValueError, loads, data[:3] + b'\x09' + data[4:])
+        self.assertRaises(ValueError, loads, data[:-1])
+        self.assertRaises(ValueError, loads, data + b'\x00')
+        self.assertRaises(ValueError, loads, b'PQT\x01\x09\xff\xff\xff\x7f')
+        self.assertRaises(ValueError, loads, b'PQT\x01\x10')
+        self.assertRaises(ValueError, loads,
+                          b'PQT\x01\x0b\x06\x07Missing\x00\x00')
+        self.assertRaises(TypeError, dumps, [object()])
@@ -0,0 +1,120 @@
+import unittest
+
+import psqlparse
+from psqlparse import nodes
+from psqlparse.cache import ParseCache
+from psqlparse.exceptions import PSqlParseError
+from psqlparse.stats import ParseStats, count_nodes
+
+
+class ParseStatsTest(unittest.TestCase):
+
+    query = "SELECT a, 1 FROM my_table WHERE b = 'x'"
+
+    def setUp(self):
+        self.records = []
+        self.stats = ParseStats(callback=self.records.append,
+                                count_nodes=True)
+        psqlparse.set_stats(self.stats)
+
+    def tearDown(self):
+        psqlparse.set_stats(None)
+        psqlparse.set_cache(None)
+
+    def test_parse(self):
+        psqlparse.parse(self.query)
+        self.assertIs(psqlparse.get_stats(), self.stats)
+        record, = self.records
+        self.assertEqual(record.function, 'parse')
+        self.assertEqual(record.bytes, len(self.query))
+        self.assertGreater(record.seconds['parse'], 0)
+        self.assertGreater(record.seconds['decode'], 0)
+        self.assertGreaterEqual(record.elapsed,
+                                sum(record.seconds.values()))
+        self.assertEqual(record.nodes['SelectStmt'], 1)
+        self.assertEqual(record.nodes['RangeVar'], 1)
+        self.assertEqual(record.nodes['ColumnRef'], 2)
+        self.assertEqual(record.nodes['String'], 4)
+        self.assertEqual(record.nodes['Integer'], 1)
+        self.assertIsNone(record.error)
+        self.assertIsNone(record.cached)
+
+    def test_lazy(self):
+        stmt = psqlparse.parse(self.query, lazy=True)[0]
+        record, = self.records
+        self.assertGreater(record.seconds['build'], 0)
+        self.assertEqual(record.nodes, {'SelectStmt': 1})
+        stmt.from_clause
+        self.assertEqual(count_nodes(stmt), {'SelectStmt': 1, 'RangeVar': 1})
+
+    def test_totals(self):
+        psqlparse.parse(self.query)
+        psqlparse.parse_dict(self.query)
+        psqlparse.parse_json(self.query)
+        self.assertEqual(psqlparse.tables(self.query), {'my_table'})
+        self.assertRaises(PSqlParseError, psqlparse.parse, 'SELECT * FRO t')
+
+        self.assertEqual([record.function for record in self.records],
+                         ['parse', 'parse_dict', 'parse_json', 'tables',
+                          'parse'])
+        self.assertIsInstance(self.records[-1].error, PSqlParseError)
+        self.assertIsNone(self.records[1].nodes)
+
+        totals = self.stats.snapshot()
+        self.assertEqual(totals['calls'], {'parse': 2, 'parse_dict': 1,
+                                           'parse_json': 1, 'tables': 1})
+        self.assertEqual(totals['errors'], 1)
+        self.assertEqual(totals['bytes'],
+                         4 * len(self.query) + len('SELECT * FRO t'))
+        self.assertEqual(totals['nodes']['SelectStmt'], 1)
+        self.assertAlmostEqual(
+            totals['seconds']['parse'],
+            sum(record.seconds['parse'] for record in self.records))
+
+        metrics = self.stats.metrics('app.sql')
+        self.assertEqual(metrics['app.sql.calls.parse'], 2)
+        self.assertEqual(metrics['app.sql.errors'], 1)
+        self.assertIn('app.sql.seconds.decode', metrics)
+
+        self.stats.reset()
+        self.assertEqual(self.stats.snapshot()['calls'], {})
+
+    def test_parse_many(self):
+        results = psqlparse.parse_many([self.query, 'SELECT * FRO t'],
+                                       workers=2)
+        self.assertIsInstance(results[1], PSqlParseError)
+        self.assertEqual(sorted(record.function for record in self.records),
+                         ['parse_many', 'parse_many'])
+        self.assertEqual(self.stats.snapshot()['errors'], 1)
+
+    def test_cache(self):
+        psqlparse.set_cache(ParseCache())
+        psqlparse.parse(self.query)
+        psqlparse.parse(self.query)
+        self.assertEqual([record.cached for record in self.records],
+                         [False, True])
+        self.assertEqual(self.records[1].seconds['parse'], 0)
+        self.assertGreater(self.records[1].seconds['decode'], 0)
+        self.assertEqual(self.stats.snapshot()['cache_hits'], 1)
+
+    def test_include(self):
+        stmt = psqlparse.parse(self.query, include=[nodes.RangeVar])[0]
+        self.assertEqual(stmt.tables(), {'my_table'})
+        record, = self.records
+        self.assertEqual(record.nodes['RangeVar'], 1)
+        self.assertNotIn('ColumnRef', record.nodes)
+
+    def test_without_counting_nodes(self):
+        self.stats.count_nodes = False
+        psqlparse.parse(self.query)
+        self.assertIsNone(self.records[0].nodes)
+        self.assertEqual(self.stats.snapshot()['nodes'], {})
+
+    def test_record_as_dict(self):
+        self.assertRaises(PSqlParseError, psqlparse.parse_dict,
+                          'SELECT * FRO t')
+        record = self.records[0].as_dict()
+        self.assertEqual(record['function'], 'parse_dict')
+        self.assertIn('syntax error', record['error'])
+        self.assertEqual(sorted(record['seconds']),
+                         ['build', 'decode', 'parse'])
@@ -0,0 +1,89 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from psqlparse import iter_parse, nodes
+from psqlparse.exceptions import PSqlParseError
+
+
+SCRIPT = u"""\\connect mydb
+-- Comments; with semicolons
+SELECT * FROM users WHERE name = 'a;b';
+/* nested /* comments; */ too; */
+CREATE FUNCTION f() RETURNS int AS $body$
+BEGIN
+    RETURN 1; -- $$;
+END;
+$body$ LANGUAGE plpgsql;
+COPY users (id, name) FROM stdin;
+1\tsemi;colon
+2\t'quote
+\\.
+INSERT INTO logs VALUES (E'it\\'s;', 'café');;
+SELECT 1 FRO logs;
+UPDATE users SET name = "Name;" FROM accounts
+"""
+
+
+class IterParseTest(unittest.TestCase):
+
+    def check(self, results):
+        encoded = SCRIPT.encode('utf8')
+        texts = [encoded[offset:offset + length]
+                 for offset, length, _ in results]
+        self.assertEqual(texts, [
+            b"SELECT * FROM users WHERE name = 'a;b'",
+            SCRIPT[SCRIPT.index('CREATE'):
+                   SCRIPT.index(' LANGUAGE')].encode('utf8') +
+            b' LANGUAGE plpgsql',
+            b'COPY users (id, name) FROM stdin',
+            u"INSERT INTO logs VALUES (E'it\\'s;', 'café')".encode(
+                'utf8'),
+            b'SELECT 1 FRO logs',
+            b'UPDATE users SET name = "Name;" FROM accounts',
+        ])
+
+        statements = [statement for _, _, statement in results]
+        self.assertIsInstance(statements[0], nodes.SelectStmt)
+        self.assertEqual(statements[0].tables(), {'users'})
+        self.assertIsInstance(statements[1], dict)
+        self.assertIsInstance(statements[3], nodes.InsertStmt)
+        self.assertIsInstance(statements[4], PSqlParseError)
+        self.assertIsInstance(statements[5], nodes.UpdateStmt)
+
+    def test_binary_file(self):
+        for chunk_size in range(1, 40):
+            stream = io.BytesIO(SCRIPT.encode('utf8'))
+            self.check(list(iter_parse(stream, chunk_size)))
+
+    def test_text_file(self):
+        self.check(list(iter_parse(io.StringIO(SCRIPT), 16)))
+
+    def test_path(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'dump.sql')
+            with open(path, 'wb') as f:
+                f.write(SCRIPT.encode('utf8'))
+            self.check(list(iter_parse(path)))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_lazy(self):
+        stream = io.BytesIO(b'SELECT 1; SELECT 2;' * 1000)
+        results = iter_parse(stream, 64)
+        self.assertEqual(next(results)[:2], (0, 8))
+        self.assertEqual(next(results)[:2], (10, 8))
+        self.assertLess(stream.tell(), 1000)
+
+    def test_empty(self):
+        self.assertEqual(list(iter_parse(io.BytesIO(b''))), [])
+        self.assertEqual(list(iter_parse(io.BytesIO(b' ;; -- x\n'))), [])
+
+    def test_unterminated_copy_data(self):
+        results = list(iter_parse(io.BytesIO(
+            b'SELECT 1; COPY t FROM STDIN;\n1\n2\n'), 4))
+        self.assertEqual([result[:2] for result in results],
+                         [(0, 8), (10, 17)])
@@ -0,0 +1,160 @@
+import unittest
+
+from psqlparse import parse
+from psqlparse import nodes
+from psqlparse.visitor import Visitor, Transformer, SKIP, STOP
+
+
+class RangeVarCollector(Visitor):
+
+    def __init__(self):
+        self.names = []
+
+    def visit_RangeVar(self, node):
+        self.names.append(node.relname)
+
+
+class VisitorTest(unittest.TestCase):
+
+    query = ("SELECT a, b + 1 FROM t1 JOIN t2 ON t1.id = t2.id "
+             "WHERE a IN (SELECT x FROM t3) AND b = 'c'")
+
+    def test_order(self):
+        class Collector(Visitor):
+            def __init__(self):
+                self.classes = []
+
+            def generic_visit(self, node):
+                self.classes.append(type(node).__name__)
+
+        collector = Collector()
+        self.assertTrue(collector.visit(parse("SELECT a FROM t WHERE b")))
+        self.assertEqual(collector.classes,
+                         ['SelectStmt', 'ResTarget', 'ColumnRef', 'String',
+                          'RangeVar', 'ColumnRef', 'String'])
+
+    def test_handlers(self):
+        collector = RangeVarCollector()
+        collector.visit(parse(self.query))
+        self.assertEqual(collector.names, ['t1', 't2', 't3'])
+
+    def test_base_class_handler(self):
+        class ExprCounter(Visitor):
+            count = 0
+
+            def visit_Expr(self, node):
+                self.count += 1
+
+        counter = ExprCounter()
+        counter.visit(parse(self.query))
+        # The AND and the IN subquery.
+        self.assertEqual(counter.count, 2)
+
+    def test_value_handler(self):
+        class Strings(Visitor):
+            def __init__(self):
+                self.strings = []
+
+            def visit_String(self, node):
+                self.strings.append(str(node))
+
+        visitor = Strings()
+        visitor.visit(parse("SELECT 'c', 1"))
+        self.assertEqual(visitor.strings, ['c'])
+
+    def test_skip(self):
+        class OuterTables(RangeVarCollector):
+            def visit_SubLink(self, node):
+                return SKIP
+
+        visitor = OuterTables()
+        self.assertTrue(visitor.visit(parse(self.query)))
+        self.assertEqual(visitor.names, ['t1', 't2'])
+
+    def test_stop(self):
+        class FirstTable(RangeVarCollector):
+            def visit_RangeVar(self, node):
+                self.names.append(node.relname)
+                return STOP
+
+        visitor = FirstTable()
+        self.assertFalse(visitor.visit(parse(self.query)))
+        self.assertEqual(visitor.names, ['t1'])
+
+    def test_dispatch_per_class(self):
+        class Base(Visitor):
+            def visit_RangeVar(self, node):
+                return STOP
+
+        class Derived(Base):
+            def visit_RangeVar(self, node):
+                return None
+
+        stmts = parse(self.query)
+        self.assertFalse(Base().visit(stmts))
+        self.assertTrue(Derived().visit(stmts))
+        self.assertFalse(Base().visit(stmts))
+
+    def test_deep_tree(self):
+        query = " UNION ".join("SELECT * FROM t%d" % i for i in range(5000))
+        collector = RangeVarCollector()
+        collector.visit(parse(query))
+        self.assertEqual(collector.names,
+                         ['t%d' % i for i in range(5000)])
+
+
+class TransformerTest(unittest.TestCase):
+
+    def test_replace_attribute(self):
+        class Rename(Transformer):
+            def visit_RangeVar(self, node):
+                node.relname = 'new_' + node.relname
+                return node
+
+        stmts = Rename().visit(parse("SELECT * FROM t1, (SELECT 1 FROM t2) s"))
+        self.assertEqual(stmts[0].tables(), {'new_t1', 'new_t2'})
+
+    def test_replace_node(self):
+        class ConstToColumn(Transformer):
+            def visit_AConst(self, node):
+                return parse("SELECT c")[0].target_list[0].val
+
+        stmt = ConstToColumn().visit(parse("SELECT 1 + a")[0])
+        self.assertIsInstance(stmt.target_list[0].val.lexpr, nodes.ColumnRef)
+
+    def test_children_first(self):
+        class Order(Transformer):
+            def __init__(self):
+                self.classes = []
+
+            def generic_visit(self, node):
+                self.classes.append(type(node).__name__)
+                return node
+
+        transformer = Order()
+        transformer.visit(parse("SELECT a FROM t"))
+        self.assertEqual(transformer.classes,
+                         ['String', 'ColumnRef', 'ResTarget', 'RangeVar',
+                          'SelectStmt'])
+
+    def test_remove(self):
+        class DropConsts(Transformer):
+            def visit_ResTarget(self, node):
+                if not isinstance(node.val, nodes.AConst):
+                    return node
+
+            def visit_SelectStmt(self, node):
+                if node.target_list:
+                    return node
+
+        stmts = DropConsts().visit(parse("SELECT 1, a, 2, b, 3; SELECT 1"))
+        self.assertEqual(len(stmts), 1)
+        self.assertEqual([str(target.val.fields[0])
+                          for target in stmts[0].target_list], ['a', 'b'])
+
+    def test_remove_root(self):
+        class DropAll(Transformer):
+            def visit_SelectStmt(self, node):
+                return None
+
+        self.assertIsNone(DropAll().visit(parse("SELECT 1")[0]))